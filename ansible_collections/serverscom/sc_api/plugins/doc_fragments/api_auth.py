@@ -29,4 +29,133 @@ options:
         - If not set, the value of the C(SERVERSCOM_API_TOKEN) or C(SC_TOKEN) environment variable is used
           (C(SERVERSCOM_API_TOKEN) takes precedence).
         - Value is not logged.
+
+    page_size:
+      type: int
+      default: 100
+      description:
+        - Number of items to request per page when listing objects.
+        - Bigger pages mean fewer requests for large inventories.
+        - 100 is the largest page size the API allows; larger values are rejected.
+        - If not set, the value of the C(SERVERSCOM_API_PAGE_SIZE) environment variable is used.
+
+    cache:
+      type: str
+      choices: [use, refresh, bypass]
+      default: use
+      description:
+        - How to use the on-disk cache for reference data (locations, cloud regions,
+          flavors and images, server models, SBM flavors, operating systems and RBS flavors).
+        - C(use) returns cached data while it is fresh and fetches it otherwise.
+        - C(refresh) always fetches data from the API and updates the cache.
+        - C(bypass) neither reads nor writes the cache.
+        - Info modules which return reference data (e.g. C(baremetal_locations_info)
+          and C(cloud_computing_images_info)) default to C(refresh), so they
+          return current data and later tasks get it from the cache.
+        - Cached data expires after 10 minutes (cloud images), 1 day (locations and cloud regions),
+          or 1 hour (everything else).
+        - Other objects (servers, instances, volumes, etc.) are never cached.
+          Only the IDs of cloud instances, L2 segments and SBM servers found by
+          name are remembered, so the next lookup of the same name is a single
+          request which also checks that the object still has this name.
+        - If not set, the value of the C(SERVERSCOM_API_CACHE) environment variable is used.
+
+    cache_dir:
+      type: path
+      description:
+        - Directory for the reference data cache.
+        - Defaults to C(serverscom-sc-api) in C($XDG_CACHE_HOME) or C(~/.cache).
+        - If not set, the value of the C(SERVERSCOM_API_CACHE_DIR) environment variable is used.
+
+    revalidate:
+      type: str
+      choices: [memory, disk, off]
+      default: "off"
+      description:
+        - How to revalidate objects and pages which were already fetched.
+        - Answers to C(GET) requests with an C(ETag) or C(Last-Modified) header
+          are kept, and the same request is sent again with C(If-None-Match) or
+          C(If-Modified-Since). If the API answers C(304 Not Modified), the kept
+          body is used, so wait loops and listings which see unchanged objects
+          don't download them again.
+        - C(memory) keeps answers while the module runs.
+        - C(disk) also keeps them in the C(validators) directory of I(cache_dir),
+          so later module runs revalidate too. Answers with credentials
+          (RBS volume and cloud region credentials) are kept in memory only.
+        - C(off) always downloads whole answers. Most tasks make only a few
+          requests and never repeat one, so this is the default.
+        - If not set, the value of the C(SERVERSCOM_API_REVALIDATE) environment variable is used.
+
+    connect_timeout:
+      type: float
+      default: 10
+      description:
+        - Seconds to wait for a connection to the API.
+        - C(0) waits forever.
+        - If not set, the value of the C(SERVERSCOM_API_CONNECT_TIMEOUT) environment variable is used.
+
+    read_timeout:
+      type: float
+      default: 60
+      description:
+        - Seconds to wait for data from the API once a request is sent.
+        - C(0) waits forever.
+        - In modules with a C(wait) option all requests, their retries and
+          all wait loops share one deadline, C(wait) seconds after the module
+          started. Both timeouts are cut to the time left until then, but
+          not below 5 seconds, so the last poll still gets its answer.
+        - A request which times out fails the module with C(request_timeout)
+          (C(connect) and C(read) seconds) in the result, and with C(attempts)
+          if it was retried. Timed out requests are retried the same way as
+          failed ones, and show up as C(timeout) in C(api_stats).
+        - Not used with the C(serverscom.sc_api.serverscom) httpapi connection,
+          which has its own timeouts.
+        - If not set, the value of the C(SERVERSCOM_API_READ_TIMEOUT) environment variable is used.
+
+    rate_limit:
+      type: float
+      description:
+        - Maximum number of API requests per second, shared by all module runs
+          on this host which use the same token (e.g. all forks of a playbook).
+        - The limiter state is kept in I(cache_dir).
+        - If not set, there is no shared limiter; C(429 Too Many Requests)
+          answers are retried like other failed requests.
+        - C(0) disables the client-side limit, but C(429 Too Many Requests)
+          answers and C(Retry-After)/C(X-RateLimit-*) headers are still honored
+          and make other module runs wait too.
+        - When set, requests rejected with C(429) are retried as soon as the
+          C(Retry-After) or C(X-RateLimit-Reset) header allows, for up to 120
+          seconds of waiting per request and never past the C(wait) deadline.
+          These retries don't count toward the 3 retries in the notes; if the
+          request is still rejected after that, it is retried like other
+          failed requests.
+        - If a module had to wait, its result has C(api_throttle) with the time
+          spent waiting (C(seconds)) and the number of C(429) answers (C(rate_limited)).
+        - If not set, the value of the C(SERVERSCOM_API_RATE_LIMIT) environment variable is used.
+
+    api_stats:
+      type: bool
+      default: false
+      description:
+        - Add C(api_stats) to the module result, with timings of the API requests
+          made by the module.
+        - C(api_stats) has the number of C(requests), C(retries) and C(bytes) received
+          (as sent by the API, i.e. compressed),
+          the C(p50), C(p95), C(p99) and C(max) request C(latency) in seconds,
+          the total time spent in requests (C(network_seconds)) and sleeping
+          (C(sleep_seconds) for C(wait) loops, C(retry) delays and rate limit C(throttle)),
+          the wall time of the module (C(elapsed)), and per-endpoint totals (C(endpoints))
+          by method and path template (e.g. C(/hosts/sbm_servers/{id})).
+        - Requests running concurrently (page prefetch) overlap, so C(network_seconds)
+          can be larger than C(elapsed).
+        - If not set, the value of the C(SERVERSCOM_API_STATS) environment variable is used.
+
+notes:
+    - Requests which fail with C(429), C(502), C(503) or C(504), time out or lose
+      the connection are retried up to 3 times with exponentially growing random
+      delays (and not sooner than the C(Retry-After) header asks for).
+      C(GET), C(PUT) and C(DELETE) requests are always retried; C(POST) requests
+      only if the API didn't get them (refused connection) or rejected them with C(429).
+    - With I(rate_limit) set, C(429) answers are first retried for up to 120 seconds,
+      see I(rate_limit).
 """
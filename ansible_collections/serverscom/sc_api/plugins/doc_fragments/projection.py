@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+# (c) 2026, Servers.com
+# GNU General Public License v3.0
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+    DOCUMENTATION = r"""
+options:
+    fields:
+      type: list
+      elements: str
+      description:
+        - Return only these fields of each object.
+        - Fields are dotted paths, e.g. C(id), C(configuration_details.ram_size).
+          For lists of objects the path applies to every item,
+          e.g. C(networks.cidr).
+        - Fields missing in an object are skipped.
+        - Status flags added by the module (e.g. C(changed), C(found),
+          C(ready)) are always returned.
+        - If not set, whole objects are returned.
+"""
+
+    LISTING = r"""
+options:
+    limit:
+      type: int
+      description:
+        - Return at most this many objects.
+        - Listing stops as soon as enough objects are received,
+          so further pages are not requested.
+        - If not set, all objects are returned.
+
+    dest:
+      type: path
+      description:
+        - Write objects to this file instead of returning them, one JSON
+          object per line (JSON Lines). The file is gzip-compressed if its
+          name ends with C(.gz).
+        - Objects are written while pages are received, so the listing is
+          never kept in memory as a whole.
+        - The file is replaced atomically once the whole listing is written,
+          and only if its content changed. If listing fails, the file is
+          left as it was.
+        - The module then returns C(dest), C(count) (number of objects) and
+          C(checksum) (SHA1 of the file) instead of the list of objects.
+        - In check mode the file is not written, but C(count), C(checksum)
+          and C(changed) are reported.
+"""
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# (c) 2026, Servers.com
+# GNU General Public License v3.0
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+name: serverscom
+author: "Servers.com"
+short_description: Persistent HTTPS session to the Servers.com API
+version_added: "1.2.0"
+description:
+  - Lets modules of this collection send their API requests through a
+    persistent connection (C(ansible_connection=ansible.netcommon.httpapi)).
+  - The connection process keeps one HTTPS session with keep-alive, so
+    tasks of a play reuse established TLS connections instead of doing
+    DNS, TCP and TLS handshakes in every task.
+  - Modules still use their own O(token) and O(endpoint) options; the
+    connection only carries the requests.
+  - Modules fall back to their own HTTPS session if they are run
+    without the persistent connection.
+requirements:
+  - requests
+  - ansible.netcommon collection
+"""
+
+EXAMPLES = r"""
+# inventory
+# [serverscom]
+# api.servers.com
+#
+# [serverscom:vars]
+# ansible_connection=ansible.netcommon.httpapi
+# ansible_network_os=serverscom.sc_api.serverscom
+
+- hosts: serverscom
+  gather_facts: false
+  tasks:
+    - name: Get list of SBM servers
+      serverscom.sc_api.sbm_servers_info:
+        token: "{{ sc_token }}"
+      register: sbm_servers
+"""
+
+from ansible.module_utils.connection import ConnectionError
+from ansible.plugins.httpapi import HttpApiBase
+
+
+class HttpApi(HttpApiBase):
+    def __init__(self, connection):
+        super(HttpApi, self).__init__(connection)
+        self._session = None
+
+    @property
+    def session(self):
+        """requests session living as long as the persistent connection."""
+        if self._session is None:
+            # pylint: disable=bad-option-value, import-outside-toplevel
+            import requests
+
+            self._session = requests.Session()
+            self._session.verify = self._option("validate_certs", True)
+        return self._session
+
+    def _option(self, name, default=None):
+        try:
+            return self.connection.get_option(name)
+        except KeyError:
+            return default
+
+    def send_request(self, data, method="GET", url=None, headers=None):
+        """Send one API request for a module.
+
+        data: request body (str) or None.
+        Returns a dict with status, headers, url and body (str), which
+        ApiHelper turns back into a response object.
+        """
+        # pylint: disable=bad-option-value, import-outside-toplevel
+        import requests
+
+        try:
+            response = self.session.request(
+                method,
+                url,
+                data=data.encode("utf-8") if data is not None else None,
+                headers=headers,
+                timeout=self._option("persistent_command_timeout"),
+            )
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            raise ConnectionError(f"{type(e).__name__}: {e}")
+        return {
+            "status": response.status_code,
+            "headers": dict(response.headers),
+            "url": response.url,
+            "body": response.text,
+        }
+
+    def handle_httperror(self, exc):
+        # Status codes are interpreted by the module (ApiHelper).
+        return exc
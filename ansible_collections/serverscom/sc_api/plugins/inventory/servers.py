@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+# (c) 2026, Servers.com
+# GNU General Public License v3.0
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+name: servers
+author: "Servers.com"
+short_description: Servers.com inventory source
+version_added: "1.2.0"
+description:
+  - Get dedicated servers, SBM servers and cloud instances from the Servers.com API.
+  - All requested kinds of objects are fetched concurrently.
+  - Builds groups by object type, labels, location and cloud region.
+  - Hosts are named by title (cloud instances by name), or by ID if they have none.
+    If several objects have the same name, each of them gets its ID appended
+    (e.g. C(web_s1) and C(web_s2)) and a warning is shown.
+  - Uses a YAML configuration file that ends with C(serverscom.yml) or C(serverscom.yaml).
+extends_documentation_fragment:
+  - inventory_cache
+  - constructed
+requirements:
+  - requests
+options:
+  plugin:
+    description: Token that ensures this is a source file for the plugin.
+    required: true
+    choices: ["serverscom.sc_api.servers"]
+  token:
+    type: str
+    required: true
+    description:
+      - API token.
+      - If not set, the value of the C(SERVERSCOM_API_TOKEN) or C(SC_TOKEN) environment variable is used.
+    env:
+      - name: SERVERSCOM_API_TOKEN
+      - name: SC_TOKEN
+  endpoint:
+    type: str
+    default: https://api.servers.com/v1
+    description:
+      - Endpoint to use to connect to API.
+    env:
+      - name: SERVERSCOM_API_URL
+  page_size:
+    type: int
+    default: 100
+    description:
+      - Number of items to request per page, from 1 to 100 (the largest page size the API allows).
+    env:
+      - name: SERVERSCOM_API_PAGE_SIZE
+  resources:
+    type: list
+    elements: str
+    choices: ["dedicated_server", "sbm_server", "cloud_instance"]
+    default: ["dedicated_server", "sbm_server", "cloud_instance"]
+    description:
+      - Kinds of objects to add to the inventory.
+  label_selector:
+    type: str
+    description:
+      - Add only objects matching this label selector.
+      - More info at https://developers.servers.com/api-documentation/v1/#section/Labels/Labels-selector
+  group_prefix:
+    type: str
+    default: serverscom_
+    description:
+      - Prefix for names of the groups made by this plugin.
+"""
+
+EXAMPLES = r"""
+# serverscom.yml
+plugin: serverscom.sc_api.servers
+
+# Only SBM servers with a label, cached for an hour
+plugin: serverscom.sc_api.servers
+resources:
+  - sbm_server
+label_selector: env=prod
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: ~/.cache/ansible-inventory
+cache_timeout: 3600
+
+# Extra groups with the constructed options
+plugin: serverscom.sc_api.servers
+keyed_groups:
+  - key: serverscom_status
+    prefix: status
+"""
+
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.errors import AnsibleError
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
+from ansible.utils.display import Display
+
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    DEFAULT_PAGE_SIZE,
+    SCBaseError,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_client import (
+    ScApi,
+)
+
+
+display = Display()
+
+HOST_TYPES = {"dedicated_server", "sbm_server"}
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+    NAME = "serverscom.sc_api.servers"
+
+    def verify_file(self, path):
+        return super(InventoryModule, self).verify_file(path) and path.endswith(
+            ("serverscom.yml", "serverscom.yaml")
+        )
+
+    def _fetch_hosts(self, api, host_type):
+        return [
+            dict(host, resource=host_type)
+            for host in api.list_hosts(
+                type=host_type, label_selector=self.get_option("label_selector")
+            )
+        ]
+
+    def _fetch_instances(self, api):
+        return [
+            dict(instance, resource="cloud_instance")
+            for instance in api.list_instances(
+                label_selector=self.get_option("label_selector")
+            )
+        ]
+
+    def fetch(self):
+        """Fetch all requested kinds of objects concurrently."""
+        page_size = self.get_option("page_size")
+        if not 1 <= page_size <= DEFAULT_PAGE_SIZE:
+            raise AnsibleError(
+                f"page_size must be between 1 and {DEFAULT_PAGE_SIZE}, got {page_size}."
+            )
+        api = ScApi(
+            self.get_option("token"), self.get_option("endpoint"), page_size=page_size
+        )
+        resources = self.get_option("resources")
+        with ThreadPoolExecutor(max_workers=len(resources) or 1) as executor:
+            futures = []
+            for resource in resources:
+                if resource in HOST_TYPES:
+                    futures.append(executor.submit(self._fetch_hosts, api, resource))
+                else:
+                    futures.append(executor.submit(self._fetch_instances, api))
+            try:
+                return [obj for future in futures for obj in future.result()]
+            except SCBaseError as e:
+                raise AnsibleError(f"Servers.com API error: {e.msg}")
+
+    def _group(self, name):
+        name = re.sub(r"[^A-Za-z0-9_]", "_", f"{self.get_option('group_prefix')}{name}")
+        return self.inventory.add_group(name)
+
+    @staticmethod
+    def _hostname(obj):
+        return obj.get("title") or obj.get("name") or obj["id"]
+
+    def _hostnames(self, objects):
+        """Host names for objects, with IDs appended to names used more than once.
+
+        Otherwise objects with the same title would be merged into one host.
+        """
+        names = [self._hostname(obj) for obj in objects]
+        counts = Counter(names)
+        for name, count in sorted(counts.items()):
+            if count > 1:
+                display.warning(
+                    f"{count} Servers.com objects are named {name}, "
+                    "adding their IDs to their inventory host names."
+                )
+        return [
+            f"{name}_{obj['id']}" if counts[name] > 1 else name
+            for name, obj in zip(names, objects)
+        ]
+
+    def populate(self, objects):
+        strict = self.get_option("strict")
+        for obj, name in zip(objects, self._hostnames(objects)):
+            hostname = self.inventory.add_host(name)
+            hostvars = {f"serverscom_{key}": value for key, value in obj.items()}
+            address = obj.get("public_ipv4_address") or obj.get("private_ipv4_address")
+            if address:
+                hostvars["ansible_host"] = address
+            for key, value in hostvars.items():
+                self.inventory.set_variable(hostname, key, value)
+
+            self.inventory.add_child(self._group(f"{obj['resource']}s"), hostname)
+            if obj.get("location_code"):
+                self.inventory.add_child(
+                    self._group(f"location_{obj['location_code']}"), hostname
+                )
+            if obj.get("region_code"):
+                self.inventory.add_child(
+                    self._group(f"region_{obj['region_code']}"), hostname
+                )
+            for key, value in (obj.get("labels") or {}).items():
+                self.inventory.add_child(self._group(f"label_{key}_{value}"), hostname)
+
+            self._set_composite_vars(
+                self.get_option("compose"), hostvars, hostname, strict=strict
+            )
+            self._add_host_to_composed_groups(
+                self.get_option("groups"), hostvars, hostname, strict=strict
+            )
+            self._add_host_to_keyed_groups(
+                self.get_option("keyed_groups"), hostvars, hostname, strict=strict
+            )
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path, cache)
+        self._read_config_data(path)
+
+        cache_key = self.get_cache_key(path)
+        use_cache = self.get_option("cache") and cache
+        update_cache = self.get_option("cache") and not cache
+
+        objects = None
+        if use_cache:
+            try:
+                objects = self._cache[cache_key]
+            except KeyError:
+                update_cache = True
+        if objects is None:
+            objects = self.fetch()
+        if update_cache:
+            self._cache[cache_key] = objects
+
+        self.populate(objects)
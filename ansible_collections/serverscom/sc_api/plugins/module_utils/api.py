@@ -1,12 +1,130 @@
 from __future__ import absolute_import, division, print_function
-import re
+import json
+import os
 import random
+import sys
 import time
+from collections import deque
+from itertools import chain, islice
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+
+# cache, jsonstream, ratelimit, revalidate and tracing are imported on
+# first use: AnsiballZ compiles every imported module_util on every run.
+# They still ship in every payload, so the features they implement are
+# off by default (except for the reference data cache), and runs which
+# don't ask for them never import them. Their option values, which
+# modules need for the argument spec, are defined here.
 
 __metaclass__ = type
 
 
 DEFAULT_API_ENDPOINT = "https://api.servers.com/v1"
+DEFAULT_PREFETCH_WORKERS = 4
+DEFAULT_PAGE_SIZE = 100  # the largest per_page the API accepts
+# Bytes read from the socket at a time when a list page is decoded.
+DECODE_CHUNK_SIZE = 64 * 1024
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_READ_TIMEOUT = 60
+# Read timeout for requests made when the deadline is (nearly) over,
+# e.g. the last poll of a wait loop, which happens right at the deadline.
+MIN_REQUEST_TIMEOUT = 5
+# Status codes of transient failures (rate limit, gateway and overload
+# errors), retried by the default RetryPolicy.
+RETRY_CODES = frozenset((429, 502, 503, 504))
+# Methods which have the same effect when sent twice, so any failure
+# (including a connection lost after the request was sent) can be retried.
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+# Answers which mean the API didn't process the request at all, so
+# even a POST can be sent again.
+NOT_PROCESSED_CODES = frozenset((429,))
+
+
+def accept_encoding():
+    """Encodings to ask for: gzip and deflate, and br when a brotli
+    library is installed (urllib3 decodes it only then)."""
+    encodings = ["gzip", "deflate"]
+    for name in ("brotli", "brotlicffi"):
+        try:
+            __import__(name)
+        except ImportError:
+            continue
+        encodings.append("br")
+        break
+    return ", ".join(encodings)
+
+
+ACCEPT_ENCODING = accept_encoding()
+
+# Modes of the on-disk reference data cache (see cache.py).
+CACHE_USE = "use"
+CACHE_REFRESH = "refresh"
+CACHE_BYPASS = "bypass"
+CACHE_MODES = [CACHE_USE, CACHE_REFRESH, CACHE_BYPASS]
+
+# Where to keep validators (see revalidate.py).
+REVALIDATE_MEMORY = "memory"
+REVALIDATE_DISK = "disk"
+REVALIDATE_OFF = "off"
+REVALIDATE_MODES = [REVALIDATE_MEMORY, REVALIDATE_DISK, REVALIDATE_OFF]
+
+# With the rate_limit option (see ratelimit.py), don't wait longer than
+# that for a single request to get through 429s.
+RATE_LIMIT_MAX_WAIT = 120
+# Time spent waiting for the rate limiter by this process; reported in
+# module results (see modules.client_info).
+THROTTLE_STATS = {"seconds": 0.0, "rate_limited": 0}
+
+TRACING_MODULE = "ansible_collections.serverscom.sc_api.plugins.module_utils.tracing"
+
+
+def default_cache_dir():
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "serverscom-sc-api")
+
+
+def tracer():
+    """The Tracer of this process if it is on, else None.
+
+    Modules import tracing.py only when asked for api_stats (see
+    modules.configure_api_client), and a tracer which was never
+    imported can't be on.
+    """
+    tracing = sys.modules.get(TRACING_MODULE)
+    if tracing is None or not tracing.TRACE.enabled:
+        return None
+    return tracing.TRACE
+
+
+# Settings for every ApiHelper created in this process. Each module
+# invocation is a separate process, so main() sets them once from the
+# common module options (see modules.configure_api_client).
+CLIENT_DEFAULTS = {
+    "page_size": DEFAULT_PAGE_SIZE,
+    "prefetch_workers": DEFAULT_PREFETCH_WORKERS,
+    "cache": CACHE_BYPASS,
+    "cache_dir": None,
+    "rate_limit": None,  # None: no limiter at all (ScApi used outside of modules)
+    "revalidate": REVALIDATE_OFF,
+    # Seconds to wait for a connection and for data from the API; 0 or
+    # None waits forever.
+    "connect_timeout": DEFAULT_CONNECT_TIMEOUT,
+    "read_timeout": DEFAULT_READ_TIMEOUT,
+    # time.time() by which the module should be done (now + the wait
+    # option), shared by request timeouts, retries and wait loops.
+    "deadline": None,
+    # Persistent connection (httpapi plugin) to send requests through.
+    "socket_path": None,
+}
+
+
+def remaining_time():
+    """Seconds left until CLIENT_DEFAULTS["deadline"], None without a deadline."""
+    deadline = CLIENT_DEFAULTS["deadline"]
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.time())
 
 
 class SCBaseError(Exception):
@@ -30,10 +148,11 @@ class APIRequirementsError(SCBaseError):
 
 
 class APIError(SCBaseError):
-    def __init__(self, msg, api_url, status_code, correlation_id=None):
+    def __init__(self, msg, api_url, status_code, correlation_id=None, retry_after=None):
         self.api_url = api_url
         self.status_code = status_code
         self.correlation_id = correlation_id
+        self.retry_after = retry_after  # seconds, from the Retry-After header
         if correlation_id:
             self.msg = f"{msg} (X-Correlation-ID: {correlation_id})"
         else:
@@ -83,30 +202,230 @@ class APIError412(APIError):
 
 
 class SCConnectionError(SCBaseError):
-    def __init__(self, msg, api_url):
+    def __init__(self, msg, api_url, sent=True):
         self.msg = msg
         self.api_url = api_url
+        # False if the connection was never made, so the API surely
+        # didn't get the request; True when that's unknown.
+        self.sent = sent
+        self.attempts = 1  # set by send_retrying when it gives up retrying
+
+    def fail(self):
+        result = {"failed": True, "msg": self.msg, "api_url": self.api_url}
+        if self.attempts > 1:
+            result["attempts"] = self.attempts
+        return result
+
+
+class SCTimeoutError(SCConnectionError):
+    """The API didn't accept the connection or answer in time."""
+
+    def __init__(self, msg, api_url, timeout, sent=True):
+        super(SCTimeoutError, self).__init__(msg, api_url, sent)
+        self.timeout = timeout  # (connect, read) seconds of the attempt
 
     def fail(self):
-        return {"failed": True, "msg": self.msg, "api_url": self.api_url}
+        result = super(SCTimeoutError, self).fail()
+        result["request_timeout"] = {"connect": self.timeout[0], "read": self.timeout[1]}
+        return result
+
+
+class RetryPolicy:
+    """When and after how long a failed request is sent again.
+
+    Answers with one of codes and connection errors (timeouts included)
+    are retried, as long as it's safe: IDEMPOTENT_METHODS always are,
+    other methods (POST) only when the API surely didn't process the
+    request (a NOT_PROCESSED_CODES answer, or no connection at all).
+
+    The delay before attempt n+1 is random between 0 and
+    base_delay * 2 ** (n - 1), capped at max_delay ("full jitter"), but
+    never shorter than the Retry-After header of the answer asks for.
+    Retries stop after max_attempts attempts (None: no limit), once
+    max_wait seconds have passed since the first one, or at the deadline.
+    """
+
+    def __init__(
+        self,
+        codes=RETRY_CODES,
+        max_attempts=4,
+        base_delay=0.5,
+        max_delay=8.0,
+        max_wait=30.0,
+    ):
+        self.codes = frozenset(codes)
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_wait = max_wait
+
+    @classmethod
+    def from_rules(cls, retry_rules):
+        """Policy for a retry_rules dict (see ApiHelper.make_get_request).
+
+        The codes are retried in addition to RETRY_CODES, delays start at
+        retry_rules["delay"] and grow up to four times that, and there are
+        as many attempts as fit in retry_rules["max_wait"].
+        """
+        return cls(
+            codes=RETRY_CODES | frozenset(retry_rules["codes"]),
+            max_attempts=None,
+            base_delay=retry_rules["delay"],
+            max_delay=retry_rules["delay"] * 4,
+            max_wait=retry_rules["max_wait"],
+        )
+
+    def retryable(self, method, error):
+        """Whether the request which failed with error may be sent again."""
+        if isinstance(error, SCConnectionError):
+            return method in IDEMPOTENT_METHODS or not error.sent
+        if isinstance(error, APIError) and error.status_code in self.codes:
+            return method in IDEMPOTENT_METHODS or error.status_code in NOT_PROCESSED_CODES
+        return False
+
+    def delay(self, method, error, attempts, elapsed):
+        """Seconds to sleep before the next attempt, or None to give up.
+
+        attempts: how many times the request has been sent;
+        elapsed: seconds since the first attempt.
+        """
+        if not self.retryable(method, error):
+            return None
+        if self.max_attempts is not None and attempts >= self.max_attempts:
+            return None
+        if elapsed >= self.max_wait:
+            return None
+        delay = random.uniform(
+            0, min(self.max_delay, self.base_delay * 2 ** (attempts - 1))
+        )
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            if elapsed + retry_after > self.max_wait:
+                return None
+            delay = max(delay, retry_after)
+        remaining = remaining_time()
+        if remaining is not None:
+            if remaining <= 0 or (retry_after or 0) > remaining:
+                return None
+            delay = min(delay, remaining)
+        return delay
 
 
 class ApiHelper:
-    def __init__(self, token, endpoint):
-        # pylint: disable=bad-option-value, import-outside-toplevel
-        # pylint: disable=bad-option-value, raise-missing-from
-        try:
-            import requests  # noqa
+    """Sends requests to the API.
 
-            self.requests = requests
-        except ImportError:
-            raise APIRequirementsError(
-                msg="The requests library is required (python3-requests)."
-            )
-        self.session = requests.Session()
+    Failed requests are retried according to retry_policy (RetryPolicy()
+    by default); requests made with retry_rules use RetryPolicy.from_rules.
+    """
+
+    def __init__(
+        self, token, endpoint, page_size=None, prefetch_workers=None, retry_policy=None
+    ):
+        # requests and the session are set up on first use, so modules
+        # which fail validation or need no API calls don't pay for them.
+        self._requests = None
+        self._session = None
         self.request = None
         self.endpoint = endpoint
         self.token = token
+        if page_size is None:
+            page_size = CLIENT_DEFAULTS["page_size"]
+        if prefetch_workers is None:
+            prefetch_workers = CLIENT_DEFAULTS["prefetch_workers"]
+        self.page_size = page_size
+        self.prefetch_workers = prefetch_workers
+        if retry_policy is None:
+            retry_policy = RetryPolicy()
+        self.retry_policy = retry_policy
+        self.connect_timeout = CLIENT_DEFAULTS["connect_timeout"]
+        self.read_timeout = CLIENT_DEFAULTS["read_timeout"]
+        self.cache_mode = CLIENT_DEFAULTS["cache"]
+        self.cache_dir = CLIENT_DEFAULTS["cache_dir"]
+        self.revalidate = CLIENT_DEFAULTS["revalidate"]
+        self.rate_limit = CLIENT_DEFAULTS["rate_limit"]
+        self._cache = None
+        self._validators = None
+        self._limiter = False  # not created yet; None: no limiter
+        self.socket_path = CLIENT_DEFAULTS["socket_path"]
+
+    @property
+    def requests(self):
+        """The requests library, imported on first use."""
+        if self._requests is None:
+            # pylint: disable=bad-option-value, import-outside-toplevel
+            # pylint: disable=bad-option-value, raise-missing-from
+            try:
+                import requests  # noqa
+            except ImportError:
+                raise APIRequirementsError(
+                    msg="The requests library is required (python3-requests)."
+                )
+            self._requests = requests
+        return self._requests
+
+    @property
+    def session(self):
+        """requests session, created on first use."""
+        if self._session is None:
+            self._session = self.requests.Session()
+        return self._session
+
+    @session.setter
+    def session(self, session):
+        self._session = session
+
+    @property
+    def cache(self):
+        """ReferenceCache (see cache.py), created on first use."""
+        if self._cache is None:
+            # pylint: disable=bad-option-value, import-outside-toplevel
+            from ansible_collections.serverscom.sc_api.plugins.module_utils.cache import (
+                ReferenceCache,
+            )
+
+            self._cache = ReferenceCache(
+                self.token, self.endpoint, mode=self.cache_mode, cache_dir=self.cache_dir
+            )
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache):
+        self._cache = cache
+
+    @property
+    def validators(self):
+        """ValidatorStore (see revalidate.py) created on first use, None
+        when revalidate is off."""
+        if self._validators is None and self.revalidate != REVALIDATE_OFF:
+            # pylint: disable=bad-option-value, import-outside-toplevel
+            from ansible_collections.serverscom.sc_api.plugins.module_utils.revalidate import (
+                ValidatorStore,
+            )
+
+            self._validators = ValidatorStore(
+                self.token, self.endpoint, mode=self.revalidate, cache_dir=self.cache_dir
+            )
+        return self._validators
+
+    @property
+    def limiter(self):
+        """RateLimiter (see ratelimit.py) created on first use, None
+        when rate_limit is None."""
+        if self._limiter is False:
+            self._limiter = None
+            if self.rate_limit is not None:
+                # pylint: disable=bad-option-value, import-outside-toplevel
+                from ansible_collections.serverscom.sc_api.plugins.module_utils.ratelimit import (
+                    RateLimiter,
+                )
+
+                self._limiter = RateLimiter(
+                    self.token,
+                    self.endpoint,
+                    rate=self.rate_limit,
+                    state_dir=self.cache_dir,
+                )
+        return self._limiter
 
     def make_url(self, path):
         return self.endpoint + path
@@ -117,24 +436,26 @@ class ApiHelper:
             method, self.make_url(path), params=query_parameters
         )
 
-    def send_request(self, good_codes):
-        """send a single request/finishes request"""
+    def send_request(self, good_codes, request=None, stream=False):
+        """send a single request/finishes request
 
-        self.request.headers["Authorization"] = f"Bearer {self.token}"
-        self.request.headers["User-Agent"] = "ansible-module/sc_api/0.1"
-        prep_request = self.request.prepare()
-        try:
-            response = self.session.send(prep_request)
-        except self.requests.exceptions.ConnectionError as e:
-            raise SCConnectionError(
-                msg=f"Connection error: {e}",
-                api_url=prep_request.url,
-            )
-        except self.requests.exceptions.Timeout as e:
-            raise SCConnectionError(
-                msg=f"Request timeout: {e}",
-                api_url=prep_request.url,
-            )
+        With stream, the body of a good response is left on the socket
+        to be read by decode_items.
+        """
+        prep_request = self.prepare(request)
+        response = self._send_throttled(prep_request, good_codes, stream)
+        return self.check_response(response, prep_request, good_codes)
+
+    def prepare(self, request=None):
+        if request is None:
+            request = self.request
+        request.headers["Authorization"] = f"Bearer {self.token}"
+        request.headers["User-Agent"] = "ansible-module/sc_api/0.1"
+        request.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        return request.prepare()
+
+    def check_response(self, response, prep_request, good_codes):
+        """Raise a matching APIError unless response has one of good_codes."""
         correlation_id = response.headers.get("X-Correlation-ID")
         if response.status_code == 400:
             raise APIError400(
@@ -179,9 +500,195 @@ class ApiHelper:
                 api_url=prep_request.url,
                 msg=f"API Error: {response.content}",
                 correlation_id=correlation_id,
+                retry_after=self.retry_after(response),
             )
         return response
 
+    @staticmethod
+    def retry_after(response):
+        """Seconds from the Retry-After header of response, or None."""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        # pylint: disable=bad-option-value, import-outside-toplevel
+        from ansible_collections.serverscom.sc_api.plugins.module_utils.ratelimit import (
+            parse_retry_after,
+        )
+
+        return parse_retry_after(value, time.time())
+
+    def _send_throttled(self, prep_request, good_codes, stream=False):
+        """Send a prepared request, going through the rate limiter.
+
+        429 responses are retried (the API didn't process the request, so
+        it's safe for any method) for up to RATE_LIMIT_MAX_WAIT seconds,
+        and never past the deadline.
+        """
+        throttled = 0.0
+        while True:
+            if self.limiter:
+                throttled += self.limiter.acquire()
+            response = self._send_traced(prep_request, stream)
+            if not self.limiter:
+                return response
+            retry_after = self.limiter.observe(response)
+            remaining = remaining_time()
+            if (
+                retry_after is None
+                or 429 in good_codes
+                or throttled + retry_after > RATE_LIMIT_MAX_WAIT
+                or (remaining is not None and retry_after > remaining)
+            ):
+                return response
+            self.trace_retry(prep_request)
+
+    def _send_traced(self, prep_request, stream=False):
+        started = time.monotonic()
+        response = None
+        status = None
+        try:
+            response = self._send_or_raise(prep_request, stream)
+            return response
+        except SCTimeoutError:
+            status = "timeout"
+            raise
+        finally:
+            self.trace(prep_request, response, started, status)
+
+    def trace(self, prep_request, response, started, status=None):
+        """Record a request (response is None if sending failed), see tracing.py.
+
+        status: what to record instead of a status code when there is
+        no response ("timeout"; anything else is recorded as "error").
+        """
+        trace = tracer()
+        if trace is None:
+            return
+        trace.request(
+            prep_request.method,
+            self.endpoint,
+            prep_request.url,
+            status if response is None else response.status_code,
+            0 if response is None else self.received_bytes(response),
+            time.monotonic() - started,
+        )
+
+    @staticmethod
+    def received_bytes(response):
+        """Size of the body as sent (compressed), without reading a streamed one."""
+        length = response.headers.get("Content-Length")
+        if length is not None:
+            try:
+                return int(length)
+            except ValueError:
+                pass
+        if getattr(response, "_content", None) is False:
+            return 0  # streamed with chunked encoding, size unknown yet
+        return len(response.content)
+
+    def trace_retry(self, prep_request):
+        trace = tracer()
+        if trace is not None:
+            trace.retried(prep_request.method, self.endpoint, prep_request.url)
+
+    def _send_or_raise(self, prep_request, stream=False):
+        """Send a prepared request, turning transport errors into SCConnectionError."""
+        timeout = self.timeout()
+        try:
+            return self._send(prep_request, stream, timeout)
+        except self.requests.exceptions.RequestException as e:
+            raise self.transport_error(e, prep_request.url, timeout)
+
+    def timeout(self):
+        """(connect, read) timeouts for the next request.
+
+        Both are cut to the time left until the deadline, but not below
+        MIN_REQUEST_TIMEOUT, so a request made right at the deadline
+        still gets its answer.
+        """
+        connect = self.connect_timeout or None
+        read = self.read_timeout or None
+        remaining = remaining_time()
+        if remaining is not None:
+            budget = max(remaining, MIN_REQUEST_TIMEOUT)
+            connect = budget if connect is None else min(connect, budget)
+            read = budget if read is None else min(read, budget)
+        return connect, read
+
+    def transport_error(self, error, url, timeout):
+        """SCTimeoutError or SCConnectionError for a requests exception."""
+        exceptions = self.requests.exceptions
+        urllib3_exceptions = self.requests.packages.urllib3.exceptions
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        # Refused or timed out connections: the request never left.
+        sent = not (
+            isinstance(error, exceptions.ConnectTimeout)
+            or isinstance(
+                reason,
+                (urllib3_exceptions.NewConnectionError, urllib3_exceptions.ConnectTimeoutError),
+            )
+        )
+        # Read timeouts while a streamed body is read come as ConnectionError.
+        if isinstance(error, exceptions.Timeout) or (
+            error.args and isinstance(error.args[0], urllib3_exceptions.ReadTimeoutError)
+        ):
+            return SCTimeoutError(
+                msg=f"Request timeout (connect {timeout[0]}s, read {timeout[1]}s): {error}",
+                api_url=url,
+                timeout=timeout,
+                sent=sent,
+            )
+        return SCConnectionError(msg=f"Connection error: {error}", api_url=url, sent=sent)
+
+    def _send(self, prep_request, stream=False, timeout=None):
+        if not self.socket_path:
+            return self.session.send(prep_request, stream=stream, timeout=timeout)
+        return self._send_via_connection(prep_request)
+
+    def _send_via_connection(self, prep_request):
+        """Send a prepared request through the persistent connection.
+
+        The serverscom httpapi plugin keeps one HTTPS session for all
+        tasks of a play; its reply is turned back into a requests Response.
+        """
+        # pylint: disable=bad-option-value, import-outside-toplevel
+        from ansible.module_utils.connection import Connection, ConnectionError
+
+        body = prep_request.body
+        if isinstance(body, bytes):
+            body = body.decode("utf-8")
+        try:
+            reply = Connection(self.socket_path).send_request(
+                body,
+                method=prep_request.method,
+                url=prep_request.url,
+                headers=dict(prep_request.headers),
+            )
+        except ConnectionError as e:
+            raise SCConnectionError(
+                msg=f"Connection error: {e}",
+                api_url=prep_request.url,
+            )
+        return self.build_response(
+            prep_request,
+            reply["status"],
+            reply["headers"],
+            reply["url"],
+            reply["body"].encode("utf-8"),
+        )
+
+    def build_response(self, prep_request, status, headers, url, content):
+        """Make a requests Response for a reply received by other means."""
+        response = self.requests.Response()
+        response.status_code = status
+        response.headers = self.requests.structures.CaseInsensitiveDict(headers)
+        response.url = url
+        response.encoding = "utf-8"
+        response._content = content
+        response._content_consumed = True
+        response.request = prep_request
+        return response
+
     def decode(self, response):
         # pylint: disable=bad-option-value, raise-missing-from
         try:
@@ -195,1124 +702,391 @@ class ApiHelper:
             )
         return decoded
 
-    def make_get_request(self, path, query_parameters=None, retry_rules=None):
+    def decode_items(self, response):
+        """Yield the items of a list page as they are parsed from its body.
+
+        A streamed body is read and decompressed DECODE_CHUNK_SIZE bytes
+        at a time, so only one item is held decoded, not the whole page
+        (see jsonstream.py). A page which fits in one chunk has nothing
+        to gain from that, and is decoded whole.
+        The response is closed if the caller stops early.
+        """
+        try:
+            yield from self._page_items(response)
+        except ValueError as e:
+            raise DecodeError(
+                api_url=response.url,
+                status_code=response.status_code,
+                msg=f"API decoding error: {str(e)}",
+                correlation_id=response.headers.get("X-Correlation-ID"),
+            )
+        except self.requests.exceptions.RequestException as e:
+            raise self.transport_error(e, response.url, self.timeout())
+        finally:
+            response.close()
+
+    @staticmethod
+    def _page_items(response):
+        chunks = iter(response.iter_content(DECODE_CHUNK_SIZE))
+        first = next(chunks, b"")
+        second = next(chunks, None)
+        if second is None:
+            items = json.loads(first)
+            if not isinstance(items, list):
+                raise ValueError("Expected a JSON array.")
+            return iter(items)
+        # pylint: disable=bad-option-value, import-outside-toplevel
+        from ansible_collections.serverscom.sc_api.plugins.module_utils.jsonstream import (
+            iter_json_array,
+        )
+
+        return iter_json_array(chain((first, second), chunks))
+
+    def make_get_request(
+        self, path, query_parameters=None, retry_rules=None, sensitive=False
+    ):
         """Used for a simple GET request without pagination.
 
         retry_rules: dict with keys:
             codes: list of status codes to retry on (e.g. [500, 502, 503, 504])
             delay: delay between retries in seconds
             max_wait: maximum total wait time in seconds (+/- additional delay).
+        Without retry_rules, retry_policy is used.
+        sensitive: the answer holds secrets (e.g. credentials), so it is
+        never written to disk (see send_get_request).
         """
-        start = time.time()
-        while True:
-            try:
-                self.start_request("GET", path, query_parameters)
-                return self.decode(self.send_request(good_codes=[200]))
-
-            except (APIError, SCConnectionError) as e:
-                if not retry_rules:
-                    raise
-                if (
-                    isinstance(e, APIError)
-                    and e.status_code not in retry_rules["codes"]
-                ):
-                    raise
-                if time.time() >= start + retry_rules["max_wait"]:
-                    raise
-                time.sleep(retry_rules["delay"] * random.uniform(0.7, 1.3))
+        return self.decode(
+            self.send_get_request(
+                self.make_url(path), query_parameters, retry_rules, sensitive=sensitive
+            )
+        )
 
     def make_delete_request(self, path, body, query_parameters, good_codes):
         self.start_request("DELETE", path, query_parameters)
         self.request.body = body
-        return self.send_request(good_codes)
+        return self.send_retrying(self.request, good_codes)
 
     def make_post_request(self, path, body, query_parameters, good_codes):
         self.start_request("POST", path, query_parameters)
         self.request.json = body
-        return self.decode(self.send_request(good_codes))
+        return self.decode(self.send_retrying(self.request, good_codes))
 
     def make_put_request(self, path, body, query_parameters, good_codes):
         self.start_request("PUT", path, query_parameters)
         self.request.json = body
-        response = self.send_request(good_codes)
+        response = self.send_retrying(self.request, good_codes)
         return response.status_code, self.decode(response)
 
-    def is_next(self):
-        if self.request:
-            return bool(self.request.url)
-        return False
-
-    def prepare_next(self, response):
-        self.request.url = response.links.get("next", {"url": None})["url"]
-        self.request.query_params = []
-
-    def make_multipage_request(self, path, query_parameters=None, retry_rules=None):
-        """Used for GET request with expected pagination. Returns iterator?"""
-        start = time.time()
-        self.start_request("GET", path, query_parameters)
-        while self.is_next():
-            while True:
-                try:
-                    response = self.send_request(good_codes=[200])
-                    break
-                except (APIError, SCConnectionError) as e:
-                    if not retry_rules:
-                        raise
-                    if (
-                        isinstance(e, APIError)
-                        and e.status_code not in retry_rules["codes"]
-                    ):
-                        raise
-                    if time.time() >= start + retry_rules["max_wait"]:
-                        raise
-                    time.sleep(retry_rules["delay"] * random.uniform(0.7, 1.3))
-            list_from_api = self.decode(response)
-            yield from list_from_api
-            self.prepare_next(response)
-
-
-class ScApiToolbox:
-    """Additional functions to work with API."""
-
-    def __init__(self, api):
-        self.api = api
-
-    def get_ssh_fingerprints_by_key_name(self, ssh_key_name, must=False):
-        """Search for registered ssh key by name and return it's
-        fingerprints or return None if nothing found."""
-        for key in self.api.list_ssh_keys():
-            if key["name"] == ssh_key_name:
-                return key["fingerprint"]
-        if must:
-            raise ToolboxError(f"Unable to find registered ssh key {ssh_key_name}")
-
-    def find_cloud_image_id_by_name_regexp(self, regexp, region_id=None, must=False):
-        for image in self.api.list_images(region_id):
-            if re.match(regexp, image["name"]):
-                return image["id"]
-        if must:
-            raise ToolboxError(f"Unable to find image by regexp {regexp}")
-
-    def find_image_id(self, image_id, image_regexp, region_id=None, must=False):
-        if image_id and image_regexp:
-            raise ToolboxError("Both image_id and image_regexp specified.")
-        if image_id:
-            return image_id
-        if image_regexp:
-            return self.find_cloud_image_id_by_name_regexp(
-                image_regexp, region_id, must=must
-            )
-        raise ToolboxError("No image_id and no image_regexp specified.")
+    def retry_policy_for(self, retry_rules):
+        """RetryPolicy for a request made with retry_rules (may be None)."""
+        if retry_rules:
+            return RetryPolicy.from_rules(retry_rules)
+        return self.retry_policy
 
-    def find_cloud_flavor_id_by_name(self, flavor_name, region_id=None, must=False):
-        """Search flavor by exact name match.
-
-        Returns flavor_id if found, or None if not found."""
-        for flavor in self.api.list_flavors(region_id):
-            if flavor["name"] == flavor_name:
-                return flavor["id"]
-        if must:
-            raise ToolboxError(f"Unable to find flavor by name {flavor_name}")
-
-    def find_cloud_instance_id_by_name(self, name, region_id=None, must=False):
-        instances = self.api.list_instances(region_id)
-        found = []
-        for instance in instances:
-            if instance["name"] == name:
-                found.append(instance)
-        if len(found) > 1:
-            raise ToolboxError(f"Multiple instances found with name {name}")
-        if len(found) == 1:
-            return found[0]
-        if must:
-            raise ToolboxError(f"Unable to find instance by name {name}")
-
-    def find_instance(self, instance_id, instance_name, region_id=None, must=False):
-        """Search instance either by id, or by name (and region).
+    def send_retrying(
+        self, request, good_codes, retry_rules=None, start=None, stream=False
+    ):
+        """Send request, retrying failures according to the retry policy.
 
-        Returns instance object, raises an exception if nothing
-        found (and must=True), or return None (if must=False).
-        Raises an exception if multiple instances found with the
-        same name.
+        When retries stop, the last error is raised; connection errors
+        tell how many attempts were made.
         """
-        if instance_id and instance_name:
-            raise ToolboxError("Both instance_id and instance_name are specified.")
-        if not instance_id and not instance_name:
-            raise ToolboxError("Neither instance_id nor instance_name specified.")
-        if instance_id:
+        if start is None:
+            start = time.time()
+        policy = self.retry_policy_for(retry_rules)
+        attempts = 0
+        while True:
+            attempts += 1
             try:
-                return self.api.get_instances(instance_id)
-            except APIError404:
-                if must:
+                return self.send_request(good_codes, request=request, stream=stream)
+            except (APIError, SCConnectionError) as e:
+                if isinstance(e, SCConnectionError):
+                    e.attempts = attempts
+                delay = policy.delay(request.method, e, attempts, time.time() - start)
+                if delay is None:
                     raise
-                return None
-        if instance_name:
-            return self.find_cloud_instance_id_by_name(instance_name, must=must)
-
-    def find_flavor_id(self, flavor_id, flavor_name, region_id=None):
-        """Search for flavor by id or by name.
-
-        Returns flavor id, by id or by name.
-        Raises an exception if nothing found.
+                trace = tracer()
+                if trace is not None:
+                    trace.retried(request.method, self.endpoint, e.api_url)
+                    trace.slept("retry", delay)
+                time.sleep(delay)
+
+    def page_urls(self, response):
+        """Return URLs of all pages after the one in response.
+
+        Uses the ``last`` link (or the ``X-Total-Count`` header together
+        with ``per_page``) to work out the page numbers up front.
+        Returns None if the number of pages can't be figured out, in which
+        case the caller has to follow ``next`` links one by one.
         """
-        if flavor_id and flavor_name:
-            raise ToolboxError("Both flavor_id and flavor_name specified.")
-
-        if not flavor_id and not flavor_name:
-            raise ToolboxError("Neither flavor_id nor flavor_name specified.")
-        if flavor_id:
-            return flavor_id
-        return self.find_cloud_flavor_id_by_name(
-            flavor_name=flavor_name, region_id=region_id, must=True
-        )
-
-
-# naiming convention:
-# Prefixes:
-# list_ -> returns interator over paginatated response.
-# get_ -> returns single object
-# post_ -> make post request for a single object (update/create/change)
-# delete_ -> make delete request for a single object
-# Suffixes:
-# Last element of the path (except for the path parameter)
-# if there is no collision, more path pieces if there are collisions.
-# Arguments:
-# 'as is' in the API if possible.
-
-
-class ScApi:
-    """Provide functions matching Servers.com Public API."""
-
-    def __init__(self, token, endpoint=DEFAULT_API_ENDPOINT):
-        self.api_helper = ApiHelper(token, endpoint)
-        self.toolbox = ScApiToolbox(self)
-
-    def list_locations(self, search_pattern=None):
-        if search_pattern:
-            query = {"search_pattern": search_pattern}
-        else:
-            query = None
-        return self.api_helper.make_multipage_request(
-            path="/locations", query_parameters=query
-        )
-
-    def list_regions(self):
-        return self.api_helper.make_multipage_request("/cloud_computing/regions")
-
-    def get_dedicated_servers(self, server_id, retry_rules=None):
-        return self.api_helper.make_get_request(
-            path=f"/hosts/dedicated_servers/{server_id}",
-            retry_rules=retry_rules,
-        )
-
-    def get_sbm_servers(self, server_id, retry_rules=None):
-        return self.api_helper.make_get_request(
-            path=f"/hosts/sbm_servers/{server_id}",
-            retry_rules=retry_rules,
-        )
-
-    def post_sbm_server_power_on(self, server_id):
-        return self.api_helper.make_post_request(
-            path=f"/hosts/sbm_servers/{server_id}/power_on",
-            body=None,
-            query_parameters=None,
-            good_codes=[202],
-        )
-
-    def post_sbm_server_power_off(self, server_id):
-        return self.api_helper.make_post_request(
-            path=f"/hosts/sbm_servers/{server_id}/power_off",
-            body=None,
-            query_parameters=None,
-            good_codes=[202],
-        )
-
-    def post_sbm_server_power_cycle(self, server_id):
-        return self.api_helper.make_post_request(
-            path=f"/hosts/sbm_servers/{server_id}/power_cycle",
-            body=None,
-            query_parameters=None,
-            good_codes=[202],
-        )
-
-    def post_sbm_server_reinstall(
-        self,
-        server_id,
-        hostname,
-        operating_system_id,
-        ssh_key_fingerprints=None,
-        user_data=None,
-    ):
-        body = {
-            "hostname": hostname,
-            "operating_system_id": operating_system_id,
-        }
-        if ssh_key_fingerprints is not None:
-            body["ssh_key_fingerprints"] = ssh_key_fingerprints
-        if user_data is not None:
-            body["user_data"] = user_data
-        return self.api_helper.make_post_request(
-            path=f"/hosts/sbm_servers/{server_id}/reinstall",
-            body=body,
-            query_parameters=None,
-            good_codes=[202],
-        )
-
-    def list_sbm_server_ptr_records(self, server_id):
-        return self.api_helper.make_multipage_request(
-            path=f"/hosts/sbm_servers/{server_id}/ptr_records"
-        )
-
-    def post_sbm_server_ptr_record(
-        self, server_id, ip, domain, ttl=None, priority=None
-    ):
-        body = {"ip": ip, "domain": domain}
-        if ttl is not None:
-            body["ttl"] = ttl
-        if priority is not None:
-            body["priority"] = priority
-        return self.api_helper.make_post_request(
-            path=f"/hosts/sbm_servers/{server_id}/ptr_records",
-            body=body,
-            query_parameters=None,
-            good_codes=[201],
-        )
-
-    def delete_sbm_server_ptr_record(self, server_id, record_id):
-        return self.api_helper.make_delete_request(
-            path=f"/hosts/sbm_servers/{server_id}/ptr_records/{record_id}",
-            body=None,
-            query_parameters=None,
-            good_codes=[204],
-        )
-
-    def post_sbm_servers(
-        self,
-        location_id,
-        sbm_flavor_model_id,
-        hosts,
-        operating_system_id,
-        ssh_key_fingerprints=None,
-        user_data=None,
-    ):
-        body = {
-            "location_id": location_id,
-            "sbm_flavor_model_id": sbm_flavor_model_id,
-            "hosts": hosts,
-            "operating_system_id": operating_system_id,
-        }
-        if ssh_key_fingerprints is not None:
-            body["ssh_key_fingerprints"] = ssh_key_fingerprints
-        if user_data is not None:
-            body["user_data"] = user_data
-        return self.api_helper.make_post_request(
-            path="/hosts/sbm_servers",
-            body=body,
-            query_parameters=None,
-            good_codes=[202],
-        )
-
-    def delete_sbm_server(self, server_id):
-        return self.api_helper.make_delete_request(
-            path=f"/hosts/sbm_servers/{server_id}",
-            body=None,
-            query_parameters=None,
-            good_codes=[200],
-        )
-
-    def list_sbm_servers(
-        self,
-        search_pattern=None,
-        location_id=None,
-        rack_id=None,
-        label_selector=None,
-    ):
-        query = {}
-        if search_pattern:
-            query["search_pattern"] = search_pattern
-        if location_id is not None:
-            query["location_id"] = location_id
-        if rack_id:
-            query["rack_id"] = rack_id
-        if label_selector:
-            query["label_selector"] = label_selector
-        return self.api_helper.make_multipage_request(
-            path="/hosts/sbm_servers", query_parameters=query
-        )
-
-    def put_sbm_server(self, server_id, labels):
-        body = {"labels": labels}
-        return self.api_helper.make_put_request(
-            path=f"/hosts/sbm_servers/{server_id}",
-            body=body,
-            query_parameters=None,
-            good_codes=[200],
-        )
-
-    def list_sbm_server_networks(
-        self,
-        server_id,
-        search_pattern=None,
-        family=None,
-        interface_type=None,
-        distribution_method=None,
-        additional=None,
-    ):
-        query = {}
-        if search_pattern:
-            query["search_pattern"] = search_pattern
-        if family:
-            query["family"] = family
-        if interface_type:
-            query["interface_type"] = interface_type
-        if distribution_method:
-            query["distribution_method"] = distribution_method
-        if additional is not None:
-            query["additional"] = additional
-        return self.api_helper.make_multipage_request(
-            path=f"/hosts/sbm_servers/{server_id}/networks",
-            query_parameters=query,
-        )
-
-    def get_sbm_server_network(self, server_id, network_id, retry_rules=None):
-        return self.api_helper.make_get_request(
-            path=f"/hosts/sbm_servers/{server_id}/networks/{network_id}",
-            retry_rules=retry_rules,
-        )
-
-    def delete_sbm_server_network(self, server_id, network_id):
-        return self.api_helper.make_delete_request(
-            path=f"/hosts/sbm_servers/{server_id}/networks/{network_id}",
-            body=None,
-            query_parameters=None,
-            good_codes=[202],
-        )
-
-    def post_sbm_server_private_ipv4_network(
-        self, server_id, mask, distribution_method=None
-    ):
-        body = {"mask": mask}
-        if distribution_method:
-            body["distribution_method"] = distribution_method
-        return self.api_helper.make_post_request(
-            path=f"/hosts/sbm_servers/{server_id}/networks/private_ipv4",
-            body=body,
-            query_parameters=None,
-            good_codes=[202],
-        )
-
-    def list_hosts(self, type=None, search_pattern=None, label_selector=None):
-        query = {}
-        if type:
-            query["type"] = type
-        if search_pattern:
-            query["search_pattern"] = search_pattern
-        if label_selector:
-            query["label_selector"] = label_selector
-
-        return self.api_helper.make_multipage_request(
-            path="/hosts", query_parameters=query
-        )
-
-    def post_dedicated_server_reinstall(
-        self,
-        server_id,
-        hostname,
-        operating_system_id,
-        ssh_key_fingerprints,
-        drives,
-        user_data,
-    ):
-        body = {
-            "hostname": hostname,
-            "operating_system_id": operating_system_id,
-            "ssh_key_fingerprints": ssh_key_fingerprints,
-            "drives": drives,
-        }
-        if user_data:
-            body["user_data"] = user_data
-        return self.api_helper.make_post_request(
-            path=f"/hosts/dedicated_servers/{server_id}/reinstall",
-            body=body,
-            query_parameters=None,
-            good_codes=[202],
-        )
-
-    def list_ssh_keys(self, label_selector=None):
-        query = {}
-        if label_selector:
-            query["label_selector"] = label_selector
-        return self.api_helper.make_multipage_request(
-            "/ssh_keys", query_parameters=query
-        )
-
-    def post_ssh_keys(self, name, public_key, labels=None):
-        body = {
-            "name": name,
-            "public_key": public_key,
-        }
-        if labels:
-            body["labels"] = labels
-        return self.api_helper.make_post_request(
-            path="/ssh_keys",
-            body=body,
-            query_parameters=None,
-            # query_parameters={"name": name, "public_key": public_key},
-            good_codes=[201],
-        )
-
-    def delete_ssh_keys(self, fingerprint):
-        return self.api_helper.make_delete_request(
-            path=f"/ssh_keys/{fingerprint}",
-            body=None,
-            query_parameters=None,
-            good_codes=[204],
-        )
-
-    def get_instances(self, instance_id, retry_rules=None):
-        return self.api_helper.make_get_request(
-            path=f"/cloud_computing/instances/{instance_id}",
-            retry_rules=retry_rules,
-        )
-
-    def get_credentials(self, region_id):
-        return self.api_helper.make_get_request(
-            path=f"/cloud_computing/regions/{region_id}/credentials"
-        )
-
-    def list_flavors(self, region_id):
-        return self.api_helper.make_multipage_request(
-            path=f"/cloud_computing/regions/{region_id}/flavors"
-        )
-
-    def list_images(self, region_id):
-        return self.api_helper.make_multipage_request(
-            path=f"/cloud_computing/regions/{region_id}/images"
-        )
-
-    def list_instances(self, region_id=None, label_selector=None):
-        query = {}
-        if region_id:
-            query["region_id"] = region_id
-        if label_selector:
-            query["label_selector"] = label_selector
-
-        return self.api_helper.make_multipage_request(
-            path="/cloud_computing/instances", query_parameters=query
-        )
-
-    def post_instances_reinstall(self, instance_id, image_id):
-        return self.api_helper.make_post_request(
-            path=f"/cloud_computing/instances/{instance_id}/reinstall",
-            body=None,
-            query_parameters={"image_id": image_id},
-            good_codes=[202],
-        )
+        next_url = response.links.get("next", {}).get("url")
+        if not next_url:
+            return []
+        parsed = urlparse(next_url)
+        query = parse_qs(parsed.query)
+        try:
+            next_page = int(query["page"][0])
+        except (KeyError, ValueError):
+            return None
+        last_page = None
+        last_url = response.links.get("last", {}).get("url")
+        if last_url:
+            try:
+                last_page = int(parse_qs(urlparse(last_url).query)["page"][0])
+            except (KeyError, ValueError):
+                last_page = None
+        if last_page is None:
+            total = response.headers.get("X-Total-Count")
+            try:
+                per_page = int(query["per_page"][0])
+                last_page = -(-int(total) // per_page)
+            except (KeyError, TypeError, ValueError, ZeroDivisionError):
+                return None
+        urls = []
+        for page in range(next_page, last_page + 1):
+            query["page"] = [str(page)]
+            urls.append(urlunparse(parsed._replace(query=urlencode(query, doseq=True))))
+        return urls
 
-    def post_instance(
+    def send_get_request(
         self,
-        region_id,
-        name,
-        flavor_id,
-        image_id,
-        gpn_enabled,
-        ipv6_enabled,
-        ipv4_enabled,
-        ssh_key_fingerprint,
-        backup_copies,
-        user_data,
-        labels,
+        url,
+        query_parameters=None,
+        retry_rules=None,
+        start=None,
+        stream=False,
+        sensitive=False,
     ):
-        body = {
-            "region_id": region_id,
-            "name": name,
-            "flavor_id": flavor_id,
-            "image_id": image_id,
-        }
-        if gpn_enabled:
-            body["gpn_enabled"] = True
-        if not ipv4_enabled:
-            body["ipv4_enabled"] = False
-        if ipv6_enabled:
-            body["ipv6_enabled"] = True
-        if ssh_key_fingerprint:
-            body["ssh_key_fingerprint"] = ssh_key_fingerprint
-        if backup_copies is not None:
-            body["backup_copies"] = backup_copies
-        if user_data:
-            body["user_data"] = user_data
-        if labels:
-            body["labels"] = labels
-        return self.api_helper.make_post_request(
-            path="/cloud_computing/instances",
-            body=body,
-            query_parameters=None,
-            good_codes=[202],
-        )
-
-    def delete_instance(self, instance_id):
-        return self.api_helper.make_delete_request(
-            path=f"/cloud_computing/instances/{instance_id}",
-            query_parameters=None,
-            body=None,
-            good_codes=[202],
-        )
-
-    def list_instance_ptr_records(self, instance_id):
-        return self.api_helper.make_multipage_request(
-            path=f"/cloud_computing/instances/{instance_id}/ptr_records"
-        )
-
-    def delete_instance_ptr_records(self, instance_id, record_id):
-        return self.api_helper.make_delete_request(
-            path=f"/cloud_computing/instances/{instance_id}/ptr_records/{record_id}",  # noqa
-            body=None,
-            query_parameters=None,
-            good_codes=[204],
-        )
-
-    def post_instance_ptr_records(self, instance_id, data, ip, ttl=None, priority=None):
-        query_parameters = {
-            "data": data,
-            "ip": ip,
-        }
-        if ttl is not None:
-            query_parameters["ttl"] = ttl
-        if priority is not None:
-            query_parameters["priority"] = priority
-        return self.api_helper.make_post_request(
-            path=f"/cloud_computing/instances/{instance_id}/ptr_records",
-            query_parameters=query_parameters,
-            body=None,
-            good_codes=[201],
-        )
-
-    def post_instance_switch_on(self, instance_id):
-        return self.api_helper.make_post_request(
-            path=f"/cloud_computing/instances/{instance_id}/switch_on",
-            body=None,
-            query_parameters=None,
-            good_codes=[202],
-        )
-
-    def post_instance_switch_off(self, instance_id):
-        return self.api_helper.make_post_request(
-            path=f"/cloud_computing/instances/{instance_id}/switch_off",
-            body=None,
-            query_parameters=None,
-            good_codes=[202],
-        )
-
-    def post_instance_rescue(self, instance_id, image_id=None):
-        if image_id:
-            body = {"image_id": image_id}
-        else:
-            body = None
-        return self.api_helper.make_post_request(
-            path=f"/cloud_computing/instances/{instance_id}/rescue",
-            body=body,
-            query_parameters=None,
-            good_codes=[202],
-        )
-
-    def post_instance_unrescue(self, instance_id):
-        return self.api_helper.make_post_request(
-            path=f"/cloud_computing/instances/{instance_id}/unrescue",
-            body=None,
-            query_parameters=None,
-            good_codes=[202],
-        )
-
-    def post_instance_reboot(self, instance_id):
-        return self.api_helper.make_post_request(
-            path=f"/cloud_computing/instances/{instance_id}/reboot",
-            body=None,
-            query_parameters=None,
-            good_codes=[202],
-        )
-
-    def post_instances_approve_upgrade(self, instance_id):
-        return self.api_helper.make_post_request(
-            path=f"/cloud_computing/instances/{instance_id}/approve_upgrade",
-            body=None,
-            query_parameters=None,
-            good_codes=[201],
-        )
-
-    def post_instances_revert_upgrade(self, instance_id):
-        return self.api_helper.make_post_request(
-            path=f"/cloud_computing/instances/{instance_id}/revert_upgrade",
-            body=None,
-            query_parameters=None,
-            good_codes=[201],
-        )
-
-    def list_l2_segments(self, label_selector=None):
-        query = {}
-        if label_selector:
-            query["label_selector"] = label_selector
-        return self.api_helper.make_multipage_request(
-            path="/l2_segments", query_parameters=query
-        )
-
-    def list_l2_location_groups(self):
-        return self.api_helper.make_multipage_request(
-            path="/l2_segments/location_groups"
-        )
-
-    def list_l2_segment_members(self, l2_segment_id):
-        return self.api_helper.make_multipage_request(
-            path=f"/l2_segments/{l2_segment_id}/members"
-        )
-
-    def list_l2_segment_networks(self, l2_segment_id):
-        return self.api_helper.make_multipage_request(
-            path=f"/l2_segments/{l2_segment_id}/networks"
-        )
-
-    def put_l2_segment_networks(self, l2_segment_id, create, delete):
-        '''create: object: mask (int), distribution_method: must be "route"'''
-        body = {"create": create, "delete": delete}
-        response = self.api_helper.make_put_request(
-            path=f"/l2_segments/{l2_segment_id}/networks",
-            query_parameters=None,
-            body=body,
-            good_codes=[200, 202],
-        )[1]
-        return response
-
-    def get_l2_segment(self, l2_segment_id, retry_rules=None):
-        return self.api_helper.make_get_request(
-            path=f"/l2_segments/{l2_segment_id}",
-            retry_rules=retry_rules,
-        )
-
-    def get_l2_segment_or_none(self, l2_segment_id, retry_rules=None):
-        try:
-            seg = self.api_helper.make_get_request(
-                path=f"/l2_segments/{l2_segment_id}",
-                retry_rules=retry_rules,
+        """Send a single GET request, retrying according to retry_rules.
+
+        See send_retrying; start is when the first attempt was made
+        (by default, of this request; wait loops pass the first page's),
+        retries stop max_wait seconds after it.
+
+        Builds its own request, so it's safe to call from several threads.
+        With stream, the body is left to be read by decode_items.
+        If the URL was fetched before with an ETag or Last-Modified, the
+        request is conditional, and a 304 answer is turned into a 200
+        response with the stored body (see revalidate.py). Streamed
+        responses aren't stored: that would read the whole body first.
+        Sensitive ones are kept in memory only, even with revalidate=disk.
+        """
+        request = self.requests.Request("GET", url, params=query_parameters)
+        entry = None
+        if self.validators is not None:
+            url = request.prepare().url
+            entry = self.validators.get(url)
+            if entry is not None:
+                request.headers.update(self.validators.conditional_headers(entry))
+        response = self.send_retrying(
+            request,
+            [200, 304] if entry else [200],
+            retry_rules,
+            start,
+            stream,
+        )
+        return self.revalidated(
+            url, entry, response, store=not stream, disk=not sensitive
+        )
+
+    def revalidated(self, url, entry, response, store=True, disk=True):
+        """Return response, or the stored one if it is a 304; store new validators.
+
+        The stored body is decoded again by the caller rather than handed
+        out as already decoded objects, because callers modify what they
+        get and json.loads is cheaper than a deep copy.
+        """
+        if response.status_code == 304:
+            response.close()
+            return self.build_response(
+                response.request,
+                200,
+                self.validators.merged_headers(entry, response),
+                response.url,
+                entry["content"],
             )
-        except APIError404:
-            seg = {"id": None}
-        return seg
-
-    def delete_l2_segment(self, l2_segment_id):
-        return self.api_helper.make_delete_request(
-            path=f"/l2_segments/{l2_segment_id}",
-            query_parameters=None,
-            body=None,
-            good_codes=[202, 204],
-        )
-
-    def post_l2_segment(self, name, type, location_group_id, members, labels=None):
-        body = {
-            "name": name,
-            "members": members,
-            "type": type,
-            "location_group_id": location_group_id,
-        }
-        if labels:
-            body["labels"] = labels
-
-        return self.api_helper.make_post_request(
-            path="/l2_segments/",
-            body=body,
-            query_parameters=None,
-            good_codes=[200, 202],
-        )
-
-    def put_l2_segment_update(self, l2_segment_id, members, labels=None):
-        body = {"members": members}
-        if labels:
-            body["labels"] = labels
-
-        response = self.api_helper.make_put_request(
-            path=f"/l2_segments/{l2_segment_id}",
-            body=body,
-            query_parameters=None,
-            good_codes=[200, 202],
-        )[1]
+        if store and self.validators is not None:
+            self.validators.store(url, response, disk=disk)
         return response
 
-    def list_load_balancer_instances(self, label_selector=None, retry_rules=None):
-        query = {}
-        if label_selector:
-            query["label_selector"] = label_selector
-        return self.api_helper.make_multipage_request(
-            path="/load_balancers",
-            query_parameters=query,
-            retry_rules=retry_rules,
-        )
+    def make_multipage_request(self, path, query_parameters=None, retry_rules=None):
+        """Used for GET request with expected pagination. Returns iterator.
 
-    def get_lb_instance(self, instance_id, lb_instance_type, retry_rules=None):
-        return self.api_helper.make_get_request(
-            path=f"/load_balancers/{lb_instance_type}/{instance_id}",
-            retry_rules=retry_rules,
-        )
+        The first page is fetched as usual. If the API tells how many
+        pages there are, the rest are fetched by a pool of
+        prefetch_workers threads, and items are still yielded in page order.
+        Otherwise, ``next`` links are followed one page at a time.
 
-    def delete_lb_instance(self, instance_id, lb_instance_type):
-        return self.api_helper.make_delete_request(
-            path=f"/load_balancers/{lb_instance_type}/{instance_id}",
-            query_parameters=None,
-            body=None,
-            good_codes=[204],
-        )
+        Unless query_parameters already has ``per_page``, page_size
+        is requested, so listings take as few pages as possible.
 
-    def lb_instance_l4_create(
-        self,
-        name,
-        location_id,
-        cluster_id,
-        store_logs,
-        store_logs_region_id,
-        shared_cluster,
-        vhost_zones,
-        upstream_zones,
-        labels,
-    ):
-        body = {
-            "name": name,
-            "location_id": location_id,
-            "vhost_zones": vhost_zones,
-            "upstream_zones": upstream_zones,
-        }
-        if cluster_id is not None:
-            body["cluster_id"] = cluster_id
-        body["store_logs"] = store_logs
-        if store_logs_region_id is not None:
-            body["store_logs_region_id"] = store_logs_region_id
-        if shared_cluster is not None:
-            body["shared_cluster"] = shared_cluster
-        if labels:
-            body["labels"] = labels
-
-        return self.api_helper.make_post_request(
-            path="/load_balancers/l4",
-            body=body,
-            query_parameters=None,
-            good_codes=[202],
-        )
-
-    def lb_instance_l4_update(
-        self,
-        lb_id,
-        name,
-        store_logs,
-        store_logs_region_id,
-        new_external_ips_count,
-        delete_external_ips,
-        cluster_id,
-        shared_cluster,
-        vhost_zones,
-        upstream_zones,
-        labels,
-    ):
-        body = {}
-        if name is not None:
-            body["name"] = name
-        if store_logs is not None:
-            body["store_logs"] = store_logs
-        if store_logs_region_id is not None:
-            body["store_logs_region_id"] = store_logs_region_id
-        if new_external_ips_count is not None:
-            body["new_external_ips_count"] = new_external_ips_count
-        if delete_external_ips is not None:
-            body["delete_external_ips"] = delete_external_ips
-        if cluster_id is not None:
-            body["cluster_id"] = cluster_id
-        if shared_cluster is not None:
-            body["shared_cluster"] = shared_cluster
-        if vhost_zones is not None:
-            body["vhost_zones"] = vhost_zones
-        if upstream_zones is not None:
-            body["upstream_zones"] = upstream_zones
-        if labels is not None:
-            body["labels"] = labels
-
-        return self.api_helper.make_put_request(
-            path=f"/load_balancers/l4/{lb_id}",
-            body=body,
-            query_parameters=None,
-            good_codes=[200, 202],
-        )
+        Pages fetched one at a time are decoded while they are read from
+        the socket (see decode_items) and not stored for revalidation;
+        prefetched pages are read whole by their threads (and stored),
+        but still decoded item by item.
+        """
+        # Wait loops pass retry_rules with the time they have left, which
+        # covers the whole listing; otherwise every page gets its own
+        # retry clock, so a long listing can still retry a late page.
+        start = time.time() if retry_rules else None
+        if self.page_size and "per_page" not in (query_parameters or {}):
+            query_parameters = dict(query_parameters or {}, per_page=self.page_size)
+        response = self.send_get_request(
+            self.make_url(path), query_parameters, retry_rules, start, stream=True
+        )
+        yield from self.decode_items(response)
+        urls = self.page_urls(response)
+        if urls is not None and self.prefetch_workers > 1:
+            yield from self._prefetch_pages(urls, retry_rules, start)
+            return
+        next_url = response.links.get("next", {}).get("url")
+        while next_url:
+            response = self.send_get_request(
+                next_url, None, retry_rules, start, stream=True
+            )
+            yield from self.decode_items(response)
+            next_url = response.links.get("next", {}).get("url")
 
-    def lb_instance_l7_create(
-        self,
-        name,
-        location_id,
-        cluster_id,
-        store_logs,
-        store_logs_region_id,
-        shared_cluster,
-        geoip,
-        vhost_zones,
-        upstream_zones,
-        labels,
-    ):
-        body = {
-            "name": name,
-            "location_id": location_id,
-            "vhost_zones": vhost_zones,
-            "upstream_zones": upstream_zones,
-        }
-        if cluster_id is not None:
-            body["cluster_id"] = cluster_id
-        body["store_logs"] = store_logs
-        if store_logs_region_id is not None:
-            body["store_logs_region_id"] = store_logs_region_id
-        if shared_cluster is not None:
-            body["shared_cluster"] = shared_cluster
-        if geoip is not None:
-            body["geoip"] = geoip
-        if labels:
-            body["labels"] = labels
-
-        return self.api_helper.make_post_request(
-            path="/load_balancers/l7",
-            body=body,
-            query_parameters=None,
-            good_codes=[202],
-        )
+    def make_cached_request(self, resource, path, query_parameters=None):
+        """Same as make_multipage_request, but for reference data.
 
-    def lb_instance_l7_update(
-        self,
-        lb_id,
-        name,
-        store_logs,
-        store_logs_region_id,
-        geoip,
-        new_external_ips_count,
-        delete_external_ips,
-        cluster_id,
-        shared_cluster,
-        vhost_zones,
-        upstream_zones,
-        labels,
-    ):
-        body = {}
-        if name is not None:
-            body["name"] = name
-        if store_logs is not None:
-            body["store_logs"] = store_logs
-        if store_logs_region_id is not None:
-            body["store_logs_region_id"] = store_logs_region_id
-        if geoip is not None:
-            body["geoip"] = geoip
-        if new_external_ips_count is not None:
-            body["new_external_ips_count"] = new_external_ips_count
-        if delete_external_ips is not None:
-            body["delete_external_ips"] = delete_external_ips
-        if cluster_id is not None:
-            body["cluster_id"] = cluster_id
-        if shared_cluster is not None:
-            body["shared_cluster"] = shared_cluster
-        if vhost_zones is not None:
-            body["vhost_zones"] = vhost_zones
-        if upstream_zones is not None:
-            body["upstream_zones"] = upstream_zones
-        if labels is not None:
-            body["labels"] = labels
-
-        return self.api_helper.make_put_request(
-            path=f"/load_balancers/l7/{lb_id}",
-            body=body,
-            query_parameters=None,
-            good_codes=[200, 202],
+        The whole listing is kept in the on-disk cache (see cache.py)
+        for the resource's TTL.
+        """
+        yield from self.cache.get(
+            resource,
+            path,
+            query_parameters,
+            lambda: self.make_multipage_request(path, query_parameters),
         )
 
-    def post_dedicated_server_power_on(self, server_id):
-        return self.api_helper.make_post_request(
-            path=f"/hosts/dedicated_servers/{server_id}/power_on",
-            body=None,
-            query_parameters=None,
-            good_codes=[202],
-        )
+    def _prefetch_pages(self, urls, retry_rules, start):
+        if not urls:
+            return
+        # pylint: disable=bad-option-value, import-outside-toplevel
+        from concurrent.futures import ThreadPoolExecutor
 
-    def post_dedicated_server_power_off(self, server_id):
-        return self.api_helper.make_post_request(
-            path=f"/hosts/dedicated_servers/{server_id}/power_off",
-            body=None,
-            query_parameters=None,
-            good_codes=[202],
+        executor = ThreadPoolExecutor(max_workers=self.prefetch_workers)
+        urls = iter(urls)
+        # Keep a bounded window of pages in flight, so a slow consumer
+        # doesn't make us hold the whole listing in memory.
+        pending = deque(
+            executor.submit(self.send_get_request, url, None, retry_rules, start)
+            for url in islice(urls, self.prefetch_workers * 2)
         )
+        try:
+            while pending:
+                response = pending.popleft().result()
+                url = next(urls, None)
+                if url is not None:
+                    pending.append(
+                        executor.submit(self.send_get_request, url, None, retry_rules, start)
+                    )
+                yield from self.decode_items(response)
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
 
-    def get_dedicated_server_features(self, server_id, retry_rules=None):
-        return self.api_helper.make_get_request(
-            path=f"/hosts/dedicated_servers/{server_id}/features",
-            retry_rules=retry_rules,
-        )
 
-    def post_dedicated_server_feature_activate(
-        self, server_id, feature_name, body=None
-    ):
-        return self.api_helper.make_post_request(
-            path=f"/hosts/dedicated_servers/{server_id}/features/{feature_name}/activate",
-            body=body,
-            query_parameters=None,
-            good_codes=[202],
-        )
+class ScApiToolbox:
+    """Additional functions to work with API.
 
-    def post_dedicated_server_feature_deactivate(self, server_id, feature_name):
-        return self.api_helper.make_post_request(
-            path=f"/hosts/dedicated_servers/{server_id}/features/{feature_name}/deactivate",
-            body=None,
-            query_parameters=None,
-            good_codes=[202],
-        )
+    Lookups which need a resource mixin live in a subclass next to it
+    (api_cloud.CloudToolbox); a client picks one with toolbox_class.
+    """
 
-    def put_dedicated_server(self, server_id, body):
-        return self.api_helper.make_put_request(
-            path=f"/hosts/dedicated_servers/{server_id}",
-            body=body,
-            query_parameters=None,
-            good_codes=[200],
-        )
+    def __init__(self, api):
+        self.api = api
 
-    def post_dedicated_server_rescue_activate(
-        self, server_id, auth_methods, ssh_key_fingerprints=None
-    ):
-        body = {"auth_methods": auth_methods}
-        if ssh_key_fingerprints:
-            body["ssh_key_fingerprints"] = ssh_key_fingerprints
-        return self.api_helper.make_post_request(
-            path=f"/hosts/dedicated_servers/{server_id}/features/host_rescue_mode/activate",
-            body=body,
-            query_parameters=None,
-            good_codes=[202],
-        )
+    def find_by_name(self, kind, name, search, get, match=None, name_key="name"):
+        """Return the list of kind objects called name.
+
+        search: callable returning a listing narrowed down by the API
+            (search_pattern, label_selector, ...); names are compared
+            exactly here.
+        get: callable fetching a single object by ID.
+        match: optional callable for additional conditions (region, type).
+
+        The ID of a single match is kept in the name index of the on-disk
+        cache. The next lookup of that name is one GET which checks that
+        the object still exists and has this name; otherwise the listing
+        is used again. An object with the same name created elsewhere
+        after that is not noticed, so modules which create or delete
+        objects update the index with remember_name and forget_name.
+        """
 
-    def post_dedicated_server_rescue_deactivate(self, server_id):
-        return self.api_helper.make_post_request(
-            path=f"/hosts/dedicated_servers/{server_id}/features/host_rescue_mode/deactivate",
-            body=None,
-            query_parameters=None,
-            good_codes=[202],
-        )
+        def wanted(obj):
+            return obj.get(name_key) == name and (match is None or match(obj))
 
-    def list_server_models(self, location_id, search_pattern=None):
-        if search_pattern:
-            query = {"search_pattern": search_pattern}
-        else:
-            query = None
-        return self.api_helper.make_multipage_request(
-            path=f"/locations/{location_id}/order_options/server_models",
-            query_parameters=query,
-        )
+        cache = self.api.api_helper.cache
+        obj_id = cache.lookup_name(kind, name)
+        if obj_id:
+            try:
+                obj = get(obj_id)
+            except APIError404:
+                obj = None
+            if obj and wanted(obj):
+                return [obj]
+        found = [obj for obj in search() if wanted(obj)]
+        if len(found) == 1:
+            cache.update_index(kind, name, found[0]["id"])
+        elif obj_id:
+            cache.update_index(kind, name, forget=True)
+        return found
 
-    def list_sbm_flavor_models(self, location_id, search_pattern=None):
-        if search_pattern:
-            query = {"search_pattern": search_pattern}
-        else:
-            query = None
-        return self.api_helper.make_multipage_request(
-            path=f"/locations/{location_id}/order_options/sbm_flavor_models",
-            query_parameters=query,
-        )
+    def remember_name(self, kind, name, obj_id):
+        """Add an object created by the module to the name index."""
+        if name and obj_id:
+            self.api.api_helper.cache.update_index(kind, name, obj_id)
 
-    def list_os_images_by_model_id(self, location_id, model_id):
-        return self.api_helper.make_multipage_request(
-            path=f"/locations/{location_id}/order_options/server_models/{model_id}/operating_systems",
-            query_parameters=None,
-        )
+    def forget_name(self, kind, name=None, obj_id=None):
+        """Drop a deleted object from the name index."""
+        self.api.api_helper.cache.update_index(kind, name, obj_id, forget=True)
 
-    def list_os_images_by_sbm_flavor_id(self, location_id, sbm_flavor_id):
-        return self.api_helper.make_multipage_request(
-            path=f"/locations/{location_id}/order_options/sbm_flavor_models/{sbm_flavor_id}/operating_systems",
-            query_parameters=None,
-        )
+    def get_ssh_fingerprints_by_key_name(self, ssh_key_name, must=False):
+        """Search for registered ssh key by name and return it's
+        fingerprints or return None if nothing found."""
+        for key in self.api.list_ssh_keys():
+            if key["name"] == ssh_key_name:
+                return key["fingerprint"]
+        if must:
+            raise ToolboxError(f"Unable to find registered ssh key {ssh_key_name}")
 
-    def list_rbs_flavors(self, location_id):
-        return self.api_helper.make_multipage_request(
-            path=f"/locations/{location_id}/order_options/remote_block_storage/flavors",
-            query_parameters=None,
-        )
 
-    def list_rbs_volumes(
-        self, label_selector=None, search_pattern=None, location_id=None
-    ):
-        query = None
-        if any([label_selector, search_pattern, location_id]):
-            query = {}
-            if label_selector:
-                query["label_selector"] = label_selector
-            if search_pattern:
-                query["search_pattern"] = search_pattern
-            if location_id:
-                query["location_id"] = location_id
-
-        return self.api_helper.make_multipage_request(
-            path="/remote_block_storage/volumes", query_parameters=query
-        )
+# naming convention for the API methods in the mixins:
+# Prefixes:
+# list_ -> returns interator over paginatated response.
+# get_ -> returns single object
+# post_ -> make post request for a single object (update/create/change)
+# delete_ -> make delete request for a single object
+# Suffixes:
+# Last element of the path (except for the path parameter)
+# if there is no collision, more path pieces if there are collisions.
+# Arguments:
+# 'as is' in the API if possible.
 
-    def get_rbs_volume(self, rbs_volume_id, retry_rules=None):
-        return self.api_helper.make_get_request(
-            path=f"/remote_block_storage/volumes/{rbs_volume_id}",
-            retry_rules=retry_rules,
-        )
 
-    def get_rbs_volume_by_name(self, name):
-        try:
-            candidates = self.list_rbs_volumes(search_pattern=name)
-            for candidate in candidates:
-                if candidate["name"] == name:
-                    return candidate
-        except APIError404:
-            return None
-        return None
+class ScApiBase:
+    """Client for Servers.com Public API without the API methods.
 
-    def create_rbs_volume(self, name, flavor_id, size, location_id, labels=None):
-        body = {
-            "name": name,
-            "flavor_id": flavor_id,
-            "size": size,
-            "location_id": location_id,
-        }
-        if labels:
-            body["labels"] = labels
-        return self.api_helper.make_post_request(
-            path="/remote_block_storage/volumes",
-            body=body,
-            query_parameters=None,
-            good_codes=[202],
-        )
+    Methods matching the API are grouped by resource in mixins
+    (api_hosts.HostsApi, api_sbm.SbmApi, api_cloud.CloudApi, ...).
+    Each module_utils file combines this class with the mixins it
+    needs, so a module ships and imports only those:
 
-    def update_rbs_volume(self, rbs_volume_id, name=None, size=None, labels=None):
-        body = None
-        if any([name, size, labels]):
-            body = {}
-            if name is not None:
-                body["name"] = name
-            if size is not None:
-                body["size"] = size
-            if labels is not None:
-                body["labels"] = labels
-
-        return self.api_helper.make_put_request(
-            path=f"/remote_block_storage/volumes/{rbs_volume_id}",
-            body=body,
-            query_parameters=None,
-            good_codes=[200, 202],
-        )
+        class ScSshKeyApi(ScApiBase, SshKeysApi):
+            pass
 
-    def delete_rbs_volume(self, rbs_volume_id):
-        return self.api_helper.make_delete_request(
-            path=f"/remote_block_storage/volumes/{rbs_volume_id}",
-            body=None,
-            query_parameters=None,
-            good_codes=[204],
-        )
+    api_client.ScApi has every mixin.
+    """
 
-    def get_rbs_volume_credentials(self, rbs_volume_id, retry_rules=None):
-        return self.api_helper.make_get_request(
-            path=f"/remote_block_storage/volumes/{rbs_volume_id}/credentials",
-            retry_rules=retry_rules,
-        )
+    toolbox_class = ScApiToolbox
 
-    def reset_rbs_volume_credentials(self, rbs_volume_id):
-        return self.api_helper.make_post_request(
-            path=f"/remote_block_storage/volumes/{rbs_volume_id}/reset_credentials",
-            body=None,
-            query_parameters=None,
-            good_codes=[202],
+    def __init__(
+        self, token, endpoint=DEFAULT_API_ENDPOINT, page_size=None, retry_policy=None
+    ):
+        self.api_helper = ApiHelper(
+            token, endpoint, page_size=page_size, retry_policy=retry_policy
         )
+        self.toolbox = self.toolbox_class(self)
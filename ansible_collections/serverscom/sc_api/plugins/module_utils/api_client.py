@@ -0,0 +1,53 @@
+from __future__ import absolute_import, division, print_function
+
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    ScApiBase,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_cloud import (
+    CloudApi,
+    CloudToolbox,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_hosts import (
+    HostsApi,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_l2 import (
+    L2Api,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_lb import (
+    LoadBalancerApi,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_locations import (
+    LocationsApi,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_rbs import (
+    RbsApi,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_sbm import (
+    SbmApi,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_ssh_keys import (
+    SshKeysApi,
+)
+
+
+__metaclass__ = type
+
+
+# Modules use smaller clients with just the mixins they need (see
+# api.ScApiBase); these are for the inventory plugin, scripts and tests.
+
+
+class ScApi(
+    ScApiBase,
+    LocationsApi,
+    HostsApi,
+    SbmApi,
+    CloudApi,
+    L2Api,
+    LoadBalancerApi,
+    RbsApi,
+    SshKeysApi,
+):
+    """Provide functions matching Servers.com Public API."""
+
+    toolbox_class = CloudToolbox
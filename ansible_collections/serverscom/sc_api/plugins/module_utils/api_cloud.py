@@ -0,0 +1,293 @@
+from __future__ import absolute_import, division, print_function
+import re
+
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    APIError404,
+    ScApiToolbox,
+    ToolboxError,
+)
+
+
+__metaclass__ = type
+
+
+class CloudApi:
+    """Cloud computing regions and instances (/cloud_computing)."""
+
+    def list_regions(self):
+        return self.api_helper.make_cached_request(
+            "cloud_regions", "/cloud_computing/regions"
+        )
+
+    def get_instances(self, instance_id, retry_rules=None):
+        return self.api_helper.make_get_request(
+            path=f"/cloud_computing/instances/{instance_id}",
+            retry_rules=retry_rules,
+        )
+
+    def get_credentials(self, region_id):
+        return self.api_helper.make_get_request(
+            path=f"/cloud_computing/regions/{region_id}/credentials", sensitive=True
+        )
+
+    def list_flavors(self, region_id):
+        return self.api_helper.make_cached_request(
+            "cloud_flavors", path=f"/cloud_computing/regions/{region_id}/flavors"
+        )
+
+    def list_images(self, region_id):
+        return self.api_helper.make_cached_request(
+            "cloud_images", path=f"/cloud_computing/regions/{region_id}/images"
+        )
+
+    def list_instances(self, region_id=None, label_selector=None, search_pattern=None):
+        query = {}
+        if region_id:
+            query["region_id"] = region_id
+        if label_selector:
+            query["label_selector"] = label_selector
+        if search_pattern:
+            query["search_pattern"] = search_pattern
+
+        return self.api_helper.make_multipage_request(
+            path="/cloud_computing/instances", query_parameters=query
+        )
+
+    def post_instances_reinstall(self, instance_id, image_id):
+        return self.api_helper.make_post_request(
+            path=f"/cloud_computing/instances/{instance_id}/reinstall",
+            body=None,
+            query_parameters={"image_id": image_id},
+            good_codes=[202],
+        )
+
+    def post_instance(
+        self,
+        region_id,
+        name,
+        flavor_id,
+        image_id,
+        gpn_enabled,
+        ipv6_enabled,
+        ipv4_enabled,
+        ssh_key_fingerprint,
+        backup_copies,
+        user_data,
+        labels,
+    ):
+        body = {
+            "region_id": region_id,
+            "name": name,
+            "flavor_id": flavor_id,
+            "image_id": image_id,
+        }
+        if gpn_enabled:
+            body["gpn_enabled"] = True
+        if not ipv4_enabled:
+            body["ipv4_enabled"] = False
+        if ipv6_enabled:
+            body["ipv6_enabled"] = True
+        if ssh_key_fingerprint:
+            body["ssh_key_fingerprint"] = ssh_key_fingerprint
+        if backup_copies is not None:
+            body["backup_copies"] = backup_copies
+        if user_data:
+            body["user_data"] = user_data
+        if labels:
+            body["labels"] = labels
+        return self.api_helper.make_post_request(
+            path="/cloud_computing/instances",
+            body=body,
+            query_parameters=None,
+            good_codes=[202],
+        )
+
+    def delete_instance(self, instance_id):
+        return self.api_helper.make_delete_request(
+            path=f"/cloud_computing/instances/{instance_id}",
+            query_parameters=None,
+            body=None,
+            good_codes=[202],
+        )
+
+    def list_instance_ptr_records(self, instance_id):
+        return self.api_helper.make_multipage_request(
+            path=f"/cloud_computing/instances/{instance_id}/ptr_records"
+        )
+
+    def delete_instance_ptr_records(self, instance_id, record_id):
+        return self.api_helper.make_delete_request(
+            path=f"/cloud_computing/instances/{instance_id}/ptr_records/{record_id}",  # noqa
+            body=None,
+            query_parameters=None,
+            good_codes=[204],
+        )
+
+    def post_instance_ptr_records(self, instance_id, data, ip, ttl=None, priority=None):
+        query_parameters = {
+            "data": data,
+            "ip": ip,
+        }
+        if ttl is not None:
+            query_parameters["ttl"] = ttl
+        if priority is not None:
+            query_parameters["priority"] = priority
+        return self.api_helper.make_post_request(
+            path=f"/cloud_computing/instances/{instance_id}/ptr_records",
+            query_parameters=query_parameters,
+            body=None,
+            good_codes=[201],
+        )
+
+    def post_instance_switch_on(self, instance_id):
+        return self.api_helper.make_post_request(
+            path=f"/cloud_computing/instances/{instance_id}/switch_on",
+            body=None,
+            query_parameters=None,
+            good_codes=[202],
+        )
+
+    def post_instance_switch_off(self, instance_id):
+        return self.api_helper.make_post_request(
+            path=f"/cloud_computing/instances/{instance_id}/switch_off",
+            body=None,
+            query_parameters=None,
+            good_codes=[202],
+        )
+
+    def post_instance_rescue(self, instance_id, image_id=None):
+        if image_id:
+            body = {"image_id": image_id}
+        else:
+            body = None
+        return self.api_helper.make_post_request(
+            path=f"/cloud_computing/instances/{instance_id}/rescue",
+            body=body,
+            query_parameters=None,
+            good_codes=[202],
+        )
+
+    def post_instance_unrescue(self, instance_id):
+        return self.api_helper.make_post_request(
+            path=f"/cloud_computing/instances/{instance_id}/unrescue",
+            body=None,
+            query_parameters=None,
+            good_codes=[202],
+        )
+
+    def post_instance_reboot(self, instance_id):
+        return self.api_helper.make_post_request(
+            path=f"/cloud_computing/instances/{instance_id}/reboot",
+            body=None,
+            query_parameters=None,
+            good_codes=[202],
+        )
+
+    def post_instances_approve_upgrade(self, instance_id):
+        return self.api_helper.make_post_request(
+            path=f"/cloud_computing/instances/{instance_id}/approve_upgrade",
+            body=None,
+            query_parameters=None,
+            good_codes=[201],
+        )
+
+    def post_instances_revert_upgrade(self, instance_id):
+        return self.api_helper.make_post_request(
+            path=f"/cloud_computing/instances/{instance_id}/revert_upgrade",
+            body=None,
+            query_parameters=None,
+            good_codes=[201],
+        )
+
+
+class CloudToolbox(ScApiToolbox):
+    """ScApiToolbox with lookups of cloud images, flavors and instances.
+
+    For clients with CloudApi:
+
+        class ScCloudComputingApi(ScApiBase, CloudApi):
+            toolbox_class = CloudToolbox
+    """
+
+    def find_cloud_image_id_by_name_regexp(self, regexp, region_id=None, must=False):
+        for image in self.api.list_images(region_id):
+            if re.match(regexp, image["name"]):
+                return image["id"]
+        if must:
+            raise ToolboxError(f"Unable to find image by regexp {regexp}")
+
+    def find_image_id(self, image_id, image_regexp, region_id=None, must=False):
+        if image_id and image_regexp:
+            raise ToolboxError("Both image_id and image_regexp specified.")
+        if image_id:
+            return image_id
+        if image_regexp:
+            return self.find_cloud_image_id_by_name_regexp(
+                image_regexp, region_id, must=must
+            )
+        raise ToolboxError("No image_id and no image_regexp specified.")
+
+    def find_cloud_flavor_id_by_name(self, flavor_name, region_id=None, must=False):
+        """Search flavor by exact name match.
+
+        Returns flavor_id if found, or None if not found."""
+        for flavor in self.api.list_flavors(region_id):
+            if flavor["name"] == flavor_name:
+                return flavor["id"]
+        if must:
+            raise ToolboxError(f"Unable to find flavor by name {flavor_name}")
+
+    def find_cloud_instance_id_by_name(self, name, region_id=None, must=False):
+        found = self.find_by_name(
+            "cloud_instances",
+            name,
+            search=lambda: self.api.list_instances(region_id, search_pattern=name),
+            get=self.api.get_instances,
+            match=lambda instance: not region_id
+            or instance["region_id"] == region_id,
+        )
+        if len(found) > 1:
+            raise ToolboxError(f"Multiple instances found with name {name}")
+        if len(found) == 1:
+            return found[0]
+        if must:
+            raise ToolboxError(f"Unable to find instance by name {name}")
+
+    def find_instance(self, instance_id, instance_name, region_id=None, must=False):
+        """Search instance either by id, or by name (and region).
+
+        Returns instance object, raises an exception if nothing
+        found (and must=True), or return None (if must=False).
+        Raises an exception if multiple instances found with the
+        same name.
+        """
+        if instance_id and instance_name:
+            raise ToolboxError("Both instance_id and instance_name are specified.")
+        if not instance_id and not instance_name:
+            raise ToolboxError("Neither instance_id nor instance_name specified.")
+        if instance_id:
+            try:
+                return self.api.get_instances(instance_id)
+            except APIError404:
+                if must:
+                    raise
+                return None
+        if instance_name:
+            return self.find_cloud_instance_id_by_name(instance_name, must=must)
+
+    def find_flavor_id(self, flavor_id, flavor_name, region_id=None):
+        """Search for flavor by id or by name.
+
+        Returns flavor id, by id or by name.
+        Raises an exception if nothing found.
+        """
+        if flavor_id and flavor_name:
+            raise ToolboxError("Both flavor_id and flavor_name specified.")
+
+        if not flavor_id and not flavor_name:
+            raise ToolboxError("Neither flavor_id nor flavor_name specified.")
+        if flavor_id:
+            return flavor_id
+        return self.find_cloud_flavor_id_by_name(
+            flavor_name=flavor_name, region_id=region_id, must=True
+        )
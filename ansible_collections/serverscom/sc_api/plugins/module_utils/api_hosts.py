@@ -0,0 +1,122 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+
+class HostsApi:
+    """Dedicated servers and the list of all hosts (/hosts)."""
+
+    def get_dedicated_servers(self, server_id, retry_rules=None):
+        return self.api_helper.make_get_request(
+            path=f"/hosts/dedicated_servers/{server_id}",
+            retry_rules=retry_rules,
+        )
+
+    def list_hosts(
+        self, type=None, search_pattern=None, label_selector=None, retry_rules=None
+    ):
+        query = {}
+        if type:
+            query["type"] = type
+        if search_pattern:
+            query["search_pattern"] = search_pattern
+        if label_selector:
+            query["label_selector"] = label_selector
+
+        return self.api_helper.make_multipage_request(
+            path="/hosts", query_parameters=query, retry_rules=retry_rules
+        )
+
+    def post_dedicated_server_reinstall(
+        self,
+        server_id,
+        hostname,
+        operating_system_id,
+        ssh_key_fingerprints,
+        drives,
+        user_data,
+    ):
+        body = {
+            "hostname": hostname,
+            "operating_system_id": operating_system_id,
+            "ssh_key_fingerprints": ssh_key_fingerprints,
+            "drives": drives,
+        }
+        if user_data:
+            body["user_data"] = user_data
+        return self.api_helper.make_post_request(
+            path=f"/hosts/dedicated_servers/{server_id}/reinstall",
+            body=body,
+            query_parameters=None,
+            good_codes=[202],
+        )
+
+    def post_dedicated_server_power_on(self, server_id):
+        return self.api_helper.make_post_request(
+            path=f"/hosts/dedicated_servers/{server_id}/power_on",
+            body=None,
+            query_parameters=None,
+            good_codes=[202],
+        )
+
+    def post_dedicated_server_power_off(self, server_id):
+        return self.api_helper.make_post_request(
+            path=f"/hosts/dedicated_servers/{server_id}/power_off",
+            body=None,
+            query_parameters=None,
+            good_codes=[202],
+        )
+
+    def get_dedicated_server_features(self, server_id, retry_rules=None):
+        return self.api_helper.make_get_request(
+            path=f"/hosts/dedicated_servers/{server_id}/features",
+            retry_rules=retry_rules,
+        )
+
+    def post_dedicated_server_feature_activate(
+        self, server_id, feature_name, body=None
+    ):
+        return self.api_helper.make_post_request(
+            path=f"/hosts/dedicated_servers/{server_id}/features/{feature_name}/activate",
+            body=body,
+            query_parameters=None,
+            good_codes=[202],
+        )
+
+    def post_dedicated_server_feature_deactivate(self, server_id, feature_name):
+        return self.api_helper.make_post_request(
+            path=f"/hosts/dedicated_servers/{server_id}/features/{feature_name}/deactivate",
+            body=None,
+            query_parameters=None,
+            good_codes=[202],
+        )
+
+    def put_dedicated_server(self, server_id, body):
+        return self.api_helper.make_put_request(
+            path=f"/hosts/dedicated_servers/{server_id}",
+            body=body,
+            query_parameters=None,
+            good_codes=[200],
+        )
+
+    def post_dedicated_server_rescue_activate(
+        self, server_id, auth_methods, ssh_key_fingerprints=None
+    ):
+        body = {"auth_methods": auth_methods}
+        if ssh_key_fingerprints:
+            body["ssh_key_fingerprints"] = ssh_key_fingerprints
+        return self.api_helper.make_post_request(
+            path=f"/hosts/dedicated_servers/{server_id}/features/host_rescue_mode/activate",
+            body=body,
+            query_parameters=None,
+            good_codes=[202],
+        )
+
+    def post_dedicated_server_rescue_deactivate(self, server_id):
+        return self.api_helper.make_post_request(
+            path=f"/hosts/dedicated_servers/{server_id}/features/host_rescue_mode/deactivate",
+            body=None,
+            query_parameters=None,
+            good_codes=[202],
+        )
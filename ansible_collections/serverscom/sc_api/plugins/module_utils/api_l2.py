@@ -0,0 +1,102 @@
+from __future__ import absolute_import, division, print_function
+
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    APIError404,
+)
+
+
+__metaclass__ = type
+
+
+class L2Api:
+    """L2 segments (/l2_segments)."""
+
+    def list_l2_segments(self, label_selector=None, search_pattern=None):
+        query = {}
+        if label_selector:
+            query["label_selector"] = label_selector
+        if search_pattern:
+            query["search_pattern"] = search_pattern
+        return self.api_helper.make_multipage_request(
+            path="/l2_segments", query_parameters=query
+        )
+
+    def list_l2_location_groups(self):
+        return self.api_helper.make_multipage_request(
+            path="/l2_segments/location_groups"
+        )
+
+    def list_l2_segment_members(self, l2_segment_id):
+        return self.api_helper.make_multipage_request(
+            path=f"/l2_segments/{l2_segment_id}/members"
+        )
+
+    def list_l2_segment_networks(self, l2_segment_id):
+        return self.api_helper.make_multipage_request(
+            path=f"/l2_segments/{l2_segment_id}/networks"
+        )
+
+    def put_l2_segment_networks(self, l2_segment_id, create, delete):
+        '''create: object: mask (int), distribution_method: must be "route"'''
+        body = {"create": create, "delete": delete}
+        response = self.api_helper.make_put_request(
+            path=f"/l2_segments/{l2_segment_id}/networks",
+            query_parameters=None,
+            body=body,
+            good_codes=[200, 202],
+        )[1]
+        return response
+
+    def get_l2_segment(self, l2_segment_id, retry_rules=None):
+        return self.api_helper.make_get_request(
+            path=f"/l2_segments/{l2_segment_id}",
+            retry_rules=retry_rules,
+        )
+
+    def get_l2_segment_or_none(self, l2_segment_id, retry_rules=None):
+        try:
+            seg = self.api_helper.make_get_request(
+                path=f"/l2_segments/{l2_segment_id}",
+                retry_rules=retry_rules,
+            )
+        except APIError404:
+            seg = {"id": None}
+        return seg
+
+    def delete_l2_segment(self, l2_segment_id):
+        return self.api_helper.make_delete_request(
+            path=f"/l2_segments/{l2_segment_id}",
+            query_parameters=None,
+            body=None,
+            good_codes=[202, 204],
+        )
+
+    def post_l2_segment(self, name, type, location_group_id, members, labels=None):
+        body = {
+            "name": name,
+            "members": members,
+            "type": type,
+            "location_group_id": location_group_id,
+        }
+        if labels:
+            body["labels"] = labels
+
+        return self.api_helper.make_post_request(
+            path="/l2_segments/",
+            body=body,
+            query_parameters=None,
+            good_codes=[200, 202],
+        )
+
+    def put_l2_segment_update(self, l2_segment_id, members, labels=None):
+        body = {"members": members}
+        if labels:
+            body["labels"] = labels
+
+        response = self.api_helper.make_put_request(
+            path=f"/l2_segments/{l2_segment_id}",
+            body=body,
+            query_parameters=None,
+            good_codes=[200, 202],
+        )[1]
+        return response
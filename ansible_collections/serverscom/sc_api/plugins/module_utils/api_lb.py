@@ -0,0 +1,194 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+
+class LoadBalancerApi:
+    """Load balancers (/load_balancers)."""
+
+    def list_load_balancer_instances(self, label_selector=None, retry_rules=None):
+        query = {}
+        if label_selector:
+            query["label_selector"] = label_selector
+        return self.api_helper.make_multipage_request(
+            path="/load_balancers",
+            query_parameters=query,
+            retry_rules=retry_rules,
+        )
+
+    def get_lb_instance(self, instance_id, lb_instance_type, retry_rules=None):
+        return self.api_helper.make_get_request(
+            path=f"/load_balancers/{lb_instance_type}/{instance_id}",
+            retry_rules=retry_rules,
+        )
+
+    def delete_lb_instance(self, instance_id, lb_instance_type):
+        return self.api_helper.make_delete_request(
+            path=f"/load_balancers/{lb_instance_type}/{instance_id}",
+            query_parameters=None,
+            body=None,
+            good_codes=[204],
+        )
+
+    def lb_instance_l4_create(
+        self,
+        name,
+        location_id,
+        cluster_id,
+        store_logs,
+        store_logs_region_id,
+        shared_cluster,
+        vhost_zones,
+        upstream_zones,
+        labels,
+    ):
+        body = {
+            "name": name,
+            "location_id": location_id,
+            "vhost_zones": vhost_zones,
+            "upstream_zones": upstream_zones,
+        }
+        if cluster_id is not None:
+            body["cluster_id"] = cluster_id
+        body["store_logs"] = store_logs
+        if store_logs_region_id is not None:
+            body["store_logs_region_id"] = store_logs_region_id
+        if shared_cluster is not None:
+            body["shared_cluster"] = shared_cluster
+        if labels:
+            body["labels"] = labels
+
+        return self.api_helper.make_post_request(
+            path="/load_balancers/l4",
+            body=body,
+            query_parameters=None,
+            good_codes=[202],
+        )
+
+    def lb_instance_l4_update(
+        self,
+        lb_id,
+        name,
+        store_logs,
+        store_logs_region_id,
+        new_external_ips_count,
+        delete_external_ips,
+        cluster_id,
+        shared_cluster,
+        vhost_zones,
+        upstream_zones,
+        labels,
+    ):
+        body = {}
+        if name is not None:
+            body["name"] = name
+        if store_logs is not None:
+            body["store_logs"] = store_logs
+        if store_logs_region_id is not None:
+            body["store_logs_region_id"] = store_logs_region_id
+        if new_external_ips_count is not None:
+            body["new_external_ips_count"] = new_external_ips_count
+        if delete_external_ips is not None:
+            body["delete_external_ips"] = delete_external_ips
+        if cluster_id is not None:
+            body["cluster_id"] = cluster_id
+        if shared_cluster is not None:
+            body["shared_cluster"] = shared_cluster
+        if vhost_zones is not None:
+            body["vhost_zones"] = vhost_zones
+        if upstream_zones is not None:
+            body["upstream_zones"] = upstream_zones
+        if labels is not None:
+            body["labels"] = labels
+
+        return self.api_helper.make_put_request(
+            path=f"/load_balancers/l4/{lb_id}",
+            body=body,
+            query_parameters=None,
+            good_codes=[200, 202],
+        )
+
+    def lb_instance_l7_create(
+        self,
+        name,
+        location_id,
+        cluster_id,
+        store_logs,
+        store_logs_region_id,
+        shared_cluster,
+        geoip,
+        vhost_zones,
+        upstream_zones,
+        labels,
+    ):
+        body = {
+            "name": name,
+            "location_id": location_id,
+            "vhost_zones": vhost_zones,
+            "upstream_zones": upstream_zones,
+        }
+        if cluster_id is not None:
+            body["cluster_id"] = cluster_id
+        body["store_logs"] = store_logs
+        if store_logs_region_id is not None:
+            body["store_logs_region_id"] = store_logs_region_id
+        if shared_cluster is not None:
+            body["shared_cluster"] = shared_cluster
+        if geoip is not None:
+            body["geoip"] = geoip
+        if labels:
+            body["labels"] = labels
+
+        return self.api_helper.make_post_request(
+            path="/load_balancers/l7",
+            body=body,
+            query_parameters=None,
+            good_codes=[202],
+        )
+
+    def lb_instance_l7_update(
+        self,
+        lb_id,
+        name,
+        store_logs,
+        store_logs_region_id,
+        geoip,
+        new_external_ips_count,
+        delete_external_ips,
+        cluster_id,
+        shared_cluster,
+        vhost_zones,
+        upstream_zones,
+        labels,
+    ):
+        body = {}
+        if name is not None:
+            body["name"] = name
+        if store_logs is not None:
+            body["store_logs"] = store_logs
+        if store_logs_region_id is not None:
+            body["store_logs_region_id"] = store_logs_region_id
+        if geoip is not None:
+            body["geoip"] = geoip
+        if new_external_ips_count is not None:
+            body["new_external_ips_count"] = new_external_ips_count
+        if delete_external_ips is not None:
+            body["delete_external_ips"] = delete_external_ips
+        if cluster_id is not None:
+            body["cluster_id"] = cluster_id
+        if shared_cluster is not None:
+            body["shared_cluster"] = shared_cluster
+        if vhost_zones is not None:
+            body["vhost_zones"] = vhost_zones
+        if upstream_zones is not None:
+            body["upstream_zones"] = upstream_zones
+        if labels is not None:
+            body["labels"] = labels
+
+        return self.api_helper.make_put_request(
+            path=f"/load_balancers/l7/{lb_id}",
+            body=body,
+            query_parameters=None,
+            good_codes=[200, 202],
+        )
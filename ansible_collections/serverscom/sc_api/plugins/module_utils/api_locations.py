@@ -0,0 +1,53 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+
+class LocationsApi:
+    """Locations and what can be ordered in them (/locations)."""
+
+    def list_locations(self, search_pattern=None):
+        if search_pattern:
+            query = {"search_pattern": search_pattern}
+        else:
+            query = None
+        return self.api_helper.make_cached_request(
+            "locations", path="/locations", query_parameters=query
+        )
+
+    def list_server_models(self, location_id, search_pattern=None):
+        if search_pattern:
+            query = {"search_pattern": search_pattern}
+        else:
+            query = None
+        return self.api_helper.make_cached_request(
+            "server_models",
+            path=f"/locations/{location_id}/order_options/server_models",
+            query_parameters=query,
+        )
+
+    def list_sbm_flavor_models(self, location_id, search_pattern=None):
+        if search_pattern:
+            query = {"search_pattern": search_pattern}
+        else:
+            query = None
+        return self.api_helper.make_cached_request(
+            "sbm_flavor_models",
+            path=f"/locations/{location_id}/order_options/sbm_flavor_models",
+            query_parameters=query,
+        )
+
+    def list_os_images_by_model_id(self, location_id, model_id):
+        return self.api_helper.make_cached_request(
+            "operating_systems",
+            path=f"/locations/{location_id}/order_options/server_models/{model_id}/operating_systems",
+            query_parameters=None,
+        )
+
+    def list_os_images_by_sbm_flavor_id(self, location_id, sbm_flavor_id):
+        return self.api_helper.make_cached_request(
+            "operating_systems",
+            path=f"/locations/{location_id}/order_options/sbm_flavor_models/{sbm_flavor_id}/operating_systems",
+            query_parameters=None,
+        )
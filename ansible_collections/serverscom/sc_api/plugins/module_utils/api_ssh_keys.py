@@ -0,0 +1,39 @@
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+
+class SshKeysApi:
+    """SSH keys (/ssh_keys)."""
+
+    def list_ssh_keys(self, label_selector=None):
+        query = {}
+        if label_selector:
+            query["label_selector"] = label_selector
+        return self.api_helper.make_multipage_request(
+            "/ssh_keys", query_parameters=query
+        )
+
+    def post_ssh_keys(self, name, public_key, labels=None):
+        body = {
+            "name": name,
+            "public_key": public_key,
+        }
+        if labels:
+            body["labels"] = labels
+        return self.api_helper.make_post_request(
+            path="/ssh_keys",
+            body=body,
+            query_parameters=None,
+            # query_parameters={"name": name, "public_key": public_key},
+            good_codes=[201],
+        )
+
+    def delete_ssh_keys(self, fingerprint):
+        return self.api_helper.make_delete_request(
+            path=f"/ssh_keys/{fingerprint}",
+            body=None,
+            query_parameters=None,
+            good_codes=[204],
+        )
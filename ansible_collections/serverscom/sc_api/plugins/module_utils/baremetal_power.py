@@ -0,0 +1,291 @@
+from __future__ import absolute_import, division, print_function
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    APIError,
+    APIError409,
+    ScApiBase,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_hosts import (
+    HostsApi,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_sbm import (
+    SbmApi,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
+    ModuleError,
+    PartialFailureError,
+    Poller,
+)
+
+
+__metaclass__ = type
+
+
+# Server types with power management.
+POWER_SERVER_TYPES = ("dedicated_server", "sbm_server")
+POWER_TRANSITIONAL = ("powering_on", "powering_off", "power_cycling")
+DEFAULT_POWER_CONCURRENCY = 10
+
+# 409 with this code means power management is busy for the server
+# and the request can be repeated later.
+_CONFLICT_RE = re.compile(r'"code"\s*:\s*"CONFLICT"')
+
+
+class ScBaremetalPowerApi(ScApiBase, HostsApi, SbmApi):
+    """The part of the API used by baremetal_power_bulk."""
+
+
+class ScBaremetalPowerBulk:
+    """Power on/off/cycle many dedicated and SBM servers.
+
+    Power requests are sent concurrently, and at most concurrency servers
+    are in transition at once, so state=cycle is a rolling restart.
+    All transitions are watched in one loop which lists hosts once per
+    poll instead of requesting every server. A request refused with
+    409 CONFLICT is repeated on the next poll.
+
+    The API may report the old power_status for a while after a request,
+    so an SBM server being cycled is powered_on before the cycle starts.
+    A step is done only after the status changed or update_interval has
+    passed since the request.
+
+    When more than max_failures servers fail, no more servers are
+    started (the rest are reported as skipped) and run() raises
+    PartialFailureError after the servers in transition are done.
+    """
+
+    def __init__(
+        self,
+        endpoint,
+        token,
+        state,
+        server_ids=None,
+        label_selector=None,
+        server_type=None,
+        concurrency=DEFAULT_POWER_CONCURRENCY,
+        max_failures=0,
+        wait=600,
+        update_interval=10,
+        checkmode=False,
+    ):
+        if bool(server_ids) == bool(label_selector):
+            raise ModuleError("Exactly one of server_ids or label_selector is required.")
+        if concurrency < 1:
+            raise ModuleError("concurrency should be at least 1.")
+        if max_failures < 0:
+            raise ModuleError("max_failures should not be negative.")
+        if wait and update_interval > wait:
+            raise ModuleError(
+                f"Update interval ({update_interval}) is longer than wait time ({wait})"
+            )
+        self.api = ScBaremetalPowerApi(token, endpoint)
+        self.state = state
+        self.server_ids = list(dict.fromkeys(server_ids or []))
+        self.label_selector = label_selector
+        self.server_type = server_type
+        self.concurrency = concurrency
+        self.max_failures = max_failures
+        self.wait = wait
+        self.update_interval = update_interval
+        self.checkmode = checkmode
+        self.results = {}
+        self.failures = 0
+        self.poller = None
+        self.requested = {}  # server ID -> (elapsed at request, old status)
+
+    def list_hosts(self, retry_rules=None):
+        """Return servers with power management, by ID."""
+        return {
+            host["id"]: host
+            for host in self.api.list_hosts(
+                type=self.server_type,
+                label_selector=self.label_selector,
+                retry_rules=retry_rules,
+            )
+            if host["type"] in POWER_SERVER_TYPES
+        }
+
+    def steps(self, host):
+        """Return (action, target power_status) pairs to reach the state."""
+        status = host.get("power_status")
+        if self.state == "on":
+            return [] if status == "powered_on" else [("power_on", "powered_on")]
+        if self.state == "off":
+            return [] if status == "powered_off" else [("power_off", "powered_off")]
+        if host["type"] == "sbm_server":
+            return [("power_cycle", "powered_on")]
+        # there is no power_cycle for dedicated servers
+        return [("power_off", "powered_off"), ("power_on", "powered_on")]
+
+    def select(self, hosts):
+        """Fill self.results and return steps for servers to change."""
+        todo = {}
+        for server_id in self.server_ids or hosts:
+            host = hosts.get(server_id)
+            if host is None:
+                self.results[server_id] = {"id": server_id, "changed": False}
+                self.fail(server_id, f"Server {server_id} not found.")
+                continue
+            self.results[server_id] = {
+                "id": server_id,
+                "title": host.get("title"),
+                "type": host["type"],
+                "power_status": host.get("power_status"),
+                "changed": False,
+                "result": "unchanged",
+            }
+            steps = self.steps(host)
+            if len(steps) > 1 and not self.wait:
+                self.fail(server_id, "Power cycle of a dedicated server needs wait.")
+            elif steps:
+                todo[server_id] = steps
+        return todo
+
+    def fail(self, server_id, msg):
+        self.results[server_id].update(result="failed", msg=msg)
+        self.failures += 1
+
+    def request(self, server_id, action):
+        """Send the power request; return None, 'conflict' or an error message."""
+        if self.results[server_id]["type"] == "sbm_server":
+            send = {
+                "power_on": self.api.post_sbm_server_power_on,
+                "power_off": self.api.post_sbm_server_power_off,
+                "power_cycle": self.api.post_sbm_server_power_cycle,
+            }[action]
+        else:
+            send = {
+                "power_on": self.api.post_dedicated_server_power_on,
+                "power_off": self.api.post_dedicated_server_power_off,
+            }[action]
+        try:
+            send(server_id)
+        except APIError409 as e:
+            if _CONFLICT_RE.search(e.msg):
+                return "conflict"
+            return e.msg
+        except APIError as e:
+            return e.msg
+        return None
+
+    def send(self, executor, active, server_ids):
+        """Send the next action for server_ids; return IDs to resend."""
+        resend = []
+        outcomes = executor.map(
+            lambda server_id: self.request(server_id, active[server_id][0][0]),
+            server_ids,
+        )
+        for server_id, outcome in zip(server_ids, outcomes):
+            if outcome is None:
+                self.results[server_id].update(changed=True, result="changed")
+                if self.wait:
+                    self.requested[server_id] = (
+                        self.poller.elapsed(),
+                        self.results[server_id]["power_status"],
+                    )
+                else:
+                    active[server_id].popleft()
+                    if not active[server_id]:
+                        del active[server_id]
+            elif outcome == "conflict" and self.wait:
+                resend.append(server_id)
+            else:
+                if outcome == "conflict":
+                    outcome = "Power management is busy (409 CONFLICT)."
+                self.fail(server_id, outcome)
+                del active[server_id]
+        return resend
+
+    def check(self, active, server_id, host):
+        """Update the server from the listing; return True to send the next action."""
+        action, target_status = active[server_id][0]
+        if host is None:
+            self.fail(server_id, f"Server disappeared while waiting for power_status={target_status}.")
+            del active[server_id]
+            return False
+        status = host.get("power_status")
+        self.results[server_id]["power_status"] = status
+        requested = self.requested.get(server_id)
+        if requested is not None:
+            requested_at, old_status = requested
+            if (
+                status == old_status
+                and self.poller.elapsed() - requested_at < self.update_interval
+            ):
+                return False  # the request isn't applied yet
+            del self.requested[server_id]
+        if status == target_status:
+            active[server_id].popleft()
+            if active[server_id]:
+                return True
+            del active[server_id]
+        elif status not in POWER_TRANSITIONAL:
+            self.fail(
+                server_id, f"Unexpected power_status={status}, expected {target_status}"
+            )
+            del active[server_id]
+        return False
+
+    def track(self, todo):
+        """Start servers from todo and wait for them, in one loop."""
+        todo = deque(todo.items())
+        active = {}  # server ID -> remaining steps
+        to_send = []
+        poller = self.poller = Poller(self.wait, self.update_interval)
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while True:
+                while (
+                    todo
+                    and len(active) < self.concurrency
+                    and self.failures <= self.max_failures
+                ):
+                    server_id, steps = todo.popleft()
+                    active[server_id] = deque(steps)
+                    to_send.append(server_id)
+                to_send = self.send(executor, active, to_send)
+                if not active and not (todo and self.failures <= self.max_failures):
+                    break
+                if not self.wait:
+                    continue
+                if not poller.sleep():
+                    for server_id, steps in active.items():
+                        self.fail(
+                            server_id,
+                            f"Timeout waiting for power_status={steps[0][1]}, "
+                            f"last={self.results[server_id]['power_status']}",
+                        )
+                    break
+                hosts = self.list_hosts(poller.retry_rules())
+                for server_id in list(active):
+                    if server_id not in to_send and self.check(
+                        active, server_id, hosts.get(server_id)
+                    ):
+                        to_send.append(server_id)
+        for server_id, _steps in todo:
+            self.results[server_id].update(
+                result="skipped", msg="Not started: too many servers failed."
+            )
+
+    def run(self):
+        todo = self.select(self.list_hosts())
+        if self.checkmode:
+            for server_id in todo:
+                self.results[server_id].update(changed=True, result="changed")
+        else:
+            self.track(todo)
+        servers = list(self.results.values())
+        result = {
+            "changed": any(server["changed"] for server in servers),
+            "servers": servers,
+            "failed_count": self.failures,
+        }
+        if self.failures > self.max_failures:
+            raise PartialFailureError(
+                f"{self.failures} of {len(servers)} servers failed "
+                f"(max_failures={self.max_failures}).",
+                result,
+            )
+        return result
@@ -0,0 +1,179 @@
+from __future__ import absolute_import, division, print_function
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+try:
+    import fcntl
+except ImportError:  # not a POSIX system, go without locking
+    fcntl = None
+
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (  # noqa: F401
+    CACHE_BYPASS,
+    CACHE_MODES,
+    CACHE_REFRESH,
+    CACHE_USE,
+    default_cache_dir,
+)
+
+
+__metaclass__ = type
+
+
+# How long (in seconds) a cached catalog is considered fresh.
+CACHE_TTLS = {
+    "locations": 86400,
+    "cloud_regions": 86400,
+    "cloud_flavors": 3600,
+    "cloud_images": 600,
+    "server_models": 3600,
+    "sbm_flavor_models": 3600,
+    "operating_systems": 3600,
+    "rbs_flavors": 3600,
+    # name -> id index (see ReferenceCache.lookup_name); hits are checked
+    # with a GET, so entries may live long.
+    "name_index": 7 * 86400,
+}
+
+
+class ReferenceCache:
+    """File-backed cache for reference data (locations, flavors, images, ...).
+
+    Every entry is a JSON file named after a hash of the token, endpoint,
+    path and query, so different accounts never share entries. Files are
+    written atomically (temporary file + rename) and filling an entry is
+    done under an exclusive lock, so parallel forks asking for the same
+    catalog make a single API call between them.
+
+    mode:
+        use: return fresh entries, fetch and store missing or stale ones.
+        refresh: always fetch and store.
+        bypass: neither read nor write the cache.
+    """
+
+    def __init__(self, token, endpoint, mode=CACHE_USE, cache_dir=None, ttls=None):
+        self.mode = mode
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.ttls = dict(CACHE_TTLS, **(ttls or {}))
+        self.account = hashlib.sha256(f"{endpoint}\0{token}".encode()).hexdigest()
+
+    def key(self, path, query_parameters=None):
+        query = json.dumps(query_parameters or {}, sort_keys=True)
+        data = f"{self.account}\0{path}\0{query}".encode()
+        return hashlib.sha256(data).hexdigest()
+
+    def entry_path(self, key):
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def read(self, key, ttl):
+        """Return cached items for key, or None if missing or stale."""
+        try:
+            with open(self.entry_path(key), encoding="utf-8") as f:
+                entry = json.load(f)
+            age = time.time() - entry["fetched_at"]
+            items = entry["items"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if not 0 <= age < ttl or not isinstance(items, list):
+            return None
+        return items
+
+    def write(self, key, items):
+        """Store items atomically. Failing to store is not an error."""
+        tmp_name = None
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"fetched_at": time.time(), "items": items}, f)
+            os.replace(tmp_name, self.entry_path(key))
+            tmp_name = None
+        except OSError:
+            pass
+        finally:
+            if tmp_name:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+    def lock(self, key):
+        """Return an open lock file for key (exclusively locked), or None."""
+        if fcntl is None:
+            return None
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            lock_file = open(os.path.join(self.cache_dir, key + ".lock"), "a")
+        except OSError:
+            return None
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        return lock_file
+
+    def index_key(self, kind):
+        return self.key(f"name_index/{kind}")
+
+    def lookup_name(self, kind, name):
+        """Return the indexed ID of the kind object called name, or None.
+
+        The index is only read in the 'use' mode.
+        """
+        if self.mode != CACHE_USE:
+            return None
+        for entry in self.read(self.index_key(kind), self.ttls["name_index"]) or []:
+            if isinstance(entry, dict) and entry.get("name") == name:
+                return entry.get("id")
+        return None
+
+    def update_index(self, kind, name=None, obj_id=None, forget=False):
+        """Record name -> obj_id in the name index of kind.
+
+        forget=True drops entries for name and/or obj_id instead.
+        Does nothing in the 'bypass' mode.
+        """
+        if self.mode == CACHE_BYPASS:
+            return
+        key = self.index_key(kind)
+        lock_file = self.lock(key)
+        try:
+            entries = [
+                entry
+                for entry in self.read(key, self.ttls["name_index"]) or []
+                if isinstance(entry, dict)
+                and entry.get("name") != name
+                and (obj_id is None or entry.get("id") != obj_id)
+            ]
+            if not forget:
+                entries.append({"name": name, "id": obj_id})
+            self.write(key, entries)
+        finally:
+            if lock_file:
+                lock_file.close()
+
+    def get(self, resource, path, query_parameters, fetch):
+        """Return a list of items for path, using the cache according to mode.
+
+        fetch: callable returning an iterable of items from the API.
+        """
+        if self.mode == CACHE_BYPASS:
+            return list(fetch())
+        key = self.key(path, query_parameters)
+        ttl = self.ttls[resource]
+        if self.mode == CACHE_USE:
+            items = self.read(key, ttl)
+            if items is not None:
+                return items
+        lock_file = self.lock(key)
+        try:
+            if self.mode == CACHE_USE:
+                # someone may have filled it while we were waiting for the lock
+                items = self.read(key, ttl)
+                if items is not None:
+                    return items
+            items = list(fetch())
+            self.write(key, items)
+            return items
+        finally:
+            if lock_file:
+                lock_file.close()
@@ -4,24 +4,43 @@ import time
 from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
     APIError404,
     APIError409,
-    ScApi,
+    ScApiBase,
+    tracer,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_cloud import (
+    CloudApi,
+    CloudToolbox,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_ssh_keys import (
+    SshKeysApi,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     ModuleError,
     WaitError,
     CHANGED,
     NOT_CHANGED,
-    _retry_rules_for_wait,
+    Poller,
+    wait_until_gone,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    Projection,
 )
 
 
 __metaclass__ = type
 
 
+class ScCloudComputingApi(ScApiBase, CloudApi, SshKeysApi):
+    """The part of the API used by cloud computing modules."""
+
+    toolbox_class = CloudToolbox
+
+
 class ScCloudComputingRegionsInfo(object):
-    def __init__(self, endpoint, token, search_pattern):
+    def __init__(self, endpoint, token, search_pattern, projection=None):
         self.search_pattern = search_pattern
-        self.api = ScApi(token, endpoint)
+        self.api = ScCloudComputingApi(token, endpoint)
+        self.projection = projection or Projection()
 
     @staticmethod
     def location_features(location):
@@ -49,65 +68,78 @@ class ScCloudComputingRegionsInfo(object):
 
     def run(self):
         ret_data = {"changed": False}
-        ret_data["regions"] = list(self.search(self.regions()))
+        ret_data.update(self.projection.output("regions", self.search(self.regions())))
         return ret_data
 
 
 class ScCloudComputingFlavorsInfo:
-    def __init__(self, endpoint, token, region_id):
-        self.api = ScApi(token, endpoint)
+    def __init__(self, endpoint, token, region_id, projection=None):
+        self.api = ScCloudComputingApi(token, endpoint)
         self.region_id = region_id
+        self.projection = projection or Projection()
 
     def run(self):
         return {
             "changed": False,
-            "cloud_flavors": list(self.api.list_flavors(self.region_id)),
+            **self.projection.output("cloud_flavors", self.api.list_flavors(self.region_id)),
         }
 
 
 class ScCloudComputingImagesInfo:
-    def __init__(self, endpoint, token, region_id):
-        self.api = ScApi(token, endpoint)
+    def __init__(self, endpoint, token, region_id, projection=None):
+        self.api = ScCloudComputingApi(token, endpoint)
         self.region_id = region_id
+        self.projection = projection or Projection()
 
     def run(self):
         return {
             "changed": False,
-            "cloud_images": list(self.api.list_images(self.region_id)),
+            **self.projection.output("cloud_images", self.api.list_images(self.region_id)),
         }
 
 
 class ScCloudComputingInstancesInfo:
-    def __init__(self, endpoint, token, region_id, label_selector):
-        self.api = ScApi(token, endpoint)
+    def __init__(self, endpoint, token, region_id, label_selector, projection=None):
+        self.api = ScCloudComputingApi(token, endpoint)
         self.region_id = region_id
         self.label_selector = label_selector
+        self.projection = projection or Projection()
 
     def run(self):
         return {
             "changed": False,
-            "cloud_instances": list(
+            **self.projection.output(
+                "cloud_instances",
                 self.api.list_instances(self.region_id, self.label_selector)
             ),
         }
 
 
 class ScCloudComputingInstanceInfo:
-    def __init__(self, endpoint, token, instance_id, name, region_id):
-        self.api = ScApi(token, endpoint)
-        self.instance_id = self.api.toolbox.find_instance(
-            instance_id=instance_id, instance_name=name, region_id=region_id, must=True
-        )["id"]
+    def __init__(self, endpoint, token, instance_id, name, region_id, projection=None):
+        self.api = ScCloudComputingApi(token, endpoint)
+        self.instance_id = instance_id
+        self.name = name
+        self.region_id = region_id
+        self.projection = projection or Projection()
 
     def run(self):
-        result = self.api.get_instances(self.instance_id)
+        result = self.api.toolbox.find_instance(
+            instance_id=self.instance_id,
+            instance_name=self.name,
+            region_id=self.region_id,
+            must=True,
+        )
+        if not self.instance_id:  # found in the list, get the full object
+            result = self.api.get_instances(result["id"])
+        result = self.projection.one(result)
         result["changed"] = False
         return result
 
 
 class ScCloudComputingOpenstackCredentials:
     def __init__(self, endpoint, token, region_id):
-        self.api = ScApi(token, endpoint)
+        self.api = ScCloudComputingApi(token, endpoint)
         self.region_id = region_id
 
     def run(self):
@@ -140,7 +172,7 @@ class ScCloudComputingInstanceCreate:
         checkmode,
     ):
         self.checkmode = checkmode
-        self.api = ScApi(token, endpoint)
+        self.api = ScCloudComputingApi(token, endpoint)
         if region_id is None:
             raise ModuleError("region_id is mandatory for state=present.")
         self.region_id = region_id
@@ -148,16 +180,20 @@ class ScCloudComputingInstanceCreate:
             raise ModuleError("Name is mandatory for state=present.")
         self.name = name
         self.instance_id = None
-        self.flavor_id = self.get_flavor_id(flavor_id, flavor_name)
-        self.image_id = self.api.toolbox.find_image_id(
-            image_id=image_id, image_regexp=image_regexp, region_id=region_id, must=True
-        )
+        if flavor_id and flavor_name:
+            raise ModuleError("Both flavor_id and flavor_name are present.")
+        if not flavor_id and not flavor_name:
+            raise ModuleError("Need either flavor_id or flavor_name.")
+        # Names are resolved to IDs in run().
+        self.flavor_id = flavor_id
+        self.flavor_name = flavor_name
+        self.image_id = image_id
+        self.image_regexp = image_regexp
         self.gpn_enabled = gpn_enabled
         self.ipv4_enabled = ipv4_enabled
         self.ipv6_enabled = ipv6_enabled
-        self.ssh_key_fingerprint = self.get_ssh_key_fingerprint(
-            ssh_key_fingerprint, ssh_key_name
-        )
+        self.ssh_key_fingerprint = ssh_key_fingerprint
+        self.ssh_key_name = ssh_key_name
         self.backup_copies = backup_copies
         self.user_data = user_data
         self.labels = labels
@@ -176,10 +212,6 @@ class ScCloudComputingInstanceCreate:
         return None
 
     def get_flavor_id(self, flavor_id, flavor_name):
-        if flavor_id and flavor_name:
-            raise ModuleError("Both flavor_id and flavor_name are present.")
-        if not flavor_id and not flavor_name:
-            raise ModuleError("Need either flavor_id or flavor_name.")
         if flavor_name:
             flavor_id = self.api.toolbox.find_cloud_flavor_id_by_name(
                 flavor_name=flavor_name, region_id=self.region_id, must=True
@@ -200,37 +232,39 @@ class ScCloudComputingInstanceCreate:
             user_data=self.user_data,
             labels=self.labels,
         )
+        self.api.toolbox.remember_name("cloud_instances", self.name, instance["id"])
         return instance
 
     def wait_for(self, instance):
-        start_time = time.time()
+        poller = Poller(self.wait, self.update_interval)
         instance = self.api.get_instances(
-            instance["id"],
-            retry_rules=_retry_rules_for_wait(
-                max_wait=self.wait, delay=self.update_interval
-            ),
+            instance["id"], retry_rules=poller.retry_rules()
         )
         if not self.wait:
             return instance
         while instance["status"] != "ACTIVE":
-            time.sleep(self.update_interval)
-            elapsed = time.time() - start_time
-            if elapsed > self.wait:
+            if not poller.sleep():
                 raise WaitError(
                     msg=f"Timeout while waiting instance {instance['id']}"
                     f" to become ACTIVE. Last status was {instance['status']}",
-                    timeout=elapsed,
+                    timeout=poller.elapsed(),
                 )
             instance = self.api.get_instances(
-                instance["id"],
-                retry_rules=_retry_rules_for_wait(
-                    max_wait=max(0, self.wait - elapsed),
-                    delay=self.update_interval,
-                ),
+                instance["id"], retry_rules=poller.retry_rules()
             )
         return instance
 
     def run(self):
+        self.flavor_id = self.get_flavor_id(self.flavor_id, self.flavor_name)
+        self.image_id = self.api.toolbox.find_image_id(
+            image_id=self.image_id,
+            image_regexp=self.image_regexp,
+            region_id=self.region_id,
+            must=True,
+        )
+        self.ssh_key_fingerprint = self.get_ssh_key_fingerprint(
+            self.ssh_key_fingerprint, self.ssh_key_name
+        )
         instance = self.api.toolbox.find_instance(
             self.instance_id, self.name, self.region_id, must=False
         )
@@ -264,7 +298,7 @@ class ScCloudComputingInstanceDelete:
         checkmode,
     ):
         self.checkmode = checkmode
-        self.api = ScApi(token, endpoint)
+        self.api = ScCloudComputingApi(token, endpoint)
         self.region_id = region_id
         self.name = name
         self.instance_id = instance_id
@@ -276,50 +310,37 @@ class ScCloudComputingInstanceDelete:
         self.update_interval = update_interval
         self.retry_on_conflicts = retry_on_conflicts
 
-    def wait_for_disappearance(self):
-        start_time = time.time()
-        instance = self.api.toolbox.find_instance(
-            self.instance_id, self.name, self.region_id, must=False
+    def wait_for_disappearance(self, instance_id):
+        wait_until_gone(
+            lambda retry_rules: self.api.get_instances(
+                instance_id, retry_rules=retry_rules
+            ),
+            self.wait,
+            self.update_interval,
+            f"instance {instance_id}",
         )
-        while instance:
-            time.sleep(self.update_interval)
-            elapsed = time.time() - start_time
-            if elapsed > self.wait:
-                raise WaitError(
-                    msg=f"Timeout while waiting instance {instance['id']}"
-                    f" to disappear. Last status was {instance['status']}",
-                    timeout=elapsed,
-                )
-            instance = self.api.toolbox.find_instance(
-                self.instance_id, self.name, self.region_id, must=False
-            )
 
     def retry_to_delete(self, instance):
         # pylint: disable=bad-option-value, raise-missing-from
-        start_time = time.time()
-        while instance:
+        poller = Poller(self.wait, self.update_interval)
+        while True:
             try:
                 self.api.delete_instance(instance["id"])
-
+                return
             except APIError409:
                 if self.retry_on_conflicts:
-                    elapsed = time.time() - start_time
-                    if elapsed > self.wait:
+                    if not poller.sleep():
                         raise WaitError(
                             msg="Timeout retrying delete for"
                             f" instance {instance['id']}",
-                            timeout=elapsed,
+                            timeout=poller.elapsed(),
                         )
-                    time.sleep(self.update_interval)
                 else:
                     raise
             except APIError404:
                 # We expected to delete instance and it's gone
                 # == happy end
-                pass
-            instance = self.api.toolbox.find_instance(
-                self.instance_id, self.name, self.region_id, must=False
-            )
+                return
 
     def run(self):
         # pylint: disable=bad-option-value, raise-missing-from
@@ -335,8 +356,9 @@ class ScCloudComputingInstanceDelete:
                 "region_id": self.region_id,
             }
         if not self.checkmode:
-            instance = self.retry_to_delete(instance)
-            self.wait_for_disappearance()
+            self.retry_to_delete(instance)
+            self.api.toolbox.forget_name("cloud_instances", obj_id=instance["id"])
+            self.wait_for_disappearance(instance["id"])
         original_instance["changed"] = CHANGED
         return original_instance
 
@@ -356,7 +378,7 @@ class ScCloudComputingInstancePtr:
         priority,
         checkmode,
     ):
-        self.api = ScApi(token, endpoint)
+        self.api = ScCloudComputingApi(token, endpoint)
         self.state = state
         self.instance_id = instance_id
         self.name = name
@@ -435,11 +457,11 @@ class ScCloudComputingInstanceState:
         update_interval,
         checkmode,
     ):
-        self.api = ScApi(token, endpoint)
+        self.api = ScCloudComputingApi(token, endpoint)
         self.state = state
-        self.instance_id = self.api.toolbox.find_instance(
-            instance_id=instance_id, instance_name=name, region_id=region_id, must=True
-        )["id"]
+        self.instance_id = instance_id
+        self.name = name
+        self.region_id = region_id
         self.image_id = image_id
         self.image_regexp = image_regexp
         self.wait = wait
@@ -447,24 +469,19 @@ class ScCloudComputingInstanceState:
         self.checkmode = checkmode
 
     def wait_for_statuses(self, status_done, statuses_continue):
-        start_time = time.time()
+        poller = Poller(self.wait, self.update_interval)
         while self.instance["status"] not in statuses_continue + [status_done]:
             if not self.wait:
                 break
-            if time.time() > start_time + self.wait:
+            if not poller.sleep():
                 raise WaitError(
                     msg=f"Timeout waiting instance {self.instance['id']} "
                     f"status {status_done} or {statuses_continue}. "
                     f"Last state was {self.instance['status']}",
-                    timeout=time.time() - start_time,
+                    timeout=poller.elapsed(),
                 )
-            time.sleep(self.update_interval)
             self.instance = self.api.get_instances(
-                self.instance_id,
-                retry_rules=_retry_rules_for_wait(
-                    max_wait=max(0, self.wait - (time.time() - start_time)),
-                    delay=self.update_interval,
-                ),
+                self.instance_id, retry_rules=poller.retry_rules()
             )
         if self.instance["status"] == status_done:
             return True
@@ -477,7 +494,7 @@ class ScCloudComputingInstanceState:
                         msg=f"Timeout waiting instance {self.instance['id']} "
                         f"status {status_done}. "
                         f"Last state was {self.instance['status']}",
-                        timeout=time.time() - start_time,
+                        timeout=poller.elapsed(),
                     )
 
     def shutdown(self):
@@ -552,7 +569,15 @@ class ScCloudComputingInstanceState:
         return self.instance
 
     def run(self):
-        self.instance = self.api.get_instances(self.instance_id)
+        self.instance = self.api.toolbox.find_instance(
+            instance_id=self.instance_id,
+            instance_name=self.name,
+            region_id=self.region_id,
+            must=True,
+        )
+        if not self.instance_id:  # found in the list, get the full object
+            self.instance_id = self.instance["id"]
+            self.instance = self.api.get_instances(self.instance_id)
         if self.state == "shutdown":
             return self.shutdown()
         elif self.state == "rescue":
@@ -579,42 +604,37 @@ class ScCloudComputingInstanceReinstall:
         update_interval,
         checkmode,
     ):
-        self.api = ScApi(token, endpoint)
-        self.instance = self.api.toolbox.find_instance(
-            instance_id=instance_id, instance_name=name, region_id=region_id, must=True
-        )
-        if not image_id and not image_regexp:
-            self.image_id = self.instance["image_id"]
-        else:
-            self.image_id = self.api.toolbox.find_image_id(
-                image_id=image_id, image_regexp=image_regexp, region_id=region_id
-            )
+        self.api = ScCloudComputingApi(token, endpoint)
+        self.instance_id = instance_id
+        self.name = name
+        self.region_id = region_id
+        self.image_id = image_id
+        self.image_regexp = image_regexp
+        self.instance = None
         self.wait = wait
         self.update_interval = update_interval
         self.checkmode = checkmode
 
     #  copypaste, refactor, TODO
     def wait_for_statuses(self, status_done, statuses_continue):
-        start_time = time.time()
+        poller = Poller(self.wait, self.update_interval)
         if self.wait:
+            trace = tracer()
+            if trace is not None:
+                trace.slept("wait", self.update_interval)
             time.sleep(self.update_interval)  # workaround around bug in APIs
         while self.instance["status"] not in statuses_continue + [status_done]:
             if not self.wait:
                 break
-            if time.time() > start_time + self.wait:
+            if not poller.sleep():
                 raise WaitError(
                     msg=f"Timeout waiting instance {self.instance['id']} "
                     f"status {status_done} or {statuses_continue}. "
                     f"Last state was {self.instance['status']}",
-                    timeout=time.time() - start_time,
+                    timeout=poller.elapsed(),
                 )
-            time.sleep(self.update_interval)
             self.instance = self.api.get_instances(
-                self.instance["id"],
-                retry_rules=_retry_rules_for_wait(
-                    max_wait=max(0, self.wait - (time.time() - start_time)),
-                    delay=self.update_interval,
-                ),
+                self.instance["id"], retry_rules=poller.retry_rules()
             )
         if self.instance["status"] == status_done:
             return True
@@ -627,10 +647,24 @@ class ScCloudComputingInstanceReinstall:
                         msg=f"Timeout waiting instance {self.instance['id']} "
                         f"status {status_done}. "
                         f"Last state was {self.instance['status']}",
-                        timeout=time.time() - start_time,
+                        timeout=poller.elapsed(),
                     )
 
     def run(self):
+        self.instance = self.api.toolbox.find_instance(
+            instance_id=self.instance_id,
+            instance_name=self.name,
+            region_id=self.region_id,
+            must=True,
+        )
+        if not self.image_id and not self.image_regexp:
+            self.image_id = self.instance["image_id"]
+        else:
+            self.image_id = self.api.toolbox.find_image_id(
+                image_id=self.image_id,
+                image_regexp=self.image_regexp,
+                region_id=self.region_id,
+            )
         if self.checkmode:
             self.instance["changed"] = True
             return self.instance
@@ -657,19 +691,30 @@ class ScCloudComputingInstanceUpgrade:
         update_interval,
         checkmode,
     ):
-        self.api = ScApi(token, endpoint)
-        self.instance = self.api.toolbox.find_instance(
-            instance_id=instance_id, instance_name=name, region_id=region_id, must=True
-        )
-        self.flavor_id = self.api.toolbox.find_cloud_flavor_id_by_name(
-            flavor_id=flavor_id, flavor_name=flavor_name, region_id=region_id
-        )
+        self.api = ScCloudComputingApi(token, endpoint)
+        self.instance_id = instance_id
+        self.name = name
+        self.region_id = region_id
+        self.flavor_id = flavor_id
+        self.flavor_name = flavor_name
+        self.instance = None
         self.confirm_upgrade = confirm_upgrade
         self.wait = wait
         self.update_interval = update_interval
         self.checkmode = checkmode
 
     def run(self):
+        self.instance = self.api.toolbox.find_instance(
+            instance_id=self.instance_id,
+            instance_name=self.name,
+            region_id=self.region_id,
+            must=True,
+        )
+        self.flavor_id = self.api.toolbox.find_flavor_id(
+            flavor_id=self.flavor_id,
+            flavor_name=self.flavor_name,
+            region_id=self.region_id,
+        )
         if self.flavor_id == self.instance["flavor_id"]:
             self.instance["changed"] = False
             return self.instance
@@ -1,28 +1,44 @@
 from __future__ import absolute_import, division, print_function
 import re
-import time
 
 from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
     APIError404,
     APIError409,
     APIError412,
-    ScApi,
+    ScApiBase,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_hosts import (
+    HostsApi,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_locations import (
+    LocationsApi,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_ssh_keys import (
+    SshKeysApi,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     ModuleError,
     WaitError,
-    _retry_rules_for_wait,
+    Poller,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    Projection,
 )
 
 
 __metaclass__ = type
 
 
+class ScDedicatedServerApi(ScApiBase, HostsApi, LocationsApi, SshKeysApi):
+    """The part of the API used by dedicated server modules."""
+
+
 class ScDedicatedServerInfo(object):
-    def __init__(self, endpoint, token, name, fail_on_absent):
-        self.api = ScApi(token, endpoint)
+    def __init__(self, endpoint, token, name, fail_on_absent, projection=None):
+        self.api = ScDedicatedServerApi(token, endpoint)
         self.server_id = name
         self.fail_on_absent = fail_on_absent
+        self.projection = projection or Projection()
 
     @staticmethod
     def _is_server_ready(server_info):
@@ -42,7 +58,7 @@ class ScDedicatedServerInfo(object):
             if self.fail_on_absent:
                 raise e
             return {"changed": False, "found": False, "ready": False}
-        module_output = server_info
+        module_output = self.projection.one(server_info)
         module_output["found"] = True
         module_output["ready"] = self._is_server_ready(server_info)
         module_output["changed"] = False
@@ -50,26 +66,33 @@ class ScDedicatedServerInfo(object):
 
 
 class ScBaremetalServersInfo:
-    def __init__(self, search_pattern, label_selector, type, endpoint, token):
+    def __init__(
+        self, search_pattern, label_selector, type, endpoint, token, projection=None
+    ):
         self.type = type
         self.search_pattern = search_pattern
         self.label_selector = label_selector
-        self.api = ScApi(token, endpoint)
+        self.api = ScDedicatedServerApi(token, endpoint)
+        self.projection = projection or Projection()
 
     def run(self):
         return {
             "changed": False,
-            "baremetal_servers": list(
+            **self.projection.output(
+                "baremetal_servers",
                 self.api.list_hosts(self.type, self.search_pattern, self.label_selector)
             ),
         }
 
 
 class ScBaremetalLocationsInfo(object):
-    def __init__(self, endpoint, token, search_pattern, required_features):
+    def __init__(
+        self, endpoint, token, search_pattern, required_features, projection=None
+    ):
         self.search_pattern = search_pattern
         self.required_features = required_features
-        self.api = ScApi(token, endpoint)
+        self.api = ScDedicatedServerApi(token, endpoint)
+        self.projection = projection or Projection()
 
     @staticmethod
     def location_features(location):
@@ -98,7 +121,7 @@ class ScBaremetalLocationsInfo(object):
 
     def run(self):
         ret_data = {"changed": False}
-        ret_data["locations"] = self.locations()
+        ret_data.update(self.projection.output("locations", self.locations()))
         return ret_data
 
 
@@ -126,18 +149,17 @@ class ScDedicatedServerReinstall(object):
                     f"Update interval ({update_interval}) is longer "
                     f"than wait time ({wait})"
                 )
-        self.api = ScApi(token, endpoint)
+        self.api = ScDedicatedServerApi(token, endpoint)
         self.server_data = None
         self.server_id = server_id
-        self.hostname = self.get_hostname(hostname)
+        self.hostname = hostname
         self.drives_layout = self.get_drives_layout(
             drives_layout, drives_layout_template
         )
+        self.operating_system_id = operating_system_id
         self.operating_system_regex = operating_system_regex
-        self.operating_system_id = self.get_operating_system_id(
-            operating_system_id, operating_system_regex
-        )
-        self.ssh_keys = self.get_ssh_keys(ssh_keys, ssh_key_name)
+        self.ssh_keys = ssh_keys
+        self.ssh_key_name = ssh_key_name
         self.wait = wait
         self.update_interval = update_interval
         self.user_data = user_data
@@ -256,27 +278,32 @@ class ScDedicatedServerReinstall(object):
             return templates[template]
 
     def wait_for_server(self):
+        # Right after the reinstall request the server may still report
+        # its old, ready status: accept ready only once it was seen busy,
+        # or after update_interval (the first poll of the old fixed-interval
+        # loop).
         ready = False
-        start_time = time.time()
-        elapsed = 0
+        started = False
+        poller = Poller(self.wait, self.update_interval)
         while not ready:
-            time.sleep(self.update_interval)
-            elapsed = time.time() - start_time
-            if elapsed > self.wait:
-                raise WaitError(msg="Server is not ready.", timeout=elapsed)
+            if not poller.sleep():
+                raise WaitError(msg="Server is not ready.", timeout=poller.elapsed())
             server_info = self.api.get_dedicated_servers(
-                self.server_id,
-                retry_rules=_retry_rules_for_wait(
-                    max_wait=max(0, self.wait - elapsed),
-                    delay=self.update_interval,
-                ),
+                self.server_id, retry_rules=poller.retry_rules()
             )
             ready = ScDedicatedServerInfo._is_server_ready(server_info)
+            started = started or not ready
+            ready = ready and (started or poller.elapsed() >= self.update_interval)
         server_info["ready"] = True
-        server_info["elapsed"] = elapsed
+        server_info["elapsed"] = poller.elapsed()
         return server_info
 
     def run(self):
+        self.hostname = self.get_hostname(self.hostname)
+        self.operating_system_id = self.get_operating_system_id(
+            self.operating_system_id, self.operating_system_regex
+        )
+        self.ssh_keys = self.get_ssh_keys(self.ssh_keys, self.ssh_key_name)
         if self.checkmode:
             return {"changed": True}
         result = self.api.post_dedicated_server_reinstall(
@@ -297,7 +324,7 @@ class ScDedicatedServerReinstall(object):
 
 class ScDedicatedServerPower:
     def __init__(self, endpoint, token, server_id, state, wait, checkmode):
-        self.api = ScApi(token, endpoint)
+        self.api = ScDedicatedServerApi(token, endpoint)
         self.server_id = server_id
         self.state = state
         self.wait = wait
@@ -305,15 +332,10 @@ class ScDedicatedServerPower:
         self.interval = 5
 
     def wait_for_status(self, target_status):
-        start = time.time()
+        poller = Poller(self.wait, self.interval)
         while True:
-            elapsed = time.time() - start
             server = self.api.get_dedicated_servers(
-                self.server_id,
-                retry_rules=_retry_rules_for_wait(
-                    max_wait=max(0, self.wait - elapsed),
-                    delay=self.interval,
-                ),
+                self.server_id, retry_rules=poller.retry_rules()
             )
             status = server["power_status"]
             if status == target_status:
@@ -323,11 +345,10 @@ class ScDedicatedServerPower:
                 raise ModuleError(
                     f"Unexpected power_status={status}, expected {target_status}"
                 )
-            if elapsed > self.wait:
+            if not poller.sleep():
                 raise ModuleError(
                     f"Timeout waiting for power_status={target_status}, last={status}"
                 )
-            time.sleep(self.interval)
 
     def power_on(self):
         try:
@@ -406,7 +427,7 @@ class ScDedicatedServerIpxe:
                 f"Update interval ({update_interval}) is longer "
                 f"than wait time ({wait})"
             )
-        self.api = ScApi(token, endpoint)
+        self.api = ScDedicatedServerApi(token, endpoint)
         self.server_id = server_id
         self.state = state
         if state in ("public", "private"):
@@ -442,23 +463,16 @@ class ScDedicatedServerIpxe:
     def wait_for_status(self, target_status, feature_name=None):
         if feature_name is None:
             feature_name = self.feature_name
-        start = time.time()
+        poller = Poller(self.wait, self.update_interval)
         while True:
-            elapsed = time.time() - start
-            if elapsed > self.wait:
+            if not poller.sleep():
                 raise WaitError(
                     msg=f"Timeout waiting for {feature_name} "
                     f"to reach '{target_status}'",
-                    timeout=elapsed,
+                    timeout=poller.elapsed(),
                 )
-            time.sleep(self.update_interval)
-            elapsed = time.time() - start
             feature = self._get_feature_by_name(
-                feature_name,
-                retry_rules=_retry_rules_for_wait(
-                    max_wait=max(0, self.wait - elapsed),
-                    delay=self.update_interval,
-                ),
+                feature_name, retry_rules=poller.retry_rules()
             )
             if feature is None:
                 raise ModuleError(
@@ -608,7 +622,7 @@ class ScDedicatedOSList:
         server_model_name,
         os_name_regex,
     ):
-        self.api = ScApi(token, endpoint)
+        self.api = ScDedicatedServerApi(token, endpoint)
         self.server_id = server_id
         self.location_id = location_id
         self.location_code = location_code
@@ -616,6 +630,7 @@ class ScDedicatedOSList:
         self.server_model_name = server_model_name
         self.os_name_regex = os_name_regex
 
+    def resolve_location_and_model(self):
         if self.server_id:
             try:
                 server = self.api.get_dedicated_servers(self.server_id)
@@ -662,6 +677,7 @@ class ScDedicatedOSList:
         return os_list
 
     def run(self):
+        self.resolve_location_and_model()
         if self.server_model_name:
             os_list = self.get_os_list_by_model_name()
         elif self.server_model_id:
@@ -695,14 +711,13 @@ class ScDedicatedServerRescue:
         update_interval,
         checkmode,
     ):
-        self.api = ScApi(token, endpoint)
+        self.api = ScDedicatedServerApi(token, endpoint)
         self.server_id = server_id
         self.state = state
         self.auth_methods = auth_methods
         self._validate_auth_methods(auth_methods, ssh_key_fingerprints, ssh_key_name)
-        self.ssh_key_fingerprints = self._resolve_ssh_keys(
-            ssh_key_fingerprints, ssh_key_name
-        )
+        self.ssh_key_fingerprints = ssh_key_fingerprints
+        self.ssh_key_name = ssh_key_name
         self.wait = wait
         self.update_interval = update_interval
         self.checkmode = checkmode
@@ -748,40 +763,33 @@ class ScDedicatedServerRescue:
         )
 
     def _retry_on_api_error(self, action):
-        start = time.time()
+        poller = Poller(self.wait, self.update_interval)
         while True:
             try:
                 return action()
             except APIError409 as e:
                 if '"INCOMPATIBLE_FEATURE_STATE"' not in e.msg:
                     raise
-                if time.time() - start > self.wait:
+                if not poller.sleep():
                     raise
-                time.sleep(self.update_interval)
             except APIError412:
-                if time.time() - start > self.wait:
+                if not poller.sleep():
                     raise
-                time.sleep(self.update_interval)
 
     def _wait_for_feature_status(self, target_status):
-        start = time.time()
+        poller = Poller(self.wait, self.update_interval)
         while True:
-            elapsed = time.time() - start
             status = self._get_rescue_feature_status(
-                retry_rules=_retry_rules_for_wait(
-                    max_wait=max(0, self.wait - elapsed),
-                    delay=self.update_interval,
-                ),
+                retry_rules=poller.retry_rules()
             )
             if status == target_status:
                 return
-            if elapsed > self.wait:
+            if not poller.sleep():
                 raise WaitError(
                     msg=f"Timeout waiting for rescue feature "
                     f"status={target_status}, last={status}",
-                    timeout=elapsed,
+                    timeout=poller.elapsed(),
                 )
-            time.sleep(self.update_interval)
 
     def activate_rescue(self):
         feature_status = self._get_rescue_feature_status()
@@ -807,6 +815,9 @@ class ScDedicatedServerRescue:
             server["changed"] = False
             return server
 
+        self.ssh_key_fingerprints = self._resolve_ssh_keys(
+            self.ssh_key_fingerprints, self.ssh_key_name
+        )
         if self.checkmode:
             server = self.api.get_dedicated_servers(self.server_id)
             server["changed"] = True
@@ -0,0 +1,100 @@
+from __future__ import absolute_import, division, print_function
+import codecs
+import json
+import re
+
+
+__metaclass__ = type
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _Buffer:
+    """Text decoded from byte chunks, with the parsed part dropped on refill."""
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, want=1):
+        """Read chunks until at least want characters are unparsed; False at EOF."""
+        text = self.text[self.pos:]
+        parts = [text]
+        size = len(text)
+        while size < want and not self.eof:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                self.eof = True
+                part = self.decoder.decode(b"", final=True)
+            else:
+                part = self.decoder.decode(chunk)
+            parts.append(part)
+            size += len(part)
+        self.text = "".join(parts)
+        self.pos = 0
+        return size >= want
+
+    def skip_whitespace(self):
+        """Move to the next non-whitespace character; return it, or None at EOF."""
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return None
+
+
+def iter_json_array(chunks):
+    """Yield the items of a JSON array as they are parsed from chunks.
+
+    chunks is an iterable of bytes (UTF-8), e.g. Response.iter_content().
+    Only the item being parsed and one chunk are held at a time, instead
+    of the whole text and every decoded item as with json.loads.
+
+    Raises ValueError (json.JSONDecodeError for bad JSON) if the text is
+    not a single JSON array.
+    """
+    decoder = json.JSONDecoder()
+    buf = _Buffer(chunks)
+    if buf.skip_whitespace() != "[":
+        raise ValueError("Expected a JSON array.")
+    buf.pos += 1
+    expect_item = True
+    first = True
+    while True:
+        char = buf.skip_whitespace()
+        if char is None:
+            raise ValueError("Unterminated JSON array.")
+        if char == "]" and (first or not expect_item):
+            buf.pos += 1
+            break
+        if not expect_item:
+            if char != ",":
+                raise ValueError(f"Expected ',' or ']' at '{char}'.")
+            buf.pos += 1
+            expect_item = True
+            continue
+        while True:
+            try:
+                item, end = decoder.raw_decode(buf.text, buf.pos)
+            except json.JSONDecodeError:
+                if buf.eof:
+                    raise
+                end = None
+            # A number at the end of the text may continue in the next
+            # chunk, so an item is only taken when something follows it.
+            if end is not None and (end < len(buf.text) or buf.eof):
+                break
+            # Ask for twice as much text each time, so an item spread
+            # over many chunks is not parsed over and over again.
+            buf.fill((len(buf.text) - buf.pos) * 2)
+        buf.pos = end
+        yield item
+        expect_item = False
+        first = False
+    if buf.skip_whitespace() is not None:
+        raise ValueError("Extra data after the JSON array.")
@@ -1,55 +1,82 @@
 from __future__ import absolute_import, division, print_function
-import time
+from concurrent.futures import ThreadPoolExecutor
 
 from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
-    ScApi,
+    ScApiBase,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_hosts import (
+    HostsApi,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_l2 import (
+    L2Api,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     ModuleError,
     WaitError,
-    _retry_rules_for_wait,
+    Poller,
+    wait_until_gone,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    Projection,
 )
 
 
 __metaclass__ = type
 
 
+class ScL2SegmentApi(ScApiBase, L2Api, HostsApi):
+    """The part of the API used by L2 segment modules."""
+
+
+def find_segments(api, name, type=None):
+    """Return L2 segments with this name (and type, if given)."""
+    return api.toolbox.find_by_name(
+        "l2_segments",
+        name,
+        search=lambda: api.list_l2_segments(search_pattern=name),
+        get=api.get_l2_segment,
+        match=lambda segment: not type or segment["type"] == type,
+    )
+
+
 class ScL2SegmentsInfo:
-    def __init__(self, endpoint, token, label_selector):
-        self.api = ScApi(token, endpoint)
+    def __init__(self, endpoint, token, label_selector, projection=None):
+        self.api = ScL2SegmentApi(token, endpoint)
         self.label_selector = label_selector
+        self.projection = projection or Projection()
 
     def run(self):
         return {
             "changed": False,
-            "l2_segments": list(self.api.list_l2_segments(self.label_selector)),
+            **self.projection.output("l2_segments", self.api.list_l2_segments(self.label_selector)),
         }
 
 
 class ScL2SegmentInfo:
-    def __init__(self, endpoint, token, id, name):
-        self.api = ScApi(token, endpoint)
+    def __init__(self, endpoint, token, id, name, projection=None):
+        self.api = ScL2SegmentApi(token, endpoint)
         self.id = id
         self.name = name
+        self.projection = projection or Projection()
 
     def run(self):
         id = self.id
         if self.name:
-            for segment in self.api.list_l2_segments():
-                if segment["name"] == self.name:
-                    if id:
-                        raise ModuleError(
-                            "Multiple segments with the same name found. Use id."
-                        )
-                    id = segment["id"]
-            if not id:  # Either ID is from args, or we found it, or it can't be found
+            segments = find_segments(self.api, self.name)
+            if len(segments) > 1:
+                raise ModuleError("Multiple segments with the same name found. Use id.")
+            if not segments:
                 raise ModuleError(f"Unable to find segment with name {self.name}")
-        networks = list(self.api.list_l2_segment_networks(id))
-        members = list(self.api.list_l2_segment_members(id))
-        l2_segment = self.api.get_l2_segment(id)
-        l2_segment["networks"] = networks
-        l2_segment["members"] = members
-        return {"changed": False, "l2_segment": l2_segment}
+            id = segments[0]["id"]
+        # Independent requests, so they take one round-trip instead of three.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            networks = executor.submit(list, self.api.list_l2_segment_networks(id))
+            members = executor.submit(list, self.api.list_l2_segment_members(id))
+            l2_segment = executor.submit(self.api.get_l2_segment, id)
+        l2_segment = l2_segment.result()
+        l2_segment["networks"] = networks.result()
+        l2_segment["members"] = members.result()
+        return {"changed": False, "l2_segment": self.projection.one(l2_segment)}
 
 
 class ScL2Segment:
@@ -70,7 +97,7 @@ class ScL2Segment:
         update_interval,
         checkmode,
     ):
-        self.api = ScApi(token, endpoint)
+        self.api = ScL2SegmentApi(token, endpoint)
         self.name = name
         self.segment_id = segment_id
         self.state = state
@@ -86,62 +113,42 @@ class ScL2Segment:
         if update_interval > wait:
             raise ModuleError("update_interval is longer than wait")
 
-    @staticmethod
-    def _match_segment(api_object, segment_name, type):
-        if type:
-            return api_object["name"] == segment_name and api_object["type"] == type
-        else:
-            return api_object["name"] == segment_name
-
     def get_segment_id(self):
-        existing_segment_id = None
         if self.segment_id:
-            existing_segment_id = self.api.get_l2_segment_or_none(self.segment_id)["id"]
-        else:
-            for segment in self.api.list_l2_segments():
-                if self._match_segment(segment, self.name, self.type):
-                    if existing_segment_id:  # duplicate found
-                        raise ModuleError(
-                            msg=f"Duplicate segment with name {self.name} found."
-                        )
-                    existing_segment_id = segment["id"]
-        return existing_segment_id
+            return self.api.get_l2_segment_or_none(self.segment_id)["id"]
+        segments = find_segments(self.api, self.name, self.type)
+        if len(segments) > 1:
+            raise ModuleError(msg=f"Duplicate segment with name {self.name} found.")
+        return segments[0]["id"] if segments else None
 
     def wait_for_active_segment(self, segment_id):
+        # Right after an update the segment may still report its old,
+        # active status: accept active only once it was seen in another
+        # status, or after update_interval (the first poll of the old
+        # fixed-interval loop). Otherwise a second update could be sent
+        # while the first one is still applied, and fail with 409.
         ready = False
-        start_time = time.time()
-        elapsed = 0
+        started = False
+        poller = Poller(self.wait, self.update_interval)
         while not ready:
-            time.sleep(self.update_interval)
-            elapsed = time.time() - start_time
-            if elapsed > self.wait:
-                raise WaitError(msg="Segment is not ready.", timeout=elapsed)
+            if not poller.sleep():
+                raise WaitError(msg="Segment is not ready.", timeout=poller.elapsed())
             segment = self.api.get_l2_segment(
-                segment_id,
-                retry_rules=_retry_rules_for_wait(
-                    max_wait=max(0, self.wait - elapsed),
-                    delay=self.update_interval,
-                ),
+                segment_id, retry_rules=poller.retry_rules()
             )
             ready = segment["status"] == "active"
+            started = started or not ready
+            ready = ready and (started or poller.elapsed() >= self.update_interval)
 
     def wait_for_segment_disappear(self, segment_id):
-        ready = False
-        start_time = time.time()
-        elapsed = 0
-        while not ready:
-            time.sleep(self.update_interval)
-            elapsed = time.time() - start_time
-            if elapsed > self.wait:
-                raise WaitError(msg="Segment is not deleted.", timeout=elapsed)
-            segment = self.api.get_l2_segment_or_none(
-                segment_id,
-                retry_rules=_retry_rules_for_wait(
-                    max_wait=max(0, self.wait - elapsed),
-                    delay=self.update_interval,
-                ),
-            )
-            ready = not segment["id"]
+        wait_until_gone(
+            lambda retry_rules: self.api.get_l2_segment(
+                segment_id, retry_rules=retry_rules
+            ),
+            self.wait,
+            self.update_interval,
+            f"L2 segment {segment_id}",
+        )
 
     def guess_member_location_groups(self, members):
         locations = set()
@@ -187,6 +194,7 @@ class ScL2Segment:
         if self.checkmode:
             return {"changed": True, "location_group_id": lg}
         res = self.api.post_l2_segment(self.name, self.type, lg, members, self.labels)
+        self.api.toolbox.remember_name("l2_segments", self.name, res["id"])
         self.wait_for_active_segment(res["id"])
         res = self.api.get_l2_segment(res["id"])
         res["members_added"] = members
@@ -304,6 +312,7 @@ class ScL2Segment:
         if found_segment_id:
             if not self.checkmode:
                 self.api.delete_l2_segment(found_segment_id)
+                self.api.toolbox.forget_name("l2_segments", obj_id=found_segment_id)
                 self.wait_for_segment_disappear(found_segment_id)
             return {"changed": True, "id": found_segment_id}
         else:
@@ -338,7 +347,7 @@ class ScL2SegmentAliases:
         update_interval,
         checkmode,
     ):
-        self.api = ScApi(token, endpoint)
+        self.api = ScL2SegmentApi(token, endpoint)
         self.name = name
         self.segment_id = segment_id
         self.count = count
@@ -347,43 +356,28 @@ class ScL2SegmentAliases:
         self.update_interval = update_interval
         self.checkmode = checkmode
 
-    # TODO: code repeated from ScL2Segment
     def get_segment_id(self):
-        existing_segment_id = None
         if self.segment_id:
-            existing_segment_id = self.api.get_l2_segment(self.segment_id)["id"]
-        else:
-            for segment in self.api.list_l2_segments():
-                if segment["name"] == self.name:
-                    if existing_segment_id:  # duplicate found
-                        raise ModuleError(
-                            msg=f"Duplicate segment with name {self.name} found."
-                        )
-                    existing_segment_id = segment["id"]
-            if not existing_segment_id:
-                raise ModuleError(f"Segment {self.name} is not found.")
-        return existing_segment_id
+            return self.api.get_l2_segment(self.segment_id)["id"]
+        segments = find_segments(self.api, self.name)
+        if len(segments) > 1:
+            raise ModuleError(msg=f"Duplicate segment with name {self.name} found.")
+        if not segments:
+            raise ModuleError(f"Segment {self.name} is not found.")
+        return segments[0]["id"]
 
     def wait_for(self, l2):
-        start_time = time.time()
         if not self.wait:
             return
+        poller = Poller(self.wait, self.update_interval)
         while l2["status"] == "pending":
-            time.sleep(self.update_interval)
-            elapsed = time.time() - start_time
-            if elapsed > self.wait:
+            if not poller.sleep():
                 raise WaitError(
                     msg=f"Timeout while waiting for L2 {l2['id']}."
                     f" Last status was {l2['status']}",
-                    timeout=elapsed,
+                    timeout=poller.elapsed(),
                 )
-            l2 = self.api.get_l2_segment(
-                l2["id"],
-                retry_rules=_retry_rules_for_wait(
-                    max_wait=max(0, self.wait - elapsed),
-                    delay=self.update_interval,
-                ),
-            )
+            l2 = self.api.get_l2_segment(l2["id"], retry_rules=poller.retry_rules())
 
     def prep_result(self, changed):
         aliases = list(self.api.list_l2_segment_networks(self.found_segment_id))
@@ -1,24 +1,34 @@
 from __future__ import absolute_import, division, print_function
-import time
 
 from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
     APIError400,
     APIError404,
-    ScApi,
+    ScApiBase,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_lb import (
+    LoadBalancerApi,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     ModuleError,
     WaitError,
-    _retry_rules_for_wait,
+    Poller,
+    wait_until_gone,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    Projection,
 )
 
 
 __metaclass__ = type
 
 
+class ScLoadBalancerApi(ScApiBase, LoadBalancerApi):
+    """The part of the API used by load balancer modules."""
+
+
 class ScLoadBalancerInstancesList:
     def __init__(self, endpoint, token, name=None, type=None, label_selector=None):
-        self.api = ScApi(token, endpoint)
+        self.api = ScLoadBalancerApi(token, endpoint)
         self.name = name
         self.type = type
         self.label_selector = label_selector
@@ -41,10 +51,17 @@ class ScLoadBalancerInstancesList:
 
 class ScLoadBalancerInstanceInfo(object):
     def __init__(
-        self, endpoint, token, lb_instance_id, lb_instance_name, fail_on_absent
+        self,
+        endpoint,
+        token,
+        lb_instance_id,
+        lb_instance_name,
+        fail_on_absent,
+        projection=None,
     ):
-        self.api = ScApi(token, endpoint)
+        self.api = ScLoadBalancerApi(token, endpoint)
         self.fail_on_absent = fail_on_absent
+        self.projection = projection or Projection()
         if lb_instance_id and lb_instance_name:
             raise ValueError("Only one of 'id' or 'name' should be provided")
         self.lb_instance_id = lb_instance_id
@@ -92,6 +109,7 @@ class ScLoadBalancerInstanceInfo(object):
                 raise e
             return {"changed": False, "status": "absent"}
 
+        lb_instance_info = self.projection.one(lb_instance_info)
         lb_instance_info["changed"] = False
         return lb_instance_info
 
@@ -113,7 +131,7 @@ class ScLbInstanceDelete:
         if not lb_id and not lb_name:
             raise ValueError("Either 'id' or 'name' must be provided")
         self.checkmode = checkmode
-        self.api = ScApi(token, endpoint)
+        self.api = ScLoadBalancerApi(token, endpoint)
         self.lb_instance_id = lb_id
         self.lb_instance_name = lb_name
         self.lb_instance_type = lb_type
@@ -121,43 +139,29 @@ class ScLbInstanceDelete:
         self.update_interval = update_interval
 
     def wait_for_disappearance(self):
-        start_time = time.time()
-        while True:
-            elapsed = time.time() - start_time
-            instances = self.api.list_load_balancer_instances(
-                retry_rules=_retry_rules_for_wait(
-                    max_wait=max(0, self.wait - elapsed),
-                    delay=self.update_interval,
-                )
-            )
-            exists = any(
-                inst.get("id") == self.lb_instance_id
-                for inst in instances
-                if inst.get("type") == self.lb_instance_type
-            )
-            if not exists:
-                break
-            if elapsed > self.wait:
-                raise WaitError(
-                    msg=f"Timeout waiting for lb instance {self.lb_instance_id} to disappear after {elapsed:.2f} seconds.",
-                    timeout=elapsed,
-                )
-            time.sleep(self.update_interval)
+        wait_until_gone(
+            lambda retry_rules: self.api.get_lb_instance(
+                self.lb_instance_id, self.lb_instance_type, retry_rules=retry_rules
+            ),
+            self.wait,
+            self.update_interval,
+            f"lb instance {self.lb_instance_id}",
+        )
 
     def run(self):
-        lb_instances = self.api.list_load_balancer_instances()
-
         if self.lb_instance_id:
-            matched_instances = [
-                inst
-                for inst in lb_instances
-                if inst.get("id") == self.lb_instance_id
-                and inst.get("type") == self.lb_instance_type
-            ]
+            try:
+                matched_instances = [
+                    self.api.get_lb_instance(
+                        self.lb_instance_id, self.lb_instance_type
+                    )
+                ]
+            except APIError404:
+                matched_instances = []
         elif self.lb_instance_name:
             matched_instances = [
                 inst
-                for inst in lb_instances
+                for inst in self.api.list_load_balancer_instances()
                 if inst.get("name") == self.lb_instance_name
                 and inst.get("type") == self.lb_instance_type
             ]
@@ -210,7 +214,7 @@ class ScLbInstanceL4CreateUpdate:
         update_interval,
         checkmode,
     ):
-        self.api = ScApi(token, endpoint)
+        self.api = ScLoadBalancerApi(token, endpoint)
         self.lb_instance_id = lb_id
         self.name = name
         self.location_id = location_id
@@ -266,25 +270,21 @@ class ScLbInstanceL4CreateUpdate:
         )
 
     def wait_for_active(self):
-        start_time = time.time()
+        poller = Poller(self.wait, self.update_interval)
         while True:
-            elapsed = time.time() - start_time
             instance = self.api.get_lb_instance(
                 self.lb_instance_id,
                 self.lb_instance_type,
-                retry_rules=_retry_rules_for_wait(
-                    max_wait=max(0, self.wait - elapsed),
-                    delay=self.update_interval,
-                ),
+                retry_rules=poller.retry_rules(),
             )
             if instance["status"] == "active":
                 return instance
-            if elapsed > self.wait:
+            if not poller.sleep():
+                elapsed = poller.elapsed()
                 raise WaitError(
                     msg=f"Timeout waiting for lb instance {self.lb_instance_id} to become active after {elapsed:.2f} seconds.",
                     timeout=elapsed,
                 )
-            time.sleep(self.update_interval)
 
     def check_update_result(self, current):
         if not self.checkmode:
@@ -357,7 +357,7 @@ class ScLbInstanceL7CreateUpdate:
         update_interval,
         checkmode,
     ):
-        self.api = ScApi(token, endpoint)
+        self.api = ScLoadBalancerApi(token, endpoint)
         self.lb_instance_id = lb_id
         self.name = name
         self.location_id = location_id
@@ -416,25 +416,21 @@ class ScLbInstanceL7CreateUpdate:
         )
 
     def wait_for_active(self):
-        start_time = time.time()
+        poller = Poller(self.wait, self.update_interval)
         while True:
-            elapsed = time.time() - start_time
             instance = self.api.get_lb_instance(
                 self.lb_instance_id,
                 self.lb_instance_type,
-                retry_rules=_retry_rules_for_wait(
-                    max_wait=max(0, self.wait - elapsed),
-                    delay=self.update_interval,
-                ),
+                retry_rules=poller.retry_rules(),
             )
             if instance["status"] == "active":
                 return instance
-            if elapsed > self.wait:
+            if not poller.sleep():
+                elapsed = poller.elapsed()
                 raise WaitError(
                     msg=f"Timeout waiting for lb instance {self.lb_instance_id} to become active after {elapsed:.2f} seconds.",
                     timeout=elapsed,
                 )
-            time.sleep(self.update_interval)
 
     def check_update_result(self, current):
         if not self.checkmode:
@@ -1,8 +1,24 @@
 from __future__ import absolute_import, division, print_function
+import random
+import time
+
 from ansible.module_utils.basic import env_fallback
 from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    APIError404,
     SCBaseError,
+    CLIENT_DEFAULTS,
+    CACHE_MODES,
+    CACHE_REFRESH,
+    CACHE_USE,
     DEFAULT_API_ENDPOINT,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_READ_TIMEOUT,
+    REVALIDATE_MODES,
+    REVALIDATE_OFF,
+    THROTTLE_STATS,
+    remaining_time,
+    tracer,
 )
 
 
@@ -13,6 +29,14 @@ _ignored = DEFAULT_API_ENDPOINT  # to silence pylint warning, it is reimported
 CHANGED = True
 NOT_CHANGED = False
 
+POLL_FIRST_INTERVAL = 1
+POLL_BACKOFF = 1.5
+POLL_JITTER = 0.1
+# For long waits (e.g. a day-long reinstall) the interval keeps growing
+# past update_interval, up to this share of the wait (but not above the cap).
+POLL_LONG_WAIT_SHARE = 0.01
+POLL_LONG_WAIT_MAX_INTERVAL = 300
+
 AUTH_ARGS = {
     "token": {
         "type": "str",
@@ -25,9 +49,123 @@ AUTH_ARGS = {
         "default": DEFAULT_API_ENDPOINT,
         "fallback": (env_fallback, ["SERVERSCOM_API_URL"]),
     },
+    "page_size": {
+        "type": "int",
+        "default": DEFAULT_PAGE_SIZE,
+        "fallback": (env_fallback, ["SERVERSCOM_API_PAGE_SIZE"]),
+    },
+    "cache": {
+        "type": "str",
+        "choices": CACHE_MODES,
+        "default": CACHE_USE,
+        "fallback": (env_fallback, ["SERVERSCOM_API_CACHE"]),
+    },
+    "cache_dir": {
+        "type": "path",
+        "fallback": (env_fallback, ["SERVERSCOM_API_CACHE_DIR"]),
+    },
+    "revalidate": {
+        "type": "str",
+        "choices": REVALIDATE_MODES,
+        "default": REVALIDATE_OFF,
+        "fallback": (env_fallback, ["SERVERSCOM_API_REVALIDATE"]),
+    },
+    "connect_timeout": {
+        "type": "float",
+        "default": DEFAULT_CONNECT_TIMEOUT,
+        "fallback": (env_fallback, ["SERVERSCOM_API_CONNECT_TIMEOUT"]),
+    },
+    "read_timeout": {
+        "type": "float",
+        "default": DEFAULT_READ_TIMEOUT,
+        "fallback": (env_fallback, ["SERVERSCOM_API_READ_TIMEOUT"]),
+    },
+    "rate_limit": {
+        "type": "float",
+        "fallback": (env_fallback, ["SERVERSCOM_API_RATE_LIMIT"]),
+    },
+    "api_stats": {
+        "type": "bool",
+        "default": False,
+        "fallback": (env_fallback, ["SERVERSCOM_API_STATS"]),
+    },
+}
+
+# Info modules which return reference data (locations, flavors, images)
+# are run to get current data, so they refresh the cache by default.
+REFERENCE_INFO_AUTH_ARGS = {
+    **AUTH_ARGS,
+    "cache": {**AUTH_ARGS["cache"], "default": CACHE_REFRESH},
 }
 
 
+def configure_api_client(module):
+    """Apply common API options to every client created by this module."""
+    page_size = module.params.get("page_size")
+    if page_size is not None:
+        if not 1 <= page_size <= DEFAULT_PAGE_SIZE:
+            module.fail_json(
+                msg=f"page_size must be between 1 and {DEFAULT_PAGE_SIZE}, got {page_size}."
+            )
+        CLIENT_DEFAULTS["page_size"] = page_size
+    if module.params.get("cache") is not None:
+        CLIENT_DEFAULTS["cache"] = module.params["cache"]
+    CLIENT_DEFAULTS["cache_dir"] = module.params.get("cache_dir")
+    if module.params.get("revalidate") is not None:
+        CLIENT_DEFAULTS["revalidate"] = module.params["revalidate"]
+    rate_limit = module.params.get("rate_limit")
+    if rate_limit is not None:
+        if rate_limit < 0:
+            module.fail_json(msg=f"rate_limit can't be negative, got {rate_limit}.")
+        CLIENT_DEFAULTS["rate_limit"] = rate_limit
+    for name in ("connect_timeout", "read_timeout"):
+        timeout = module.params.get(name)
+        if timeout is not None:
+            if timeout < 0:
+                module.fail_json(msg=f"{name} can't be negative, got {timeout}.")
+            CLIENT_DEFAULTS[name] = timeout
+    # Modules which wait for something share one deadline: wait seconds
+    # from now, for all their requests, retries and wait loops.
+    wait = module.params.get("wait")
+    CLIENT_DEFAULTS["deadline"] = time.time() + wait if wait and wait > 0 else None
+    # Set when the task runs with the serverscom httpapi connection plugin.
+    CLIENT_DEFAULTS["socket_path"] = getattr(module, "_socket_path", None)
+    if module.params.get("api_stats"):
+        # tracing.py is imported only when it is needed (see api.tracer).
+        # pylint: disable=bad-option-value, import-outside-toplevel
+        from ansible_collections.serverscom.sc_api.plugins.module_utils.tracing import (
+            TRACE,
+        )
+
+        TRACE.enabled = True
+        TRACE.reset()
+    elif tracer() is not None:
+        tracer().enabled = False
+
+
+def client_info():
+    """Module result keys describing how the API client was throttled
+    and (with the api_stats option) where the time went."""
+    info = {}
+    if THROTTLE_STATS["seconds"] or THROTTLE_STATS["rate_limited"]:
+        info["api_throttle"] = {
+            "seconds": round(THROTTLE_STATS["seconds"], 3),
+            "rate_limited": THROTTLE_STATS["rate_limited"],
+        }
+    trace = tracer()
+    if trace is not None:
+        info["api_stats"] = trace.stats(throttled=THROTTLE_STATS["seconds"])
+    return info
+
+
+def with_client_info(result):
+    """result with client_info() added, for exit_json and fail_json:
+
+        module.exit_json(**with_client_info(worker.run()))
+    """
+    return dict(result, **client_info())
+
+
 def _retry_rules_for_wait(max_wait, delay):
     RETRY_CODES_WAIT = {
         429,  # Ratelimit, need to wait for next window. If we are unlucky, it' a failure, but nothing to do within wait time.
@@ -41,6 +179,66 @@ def _retry_rules_for_wait(max_wait, delay):
     }
 
 
+class Poller:
+    """Sleep schedule for waiting on a long-running operation.
+
+    The first polls are POLL_FIRST_INTERVAL apart, then the interval grows
+    by POLL_BACKOFF up to max_interval (usually the update_interval option).
+    Every sleep is jittered and cut short so it never ends past
+    start + wait, nor past the module's deadline (see
+    configure_api_client), which all wait loops of a module share; the
+    last poll happens right at the deadline.
+
+    Usage:
+
+        poller = Poller(self.wait, self.update_interval)
+        while not ready(obj):
+            if not poller.sleep():
+                raise WaitError(msg="...", timeout=poller.elapsed())
+            obj = self.api.get_x(obj_id, retry_rules=poller.retry_rules())
+    """
+
+    def __init__(self, wait, max_interval, first_interval=POLL_FIRST_INTERVAL):
+        self.start = time.time()
+        self.wait = wait = wait or 0
+        self.max_interval = max(
+            max_interval, min(wait * POLL_LONG_WAIT_SHARE, POLL_LONG_WAIT_MAX_INTERVAL)
+        )
+        self.interval = min(first_interval, self.max_interval)
+
+    def elapsed(self):
+        return time.time() - self.start
+
+    def remaining(self):
+        remaining = max(0, self.wait - self.elapsed())
+        deadline = remaining_time()
+        if deadline is not None:
+            remaining = min(remaining, deadline)
+        return remaining
+
+    def sleep(self):
+        """Sleep until the next poll.
+
+        Return False (without sleeping) if the deadline has passed.
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            return False
+        delay = min(
+            self.interval * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER), remaining
+        )
+        trace = tracer()
+        if trace is not None:
+            trace.slept("wait", delay)
+        time.sleep(delay)
+        self.interval = min(self.interval * POLL_BACKOFF, self.max_interval)
+        return True
+
+    def retry_rules(self):
+        """Retry rules for a poll request, bounded by the time left."""
+        return _retry_rules_for_wait(max_wait=self.remaining(), delay=self.interval)
+
+
 class ModuleError(SCBaseError):
     def __init__(self, msg):
         self.msg = msg
@@ -56,3 +254,36 @@ class WaitError(ModuleError):
 
     def fail(self):
         return {"failed": True, "timeout": self.timeout, "msg": self.msg}
+
+
+class PartialFailureError(ModuleError):
+    """Some items of a bulk operation failed; fail() keeps the result."""
+
+    def __init__(self, msg, result):
+        self.msg = msg
+        self.result = result
+
+    def fail(self):
+        return dict(self.result, failed=True, msg=self.msg)
+
+
+def wait_until_gone(probe, wait, update_interval, what):
+    """Poll a single object until it is gone.
+
+    probe(retry_rules) fetches the object by its (already resolved) ID,
+    usually a per-object GET; the object is gone once the probe raises
+    APIError404 or returns None. Raises WaitError after wait seconds.
+    """
+    poller = Poller(wait, update_interval)
+    while True:
+        try:
+            if probe(retry_rules=poller.retry_rules()) is None:
+                return
+        except APIError404:
+            return
+        if not poller.sleep():
+            elapsed = poller.elapsed()
+            raise WaitError(
+                msg=f"Timeout waiting for {what} to disappear after {elapsed:.2f} seconds.",
+                timeout=elapsed,
+            )
@@ -0,0 +1,214 @@
+from __future__ import absolute_import, division, print_function
+import hashlib
+import json
+import os
+from itertools import islice
+
+from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
+    ModuleError,
+)
+
+
+__metaclass__ = type
+
+
+FIELDS_ARGS = {
+    "fields": {"type": "list", "elements": "str"},
+}
+
+PROJECTION_ARGS = {
+    **FIELDS_ARGS,
+    "limit": {"type": "int"},
+    "dest": {"type": "path"},
+}
+
+
+class Projection:
+    """Trim objects returned by info modules.
+
+    fields are dotted paths like ``configuration_details.ram_size``;
+    lists met on the way (e.g. ``networks.cidr``) are trimmed item by
+    item, and missing keys are skipped. Without fields objects are
+    returned as is.
+
+    Listings are trimmed as items come from the API iterator, so only
+    the kept keys of at most limit items are held. Once limit items
+    are taken the iterator is closed, and further pages are not
+    requested.
+
+    With dest, output() writes a listing to that file (see
+    write_json_lines) instead of returning it, so it is never held
+    in memory as a whole.
+    """
+
+    def __init__(self, fields=None, limit=None, dest=None, checkmode=False):
+        if limit is not None and limit < 0:
+            raise ModuleError("limit should not be negative.")
+        self.tree = None
+        self.limit = limit
+        self.dest = dest
+        self.checkmode = checkmode
+        for path in fields or []:
+            keys = [key for key in path.split(".") if key]
+            if not keys:
+                raise ModuleError(f"Invalid field path '{path}'.")
+            if self.tree is None:
+                self.tree = {}
+            node = self.tree
+            for key in keys[:-1]:
+                if node.get(key) is True:
+                    break
+                node = node.setdefault(key, {})
+            else:
+                node[keys[-1]] = True
+
+    @classmethod
+    def from_module(cls, module):
+        return cls(
+            module.params.get("fields"),
+            module.params.get("limit"),
+            module.params.get("dest"),
+            module.check_mode,
+        )
+
+    def one(self, obj):
+        """Trim a single object."""
+        if self.tree is None or obj is None:
+            return obj
+        return _trim(obj, self.tree)
+
+    def take(self, items):
+        """Yield at most limit items, untrimmed, then close items."""
+        if self.limit is None:
+            yield from items
+            return
+        iterator = iter(items)
+        try:
+            yield from islice(iterator, self.limit)
+        finally:
+            close = getattr(iterator, "close", None)
+            if close:
+                close()
+
+    def __call__(self, items):
+        """Trim a listing; return a list of at most limit items."""
+        return [self.one(item) for item in self.take(items)]
+
+    def output(self, key, items):
+        """Return {key: trimmed listing}, or write it to dest.
+
+        With dest the result is {changed, dest, count, checksum}
+        instead.
+        """
+        if not self.dest:
+            return {key: self(items)}
+        return write_json_lines(
+            self.dest, (self.one(item) for item in self.take(items)), self.checkmode
+        )
+
+
+def _trim(value, tree):
+    if isinstance(value, list):
+        return [_trim(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    result = {}
+    for key, subtree in tree.items():
+        if key in value:
+            result[key] = value[key] if subtree is True else _trim(value[key], subtree)
+    return result
+
+
+class _HashingWriter:
+    """File-like object which hashes everything written to raw."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.digest = hashlib.sha1()
+
+    def write(self, data):
+        self.digest.update(data)
+        if self.raw is not None:
+            self.raw.write(data)
+        return len(data)
+
+    def flush(self):
+        if self.raw is not None:
+            self.raw.flush()
+
+
+def _file_sha1(path):
+    digest = hashlib.sha1()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def _new_file_mode(dest):
+    try:
+        return os.stat(dest).st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def write_json_lines(dest, items, checkmode=False):
+    """Write items to dest as JSON Lines, gzip-compressed for *.gz.
+
+    Items are written one by one to a temporary file next to dest,
+    which replaces dest only when the whole listing is written and
+    differs from dest; a failed listing leaves dest untouched.
+    gzip output has no timestamp, so the same items give the same
+    file. In check mode nothing is written, but count, checksum and
+    changed are still computed.
+    """
+    # Only needed with dest, which most runs don't use.
+    # pylint: disable=bad-option-value, import-outside-toplevel
+    import gzip
+    import tempfile
+
+    directory = os.path.dirname(os.path.abspath(dest))
+    if not os.path.isdir(directory):
+        raise ModuleError(f"Destination directory {directory} does not exist.")
+    tmp = None
+    raw = None
+    try:
+        if not checkmode:
+            fd, tmp = tempfile.mkstemp(
+                dir=directory, prefix=f".{os.path.basename(dest)}.", suffix=".tmp"
+            )
+            raw = os.fdopen(fd, "wb")
+        sink = _HashingWriter(raw)
+        stream = sink
+        if dest.endswith(".gz"):
+            stream = gzip.GzipFile(filename="", mode="wb", fileobj=sink, mtime=0)
+        count = 0
+        for item in items:
+            stream.write(json.dumps(item, sort_keys=True).encode("utf-8") + b"\n")
+            count += 1
+        if stream is not sink:
+            stream.close()
+        checksum = sink.digest.hexdigest()
+        changed = _file_sha1(dest) != checksum
+        if raw is not None:
+            raw.flush()
+            os.fsync(raw.fileno())
+            raw.close()
+            raw = None
+            if changed:
+                os.chmod(tmp, _new_file_mode(dest))
+                os.replace(tmp, dest)
+            else:
+                os.unlink(tmp)
+            tmp = None
+    finally:
+        if raw is not None:
+            raw.close()
+        if tmp is not None:
+            os.unlink(tmp)
+    return {"changed": changed, "dest": dest, "count": count, "checksum": checksum}
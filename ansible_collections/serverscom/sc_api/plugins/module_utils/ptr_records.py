@@ -0,0 +1,210 @@
+from __future__ import absolute_import, division, print_function
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    APIError,
+    APIError404,
+    ScApiBase,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_cloud import (
+    CloudApi,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_sbm import (
+    SbmApi,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
+    ModuleError,
+    PartialFailureError,
+)
+
+
+__metaclass__ = type
+
+
+PTR_OWNER_TYPES = ("sbm_server", "cloud_instance")
+DEFAULT_PTR_CONCURRENCY = 10
+
+
+class ScPtrRecordsApi(ScApiBase, SbmApi, CloudApi):
+    """The part of the API used by ptr_records."""
+
+
+class ScPtrRecords:
+    """Reconcile PTR records of SBM servers and cloud instances.
+
+    records is the complete desired set: for every owner mentioned in
+    it, existing records are listed once (owners concurrently), and only
+    the difference is applied. A record is kept if ip and domain match
+    and ttl/priority match where they are given; otherwise it is
+    replaced, as PTR records can't be updated. With exclusive=True,
+    records for IPs which are not in records are deleted too.
+
+    Deletes go first (a replacement may reuse ip and domain), then
+    creates, both through a pool of concurrency workers. A failed
+    request doesn't stop the others; run() raises PartialFailureError
+    with the summary if any failed.
+    """
+
+    def __init__(
+        self,
+        endpoint,
+        token,
+        records,
+        exclusive=True,
+        ttl=None,
+        priority=None,
+        concurrency=DEFAULT_PTR_CONCURRENCY,
+        checkmode=False,
+    ):
+        if concurrency < 1:
+            raise ModuleError("concurrency should be at least 1.")
+        self.api = ScPtrRecordsApi(token, endpoint)
+        self.exclusive = exclusive
+        self.concurrency = concurrency
+        self.checkmode = checkmode
+        self.desired = {}  # (owner_type, owner_id) -> [record]
+        for record in records:
+            owner_type = record.get("owner_type") or "sbm_server"
+            if owner_type not in PTR_OWNER_TYPES:
+                raise ModuleError(f"Unknown owner_type={owner_type}.")
+            for key in ("owner_id", "ip", "domain"):
+                if not record.get(key):
+                    raise ModuleError(f"{key} is required for every record.")
+            desired = {
+                "ip": record["ip"],
+                "domain": record["domain"],
+                "ttl": ttl if record.get("ttl") is None else record["ttl"],
+                "priority": priority if record.get("priority") is None else record["priority"],
+            }
+            owner_records = self.desired.setdefault((owner_type, record["owner_id"]), [])
+            if desired not in owner_records:
+                owner_records.append(desired)
+
+    def list_records(self, owner):
+        owner_type, owner_id = owner
+        if owner_type == "sbm_server":
+            return list(self.api.list_sbm_server_ptr_records(owner_id))
+        return list(self.api.list_instance_ptr_records(owner_id))
+
+    def create(self, owner, record):
+        owner_type, owner_id = owner
+        if owner_type == "sbm_server":
+            self.api.post_sbm_server_ptr_record(
+                server_id=owner_id,
+                ip=record["ip"],
+                domain=record["domain"],
+                ttl=record["ttl"],
+                priority=record["priority"],
+            )
+        else:
+            self.api.post_instance_ptr_records(
+                instance_id=owner_id,
+                data=record["domain"],
+                ip=record["ip"],
+                ttl=record["ttl"],
+                priority=record["priority"],
+            )
+
+    def delete(self, owner, record):
+        owner_type, owner_id = owner
+        try:
+            if owner_type == "sbm_server":
+                self.api.delete_sbm_server_ptr_record(
+                    server_id=owner_id, record_id=record["id"]
+                )
+            else:
+                self.api.delete_instance_ptr_records(
+                    instance_id=owner_id, record_id=record["id"]
+                )
+        except APIError404:
+            pass  # already gone
+
+    @staticmethod
+    def matches(existing, desired):
+        return (
+            existing["ip"] == desired["ip"]
+            and existing["domain"] == desired["domain"]
+            and desired["ttl"] in (None, existing.get("ttl"))
+            and desired["priority"] in (None, existing.get("priority"))
+        )
+
+    def diff(self, desired, existing):
+        """Return (to_delete, to_create, unchanged count) for one owner."""
+        to_create = []
+        kept = set()
+        for record in desired:
+            for index, current in enumerate(existing):
+                if index not in kept and self.matches(current, record):
+                    kept.add(index)
+                    break
+            else:
+                to_create.append(record)
+        desired_ips = {record["ip"] for record in desired}
+        to_delete = [
+            current
+            for index, current in enumerate(existing)
+            if index not in kept and (self.exclusive or current["ip"] in desired_ips)
+        ]
+        return to_delete, to_create, len(kept)
+
+    def apply(self, executor, function, operations):
+        """Run function(owner, record) for operations; return failures."""
+
+        def call(operation):
+            try:
+                function(*operation)
+            except APIError as e:
+                return e.msg
+            return None
+
+        failed = []
+        for (owner, record), error in zip(operations, executor.map(call, operations)):
+            if error is not None:
+                failed.append(dict(describe(owner, record), msg=error))
+        return failed
+
+    def run(self):
+        owners = list(self.desired)
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            existing = dict(zip(owners, executor.map(self.list_records, owners)))
+            deletes, creates, unchanged = [], [], 0
+            for owner in owners:
+                to_delete, to_create, kept = self.diff(self.desired[owner], existing[owner])
+                deletes.extend((owner, record) for record in to_delete)
+                creates.extend((owner, record) for record in to_create)
+                unchanged += kept
+            failed = []
+            if not self.checkmode:
+                failed.extend(self.apply(executor, self.delete, deletes))
+                failed.extend(self.apply(executor, self.create, creates))
+        result = {
+            "changed": bool(deletes or creates),
+            "created": [describe(owner, record) for owner, record in creates],
+            "deleted": [describe(owner, record) for owner, record in deletes],
+            "errors": failed,
+            "summary": {
+                "owners": len(owners),
+                "created": len(creates),
+                "deleted": len(deletes),
+                "unchanged": unchanged,
+                "failed": len(failed),
+            },
+        }
+        if failed:
+            raise PartialFailureError(
+                f"{len(failed)} of {len(creates) + len(deletes)} PTR changes failed.",
+                result,
+            )
+        return result
+
+
+def describe(owner, record):
+    owner_type, owner_id = owner
+    return {
+        "owner_type": owner_type,
+        "owner_id": owner_id,
+        "ip": record["ip"],
+        "domain": record["domain"],
+        "ttl": record.get("ttl"),
+        "priority": record.get("priority"),
+    }
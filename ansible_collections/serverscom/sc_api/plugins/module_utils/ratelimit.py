@@ -0,0 +1,198 @@
+from __future__ import absolute_import, division, print_function
+import hashlib
+import json
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # not a POSIX system, limit within this process only
+    fcntl = None
+
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (  # noqa: F401
+    RATE_LIMIT_MAX_WAIT,
+    THROTTLE_STATS,
+    default_cache_dir,
+)
+
+
+__metaclass__ = type
+
+
+DEFAULT_RATE_LIMIT = 10  # requests per second
+# Used when the API answers 429 without saying when to come back.
+RATE_LIMIT_FALLBACK_DELAY = 1
+
+_stats_lock = threading.Lock()
+
+
+def _record(seconds=0.0, rate_limited=0):
+    with _stats_lock:
+        THROTTLE_STATS["seconds"] += seconds
+        THROTTLE_STATS["rate_limited"] += rate_limited
+
+
+def parse_retry_after(value, now):
+    """Return seconds to wait from a Retry-After header value, or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    # pylint: disable=bad-option-value, import-outside-toplevel
+    from email.utils import parsedate_to_datetime
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - now)
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+def parse_rate_limit_reset(value, now):
+    """Return seconds until X-RateLimit-Reset (epoch or delta seconds)."""
+    try:
+        reset = float(value)
+    except (TypeError, ValueError):
+        return None
+    if reset > 1e9:  # a timestamp, not a delay
+        reset -= now
+    return max(0.0, reset)
+
+
+class RateLimiter:
+    """Token bucket shared by all module processes using the same account.
+
+    The bucket state lives in a small JSON file next to the reference data
+    cache, updated under an exclusive flock. Each request reserves a token;
+    if the bucket is empty, the caller sleeps until its token is due.
+    429 responses and X-RateLimit-* headers stop everyone until the API
+    says it is ready again.
+
+    rate: requests per second (bucket size is the same number, at least 1).
+        0 means no client-side limit; the API's own signals are still honored.
+    """
+
+    def __init__(self, token, endpoint, rate=DEFAULT_RATE_LIMIT, state_dir=None):
+        self.rate = rate
+        self.burst = max(1.0, float(rate))
+        state_dir = state_dir or default_cache_dir()
+        account = hashlib.sha256(f"{endpoint}\0{token}".encode()).hexdigest()
+        self.state_dir = state_dir
+        self.state_path = os.path.join(state_dir, f"ratelimit-{account}.json")
+        self._thread_lock = threading.Lock()
+        self._fallback_state = None
+
+    def _update(self, change):
+        """Apply change(state, now) to the shared state under a lock.
+
+        Returns whatever change returns. If the state file can't be used,
+        works on a fresh state (so limiting is per-process at worst).
+        """
+        with self._thread_lock:
+            lock_file = None
+            try:
+                os.makedirs(self.state_dir, mode=0o700, exist_ok=True)
+                lock_file = open(self.state_path + ".lock", "a")
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+            except OSError:
+                lock_file = None
+            try:
+                now = time.time()
+                state = self._read(now)
+                result = change(state, now)
+                if lock_file is not None:
+                    self._write(state)
+                else:
+                    self._fallback_state = state
+                return result
+            finally:
+                if lock_file is not None:
+                    lock_file.close()
+
+    def _read(self, now):
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                state = json.load(f)
+            return {
+                "tokens": float(state["tokens"]),
+                "updated": float(state["updated"]),
+                "blocked_until": float(state["blocked_until"]),
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            if self._fallback_state:
+                return self._fallback_state
+            return {"tokens": self.burst, "updated": now, "blocked_until": 0.0}
+
+    def _write(self, state):
+        tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_path)
+        except OSError:
+            self._fallback_state = state
+
+    def _refill(self, state, now):
+        if self.rate:
+            elapsed = max(0.0, now - state["updated"])
+            state["tokens"] = min(self.burst, state["tokens"] + elapsed * self.rate)
+        state["updated"] = now
+
+    def _reserve(self, state, now):
+        self._refill(state, now)
+        delay = max(0.0, state["blocked_until"] - now)
+        if self.rate:
+            state["tokens"] -= 1
+            if state["tokens"] < 0:
+                delay = max(delay, -state["tokens"] / self.rate)
+        return delay
+
+    def acquire(self):
+        """Wait for permission to send a request. Returns seconds waited."""
+        delay = self._update(self._reserve)
+        if delay > 0:
+            time.sleep(delay)
+            _record(seconds=delay)
+        return delay
+
+    def observe(self, response):
+        """Learn from response headers.
+
+        Returns seconds to wait before retrying if the response is a 429,
+        otherwise None.
+        """
+        headers = response.headers
+        if response.status_code == 429:
+            _record(rate_limited=1)
+            now = time.time()
+            delay = parse_retry_after(headers.get("Retry-After"), now)
+            if delay is None:
+                delay = parse_rate_limit_reset(headers.get("X-RateLimit-Reset"), now)
+            if delay is None:
+                delay = RATE_LIMIT_FALLBACK_DELAY
+            self._block(delay, tokens=0.0)
+            return delay
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return None
+        try:
+            remaining = float(remaining)
+        except ValueError:
+            return None
+        if remaining <= 0:
+            delay = parse_rate_limit_reset(headers.get("X-RateLimit-Reset"), time.time())
+            self._block(delay or RATE_LIMIT_FALLBACK_DELAY, tokens=0.0)
+        elif self.rate:
+            self._block(0, tokens=remaining)
+        return None
+
+    def _block(self, delay, tokens):
+        def change(state, now):
+            self._refill(state, now)
+            state["blocked_until"] = max(state["blocked_until"], now + delay)
+            state["tokens"] = min(state["tokens"], tokens)
+
+        self._update(change)
@@ -1,29 +1,60 @@
 from __future__ import absolute_import, division, print_function
-import time
+from concurrent.futures import ThreadPoolExecutor
 
 from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
     APIError404,
-    ScApi,
+    ScApiBase,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_locations import (
+    LocationsApi,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_rbs import (
+    RbsApi,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     ModuleError,
     WaitError,
-    _retry_rules_for_wait,
+    Poller,
+    wait_until_gone,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    Projection,
 )
 
 
 __metaclass__ = type
 
 
+# Concurrent requests for volume credentials (one request per volume).
+CREDENTIALS_WORKERS = 8
+
+
+class ScRbsApi(ScApiBase, RbsApi, LocationsApi):
+    """The part of the API used by RBS modules."""
+
+
+def resolve_location_code(api, location_code):
+    """Return ID of the location with location_code."""
+    location_code = location_code.upper()
+    for location in api.list_locations(search_pattern=location_code):
+        if location.get("code") == location_code:
+            return location.get("id")
+    raise ModuleError(f"Location with code '{location_code}' not found.")
+
+
 class ScRBSFlavorsInfo:
-    def __init__(self, endpoint, token, location_id):
-        self.api = ScApi(token, endpoint)
+    def __init__(self, endpoint, token, location_id, projection=None):
+        self.api = ScRbsApi(token, endpoint)
         self.location_id = location_id
+        self.projection = projection or Projection()
 
     def run(self):
         return {
             "changed": False,
-            "rbs_volume_flavors": list(self.api.list_rbs_flavors(self.location_id)),
+            **self.projection.output(
+                "rbs_volume_flavors",
+                self.api.list_rbs_flavors(self.location_id)
+            ),
         }
 
 
@@ -36,44 +67,66 @@ class ScRBSVolumeList:
         search_pattern=None,
         location_id=None,
         location_code=None,
+        include_credentials=True,
+        credentials_for=None,
+        credentials_workers=CREDENTIALS_WORKERS,
+        projection=None,
     ):
-        self.api = ScApi(token, endpoint)
+        self.api = ScRbsApi(token, endpoint)
         self.label_selector = label_selector
         self.search_pattern = search_pattern
         self.location_id = location_id
         self.location_code = location_code
+        self.include_credentials = include_credentials
+        self.credentials_for = credentials_for
+        self.credentials_workers = credentials_workers
+        self.projection = projection or Projection()
 
-        if not self.location_id and self.location_code:
-            self.location_code = self.location_code.upper()
-            locations = self.api.list_locations(search_pattern=self.location_code)
-
-            for location in locations:
-                if location.get("code") == self.location_code:
-                    self.location_id = location.get("id")
-                    break
+    def needs_credentials(self, volume):
+        if not self.include_credentials:
+            return False
+        if not self.credentials_for:
+            return True
+        return (
+            volume["id"] in self.credentials_for
+            or volume.get("name") in self.credentials_for
+        )
 
-            if not self.location_id:
-                raise ModuleError(
-                    f"Location with code '{self.location_code}' not found."
+    def fetch_credentials(self, volumes):
+        """Add username and password to volumes, credentials_workers at a time."""
+        if not volumes:
+            return
+        with ThreadPoolExecutor(
+            max_workers=min(self.credentials_workers, len(volumes))
+        ) as executor:
+            all_credentials = executor.map(
+                self.api.get_rbs_volume_credentials,
+                [volume["id"] for volume in volumes],
+            )
+            for volume, volume_credentials in zip(volumes, all_credentials):
+                volume.update(
+                    {
+                        "username": volume_credentials["username"],
+                        "password": volume_credentials["password"],
+                    }
                 )
 
     def run(self):
+        if not self.location_id and self.location_code:
+            self.location_id = resolve_location_code(self.api, self.location_code)
         volumes = list(
-            self.api.list_rbs_volumes(
-                self.label_selector, self.search_pattern, self.location_id
+            self.projection.take(
+                self.api.list_rbs_volumes(
+                    self.label_selector, self.search_pattern, self.location_id
+                )
             )
         )
-        for volume in volumes:
-            volume_credentials = self.api.get_rbs_volume_credentials(volume["id"])
-            volume.update(
-                {
-                    "username": volume_credentials["username"],
-                    "password": volume_credentials["password"],
-                }
-            )
+        self.fetch_credentials(
+            [volume for volume in volumes if self.needs_credentials(volume)]
+        )
         return {
             "changed": False,
-            "rbs_volumes": volumes,
+            **self.projection.output("rbs_volumes", volumes),
         }
 
 
@@ -94,7 +147,7 @@ class scRBSVolumeCreateUpdateDelete:
         update_interval,
         checkmode,
     ):
-        self.api = ScApi(token, endpoint)
+        self.api = ScRbsApi(token, endpoint)
         self.volume_id = volume_id
         self.name = name
         self.location_id = location_id
@@ -107,19 +160,10 @@ class scRBSVolumeCreateUpdateDelete:
         self.update_interval = update_interval
         self.checkmode = checkmode
 
+    def resolve_ids(self):
+        """Resolve location_code and flavor_name (needed for creation only)."""
         if not self.location_id and self.location_code:
-            self.location_code = self.location_code.upper()
-            locations = self.api.list_locations(search_pattern=self.location_code)
-
-            for location in locations:
-                if location.get("code") == self.location_code:
-                    self.location_id = location.get("id")
-                    break
-
-            if not self.location_id:
-                raise ModuleError(
-                    f"Location with code '{self.location_code}' not found."
-                )
+            self.location_id = resolve_location_code(self.api, self.location_code)
 
         if not self.flavor_id and self.flavor_name:
             flavors = self.api.list_rbs_flavors(location_id=self.location_id)
@@ -165,6 +209,7 @@ class scRBSVolumeCreateUpdateDelete:
             return result
 
     def create_or_update_volume(self):
+        self.resolve_ids()
         result = {"changed": False, "rbs_volume": None}
         existing_volume = self.api.get_rbs_volume_by_name(self.name)
         if existing_volume:
@@ -228,60 +273,41 @@ class scRBSVolumeCreateUpdateDelete:
         return {"changed": not no_volume, "rbs_volume": {}}
 
     def wait_for_active(self):
+        poller = Poller(self.wait, self.update_interval)
         volume = self.api.get_rbs_volume(
-            self.volume_id,
-            retry_rules=_retry_rules_for_wait(
-                max_wait=self.wait, delay=self.update_interval
-            ),
+            self.volume_id, retry_rules=poller.retry_rules()
         )
         if self.wait == 0:
             return volume
-        start_time = time.time()
         while True:
             if volume["status"] == "active":
                 return volume
-            elapsed = time.time() - start_time
-            if elapsed > self.wait:
+            if not poller.sleep():
+                elapsed = poller.elapsed()
                 raise WaitError(
                     msg=f"Timeout waiting for RBS volume {self.volume_id} to become active after {elapsed:.2f} seconds.",
                     timeout=elapsed,
                 )
-            time.sleep(self.update_interval)
             volume = self.api.get_rbs_volume(
-                self.volume_id,
-                retry_rules=_retry_rules_for_wait(
-                    max_wait=max(0, self.wait - elapsed),
-                    delay=self.update_interval,
-                ),
+                self.volume_id, retry_rules=poller.retry_rules()
             )
 
     def wait_for_disappearance(self):
         if self.wait == 0:
             return
-        start_time = time.time()
-        while True:
-            try:
-                elapsed = time.time() - start_time
-                self.api.get_rbs_volume(
-                    self.volume_id,
-                    retry_rules=_retry_rules_for_wait(
-                        max_wait=max(0, self.wait - elapsed),
-                        delay=self.update_interval,
-                    ),
-                )
-            except APIError404:
-                return []
-            if elapsed > self.wait:
-                raise WaitError(
-                    msg=f"Timeout waiting for RBS volume {self.volume_id} to disappear after {elapsed:.2f} seconds.",
-                    timeout=elapsed,
-                )
-            time.sleep(self.update_interval)
+        wait_until_gone(
+            lambda retry_rules: self.api.get_rbs_volume(
+                self.volume_id, retry_rules=retry_rules
+            ),
+            self.wait,
+            self.update_interval,
+            f"RBS volume {self.volume_id}",
+        )
 
 
 class ScRBSVolumeCredentialsInfo:
     def __init__(self, endpoint, token, volume_id, name):
-        self.api = ScApi(token, endpoint)
+        self.api = ScRbsApi(token, endpoint)
         self.volume_id = volume_id
         self.name = name
 
@@ -303,7 +329,7 @@ class ScRBSVolumeCredentialsReset:
     def __init__(
         self, endpoint, token, wait, update_interval, checkmode, volume_id, name
     ):
-        self.api = ScApi(token, endpoint)
+        self.api = ScRbsApi(token, endpoint)
         self.volume_id = volume_id
         self.name = name
         self.wait = wait
@@ -320,23 +346,18 @@ class ScRBSVolumeCredentialsReset:
         if not self.checkmode:
             rbs_volume = self.api.reset_rbs_volume_credentials(self.volume_id)
             if self.wait > 0:
-                start_time = time.time()
+                poller = Poller(self.wait, self.update_interval)
                 while True:
                     if rbs_volume["status"] == "active":
                         break
-                    elapsed = time.time() - start_time
-                    if elapsed > self.wait:
+                    if not poller.sleep():
+                        elapsed = poller.elapsed()
                         raise WaitError(
                             msg=f"Timeout waiting for RBS volume {self.volume_id} to become active after {elapsed:.2f} seconds.",
                             timeout=elapsed,
                         )
-                    time.sleep(self.update_interval)
                     rbs_volume = self.api.get_rbs_volume(
-                        self.volume_id,
-                        retry_rules=_retry_rules_for_wait(
-                            max_wait=max(0, self.wait - elapsed),
-                            delay=self.update_interval,
-                        ),
+                        self.volume_id, retry_rules=poller.retry_rules()
                     )
                 rbs_volume_credentials = self.api.get_rbs_volume_credentials(
                     self.volume_id
@@ -0,0 +1,194 @@
+from __future__ import absolute_import, division, print_function
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (  # noqa: F401
+    REVALIDATE_DISK,
+    REVALIDATE_MEMORY,
+    REVALIDATE_MODES,
+    REVALIDATE_OFF,
+    default_cache_dir,
+)
+
+
+__metaclass__ = type
+
+
+# Upper bound for bodies kept in memory by one process; the least
+# recently used entries are dropped first.
+MEMORY_LIMIT = 64 * 1024 * 1024
+
+# Headers which describe the transfer rather than the body, so they are
+# neither stored nor taken over from a 304 answer.
+_TRANSFER_HEADERS = frozenset(
+    (
+        "connection content-encoding content-length date keep-alive "
+        "transfer-encoding x-correlation-id"
+    ).split()
+)
+
+
+class _Memory:
+    """Process-wide LRU of validated responses, shared by all ApiHelpers."""
+
+    def __init__(self, limit=MEMORY_LIMIT):
+        self.lock = threading.Lock()
+        self.limit = limit
+        self.clear()
+
+    def clear(self):
+        with self.lock:
+            self.entries = OrderedDict()
+            self.size = 0
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def put(self, key, entry):
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old["content"])
+            if len(entry["content"]) > self.limit:
+                return
+            self.entries[key] = entry
+            self.size += len(entry["content"])
+            while self.size > self.limit:
+                _key, dropped = self.entries.popitem(last=False)
+                self.size -= len(dropped["content"])
+
+
+# Validated responses of this process (every module invocation is a
+# separate process, so this lasts for one task).
+MEMORY = _Memory()
+
+
+class ValidatorStore:
+    """ETag/Last-Modified validators and bodies of GET responses.
+
+    A GET whose URL has an entry is sent with If-None-Match and/or
+    If-Modified-Since; a 304 answer is then served from the stored
+    body, so unchanged objects and pages polled again cost no
+    download. Entries are keyed by a hash of the token, endpoint and
+    full URL (query included), so accounts never share them.
+
+    mode:
+        memory: keep entries for the lifetime of the process.
+        disk: also keep them as files in cache_dir/validators, so
+            later module runs revalidate too.
+        off: send plain GETs.
+    """
+
+    def __init__(self, token, endpoint, mode=REVALIDATE_MEMORY, cache_dir=None):
+        self.mode = mode
+        self.directory = os.path.join(cache_dir or default_cache_dir(), "validators")
+        self.account = hashlib.sha256(f"{endpoint}\0{token}".encode()).hexdigest()
+
+    @property
+    def enabled(self):
+        return self.mode in (REVALIDATE_MEMORY, REVALIDATE_DISK)
+
+    def key(self, url):
+        return hashlib.sha256(f"{self.account}\0{url}".encode()).hexdigest()
+
+    def entry_path(self, key):
+        return os.path.join(self.directory, key + ".json")
+
+    def get(self, url):
+        """Return the stored entry for url, or None."""
+        if not self.enabled:
+            return None
+        key = self.key(url)
+        entry = MEMORY.get(key)
+        if entry is None and self.mode == REVALIDATE_DISK:
+            entry = self._read(key)
+            if entry is not None:
+                MEMORY.put(key, entry)
+        return entry
+
+    def conditional_headers(self, entry):
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url, response, disk=True):
+        """Keep a 200 response if it has a validator (ETag or Last-Modified).
+
+        Without disk (answers with secrets) it is kept in memory only.
+        """
+        if not self.enabled:
+            return
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        key = self.key(url)
+        entry = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "headers": _body_headers(response.headers),
+            "content": response.content,
+        }
+        MEMORY.put(key, entry)
+        if disk and self.mode == REVALIDATE_DISK:
+            self._write(key, entry)
+
+    def merged_headers(self, entry, response):
+        """Stored headers updated with those of a 304 answer (RFC 9111 4.3.4)."""
+        headers = dict(entry["headers"])
+        headers.update(_body_headers(response.headers))
+        correlation_id = response.headers.get("X-Correlation-ID")
+        if correlation_id:
+            headers["X-Correlation-ID"] = correlation_id
+        return headers
+
+    def _read(self, key):
+        try:
+            with open(self.entry_path(key), encoding="utf-8") as f:
+                entry = json.load(f)
+            entry["content"] = entry["content"].encode("utf-8")
+        except (OSError, ValueError, KeyError, AttributeError):
+            return None
+        return entry
+
+    def _write(self, key, entry):
+        """Write entry atomically; failures only cost a full download later."""
+        try:
+            content = entry["content"].decode("utf-8")
+        except UnicodeDecodeError:
+            return
+        tmp = None
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(dict(entry, content=content), f)
+            os.replace(tmp, self.entry_path(key))
+            tmp = None
+        except OSError:
+            pass
+        finally:
+            if tmp is not None:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+
+
+def _body_headers(headers):
+    return {
+        name: value
+        for name, value in headers.items()
+        if name.lower() not in _TRANSFER_HEADERS
+    }
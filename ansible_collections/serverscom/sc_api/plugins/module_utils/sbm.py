@@ -1,23 +1,46 @@
 from __future__ import absolute_import, division, print_function
 import re
-import time
+import uuid
 
 from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
     APIError404,
     APIError409,
-    ScApi,
+    SCBaseError,
+    ScApiBase,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_locations import (
+    LocationsApi,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_sbm import (
+    SbmApi,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_ssh_keys import (
+    SshKeysApi,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     ModuleError,
+    PartialFailureError,
     WaitError,
     CHANGED,
     NOT_CHANGED,
-    _retry_rules_for_wait,
+    Poller,
+    wait_until_gone,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    Projection,
 )
 
 
 __metaclass__ = type
 
+# Label put on the servers ordered by one ScSbmServersCreate run (with a
+# random value), so waiting lists only them.
+ORDER_LABEL = "sc-ansible-order"
+
+
+class ScSbmApi(ScApiBase, SbmApi, LocationsApi, SshKeysApi):
+    """The part of the API used by SBM modules."""
+
 
 def resolve_sbm_server_id(api, server_id=None, hostname=None):
     """Resolve server_id or hostname to server_id.
@@ -32,10 +55,13 @@ def resolve_sbm_server_id(api, server_id=None, hostname=None):
         raise ModuleError("One of server_id or hostname must be provided.")
     if server_id:
         return server_id
-    found = []
-    for server in api.list_sbm_servers(search_pattern=hostname):
-        if server.get("title") == hostname:
-            found.append(server)
+    found = api.toolbox.find_by_name(
+        "sbm_servers",
+        hostname,
+        search=lambda: api.list_sbm_servers(search_pattern=hostname),
+        get=api.get_sbm_servers,
+        name_key="title",
+    )
     if len(found) > 1:
         raise ModuleError(f"Multiple SBM servers found with hostname '{hostname}'.")
     if len(found) == 1:
@@ -167,10 +193,13 @@ def resolve_operating_system_id(
 class ScSbmServerInfo:
     """Get single SBM server info with ready state check."""
 
-    def __init__(self, endpoint, token, server_id, fail_on_absent):
-        self.api = ScApi(token, endpoint)
+    def __init__(
+        self, endpoint, token, server_id, fail_on_absent, api=None, projection=None
+    ):
+        self.api = api or ScSbmApi(token, endpoint)
         self.server_id = server_id
         self.fail_on_absent = fail_on_absent
+        self.projection = projection or Projection()
 
     @staticmethod
     def _is_server_ready(server_info):
@@ -189,7 +218,7 @@ class ScSbmServerInfo:
             if self.fail_on_absent:
                 raise e
             return {"changed": False, "found": False, "ready": False}
-        module_output = server_info
+        module_output = self.projection.one(server_info)
         module_output["found"] = True
         module_output["ready"] = self._is_server_ready(server_info)
         module_output["changed"] = False
@@ -199,8 +228,8 @@ class ScSbmServerInfo:
 class ScSbmServerPower:
     """Power on/off/cycle with wait support."""
 
-    def __init__(self, endpoint, token, server_id, state, wait, checkmode):
-        self.api = ScApi(token, endpoint)
+    def __init__(self, endpoint, token, server_id, state, wait, checkmode, api=None):
+        self.api = api or ScSbmApi(token, endpoint)
         self.server_id = server_id
         self.state = state
         self.wait = wait
@@ -208,15 +237,10 @@ class ScSbmServerPower:
         self.interval = 5
 
     def wait_for_status(self, target_status):
-        start = time.time()
+        poller = Poller(self.wait, self.interval)
         while True:
-            elapsed = time.time() - start
             server = self.api.get_sbm_servers(
-                self.server_id,
-                retry_rules=_retry_rules_for_wait(
-                    max_wait=max(0, self.wait - elapsed),
-                    delay=self.interval,
-                ),
+                self.server_id, retry_rules=poller.retry_rules()
             )
             status = server["power_status"]
             if status == target_status:
@@ -225,11 +249,10 @@ class ScSbmServerPower:
                 raise ModuleError(
                     f"Unexpected power_status={status}, expected {target_status}"
                 )
-            if elapsed > self.wait:
+            if not poller.sleep():
                 raise ModuleError(
                     f"Timeout waiting for power_status={target_status}, last={status}"
                 )
-            time.sleep(self.interval)
 
     def _retry_on_conflict(self, action):
         """Call action(), retrying on 409 CONFLICT until wait timeout.
@@ -238,7 +261,7 @@ class ScSbmServerPower:
         (power management temporarily unavailable).  Other 409 errors
         (e.g. ``NETWORK_IS_NOT_READY``) are not retried.
         """
-        start = time.time()
+        poller = Poller(self.wait, self.interval)
         while True:
             try:
                 action()
@@ -246,9 +269,8 @@ class ScSbmServerPower:
             except APIError409 as e:
                 if '"code":"CONFLICT"' not in e.msg:
                     raise
-                if time.time() - start > self.wait:
+                if not poller.sleep():
                     raise
-                time.sleep(self.interval)
 
     def power_on(self):
         try:
@@ -334,6 +356,7 @@ class ScSbmServerReinstall:
         wait=86400,
         update_interval=60,
         checkmode=False,
+        api=None,
     ):
         if wait:
             if int(wait) < int(update_interval):
@@ -341,16 +364,15 @@ class ScSbmServerReinstall:
                     f"Update interval ({update_interval}) is longer "
                     f"than wait time ({wait})"
                 )
-        self.api = ScApi(token, endpoint)
+        self.api = api or ScSbmApi(token, endpoint)
         self.server_data = None
         self.server_id = server_id
-        self.hostname = self.get_hostname(hostname)
+        self.hostname = hostname
+        self.operating_system_id = operating_system_id
         self.operating_system_name = operating_system_name
         self.operating_system_regex = operating_system_regex
-        self.operating_system_id = self.get_operating_system_id(
-            operating_system_id, operating_system_name, operating_system_regex
-        )
-        self.ssh_keys = self.get_ssh_keys(ssh_keys, ssh_key_name)
+        self.ssh_keys = ssh_keys
+        self.ssh_key_name = ssh_key_name
         self.wait = wait
         self.update_interval = update_interval
         self.user_data = user_data
@@ -489,27 +511,34 @@ class ScSbmServerReinstall:
         ]
 
     def wait_for_server(self):
+        # Right after the reinstall request the server may still report
+        # its old, ready status: accept ready only once it was seen busy,
+        # or after update_interval (the first poll of the old fixed-interval
+        # loop).
         ready = False
-        start_time = time.time()
-        elapsed = 0
+        started = False
+        poller = Poller(self.wait, self.update_interval)
         while not ready:
-            time.sleep(self.update_interval)
-            elapsed = time.time() - start_time
-            if elapsed > self.wait:
-                raise WaitError(msg="Server is not ready.", timeout=elapsed)
+            if not poller.sleep():
+                raise WaitError(msg="Server is not ready.", timeout=poller.elapsed())
             server_info = self.api.get_sbm_servers(
-                self.server_id,
-                retry_rules=_retry_rules_for_wait(
-                    max_wait=max(0, self.wait - elapsed),
-                    delay=self.update_interval,
-                ),
+                self.server_id, retry_rules=poller.retry_rules()
             )
             ready = ScSbmServerInfo._is_server_ready(server_info)
+            started = started or not ready
+            ready = ready and (started or poller.elapsed() >= self.update_interval)
         server_info["ready"] = True
-        server_info["elapsed"] = elapsed
+        server_info["elapsed"] = poller.elapsed()
         return server_info
 
     def run(self):
+        self.hostname = self.get_hostname(self.hostname)
+        self.operating_system_id = self.get_operating_system_id(
+            self.operating_system_id,
+            self.operating_system_name,
+            self.operating_system_regex,
+        )
+        self.ssh_keys = self.get_ssh_keys(self.ssh_keys, self.ssh_key_name)
         if self.checkmode:
             return {"changed": True}
         result = self.api.post_sbm_server_reinstall(
@@ -528,13 +557,18 @@ class ScSbmServerReinstall:
 class ScSbmServerPtrInfo:
     """Query PTR records for SBM server."""
 
-    def __init__(self, endpoint, token, server_id):
-        self.api = ScApi(token, endpoint)
+    def __init__(self, endpoint, token, server_id, api=None, projection=None):
+        self.api = api or ScSbmApi(token, endpoint)
         self.server_id = server_id
+        self.projection = projection or Projection()
 
     def run(self):
-        ptr_records = list(self.api.list_sbm_server_ptr_records(self.server_id))
-        return {"changed": False, "ptr_records": ptr_records}
+        return {
+            "changed": False,
+            **self.projection.output(
+                "ptr_records", self.api.list_sbm_server_ptr_records(self.server_id)
+            ),
+        }
 
 
 class ScSbmServerPtr:
@@ -551,8 +585,9 @@ class ScSbmServerPtr:
         ttl,
         priority,
         checkmode,
+        api=None,
     ):
-        self.api = ScApi(token, endpoint)
+        self.api = api or ScSbmApi(token, endpoint)
         self.state = state
         self.server_id = server_id
         self.ip = ip
@@ -612,15 +647,19 @@ class ScSbmServerPtr:
 class ScSbmFlavorModelsInfo:
     """List SBM flavor models for a location."""
 
-    def __init__(self, endpoint, token, location_id, search_pattern):
-        self.api = ScApi(token, endpoint)
+    def __init__(
+        self, endpoint, token, location_id, search_pattern, api=None, projection=None
+    ):
+        self.api = api or ScSbmApi(token, endpoint)
         self.location_id = location_id
         self.search_pattern = search_pattern
+        self.projection = projection or Projection()
 
     def run(self):
         return {
             "changed": False,
-            "sbm_flavor_models": list(
+            **self.projection.output(
+                "sbm_flavor_models",
                 self.api.list_sbm_flavor_models(self.location_id, self.search_pattern)
             ),
         }
@@ -642,12 +681,13 @@ class ScSbmServerCreate:
         wait,
         update_interval,
         checkmode,
+        api=None,
     ):
         if wait and int(update_interval) > int(wait):
             raise ModuleError(
                 f"Update interval ({update_interval}) is longer than wait time ({wait})"
             )
-        self.api = ScApi(token, endpoint)
+        self.api = api or ScSbmApi(token, endpoint)
         self.location_id = location_id
         self.sbm_flavor_model_id = sbm_flavor_model_id
         self.hostname = hostname
@@ -659,25 +699,19 @@ class ScSbmServerCreate:
         self.checkmode = checkmode
 
     def wait_for_server(self, server):
-        start_time = time.time()
+        poller = Poller(self.wait, self.update_interval)
         while not ScSbmServerInfo._is_server_ready(server):
-            time.sleep(self.update_interval)
-            elapsed = time.time() - start_time
-            if elapsed > self.wait:
+            if not poller.sleep():
                 raise WaitError(
                     msg=f"Timeout waiting for SBM server {server.get('id')} "
                     f"to become ready. Last status: "
                     f"status={server.get('status')}, "
                     f"power_status={server.get('power_status')}, "
                     f"operational_status={server.get('operational_status')}",
-                    timeout=elapsed,
+                    timeout=poller.elapsed(),
                 )
             server = self.api.get_sbm_servers(
-                server["id"],
-                retry_rules=_retry_rules_for_wait(
-                    max_wait=max(0, self.wait - elapsed),
-                    delay=self.update_interval,
-                ),
+                server["id"], retry_rules=poller.retry_rules()
             )
         return server
 
@@ -698,12 +732,158 @@ class ScSbmServerCreate:
             user_data=self.user_data,
         )
         server = result[0]
+        self.api.toolbox.remember_name("sbm_servers", self.hostname, server["id"])
         if self.wait:
             server = self.wait_for_server(server)
         server["changed"] = True
         return server
 
 
+class ScSbmServersCreate:
+    """Order many SBM servers and wait for all of them together.
+
+    orders: list of dicts with location_id, sbm_flavor_model_id,
+    operating_system_id and hostnames; each is sent as one order.
+    Every server gets the ORDER_LABEL label with a value unique to this
+    run, and while waiting, servers are polled with one listing by that
+    label instead of a request per server. A server missing from the
+    listing is checked with a GET by its ID (the label may not be
+    applied yet); if it is gone (its order failed), it is not waited for.
+    The label stays on the servers.
+
+    If an order fails, or servers go missing, run() raises
+    PartialFailureError with the servers ordered so far.
+    """
+
+    def __init__(
+        self,
+        endpoint,
+        token,
+        orders,
+        ssh_key_fingerprints,
+        user_data,
+        wait,
+        update_interval,
+        checkmode,
+        api=None,
+    ):
+        if wait and int(update_interval) > int(wait):
+            raise ModuleError(
+                f"Update interval ({update_interval}) is longer than wait time ({wait})"
+            )
+        self.api = api or ScSbmApi(token, endpoint)
+        self.orders = orders
+        self.ssh_key_fingerprints = ssh_key_fingerprints
+        self.user_data = user_data
+        self.wait = wait
+        self.update_interval = update_interval
+        self.checkmode = checkmode
+        self.order_id = uuid.uuid4().hex  # value of ORDER_LABEL
+        self.missing = {}  # servers gone from the listing, by ID
+
+    def poll(self, servers, retry_rules):
+        """Refresh not ready servers with one listing of this run's servers.
+
+        Not ready servers which aren't listed are fetched by ID, and
+        moved to self.missing if that gives 404.
+        """
+        listed = {
+            server["id"]: server
+            for server in self.api.list_sbm_servers(
+                label_selector=f"{ORDER_LABEL}={self.order_id}",
+                retry_rules=retry_rules,
+            )
+        }
+        for server_id, server in list(servers.items()):
+            if ScSbmServerInfo._is_server_ready(server):
+                continue
+            if server_id in listed:
+                servers[server_id] = listed[server_id]
+                continue
+            try:
+                servers[server_id] = self.api.get_sbm_servers(
+                    server_id, retry_rules=retry_rules
+                )
+            except APIError404:
+                self.missing[server_id] = servers.pop(server_id)
+
+    def wait_for_servers(self, servers):
+        poller = Poller(self.wait, self.update_interval)
+        while True:
+            not_ready = [
+                server
+                for server in servers.values()
+                if not ScSbmServerInfo._is_server_ready(server)
+            ]
+            if not not_ready:
+                return
+            if not poller.sleep():
+                raise WaitError(
+                    msg=f"Timeout waiting for {len(not_ready)} of {len(servers)} "
+                    f"SBM servers to become ready: "
+                    + ", ".join(
+                        f"{server.get('id')} ({server.get('title')}, "
+                        f"status={server.get('status')})"
+                        for server in not_ready
+                    ),
+                    timeout=poller.elapsed(),
+                )
+            self.poll(servers, poller.retry_rules())
+
+    def run(self):
+        if self.checkmode:
+            return {
+                "changed": True,
+                "sbm_servers": [],
+                "info": "Servers should be created, "
+                "but check_mode is activated. "
+                "No real servers were created.",
+            }
+        servers = {}
+        for order in self.orders:
+            try:
+                ordered = self.api.post_sbm_servers(
+                    location_id=order["location_id"],
+                    sbm_flavor_model_id=order["sbm_flavor_model_id"],
+                    hosts=[
+                        {"hostname": hostname, "labels": {ORDER_LABEL: self.order_id}}
+                        for hostname in order["hostnames"]
+                    ],
+                    operating_system_id=order["operating_system_id"],
+                    ssh_key_fingerprints=self.ssh_key_fingerprints,
+                    user_data=self.user_data,
+                )
+            except SCBaseError as e:
+                if not servers:
+                    raise
+                failure = e.fail()
+                raise PartialFailureError(
+                    f"Order of {', '.join(order['hostnames'])} failed after "
+                    f"{len(servers)} servers were ordered: {failure['msg']}",
+                    dict(
+                        {k: v for k, v in failure.items() if k not in ("failed", "msg")},
+                        changed=True,
+                        sbm_servers=list(servers.values()),
+                    ),
+                )
+            for server in ordered:
+                servers[server["id"]] = server
+        if self.wait:
+            self.wait_for_servers(servers)
+        result = {"changed": True, "sbm_servers": list(servers.values())}
+        if self.missing:
+            raise PartialFailureError(
+                f"{len(self.missing)} of {len(servers) + len(self.missing)} "
+                "SBM servers disappeared while waiting (failed orders?): "
+                + ", ".join(
+                    f"{server.get('id')} ({server.get('title')})"
+                    for server in self.missing.values()
+                ),
+                dict(result, missing_sbm_servers=list(self.missing.values())),
+            )
+        return result
+
+
 class ScSbmServerDelete:
     """Delete (release) an SBM server.
 
@@ -723,12 +903,13 @@ class ScSbmServerDelete:
         retry_on_conflicts,
         wait_for_deletion,
         checkmode,
+        api=None,
     ):
         if wait and int(update_interval) > int(wait):
             raise ModuleError(
                 f"Update interval ({update_interval}) is longer than wait time ({wait})"
             )
-        self.api = ScApi(token, endpoint)
+        self.api = api or ScSbmApi(token, endpoint)
         self.server_id = server_id
         self.wait = wait
         self.update_interval = update_interval
@@ -737,46 +918,33 @@ class ScSbmServerDelete:
         self.checkmode = checkmode
 
     def retry_to_delete(self):
-        start_time = time.time()
+        poller = Poller(self.wait, self.update_interval)
         while True:
             try:
                 self.api.delete_sbm_server(self.server_id)
                 return
             except APIError409:
                 if self.retry_on_conflicts:
-                    elapsed = time.time() - start_time
-                    if elapsed > self.wait:
+                    if not poller.sleep():
                         raise WaitError(
                             msg=f"Timeout retrying delete for "
                             f"SBM server {self.server_id}",
-                            timeout=elapsed,
+                            timeout=poller.elapsed(),
                         )
-                    time.sleep(self.update_interval)
                 else:
                     raise
             except APIError404:
                 return
 
     def wait_for_disappearance(self):
-        start_time = time.time()
-        while True:
-            elapsed = time.time() - start_time
-            try:
-                self.api.get_sbm_servers(
-                    self.server_id,
-                    retry_rules=_retry_rules_for_wait(
-                        max_wait=max(0, self.wait - elapsed),
-                        delay=self.update_interval,
-                    ),
-                )
-            except APIError404:
-                return
-            if elapsed > self.wait:
-                raise WaitError(
-                    msg=f"Timeout waiting for SBM server {self.server_id} to disappear",
-                    timeout=elapsed,
-                )
-            time.sleep(self.update_interval)
+        wait_until_gone(
+            lambda retry_rules: self.api.get_sbm_servers(
+                self.server_id, retry_rules=retry_rules
+            ),
+            self.wait,
+            self.update_interval,
+            f"SBM server {self.server_id}",
+        )
 
     def run(self):
         try:
@@ -787,6 +955,7 @@ class ScSbmServerDelete:
             server["changed"] = True
             return server
         self.retry_to_delete()
+        self.api.toolbox.forget_name("sbm_servers", obj_id=self.server_id)
         if self.wait_for_deletion and self.wait:
             self.wait_for_disappearance()
         server["changed"] = True
@@ -804,17 +973,21 @@ class ScSbmServersInfo:
         location_id=None,
         rack_id=None,
         label_selector=None,
+        api=None,
+        projection=None,
     ):
-        self.api = ScApi(token, endpoint)
+        self.api = api or ScSbmApi(token, endpoint)
         self.search_pattern = search_pattern
         self.location_id = location_id
         self.rack_id = rack_id
         self.label_selector = label_selector
+        self.projection = projection or Projection()
 
     def run(self):
         return {
             "changed": False,
-            "sbm_servers": list(
+            **self.projection.output(
+                "sbm_servers",
                 self.api.list_sbm_servers(
                     search_pattern=self.search_pattern,
                     location_id=self.location_id,
@@ -828,8 +1001,8 @@ class ScSbmServersInfo:
 class ScSbmServerLabels:
     """Update labels on an SBM server."""
 
-    def __init__(self, endpoint, token, server_id, labels, checkmode):
-        self.api = ScApi(token, endpoint)
+    def __init__(self, endpoint, token, server_id, labels, checkmode, api=None):
+        self.api = api or ScSbmApi(token, endpoint)
         self.server_id = server_id
         self.labels = labels
         self.checkmode = checkmode
@@ -864,8 +1037,11 @@ class ScSbmServerNetworksInfo:
         interface_type=None,
         distribution_method=None,
         additional=None,
+        api=None,
+        projection=None,
     ):
-        self.api = ScApi(token, endpoint)
+        self.api = api or ScSbmApi(token, endpoint)
+        self.projection = projection or Projection()
         self.server_id = server_id
         self.network_id = network_id
         self.search_pattern = search_pattern
@@ -877,11 +1053,13 @@ class ScSbmServerNetworksInfo:
     def run(self):
         if self.network_id:
             network = self.api.get_sbm_server_network(self.server_id, self.network_id)
+            network = self.projection.one(network)
             network["changed"] = NOT_CHANGED
             return network
         return {
             "changed": False,
-            "networks": list(
+            **self.projection.output(
+                "networks",
                 self.api.list_sbm_server_networks(
                     server_id=self.server_id,
                     search_pattern=self.search_pattern,
@@ -909,12 +1087,13 @@ class ScSbmServerNetwork:
         wait=600,
         update_interval=10,
         checkmode=False,
+        api=None,
     ):
         if wait and int(update_interval) > int(wait):
             raise ModuleError(
                 f"Update interval ({update_interval}) is longer than wait time ({wait})"
             )
-        self.api = ScApi(token, endpoint)
+        self.api = api or ScSbmApi(token, endpoint)
         self.server_id = server_id
         self.state = state
         self.network_id = network_id
@@ -937,23 +1116,18 @@ class ScSbmServerNetwork:
         return network.get("status") == "active"
 
     def _wait_for_network_active(self, network):
-        start_time = time.time()
+        poller = Poller(self.wait, self.update_interval)
         while not self._is_network_active(network):
-            time.sleep(self.update_interval)
-            elapsed = time.time() - start_time
-            if elapsed > self.wait:
+            if not poller.sleep():
                 raise WaitError(
                     msg=f"Timeout waiting for network {network.get('id')} "
                     f"to become active. Last status: {network.get('status')}",
-                    timeout=elapsed,
+                    timeout=poller.elapsed(),
                 )
             network = self.api.get_sbm_server_network(
                 self.server_id,
                 network["id"],
-                retry_rules=_retry_rules_for_wait(
-                    max_wait=max(0, self.wait - elapsed),
-                    delay=self.update_interval,
-                ),
+                retry_rules=poller.retry_rules(),
             )
         return network
 
@@ -971,27 +1145,22 @@ class ScSbmServerNetwork:
         return network
 
     def _wait_for_network_gone(self):
-        start_time = time.time()
+        poller = Poller(self.wait, self.update_interval)
         while True:
-            elapsed = time.time() - start_time
             try:
                 network = self.api.get_sbm_server_network(
                     self.server_id,
                     self.network_id,
-                    retry_rules=_retry_rules_for_wait(
-                        max_wait=max(0, self.wait - elapsed),
-                        delay=self.update_interval,
-                    ),
+                    retry_rules=poller.retry_rules(),
                 )
             except APIError404:
                 return
-            if elapsed > self.wait:
+            if not poller.sleep():
                 raise WaitError(
                     msg=f"Timeout waiting for network {self.network_id} "
                     f"to be removed. Last status: {network.get('status')}",
-                    timeout=elapsed,
+                    timeout=poller.elapsed(),
                 )
-            time.sleep(self.update_interval)
 
     def delete(self):
         try:
@@ -1000,16 +1169,14 @@ class ScSbmServerNetwork:
             return {"changed": NOT_CHANGED}
         if self.checkmode:
             return {"changed": CHANGED}
-        start_time = time.time()
+        poller = Poller(self.wait, self.update_interval)
         while True:
             try:
                 self.api.delete_sbm_server_network(self.server_id, self.network_id)
                 break
             except APIError409:
-                elapsed = time.time() - start_time
-                if not self.wait or elapsed > self.wait:
+                if not poller.sleep():
                     raise
-                time.sleep(self.update_interval)
         if self.wait:
             self._wait_for_network_gone()
         return {"changed": CHANGED}
@@ -1026,8 +1193,9 @@ class ScSbmOSList:
         sbm_flavor_model_id=None,
         sbm_flavor_model_name=None,
         os_name_regex=None,
+        api=None,
     ):
-        self.api = ScApi(token, endpoint)
+        self.api = api or ScSbmApi(token, endpoint)
         self.location_id = location_id
         self.sbm_flavor_model_id = sbm_flavor_model_id
         self.sbm_flavor_model_name = sbm_flavor_model_name
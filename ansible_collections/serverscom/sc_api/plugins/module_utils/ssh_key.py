@@ -4,18 +4,28 @@ import base64
 import hashlib
 
 from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
-    ScApi,
+    ScApiBase,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_ssh_keys import (
+    SshKeysApi,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     ModuleError,
     CHANGED,
     NOT_CHANGED,
 )
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    Projection,
+)
 
 
 __metaclass__ = type
 
 
+class ScSshKeyApi(ScApiBase, SshKeysApi):
+    """The part of the API used by SSH key modules."""
+
+
 class ScSshKey(object):
     def __init__(
         self,
@@ -32,7 +42,7 @@ class ScSshKey(object):
         self.partial_match = []
         self.full_match = []
         self.any_match = []
-        self.api = ScApi(token, endpoint)
+        self.api = ScSshKeyApi(token, endpoint)
         self.checkmode = checkmode
         self.replace = replace
         self.state = state
@@ -130,12 +140,13 @@ class ScSshKey(object):
 
 
 class ScSshKeysInfo:
-    def __init__(self, endpoint, token, label_selector):
-        self.api = ScApi(token, endpoint)
+    def __init__(self, endpoint, token, label_selector, projection=None):
+        self.api = ScSshKeyApi(token, endpoint)
         self.label_selector = label_selector
+        self.projection = projection or Projection()
 
     def run(self):
         return {
             "changed": False,
-            "ssh_keys": list(self.api.list_ssh_keys(self.label_selector)),
+            **self.projection.output("ssh_keys", self.api.list_ssh_keys(self.label_selector)),
         }
@@ -0,0 +1,141 @@
+from __future__ import absolute_import, division, print_function
+import math
+import re
+import threading
+import time
+from urllib.parse import urlparse
+
+
+__metaclass__ = type
+
+
+# Path segments which are part of the API itself: snake_case names
+# (dedicated_servers, power_on, ...) and these single words. Anything
+# else (server IDs, fingerprints, location IDs, ...) becomes {id}.
+_LITERAL_SEGMENT = re.compile(r"^[a-z0-9]+(?:_[a-z0-9]+)+$")
+_LITERAL_WORDS = frozenset(
+    (
+        "activate credentials deactivate features flavors hosts images instances "
+        "l4 l7 locations members networks reboot regions reinstall rescue "
+        "unrescue volumes"
+    ).split()
+)
+
+
+def path_template(endpoint, url):
+    """Turn a request URL into a path template like /hosts/sbm_servers/{id}."""
+    path = urlparse(url).path
+    base = urlparse(endpoint).path.rstrip("/")
+    if base and path.startswith(base):
+        path = path[len(base):]
+    segments = [
+        segment
+        if segment in _LITERAL_WORDS or _LITERAL_SEGMENT.match(segment)
+        else "{id}"
+        for segment in path.strip("/").split("/")
+        if segment
+    ]
+    return "/" + "/".join(segments)
+
+
+def percentile(values, share):
+    """Nearest-rank percentile of sorted values."""
+    if not values:
+        return None
+    return values[max(0, math.ceil(share * len(values)) - 1)]
+
+
+class Tracer:
+    """Collects timings of API requests and sleeps made by this process.
+
+    Off by default; modules switch it on with the api_stats option (see
+    modules.configure_api_client). Requests made by several threads
+    (page prefetch, concurrent GETs) are recorded safely.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.enabled = False
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.started = time.time()
+            self.latencies = []
+            self.endpoints = {}
+            self.sleeps = {"wait": 0.0, "retry": 0.0}
+
+    def request(self, method, endpoint, url, status, size, seconds):
+        """Record one HTTP exchange (status is None if it failed)."""
+        if not self.enabled:
+            return
+        key = (method, path_template(endpoint, url))
+        with self.lock:
+            self.latencies.append(seconds)
+            stats = self.endpoints.setdefault(
+                key,
+                {"requests": 0, "retries": 0, "bytes": 0, "seconds": 0.0, "statuses": {}},
+            )
+            stats["requests"] += 1
+            stats["bytes"] += size
+            stats["seconds"] += seconds
+            status = str(status) if status is not None else "error"
+            stats["statuses"][status] = stats["statuses"].get(status, 0) + 1
+
+    def retried(self, method, endpoint, url):
+        """Record that a request is going to be sent again."""
+        if not self.enabled:
+            return
+        key = (method, path_template(endpoint, url))
+        with self.lock:
+            if key in self.endpoints:
+                self.endpoints[key]["retries"] += 1
+
+    def slept(self, kind, seconds):
+        """Record time slept in a wait loop ("wait") or between retries ("retry")."""
+        if not self.enabled:
+            return
+        with self.lock:
+            self.sleeps[kind] += seconds
+
+    def stats(self, throttled=0.0):
+        """Summary for the api_stats key of module results.
+
+        throttled: seconds spent waiting for the rate limiter.
+        """
+        with self.lock:
+            latencies = sorted(self.latencies)
+            endpoints = [
+                dict(
+                    stats,
+                    method=method,
+                    path=path,
+                    seconds=round(stats["seconds"], 3),
+                    statuses=dict(stats["statuses"]),
+                )
+                for (method, path), stats in sorted(self.endpoints.items())
+            ]
+            sleeps = dict(self.sleeps, throttle=throttled)
+
+        def rounded(value):
+            return None if value is None else round(value, 3)
+
+        return {
+            "elapsed": round(time.time() - self.started, 3),
+            "requests": len(latencies),
+            "retries": sum(stats["retries"] for stats in endpoints),
+            "bytes": sum(stats["bytes"] for stats in endpoints),
+            "network_seconds": round(sum(latencies), 3),
+            "sleep_seconds": {kind: round(value, 3) for kind, value in sleeps.items()},
+            "latency": {
+                "p50": rounded(percentile(latencies, 0.5)),
+                "p95": rounded(percentile(latencies, 0.95)),
+                "p99": rounded(percentile(latencies, 0.99)),
+                "max": rounded(latencies[-1] if latencies else None),
+            },
+            "endpoints": endpoints,
+        }
+
+
+# Tracer for this process (every module invocation is a separate process).
+TRACE = Tracer()
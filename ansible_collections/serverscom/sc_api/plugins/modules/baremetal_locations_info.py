@@ -24,9 +24,15 @@ description: >
     Module searches for locations for baremetal servers, including
     locations with dedicated servers.
 
-extends_documentation_fragment: serverscom.sc_api.api_auth
+extends_documentation_fragment:
+  - serverscom.sc_api.api_auth
+  - serverscom.sc_api.projection
+  - serverscom.sc_api.projection.listing
 
 options:
+    cache:
+        default: refresh
+
     search_pattern:
         type: str
         description:
@@ -48,7 +54,7 @@ locations:
     description:
         - List of locations for baremetal servers
         - May contain additional flags for features for location
-    returned: on success
+    returned: on success, unless I(dest) is set
     type: complex
     contains:
         id:
@@ -77,6 +83,27 @@ locations:
                 - host_rescue_mode
                 - oob_public_access
 
+dest:
+    type: str
+    returned: when I(dest) is set
+    description:
+        - Path of the file the objects were written to, one JSON object per line.
+    sample: /var/tmp/listing.jsonl.gz
+
+count:
+    type: int
+    returned: when I(dest) is set
+    description:
+        - Number of objects written to I(dest).
+    sample: 250
+
+checksum:
+    type: str
+    returned: when I(dest) is set
+    description:
+        - SHA1 checksum of I(dest).
+    sample: 2aae6c35c94fcfb415dbe95f408b9ce91ee846ed
+
 api_url:
     description: URL for the failed request
     returned: on failure
@@ -108,9 +135,15 @@ EXAMPLES = """
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
-    AUTH_ARGS,
+    REFERENCE_INFO_AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    PROJECTION_ARGS,
+    Projection,
+)
 from ansible_collections.serverscom.sc_api.plugins.module_utils.dedicated_server import (
     ScBaremetalLocationsInfo,
 )
@@ -121,22 +154,25 @@ __metaclass__ = type
 def main():
     module = AnsibleModule(
         argument_spec={
-            **AUTH_ARGS,
+            **REFERENCE_INFO_AUTH_ARGS,
+            **PROJECTION_ARGS,
             "search_pattern": {"type": "str"},
             "required_features": {"type": "list", "elements": "str"},
         },
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
         sc_info = ScBaremetalLocationsInfo(
             endpoint=module.params["endpoint"],
             token=module.params["token"],
             search_pattern=module.params["search_pattern"],
             required_features=module.params["required_features"],
+            projection=Projection.from_module(module),
         )
-        module.exit_json(**sc_info.run())
+        module.exit_json(**with_client_info(sc_info.run()))
     except SCBaseError as e:
-        module.exit_json(**e.fail())
+        module.exit_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
@@ -117,6 +117,8 @@ EXAMPLES = """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.dedicated_server import (
@@ -156,6 +158,7 @@ def main():
             ],
         ],
     )
+    configure_api_client(module)
     try:
         sc_os = ScDedicatedOSList(
             endpoint=module.params["endpoint"],
@@ -167,9 +170,9 @@ def main():
             server_model_name=module.params.get("server_model_name"),
             os_name_regex=module.params.get("os_name_regex"),
         )
-        module.exit_json(**sc_os.run())
+        module.exit_json(**with_client_info(sc_os.run()))
     except SCBaseError as e:
-        module.fail_json(**e.fail())
+        module.fail_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,212 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# (c) 2026, Servers.com
+# GNU General Public License v3.0
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    "metadata_version": "1.1",
+    "status": ["preview"],
+    "supported_by": "community",
+}
+
+DOCUMENTATION = """
+---
+module: baremetal_power_bulk
+version_added: "1.2.0"
+author: "Servers.com Team (@serverscom)"
+short_description: Power on/off/cycle many dedicated and SBM servers at once
+description: >
+    Manage the power state of many dedicated and Scalable Baremetal servers
+    from a single task.
+    Power requests are sent concurrently, but no more than I(concurrency)
+    servers are in transition at the same time, so C(state=cycle) works as
+    a rolling restart.
+    All servers are watched in one polling loop which lists servers
+    instead of requesting each of them.
+    Unlike M(serverscom.sc_api.dedicated_server_power) and
+    M(serverscom.sc_api.sbm_server_power), a failure of one server does not
+    stop the others; see I(max_failures).
+extends_documentation_fragment: serverscom.sc_api.api_auth
+
+options:
+  server_ids:
+    type: list
+    elements: str
+    description:
+      - IDs of dedicated or SBM servers.
+      - Mutually exclusive with I(label_selector).
+
+  label_selector:
+    type: str
+    description:
+      - Select servers by labels.
+      - More info at https://developers.servers.com/api-documentation/v1/#section/Labels/Labels-selector
+      - Mutually exclusive with I(server_ids).
+
+  type:
+    type: str
+    choices: [dedicated_server, sbm_server]
+    description:
+      - Only manage servers of this type.
+      - If not specified, both dedicated and SBM servers are managed.
+        Other servers (e.g. kubernetes baremetal nodes) are always ignored.
+
+  state:
+    type: str
+    required: true
+    choices: ['on', 'off', 'cycle']
+    description:
+      - Desired power state.
+      - "I(on): power on servers which are not powered on."
+      - "I(off): power off servers which are not powered off."
+      - "I(cycle): power cycle every server. Dedicated servers are powered
+        off and then on again, which needs I(wait)."
+
+  concurrency:
+    type: int
+    default: 10
+    description:
+      - Maximum number of servers in transition at the same time.
+      - Also the number of power requests sent in parallel.
+
+  max_failures:
+    type: int
+    default: 0
+    description:
+      - Number of servers which may fail without failing the module.
+      - Once more servers have failed, no more servers are started;
+        servers already in transition are still waited for.
+
+  wait:
+    type: int
+    default: 600
+    description:
+      - Maximum time in seconds for all servers to reach the desired state.
+      - C(0) sends power requests without waiting for the result.
+
+  update_interval:
+    type: int
+    default: 10
+    description:
+      - Interval between polls while waiting.
+"""
+
+RETURN = """
+servers:
+  description: Per-server results, in the order of I(server_ids) or of the API listing.
+  type: list
+  elements: dict
+  returned: always
+  contains:
+    id:
+      description: ID of the server.
+      type: str
+    title:
+      description: Title (hostname) of the server.
+      type: str
+    type:
+      description: Type of the server (dedicated_server or sbm_server).
+      type: str
+    power_status:
+      description: Power status seen last.
+      type: str
+    changed:
+      description: Whether a power request was sent for the server.
+      type: bool
+    result:
+      description: One of C(changed), C(unchanged), C(failed) or C(skipped).
+      type: str
+    msg:
+      description: Reason of a failure or of skipping the server.
+      type: str
+      returned: for failed and skipped servers
+
+failed_count:
+  description: Number of failed servers.
+  type: int
+  returned: always
+"""
+
+EXAMPLES = """
+- name: Rolling power cycle of a rack, 20 servers at a time
+  serverscom.sc_api.baremetal_power_bulk:
+    token: "{{ sc_token }}"
+    label_selector: "rack=r12"
+    state: cycle
+    concurrency: 20
+    max_failures: 3
+    wait: 1800
+
+- name: Power off a few servers
+  serverscom.sc_api.baremetal_power_bulk:
+    token: "{{ sc_token }}"
+    server_ids:
+      - abc123xyz
+      - def456uvw
+    state: "off"
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    SCBaseError,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
+    AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.baremetal_power import (
+    DEFAULT_POWER_CONCURRENCY,
+    ScBaremetalPowerBulk,
+)
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec={
+            **AUTH_ARGS,
+            "server_ids": {"type": "list", "elements": "str"},
+            "label_selector": {"type": "str"},
+            "type": {"type": "str", "choices": ["dedicated_server", "sbm_server"]},
+            "state": {
+                "type": "str",
+                "choices": ["on", "off", "cycle"],
+                "required": True,
+            },
+            "concurrency": {"type": "int", "default": DEFAULT_POWER_CONCURRENCY},
+            "max_failures": {"type": "int", "default": 0},
+            "wait": {"type": "int", "default": 600},
+            "update_interval": {"type": "int", "default": 10},
+        },
+        required_one_of=[["server_ids", "label_selector"]],
+        mutually_exclusive=[["server_ids", "label_selector"]],
+        supports_check_mode=True,
+    )
+    configure_api_client(module)
+
+    try:
+        power = ScBaremetalPowerBulk(
+            endpoint=module.params["endpoint"],
+            token=module.params["token"],
+            state=module.params["state"],
+            server_ids=module.params["server_ids"],
+            label_selector=module.params["label_selector"],
+            server_type=module.params["type"],
+            concurrency=module.params["concurrency"],
+            max_failures=module.params["max_failures"],
+            wait=module.params["wait"],
+            update_interval=module.params["update_interval"],
+            checkmode=module.check_mode,
+        )
+        module.exit_json(**with_client_info(power.run()))
+    except SCBaseError as e:
+        module.fail_json(**with_client_info(e.fail()))
+
+
+if __name__ == "__main__":
+    main()
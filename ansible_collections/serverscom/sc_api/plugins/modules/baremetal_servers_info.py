@@ -28,7 +28,10 @@ notes:
   - Includes information for both dedicated and other types of servers
     (f.e. kubernetes baremetal node)
 
-extends_documentation_fragment: serverscom.sc_api.api_auth
+extends_documentation_fragment:
+  - serverscom.sc_api.api_auth
+  - serverscom.sc_api.projection
+  - serverscom.sc_api.projection.listing
 
 options:
     type:
@@ -183,7 +186,28 @@ baremetal_servers:
       description:
         - A date and time of the host's last update.
       returned: on success
-  returned: on success
+  returned: on success, unless I(dest) is set
+
+dest:
+  type: str
+  returned: when I(dest) is set
+  description:
+    - Path of the file the objects were written to, one JSON object per line.
+  sample: /var/tmp/listing.jsonl.gz
+
+count:
+  type: int
+  returned: when I(dest) is set
+  description:
+    - Number of objects written to I(dest).
+  sample: 250
+
+checksum:
+  type: str
+  returned: when I(dest) is set
+  description:
+    - SHA1 checksum of I(dest).
+  sample: 2aae6c35c94fcfb415dbe95f408b9ce91ee846ed
 """
 
 EXAMPLES = """
@@ -203,8 +227,14 @@ EXAMPLES = """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    PROJECTION_ARGS,
+    Projection,
+)
 from ansible_collections.serverscom.sc_api.plugins.module_utils.dedicated_server import (
     ScBaremetalServersInfo,
 )
@@ -216,6 +246,7 @@ def main():
     module = AnsibleModule(
         argument_spec={
             **AUTH_ARGS,
+            **PROJECTION_ARGS,
             "type": {
                 "type": "str",
                 "choices": [
@@ -229,6 +260,7 @@ def main():
         },
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
         sc_baremetal_servers_info = ScBaremetalServersInfo(
             endpoint=module.params["endpoint"],
@@ -236,10 +268,11 @@ def main():
             type=module.params.get("type"),
             search_pattern=module.params.get("search_pattern"),
             label_selector=module.params.get("label_selector"),
+            projection=Projection.from_module(module),
         )
-        module.exit_json(**sc_baremetal_servers_info.run())
+        module.exit_json(**with_client_info(sc_baremetal_servers_info.run()))
     except SCBaseError as e:
-        module.exit_json(**e.fail())
+        module.exit_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
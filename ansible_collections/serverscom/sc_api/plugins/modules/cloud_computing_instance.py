@@ -216,6 +216,7 @@ options:
       description:
         - Polling interval for waiting.
         - Every polling request is reducing API ratelimits.
+        - Polls start 1 second apart and back off up to this interval (for a long I(wait), up to 1% of it, at most 300 seconds).
 
     retry_on_conflicts:
       type: bool
@@ -431,6 +432,8 @@ EXAMPLES = """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.cloud_computing import (
@@ -482,6 +485,7 @@ def main():
         required_if=[["state", "present", ["region_id"]]],
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
         if module.params["state"] == "present":
             instance = ScCloudComputingInstanceCreate(
@@ -546,9 +550,9 @@ def main():
             )
         else:
             raise NotImplementedError(f'Unsupported state={module.params["state"]}.')
-        module.exit_json(**instance.run())
+        module.exit_json(**with_client_info(instance.run()))
     except SCBaseError as e:
-        module.exit_json(**e.fail())
+        module.exit_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
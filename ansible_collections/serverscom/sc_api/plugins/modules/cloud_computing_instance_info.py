@@ -22,7 +22,9 @@ author: "George Shuklin (@amarao)"
 short_description: Information about cloud computing instance
 description: Return detailed information about specific cloud computing instance.
 
-extends_documentation_fragment: serverscom.sc_api.api_auth
+extends_documentation_fragment:
+  - serverscom.sc_api.api_auth
+  - serverscom.sc_api.projection
 
 options:
   instance_id:
@@ -230,8 +232,14 @@ EXAMPLES = """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    FIELDS_ARGS,
+    Projection,
+)
 from ansible_collections.serverscom.sc_api.plugins.module_utils.cloud_computing import (
     ScCloudComputingInstanceInfo,
 )
@@ -243,6 +251,7 @@ def main():
     module = AnsibleModule(
         argument_spec={
             **AUTH_ARGS,
+            **FIELDS_ARGS,
             "instance_id": {},
             "name": {"aliases": ["instance_name"]},
             "region_id": {"type": "int"},
@@ -250,6 +259,7 @@ def main():
         required_one_of=[["name", "instance_id"]],
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
         instance = ScCloudComputingInstanceInfo(
             endpoint=module.params["endpoint"],
@@ -257,10 +267,11 @@ def main():
             instance_id=module.params["instance_id"],
             name=module.params["name"],
             region_id=module.params["region_id"],
+            projection=Projection.from_module(module),
         )
-        module.exit_json(**instance.run())
+        module.exit_json(**with_client_info(instance.run()))
     except SCBaseError as e:
-        module.exit_json(**e.fail())
+        module.exit_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
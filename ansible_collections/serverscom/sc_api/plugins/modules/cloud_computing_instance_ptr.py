@@ -135,6 +135,8 @@ EXAMPLES = """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.cloud_computing import (
@@ -165,6 +167,7 @@ def main():
         required_if=[["state", "present", ["domain"]]],
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
         ptr = ScCloudComputingInstancePtr(
             endpoint=module.params["endpoint"],
@@ -179,9 +182,9 @@ def main():
             priority=module.params["priority"],
             checkmode=module.check_mode,
         )
-        module.exit_json(**ptr.run())
+        module.exit_json(**with_client_info(ptr.run()))
     except SCBaseError as e:
-        module.exit_json(**e.fail())
+        module.exit_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
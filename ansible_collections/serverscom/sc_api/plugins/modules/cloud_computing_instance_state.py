@@ -107,6 +107,7 @@ options:
       description:
         - Polling interval for waiting.
         - Every polling request is reducing API ratelimits.
+        - Polls start 1 second apart and back off up to this interval (for a long I(wait), up to 1% of it, at most 300 seconds).
 """
 
 RETURN = """
@@ -266,6 +267,8 @@ EXAMPLES = """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.cloud_computing import (
@@ -296,6 +299,7 @@ def main():
         required_one_of=[["name", "instance_id"]],
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
         instance_state = ScCloudComputingInstanceState(
             endpoint=module.params["endpoint"],
@@ -310,9 +314,9 @@ def main():
             update_interval=module.params["update_interval"],
             checkmode=module.check_mode,
         )
-        module.exit_json(**instance_state.run())
+        module.exit_json(**with_client_info(instance_state.run()))
     except SCBaseError as e:
-        module.exit_json(**e.fail())
+        module.exit_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
@@ -23,7 +23,10 @@ short_description: List of cloud computing instances
 description: >
     Return list of all instances in a given region
 
-extends_documentation_fragment: serverscom.sc_api.api_auth
+extends_documentation_fragment:
+  - serverscom.sc_api.api_auth
+  - serverscom.sc_api.projection
+  - serverscom.sc_api.projection.listing
 
 options:
     region_id:
@@ -179,7 +182,28 @@ cloud_instances:
       type: str
       description:
         - Date of last update for the instance.
-  returned: on success
+  returned: on success, unless I(dest) is set
+
+dest:
+  type: str
+  returned: when I(dest) is set
+  description:
+    - Path of the file the objects were written to, one JSON object per line.
+  sample: /var/tmp/listing.jsonl.gz
+
+count:
+  type: int
+  returned: when I(dest) is set
+  description:
+    - Number of objects written to I(dest).
+  sample: 250
+
+checksum:
+  type: str
+  returned: when I(dest) is set
+  description:
+    - SHA1 checksum of I(dest).
+  sample: 2aae6c35c94fcfb415dbe95f408b9ce91ee846ed
 
 api_url:
     description: URL for the failed request
@@ -207,8 +231,14 @@ EXAMPLES = """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    PROJECTION_ARGS,
+    Projection,
+)
 from ansible_collections.serverscom.sc_api.plugins.module_utils.cloud_computing import (
     ScCloudComputingInstancesInfo,
 )
@@ -220,21 +250,24 @@ def main():
     module = AnsibleModule(
         argument_spec={
             **AUTH_ARGS,
+            **PROJECTION_ARGS,
             "region_id": {"type": "int"},
             "label_selector": {"type": "str"},
         },
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
         instances = ScCloudComputingInstancesInfo(
             endpoint=module.params["endpoint"],
             token=module.params["token"],
             region_id=module.params["region_id"],
             label_selector=module.params.get("label_selector"),
+            projection=Projection.from_module(module),
         )
-        module.exit_json(**instances.run())
+        module.exit_json(**with_client_info(instances.run()))
     except SCBaseError as e:
-        module.exit_json(**e.fail())
+        module.exit_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
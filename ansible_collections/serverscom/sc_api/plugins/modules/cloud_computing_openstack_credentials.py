@@ -117,6 +117,8 @@ EXAMPLES = """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.cloud_computing import (
@@ -134,15 +136,16 @@ def main():
         },
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
         creds = ScCloudComputingOpenstackCredentials(
             endpoint=module.params["endpoint"],
             token=module.params["token"],
             region_id=module.params["region_id"],
         )
-        module.exit_json(**creds.run())
+        module.exit_json(**with_client_info(creds.run()))
     except SCBaseError as e:
-        module.exit_json(**e.fail())
+        module.exit_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
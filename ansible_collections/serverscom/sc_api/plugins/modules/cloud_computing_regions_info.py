@@ -23,9 +23,15 @@ short_description: Information about available cloud computing regions.
 description: >
     Module searches for computing cloud regions.
 
-extends_documentation_fragment: serverscom.sc_api.api_auth
+extends_documentation_fragment:
+  - serverscom.sc_api.api_auth
+  - serverscom.sc_api.projection
+  - serverscom.sc_api.projection.listing
 
 options:
+    cache:
+        default: refresh
+
     search_pattern:
         type: str
         description:
@@ -36,7 +42,7 @@ options:
 RETURN = """
 regions:
     description: List of cloud compute regions
-    returned: on success
+    returned: on success, unless I(dest) is set
     type: complex
     contains:
         id:
@@ -52,6 +58,27 @@ regions:
             type: str
             description:
                 - Code for the location.
+dest:
+    type: str
+    returned: when I(dest) is set
+    description:
+        - Path of the file the objects were written to, one JSON object per line.
+    sample: /var/tmp/listing.jsonl.gz
+
+count:
+    type: int
+    returned: when I(dest) is set
+    description:
+        - Number of objects written to I(dest).
+    sample: 250
+
+checksum:
+    type: str
+    returned: when I(dest) is set
+    description:
+        - SHA1 checksum of I(dest).
+    sample: 2aae6c35c94fcfb415dbe95f408b9ce91ee846ed
+
 api_url:
     description: URL for the failed request
     returned: on failure
@@ -80,9 +107,15 @@ EXAMPLES = """
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
-    AUTH_ARGS,
+    REFERENCE_INFO_AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    PROJECTION_ARGS,
+    Projection,
+)
 from ansible_collections.serverscom.sc_api.plugins.module_utils.cloud_computing import (
     ScCloudComputingRegionsInfo,
 )
@@ -93,20 +126,23 @@ __metaclass__ = type
 def main():
     module = AnsibleModule(
         argument_spec={
-            **AUTH_ARGS,
+            **REFERENCE_INFO_AUTH_ARGS,
+            **PROJECTION_ARGS,
             "search_pattern": {"type": "str"},
         },
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
         sc_info = ScCloudComputingRegionsInfo(
             endpoint=module.params["endpoint"],
             token=module.params["token"],
             search_pattern=module.params["search_pattern"],
+            projection=Projection.from_module(module),
         )
-        module.exit_json(**sc_info.run())
+        module.exit_json(**with_client_info(sc_info.run()))
     except SCBaseError as e:
-        module.exit_json(**e.fail())
+        module.exit_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
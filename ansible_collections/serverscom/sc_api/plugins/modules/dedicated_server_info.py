@@ -23,7 +23,9 @@ short_description: Information about existing dedicated server
 description: >
     retrieve information about existing dedicated baremetal server.
 
-extends_documentation_fragment: serverscom.sc_api.api_auth
+extends_documentation_fragment:
+  - serverscom.sc_api.api_auth
+  - serverscom.sc_api.projection
 
 options:
     name:
@@ -270,8 +272,14 @@ EXAMPLES = """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    FIELDS_ARGS,
+    Projection,
+)
 from ansible_collections.serverscom.sc_api.plugins.module_utils.dedicated_server import (
     ScDedicatedServerInfo,
 )
@@ -283,21 +291,24 @@ def main():
     module = AnsibleModule(
         argument_spec={
             **AUTH_ARGS,
+            **FIELDS_ARGS,
             "name": {"type": "str", "required": True, "aliases": ["id"]},
             "fail_on_absent": {"type": "bool", "default": True},
         },
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
         sc_dedicated_server_info = ScDedicatedServerInfo(
             endpoint=module.params["endpoint"],
             token=module.params["token"],
             name=module.params["name"],
             fail_on_absent=module.params["fail_on_absent"],
+            projection=Projection.from_module(module),
         )
-        module.exit_json(**sc_dedicated_server_info.run())
+        module.exit_json(**with_client_info(sc_dedicated_server_info.run()))
     except SCBaseError as e:
-        module.exit_json(**e.fail())
+        module.exit_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
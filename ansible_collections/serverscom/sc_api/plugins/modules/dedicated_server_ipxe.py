@@ -73,6 +73,7 @@ options:
     default: 10
     description:
       - Polling interval in seconds when waiting for the feature status change.
+      - Polls start 1 second apart and back off up to this interval (for a long I(wait), up to 1% of it, at most 300 seconds).
 """
 
 RETURN = """
@@ -120,6 +121,8 @@ EXAMPLES = """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.dedicated_server import (
@@ -147,6 +150,7 @@ def main():
         ],
         supports_check_mode=True,
     )
+    configure_api_client(module)
 
     try:
         ipxe = ScDedicatedServerIpxe(
@@ -159,9 +163,9 @@ def main():
             update_interval=module.params["update_interval"],
             checkmode=module.check_mode,
         )
-        module.exit_json(**ipxe.run())
+        module.exit_json(**with_client_info(ipxe.run()))
     except SCBaseError as e:
-        module.exit_json(**e.fail())
+        module.exit_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
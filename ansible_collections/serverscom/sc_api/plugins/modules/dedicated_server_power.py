@@ -191,6 +191,8 @@ EXAMPLES = """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.dedicated_server import (
@@ -214,6 +216,7 @@ def main():
         },
         supports_check_mode=True,
     )
+    configure_api_client(module)
 
     try:
         power = ScDedicatedServerPower(
@@ -224,9 +227,9 @@ def main():
             wait=module.params["wait"],
             checkmode=module.check_mode,
         )
-        module.exit_json(**power.run())
+        module.exit_json(**with_client_info(power.run()))
     except SCBaseError as e:
-        module.exit_json(**e.fail())
+        module.exit_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
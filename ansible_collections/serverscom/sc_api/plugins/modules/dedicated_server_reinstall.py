@@ -188,6 +188,7 @@ options:
               requests in accordance with ratelimit.
             - Minimal value is 10.
             - Ignored if I(wait)=C(0).
+            - Polls start 1 second apart and back off up to this interval (for a long I(wait), up to 1% of it, at most 300 seconds).
 
     user_data:
       type: str
@@ -415,6 +416,8 @@ EXAMPLES = """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.dedicated_server import (
@@ -451,6 +454,7 @@ def main():
         ],
         required_one_of=[["drives_layout", "drives_layout_template"]],
     )
+    configure_api_client(module)
     try:
         sc_dedicated_server_reinstall = ScDedicatedServerReinstall(
             endpoint=module.params["endpoint"],
@@ -468,9 +472,9 @@ def main():
             user_data=module.params["user_data"],
             checkmode=module.check_mode,
         )
-        module.exit_json(**sc_dedicated_server_reinstall.run())
+        module.exit_json(**with_client_info(sc_dedicated_server_reinstall.run()))
     except SCBaseError as e:
-        module.exit_json(**e.fail())
+        module.exit_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
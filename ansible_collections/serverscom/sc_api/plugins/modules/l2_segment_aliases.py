@@ -74,6 +74,7 @@ options:
         - Interval for polling for of L2 segment
         - Each update consumes API quota.
         - Ignored if I(wait)=C(0)
+        - Polls start 1 second apart and back off up to this interval (for a long I(wait), up to 1% of it, at most 300 seconds).
 """
 
 RETURN = """
@@ -169,6 +170,8 @@ EXAMPLES = """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.l2_segment import (
@@ -202,6 +205,7 @@ def main():
         ],
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
         sc_info = ScL2SegmentAliases(
             endpoint=module.params["endpoint"],
@@ -214,9 +218,9 @@ def main():
             update_interval=module.params["update_interval"],
             checkmode=module.check_mode,
         )
-        module.exit_json(**sc_info.run())
+        module.exit_json(**with_client_info(sc_info.run()))
     except SCBaseError as e:
-        module.exit_json(**e.fail())
+        module.exit_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
@@ -23,7 +23,9 @@ short_description: Information about L2 segment.
 description: >
     Returns information about exiting L2 segment or fail.
 
-extends_documentation_fragment: serverscom.sc_api.api_auth
+extends_documentation_fragment:
+  - serverscom.sc_api.api_auth
+  - serverscom.sc_api.projection
 
 options:
     id:
@@ -111,8 +113,14 @@ EXAMPLES = """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    FIELDS_ARGS,
+    Projection,
+)
 from ansible_collections.serverscom.sc_api.plugins.module_utils.l2_segment import (
     ScL2SegmentInfo,
 )
@@ -124,22 +132,25 @@ def main():
     module = AnsibleModule(
         argument_spec={
             **AUTH_ARGS,
+            **FIELDS_ARGS,
             "id": {},
             "name": {},
         },
         required_one_of=[["id", "name"]],
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
         sc_info = ScL2SegmentInfo(
             endpoint=module.params["endpoint"],
             token=module.params["token"],
             id=module.params["id"],
             name=module.params["name"],
+            projection=Projection.from_module(module),
         )
-        module.exit_json(**sc_info.run())
+        module.exit_json(**with_client_info(sc_info.run()))
     except SCBaseError as e:
-        module.exit_json(**e.fail())
+        module.exit_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
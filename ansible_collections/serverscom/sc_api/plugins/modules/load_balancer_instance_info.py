@@ -25,7 +25,9 @@ description:
 version_added: "1.0.0"
 author: "Volodymyr Rudniev (@koef)"
 
-extends_documentation_fragment: serverscom.sc_api.api_auth
+extends_documentation_fragment:
+  - serverscom.sc_api.api_auth
+  - serverscom.sc_api.projection
 
 options:
   fail_on_absent:
@@ -373,8 +375,14 @@ EXAMPLES = """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    FIELDS_ARGS,
+    Projection,
+)
 from ansible_collections.serverscom.sc_api.plugins.module_utils.load_balancer import (
     ScLoadBalancerInstanceInfo,
 )
@@ -386,6 +394,7 @@ def main():
     module = AnsibleModule(
         argument_spec={
             **AUTH_ARGS,
+            **FIELDS_ARGS,
             "fail_on_absent": {"type": "bool", "default": True},
             "id": {"type": "str"},
             "name": {"type": "str"},
@@ -394,6 +403,7 @@ def main():
         mutually_exclusive=[["id", "name"]],
         supports_check_mode=True,
     )
+    configure_api_client(module)
 
     try:
         sc_load_balancer_instance_info = ScLoadBalancerInstanceInfo(
@@ -402,10 +412,11 @@ def main():
             lb_instance_id=module.params.get("id"),
             lb_instance_name=module.params.get("name"),
             fail_on_absent=module.params["fail_on_absent"],
+            projection=Projection.from_module(module),
         )
-        module.exit_json(**sc_load_balancer_instance_info.run())
+        module.exit_json(**with_client_info(sc_load_balancer_instance_info.run()))
     except SCBaseError as e:
-        module.exit_json(**e.fail())
+        module.exit_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
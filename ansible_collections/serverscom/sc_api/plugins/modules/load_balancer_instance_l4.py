@@ -52,6 +52,7 @@ options:
   update_interval:
     description:
       - "Interval in seconds between consecutive status checks during state transitions."
+      - Polls start 1 second apart and back off up to this interval (for a long I(wait), up to 1% of it, at most 300 seconds).
     required: false
     type: int
     default: 5
@@ -428,6 +429,8 @@ EXAMPLES = """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.load_balancer import (
@@ -466,6 +469,7 @@ def main():
         mutually_exclusive=[["id", "name"]],
         supports_check_mode=True,
     )
+    configure_api_client(module)
 
     if module.params["state"] == "absent":
         lb_instance = ScLbInstanceDelete(
@@ -501,9 +505,9 @@ def main():
 
     try:
         result = lb_instance.run()
-        module.exit_json(**result)
+        module.exit_json(**with_client_info(result))
     except SCBaseError as e:
-        module.fail_json(**e.fail())
+        module.fail_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
@@ -124,6 +124,8 @@ EXAMPLES = """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.load_balancer import (
@@ -143,6 +145,7 @@ def main():
         },
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
         sc_load_balancer_instances_list = ScLoadBalancerInstancesList(
             endpoint=module.params["endpoint"],
@@ -151,9 +154,9 @@ def main():
             type=module.params.get("type"),
             label_selector=module.params.get("label_selector"),
         )
-        module.exit_json(**sc_load_balancer_instances_list.run())
+        module.exit_json(**with_client_info(sc_load_balancer_instances_list.run()))
     except SCBaseError as e:
-        module.exit_json(**e.fail())
+        module.exit_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,264 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# (c) 2026, Servers.com
+# GNU General Public License v3.0
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    "metadata_version": "1.1",
+    "status": ["preview"],
+    "supported_by": "community",
+}
+
+DOCUMENTATION = """
+---
+module: ptr_records
+version_added: "1.2.0"
+author: "Servers.com Team (@serverscom)"
+short_description: Reconcile PTR records of many SBM servers and cloud instances
+description: >
+    Bring PTR (reverse DNS) records of SBM servers and cloud instances to
+    the complete desired set given in I(records), in a single task.
+    Existing records are listed once per server or instance (concurrently),
+    and only missing records are created and unwanted records deleted,
+    using up to I(concurrency) parallel requests.
+    Use M(serverscom.sc_api.sbm_server_ptr) or
+    M(serverscom.sc_api.cloud_computing_instance_ptr) to manage a
+    single record.
+extends_documentation_fragment: serverscom.sc_api.api_auth
+
+options:
+  records:
+    type: list
+    elements: dict
+    required: true
+    description:
+      - Desired PTR records.
+      - Only servers and instances mentioned here are managed.
+    suboptions:
+      owner_type:
+        type: str
+        choices: [sbm_server, cloud_instance]
+        default: sbm_server
+        description:
+          - Type of the object which owns the IP address.
+      owner_id:
+        type: str
+        required: true
+        description:
+          - ID of the SBM server or cloud instance.
+      ip:
+        type: str
+        required: true
+        description:
+          - IP address. It should belong to the owner.
+      domain:
+        type: str
+        required: true
+        description:
+          - PTR domain name for the IP address.
+      ttl:
+        type: int
+        description:
+          - TTL of the record. Overrides I(ttl).
+      priority:
+        type: int
+        description:
+          - Priority of the record. Overrides I(priority).
+
+  exclusive:
+    type: bool
+    default: true
+    description:
+      - If C(true), records of the managed servers and instances which are
+        not in I(records) are deleted.
+      - If C(false), only records for IP addresses in I(records) are
+        replaced; records for other IP addresses are kept.
+
+  ttl:
+    type: int
+    description:
+      - Default TTL for I(records).
+      - If not set, existing records with any TTL are kept, and new records
+        get the API default (C(60)).
+
+  priority:
+    type: int
+    description:
+      - Default priority for I(records).
+      - If not set, existing records with any priority are kept, and new
+        records get the API default (C(0)).
+
+  concurrency:
+    type: int
+    default: 10
+    description:
+      - Maximum number of API requests in parallel.
+"""
+
+RETURN = """
+created:
+  description: Records which were (or in check mode would be) created.
+  type: list
+  elements: dict
+  returned: always
+  contains:
+    owner_type:
+      description: C(sbm_server) or C(cloud_instance).
+      type: str
+    owner_id:
+      description: ID of the server or instance.
+      type: str
+    ip:
+      description: IP address.
+      type: str
+    domain:
+      description: PTR domain name.
+      type: str
+    ttl:
+      description: TTL of the record.
+      type: int
+    priority:
+      description: Priority of the record.
+      type: int
+
+deleted:
+  description: Records which were (or in check mode would be) deleted.
+  type: list
+  elements: dict
+  returned: always
+  contains:
+    owner_type:
+      description: C(sbm_server) or C(cloud_instance).
+      type: str
+    owner_id:
+      description: ID of the server or instance.
+      type: str
+    ip:
+      description: IP address.
+      type: str
+    domain:
+      description: PTR domain name.
+      type: str
+    ttl:
+      description: TTL of the record.
+      type: int
+    priority:
+      description: Priority of the record.
+      type: int
+
+errors:
+  description: Changes which failed, like I(created), with the error in C(msg).
+  type: list
+  elements: dict
+  returned: always
+
+summary:
+  description: Counts of owners, created, deleted, unchanged and failed records.
+  type: dict
+  returned: always
+  sample:
+    owners: 2
+    created: 3
+    deleted: 1
+    unchanged: 10
+    failed: 0
+"""
+
+EXAMPLES = """
+- name: Set reverse DNS for all servers
+  serverscom.sc_api.ptr_records:
+    token: "{{ sc_token }}"
+    ttl: 300
+    records: "{{ ptr_records }}"
+  vars:
+    ptr_records:
+      - owner_id: abc123xyz
+        ip: 198.51.100.1
+        domain: node1.example.com
+      - owner_id: def456uvw
+        ip: 198.51.100.2
+        domain: node2.example.com
+      - owner_type: cloud_instance
+        owner_id: QWE123rty
+        ip: 203.0.113.20
+        domain: web.example.com
+
+- name: Replace one record, keeping other records of the server
+  serverscom.sc_api.ptr_records:
+    token: "{{ sc_token }}"
+    exclusive: false
+    records:
+      - owner_id: abc123xyz
+        ip: 198.51.100.3
+        domain: mail.example.com
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    SCBaseError,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
+    AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.ptr_records import (
+    DEFAULT_PTR_CONCURRENCY,
+    PTR_OWNER_TYPES,
+    ScPtrRecords,
+)
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec={
+            **AUTH_ARGS,
+            "records": {
+                "type": "list",
+                "elements": "dict",
+                "required": True,
+                "options": {
+                    "owner_type": {
+                        "type": "str",
+                        "choices": list(PTR_OWNER_TYPES),
+                        "default": "sbm_server",
+                    },
+                    "owner_id": {"type": "str", "required": True},
+                    "ip": {"type": "str", "required": True},
+                    "domain": {"type": "str", "required": True},
+                    "ttl": {"type": "int"},
+                    "priority": {"type": "int"},
+                },
+            },
+            "exclusive": {"type": "bool", "default": True},
+            "ttl": {"type": "int"},
+            "priority": {"type": "int"},
+            "concurrency": {"type": "int", "default": DEFAULT_PTR_CONCURRENCY},
+        },
+        supports_check_mode=True,
+    )
+    configure_api_client(module)
+
+    try:
+        ptr_records = ScPtrRecords(
+            endpoint=module.params["endpoint"],
+            token=module.params["token"],
+            records=module.params["records"],
+            exclusive=module.params["exclusive"],
+            ttl=module.params["ttl"],
+            priority=module.params["priority"],
+            concurrency=module.params["concurrency"],
+            checkmode=module.check_mode,
+        )
+        module.exit_json(**with_client_info(ptr_records.run()))
+    except SCBaseError as e:
+        module.fail_json(**with_client_info(e.fail()))
+
+
+if __name__ == "__main__":
+    main()
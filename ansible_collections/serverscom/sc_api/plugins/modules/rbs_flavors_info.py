@@ -23,9 +23,15 @@ short_description: List of available Remote Block Storage volume flavors.
 description: >
     Returns list of available Remote Block Storage volume flavors.
 
-extends_documentation_fragment: serverscom.sc_api.api_auth
+extends_documentation_fragment:
+  - serverscom.sc_api.api_auth
+  - serverscom.sc_api.projection
+  - serverscom.sc_api.projection.listing
 
 options:
+    cache:
+      default: refresh
+
     location_id:
       type: int
       required: true
@@ -59,7 +65,28 @@ rbs_volume_flavors:
       type: int
       description:
         - Minimum volume size in GB for this flavor
-  returned: on success
+  returned: on success, unless I(dest) is set
+dest:
+  type: str
+  returned: when I(dest) is set
+  description:
+    - Path of the file the objects were written to, one JSON object per line.
+  sample: /var/tmp/listing.jsonl.gz
+
+count:
+  type: int
+  returned: when I(dest) is set
+  description:
+    - Number of objects written to I(dest).
+  sample: 250
+
+checksum:
+  type: str
+  returned: when I(dest) is set
+  description:
+    - SHA1 checksum of I(dest).
+  sample: 2aae6c35c94fcfb415dbe95f408b9ce91ee846ed
+
 api_url:
     description: URL for the failed request
     returned: on failure
@@ -79,9 +106,15 @@ EXAMPLES = """
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
-    AUTH_ARGS,
+    REFERENCE_INFO_AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    PROJECTION_ARGS,
+    Projection,
+)
 from ansible_collections.serverscom.sc_api.plugins.module_utils.rbs import (
     ScRBSFlavorsInfo,
 )
@@ -90,20 +123,23 @@ from ansible_collections.serverscom.sc_api.plugins.module_utils.rbs import (
 def main():
     module = AnsibleModule(
         argument_spec={
-            **AUTH_ARGS,
+            **REFERENCE_INFO_AUTH_ARGS,
+            **PROJECTION_ARGS,
             "location_id": {"type": "int", "required": True},
         },
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
         flavors = ScRBSFlavorsInfo(
             endpoint=module.params["endpoint"],
             token=module.params["token"],
             location_id=module.params["location_id"],
+            projection=Projection.from_module(module),
         )
-        module.exit_json(**flavors.run())
+        module.exit_json(**with_client_info(flavors.run()))
     except SCBaseError as e:
-        module.fail_json(**e.fail())
+        module.fail_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
@@ -99,7 +99,9 @@ options:
       type: int
       default: 600
     update_interval:
-      description: Interval in seconds between status checks.
+      description:
+        - Interval in seconds between status checks.
+        - Polls start 1 second apart and back off up to this interval (for a long I(wait), up to 1% of it, at most 300 seconds).
       type: int
       default: 5
 """
@@ -205,6 +207,8 @@ EXAMPLES = """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.rbs import (
@@ -246,6 +250,7 @@ def main():
             ['volume_id', 'name']
         ],
     )
+    configure_api_client(module)
 
     state = module.params["state"]
 
@@ -283,9 +288,9 @@ def main():
             result = rbs_volume.update_volume()
         elif state == "absent":
             result = rbs_volume.delete_volume()
-        module.exit_json(**result)
+        module.exit_json(**with_client_info(result))
     except SCBaseError as e:
-        module.fail_json(**e.fail())
+        module.fail_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
@@ -46,7 +46,9 @@ options:
       type: int
       default: 600
     update_interval:
-      description: Interval in seconds between status checks.
+      description:
+        - Interval in seconds between status checks.
+        - Polls start 1 second apart and back off up to this interval (for a long I(wait), up to 1% of it, at most 300 seconds).
       type: int
       default: 5
 """
@@ -94,6 +96,8 @@ EXAMPLES = """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.rbs import (
@@ -118,6 +122,7 @@ def main():
             ['volume_id', 'name']
         ],
     )
+    configure_api_client(module)
     try:
         sc_volume = ScRBSVolumeCredentialsReset(
             endpoint=module.params["endpoint"],
@@ -128,9 +133,9 @@ def main():
             update_interval=module.params["update_interval"],
             checkmode=module.check_mode,
         )
-        module.exit_json(**sc_volume.run())
+        module.exit_json(**with_client_info(sc_volume.run()))
     except SCBaseError as e:
-        module.fail_json(**e.fail())
+        module.fail_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
@@ -23,7 +23,10 @@ short_description: Returns list of Remote Block Storage volumes.
 description: >
     Returns list of Remote Block Storage volumes for specified search criteria.
 
-extends_documentation_fragment: serverscom.sc_api.api_auth
+extends_documentation_fragment:
+  - serverscom.sc_api.api_auth
+  - serverscom.sc_api.projection
+  - serverscom.sc_api.projection.listing
 
 options:
     label_selector:
@@ -48,13 +51,29 @@ options:
       required: false
       description:
         - Human-readable location slug (mutually exclusive with I(location_id)).
+    include_credentials:
+      type: bool
+      default: true
+      version_added: "1.2.0"
+      description:
+        - Add C(username) and C(password) of every returned volume.
+        - Credentials take one extra request per volume (done concurrently).
+          Set to C(false) to skip those requests if credentials are not needed.
+    credentials_for:
+      type: list
+      elements: str
+      version_added: "1.2.0"
+      description:
+        - Add credentials only for volumes with these IDs or names.
+        - Other volumes are returned without C(username) and C(password).
+        - Ignored if I(include_credentials) is C(false).
 """
 
 RETURN = """
 rbs_volumes:
   type: list
   elements: dict
-  returned: on success
+  returned: on success, unless I(dest) is set
   description:
     - List of Remote Block Storage volumes.
   contains:
@@ -100,16 +119,43 @@ rbs_volumes:
       description: iSCSI target Qualified Name.
     username:
       type: str
-      description: Username to access the volume.
+      description:
+        - Username to access the volume.
+        - Not returned if I(include_credentials) is C(false) or the volume
+          is not in I(credentials_for).
     password:
       type: str
-      description: Password to access the volume.
+      description:
+        - Password to access the volume.
+        - Not returned if I(include_credentials) is C(false) or the volume
+          is not in I(credentials_for).
     created_at:
       type: str
       description: Volume creation time.
     updated_at:
       type: str
       description: Last volume update time.
+dest:
+  type: str
+  returned: when I(dest) is set
+  description:
+    - Path of the file the objects were written to, one JSON object per line.
+  sample: /var/tmp/listing.jsonl.gz
+
+count:
+  type: int
+  returned: when I(dest) is set
+  description:
+    - Number of objects written to I(dest).
+  sample: 250
+
+checksum:
+  type: str
+  returned: when I(dest) is set
+  description:
+    - SHA1 checksum of I(dest).
+  sample: 2aae6c35c94fcfb415dbe95f408b9ce91ee846ed
+
 api_url:
     description: URL for the failed request
     returned: on failure
@@ -139,13 +185,34 @@ EXAMPLES = """
         token: "{{ api_token }}"
         label_selector: "environment==staging"
       register: result
+
+    - name: List volumes in ams1 with credentials only for one of them
+      serverscom.sc_api.sc_rbs_volume_info:
+        token: "{{ api_token }}"
+        location_code: ams1
+        credentials_for:
+          - myvolume
+      register: result
+
+    - name: List volumes without credentials
+      serverscom.sc_api.sc_rbs_volume_info:
+        token: "{{ api_token }}"
+        location_code: ams1
+        include_credentials: false
+      register: result
 """
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    PROJECTION_ARGS,
+    Projection,
+)
 from ansible_collections.serverscom.sc_api.plugins.module_utils.rbs import (
     ScRBSVolumeList,
 )
@@ -155,10 +222,13 @@ def main():
     module = AnsibleModule(
         argument_spec={
             **AUTH_ARGS,
+            **PROJECTION_ARGS,
             "label_selector": {"type": "str", "required": False},
             "search_pattern": {"type": "str", "required": False},
             "location_id": {"type": "str", "required": False},
-            "location_code": {"type": "str", "required": False}
+            "location_code": {"type": "str", "required": False},
+            "include_credentials": {"type": "bool", "default": True},
+            "credentials_for": {"type": "list", "elements": "str", "no_log": False},
         },
         supports_check_mode=True,
         required_one_of=[
@@ -169,6 +239,7 @@ def main():
             ['location_id', 'location_code'],
         ],
     )
+    configure_api_client(module)
     try:
         sc_os = ScRBSVolumeList(
             endpoint=module.params["endpoint"],
@@ -177,10 +248,13 @@ def main():
             search_pattern=module.params.get("search_pattern"),
             location_id=module.params.get("location_id"),
             location_code=module.params.get("location_code"),
+            include_credentials=module.params["include_credentials"],
+            credentials_for=module.params.get("credentials_for"),
+            projection=Projection.from_module(module),
         )
-        module.exit_json(**sc_os.run())
+        module.exit_json(**with_client_info(sc_os.run()))
     except SCBaseError as e:
-        module.fail_json(**e.fail())
+        module.fail_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
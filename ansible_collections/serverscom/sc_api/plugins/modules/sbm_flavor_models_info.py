@@ -23,9 +23,15 @@ short_description: List of available SBM (Scalable Baremetal) flavor models.
 description: >
     Returns list of available Scalable Baremetal flavor models for a location.
     These flavor models define the hardware configurations available for SBM servers.
-extends_documentation_fragment: serverscom.sc_api.api_auth
+extends_documentation_fragment:
+  - serverscom.sc_api.api_auth
+  - serverscom.sc_api.projection
+  - serverscom.sc_api.projection.listing
 
 options:
+    cache:
+      default: refresh
+
     location_id:
       type: int
       description:
@@ -51,7 +57,7 @@ sbm_flavor_models:
   type: list
   description:
     - List of available SBM flavor models for the location.
-  returned: on success
+  returned: on success, unless I(dest) is set
   contains:
     id:
       type: int
@@ -74,6 +80,27 @@ sbm_flavor_models:
       description:
         - Description of the drive configuration.
 
+dest:
+  type: str
+  returned: when I(dest) is set
+  description:
+    - Path of the file the objects were written to, one JSON object per line.
+  sample: /var/tmp/listing.jsonl.gz
+
+count:
+  type: int
+  returned: when I(dest) is set
+  description:
+    - Number of objects written to I(dest).
+  sample: 250
+
+checksum:
+  type: str
+  returned: when I(dest) is set
+  description:
+    - SHA1 checksum of I(dest).
+  sample: 2aae6c35c94fcfb415dbe95f408b9ce91ee846ed
+
 api_url:
     description: URL for the failed request.
     returned: on failure
@@ -107,13 +134,19 @@ EXAMPLES = """
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
-    ScApi,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
-    AUTH_ARGS,
+    REFERENCE_INFO_AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    PROJECTION_ARGS,
+    Projection,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.sbm import (
+    ScSbmApi,
     ScSbmFlavorModelsInfo,
     resolve_location_id,
 )
@@ -122,7 +155,8 @@ from ansible_collections.serverscom.sc_api.plugins.module_utils.sbm import (
 def main():
     module = AnsibleModule(
         argument_spec={
-            **AUTH_ARGS,
+            **REFERENCE_INFO_AUTH_ARGS,
+            **PROJECTION_ARGS,
             "location_id": {"type": "int"},
             "location_code": {"type": "str"},
             "search_pattern": {"type": "str"},
@@ -131,8 +165,9 @@ def main():
         mutually_exclusive=[["location_id", "location_code"]],
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
-        api = ScApi(module.params["token"], module.params["endpoint"])
+        api = ScSbmApi(module.params["token"], module.params["endpoint"])
         location_id = resolve_location_id(
             api,
             location_id=module.params["location_id"],
@@ -141,12 +176,14 @@ def main():
         flavors = ScSbmFlavorModelsInfo(
             endpoint=module.params["endpoint"],
             token=module.params["token"],
+            api=api,
             location_id=location_id,
             search_pattern=module.params["search_pattern"],
+            projection=Projection.from_module(module),
         )
-        module.exit_json(**flavors.run())
+        module.exit_json(**with_client_info(flavors.run()))
     except SCBaseError as e:
-        module.fail_json(**e.fail())
+        module.fail_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
@@ -122,13 +122,15 @@ EXAMPLES = """
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
-    ScApi,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.sbm import (
+    ScSbmApi,
     ScSbmOSList,
     resolve_location_id,
 )
@@ -154,8 +156,9 @@ def main():
             ["flavor_id", "flavor_name"],
         ],
     )
+    configure_api_client(module)
     try:
-        api = ScApi(module.params["token"], module.params["endpoint"])
+        api = ScSbmApi(module.params["token"], module.params["endpoint"])
         location_id = resolve_location_id(
             api,
             location_id=module.params["location_id"],
@@ -164,14 +167,15 @@ def main():
         sc_os = ScSbmOSList(
             endpoint=module.params["endpoint"],
             token=module.params["token"],
+            api=api,
             location_id=location_id,
             sbm_flavor_model_id=module.params.get("flavor_id"),
             sbm_flavor_model_name=module.params.get("flavor_name"),
             os_name_regex=module.params.get("os_name_regex"),
         )
-        module.exit_json(**sc_os.run())
+        module.exit_json(**with_client_info(sc_os.run()))
     except SCBaseError as e:
-        module.fail_json(**e.fail())
+        module.fail_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
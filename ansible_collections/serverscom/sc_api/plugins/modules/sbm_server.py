@@ -131,6 +131,7 @@ options:
       description:
         - Polling interval (in seconds) for waiting.
         - Every polling request reduces API rate limits.
+        - Polls start 1 second apart and back off up to this interval (for a long I(wait), up to 1% of it, at most 300 seconds).
 
     retry_on_conflicts:
       type: bool
@@ -322,13 +323,15 @@ EXAMPLES = """
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
-    ScApi,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.sbm import (
+    ScSbmApi,
     ScSbmServerCreate,
     ScSbmServerDelete,
     resolve_location_id,
@@ -424,9 +427,10 @@ def main():
         ],
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
+        api = ScSbmApi(module.params["token"], module.params["endpoint"])
         if module.params["state"] == "present":
-            api = ScApi(module.params["token"], module.params["endpoint"])
             location_id = resolve_location_id(
                 api,
                 location_id=module.params["location_id"],
@@ -449,6 +453,7 @@ def main():
             instance = ScSbmServerCreate(
                 endpoint=module.params["endpoint"],
                 token=module.params["token"],
+                api=api,
                 location_id=location_id,
                 sbm_flavor_model_id=sbm_flavor_model_id,
                 hostname=module.params["hostname"],
@@ -460,7 +465,6 @@ def main():
                 checkmode=module.check_mode,
             )
         elif module.params["state"] == "absent":
-            api = ScApi(module.params["token"], module.params["endpoint"])
             server_id = resolve_sbm_server_id(
                 api,
                 server_id=module.params["server_id"],
@@ -469,6 +473,7 @@ def main():
             instance = ScSbmServerDelete(
                 endpoint=module.params["endpoint"],
                 token=module.params["token"],
+                api=api,
                 server_id=server_id,
                 wait=module.params["wait"],
                 update_interval=module.params["update_interval"],
@@ -478,9 +483,9 @@ def main():
             )
         else:
             raise NotImplementedError(f"Unsupported state={module.params['state']}.")
-        module.exit_json(**instance.run())
+        module.exit_json(**with_client_info(instance.run()))
     except SCBaseError as e:
-        module.fail_json(**e.fail())
+        module.fail_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
@@ -22,7 +22,9 @@ author: "Servers.com Team (@serverscom)"
 short_description: Information about existing SBM (Scalable Baremetal) server
 description: >
     Retrieve information about existing Scalable Baremetal server.
-extends_documentation_fragment: serverscom.sc_api.api_auth
+extends_documentation_fragment:
+  - serverscom.sc_api.api_auth
+  - serverscom.sc_api.projection
 
 options:
     server_id:
@@ -217,23 +219,30 @@ EXAMPLES = """
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
-    ScApi,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.sbm import (
+    ScSbmApi,
     ScSbmServerInfo,
     resolve_sbm_server_id,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     ModuleError,
 )
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    FIELDS_ARGS,
+    Projection,
+)
 
 
 def main():
     module = AnsibleModule(
         argument_spec={
             **AUTH_ARGS,
+            **FIELDS_ARGS,
             "server_id": {"type": "str"},
             "hostname": {"type": "str"},
             "fail_on_absent": {"type": "bool", "default": True},
@@ -242,8 +251,9 @@ def main():
         mutually_exclusive=[["server_id", "hostname"]],
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
-        api = ScApi(module.params["token"], module.params["endpoint"])
+        api = ScSbmApi(module.params["token"], module.params["endpoint"])
         try:
             server_id = resolve_sbm_server_id(
                 api,
@@ -252,17 +262,23 @@ def main():
             )
         except ModuleError:
             if module.params["hostname"] and not module.params["fail_on_absent"]:
-                module.exit_json(changed=False, found=False, ready=False)
+                module.exit_json(
+                    **with_client_info(
+                        {"changed": False, "found": False, "ready": False}
+                    )
+                )
             raise
         sc_sbm_server_info = ScSbmServerInfo(
             endpoint=module.params["endpoint"],
             token=module.params["token"],
+            api=api,
             server_id=server_id,
             fail_on_absent=module.params["fail_on_absent"],
+            projection=Projection.from_module(module),
         )
-        module.exit_json(**sc_sbm_server_info.run())
+        module.exit_json(**with_client_info(sc_sbm_server_info.run()))
     except SCBaseError as e:
-        module.fail_json(**e.fail())
+        module.fail_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
@@ -91,13 +91,15 @@ EXAMPLES = """
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
-    ScApi,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.sbm import (
+    ScSbmApi,
     ScSbmServerLabels,
     resolve_sbm_server_id,
 )
@@ -115,8 +117,9 @@ def main():
         mutually_exclusive=[["server_id", "hostname"]],
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
-        api = ScApi(module.params["token"], module.params["endpoint"])
+        api = ScSbmApi(module.params["token"], module.params["endpoint"])
         server_id = resolve_sbm_server_id(
             api,
             server_id=module.params["server_id"],
@@ -125,13 +128,14 @@ def main():
         labels = ScSbmServerLabels(
             endpoint=module.params["endpoint"],
             token=module.params["token"],
+            api=api,
             server_id=server_id,
             labels=module.params["labels"],
             checkmode=module.check_mode,
         )
-        module.exit_json(**labels.run())
+        module.exit_json(**with_client_info(labels.run()))
     except SCBaseError as e:
-        module.fail_json(**e.fail())
+        module.fail_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
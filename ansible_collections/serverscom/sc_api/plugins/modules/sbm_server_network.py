@@ -82,6 +82,7 @@ options:
       description:
         - Polling interval (in seconds) while waiting.
         - Every polling request reduces API rate limits.
+        - Polls start 1 second apart and back off up to this interval (for a long I(wait), up to 1% of it, at most 300 seconds).
 """
 
 RETURN = """
@@ -142,13 +143,15 @@ EXAMPLES = """
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
-    ScApi,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.sbm import (
+    ScSbmApi,
     ScSbmServerNetwork,
     resolve_sbm_server_id,
 )
@@ -183,8 +186,9 @@ def main():
         ],
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
-        api = ScApi(module.params["token"], module.params["endpoint"])
+        api = ScSbmApi(module.params["token"], module.params["endpoint"])
         server_id = resolve_sbm_server_id(
             api,
             server_id=module.params["server_id"],
@@ -193,6 +197,7 @@ def main():
         network = ScSbmServerNetwork(
             endpoint=module.params["endpoint"],
             token=module.params["token"],
+            api=api,
             server_id=server_id,
             state=module.params["state"],
             network_id=module.params["network_id"],
@@ -202,9 +207,9 @@ def main():
             update_interval=module.params["update_interval"],
             checkmode=module.check_mode,
         )
-        module.exit_json(**network.run())
+        module.exit_json(**with_client_info(network.run()))
     except SCBaseError as e:
-        module.fail_json(**e.fail())
+        module.fail_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
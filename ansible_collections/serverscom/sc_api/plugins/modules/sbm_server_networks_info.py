@@ -23,7 +23,10 @@ short_description: List or get networks for an SBM (Scalable Baremetal) server
 description: >
     Returns a list of networks for a Scalable Baremetal server, or
     details of a single network if network_id is provided.
-extends_documentation_fragment: serverscom.sc_api.api_auth
+extends_documentation_fragment:
+  - serverscom.sc_api.api_auth
+  - serverscom.sc_api.projection
+  - serverscom.sc_api.projection.listing
 
 options:
     server_id:
@@ -79,7 +82,7 @@ networks:
   type: list
   description:
     - List of networks for the server (when network_id is not provided).
-  returned: on success when listing
+  returned: on success when listing, unless I(dest) is set
 
 id:
   type: str
@@ -93,6 +96,27 @@ cidr:
     - Network CIDR (when network_id is provided).
   returned: on success when getting single network
 
+dest:
+  type: str
+  returned: when I(dest) is set
+  description:
+    - Path of the file the objects were written to, one JSON object per line.
+  sample: /var/tmp/listing.jsonl.gz
+
+count:
+  type: int
+  returned: when I(dest) is set
+  description:
+    - Number of objects written to I(dest).
+  sample: 250
+
+checksum:
+  type: str
+  returned: when I(dest) is set
+  description:
+    - SHA1 checksum of I(dest).
+  sample: 2aae6c35c94fcfb415dbe95f408b9ce91ee846ed
+
 api_url:
   description: URL for the failed request.
   returned: on failure
@@ -129,13 +153,19 @@ EXAMPLES = """
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
-    ScApi,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    PROJECTION_ARGS,
+    Projection,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.sbm import (
+    ScSbmApi,
     ScSbmServerNetworksInfo,
     resolve_sbm_server_id,
 )
@@ -145,6 +175,7 @@ def main():
     module = AnsibleModule(
         argument_spec={
             **AUTH_ARGS,
+            **PROJECTION_ARGS,
             "server_id": {"type": "str"},
             "hostname": {"type": "str"},
             "network_id": {"type": "str"},
@@ -158,8 +189,9 @@ def main():
         mutually_exclusive=[["server_id", "hostname"]],
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
-        api = ScApi(module.params["token"], module.params["endpoint"])
+        api = ScSbmApi(module.params["token"], module.params["endpoint"])
         server_id = resolve_sbm_server_id(
             api,
             server_id=module.params["server_id"],
@@ -168,6 +200,7 @@ def main():
         networks_info = ScSbmServerNetworksInfo(
             endpoint=module.params["endpoint"],
             token=module.params["token"],
+            api=api,
             server_id=server_id,
             network_id=module.params["network_id"],
             search_pattern=module.params["search_pattern"],
@@ -175,10 +208,11 @@ def main():
             interface_type=module.params["interface_type"],
             distribution_method=module.params["distribution_method"],
             additional=module.params["additional"],
+            projection=Projection.from_module(module),
         )
-        module.exit_json(**networks_info.run())
+        module.exit_json(**with_client_info(networks_info.run()))
     except SCBaseError as e:
-        module.fail_json(**e.fail())
+        module.fail_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
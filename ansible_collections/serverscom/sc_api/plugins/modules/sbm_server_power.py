@@ -162,13 +162,15 @@ EXAMPLES = """
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
-    ScApi,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.sbm import (
+    ScSbmApi,
     ScSbmServerPower,
     resolve_sbm_server_id,
 )
@@ -191,9 +193,10 @@ def main():
         mutually_exclusive=[["server_id", "hostname"]],
         supports_check_mode=True,
     )
+    configure_api_client(module)
 
     try:
-        api = ScApi(module.params["token"], module.params["endpoint"])
+        api = ScSbmApi(module.params["token"], module.params["endpoint"])
         server_id = resolve_sbm_server_id(
             api,
             server_id=module.params["server_id"],
@@ -202,14 +205,15 @@ def main():
         power = ScSbmServerPower(
             endpoint=module.params["endpoint"],
             token=module.params["token"],
+            api=api,
             server_id=server_id,
             state=module.params["state"],
             wait=module.params["wait"],
             checkmode=module.check_mode,
         )
-        module.exit_json(**power.run())
+        module.exit_json(**with_client_info(power.run()))
     except SCBaseError as e:
-        module.fail_json(**e.fail())
+        module.fail_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
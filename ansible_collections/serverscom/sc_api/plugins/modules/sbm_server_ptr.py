@@ -140,13 +140,15 @@ EXAMPLES = """
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
-    ScApi,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.sbm import (
+    ScSbmApi,
     ScSbmServerPtr,
     resolve_sbm_server_id,
 )
@@ -176,8 +178,9 @@ def main():
         ],
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
-        api = ScApi(module.params["token"], module.params["endpoint"])
+        api = ScSbmApi(module.params["token"], module.params["endpoint"])
         server_id = resolve_sbm_server_id(
             api,
             server_id=module.params["server_id"],
@@ -186,6 +189,7 @@ def main():
         ptr = ScSbmServerPtr(
             endpoint=module.params["endpoint"],
             token=module.params["token"],
+            api=api,
             state=module.params["state"],
             server_id=server_id,
             ip=module.params["ip"],
@@ -194,9 +198,9 @@ def main():
             priority=module.params["priority"],
             checkmode=module.check_mode,
         )
-        module.exit_json(**ptr.run())
+        module.exit_json(**with_client_info(ptr.run()))
     except SCBaseError as e:
-        module.fail_json(**e.fail())
+        module.fail_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
@@ -23,7 +23,10 @@ short_description: Query PTR records for an SBM (Scalable Baremetal) server
 description: >
     Returns the list of PTR records associated with
     IP addresses of the SBM (Scalable Baremetal) server.
-extends_documentation_fragment: serverscom.sc_api.api_auth
+extends_documentation_fragment:
+  - serverscom.sc_api.api_auth
+  - serverscom.sc_api.projection
+  - serverscom.sc_api.projection.listing
 
 options:
     server_id:
@@ -44,7 +47,7 @@ ptr_records:
   type: list
   description:
     - List of PTR records for the server.
-  returned: on success
+  returned: on success, unless I(dest) is set
   contains:
     id:
       type: str
@@ -67,6 +70,27 @@ ptr_records:
       description:
         - Priority of the PTR record.
 
+dest:
+  type: str
+  returned: when I(dest) is set
+  description:
+    - Path of the file the objects were written to, one JSON object per line.
+  sample: /var/tmp/listing.jsonl.gz
+
+count:
+  type: int
+  returned: when I(dest) is set
+  description:
+    - Number of objects written to I(dest).
+  sample: 250
+
+checksum:
+  type: str
+  returned: when I(dest) is set
+  description:
+    - SHA1 checksum of I(dest).
+  sample: 2aae6c35c94fcfb415dbe95f408b9ce91ee846ed
+
 api_url:
   description: URL for the failed request.
   returned: on failure
@@ -98,13 +122,19 @@ EXAMPLES = """
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
-    ScApi,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    PROJECTION_ARGS,
+    Projection,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.sbm import (
+    ScSbmApi,
     ScSbmServerPtrInfo,
     resolve_sbm_server_id,
 )
@@ -114,6 +144,7 @@ def main():
     module = AnsibleModule(
         argument_spec={
             **AUTH_ARGS,
+            **PROJECTION_ARGS,
             "server_id": {"type": "str"},
             "hostname": {"type": "str"},
         },
@@ -121,8 +152,9 @@ def main():
         mutually_exclusive=[["server_id", "hostname"]],
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
-        api = ScApi(module.params["token"], module.params["endpoint"])
+        api = ScSbmApi(module.params["token"], module.params["endpoint"])
         server_id = resolve_sbm_server_id(
             api,
             server_id=module.params["server_id"],
@@ -131,11 +163,13 @@ def main():
         ptr_info = ScSbmServerPtrInfo(
             endpoint=module.params["endpoint"],
             token=module.params["token"],
+            api=api,
             server_id=server_id,
+            projection=Projection.from_module(module),
         )
-        module.exit_json(**ptr_info.run())
+        module.exit_json(**with_client_info(ptr_info.run()))
     except SCBaseError as e:
-        module.fail_json(**e.fail())
+        module.fail_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
@@ -113,6 +113,7 @@ options:
               requests in accordance with ratelimit.
             - Minimal value is 10.
             - Ignored if I(wait)=C(0).
+            - Polls start 1 second apart and back off up to this interval (for a long I(wait), up to 1% of it, at most 300 seconds).
 
     user_data:
       type: str
@@ -300,13 +301,15 @@ EXAMPLES = """
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
-    ScApi,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.sbm import (
+    ScSbmApi,
     ScSbmServerReinstall,
     resolve_sbm_server_id,
 )
@@ -349,8 +352,9 @@ def main():
             ],
         ],
     )
+    configure_api_client(module)
     try:
-        api = ScApi(module.params["token"], module.params["endpoint"])
+        api = ScSbmApi(module.params["token"], module.params["endpoint"])
         server_id = resolve_sbm_server_id(
             api,
             server_id=module.params["server_id"],
@@ -359,6 +363,7 @@ def main():
         sc_sbm_server_reinstall = ScSbmServerReinstall(
             endpoint=module.params["endpoint"],
             token=module.params["token"],
+            api=api,
             server_id=server_id,
             hostname=module.params["hostname"],
             operating_system_id=module.params["operating_system_id"],
@@ -371,9 +376,9 @@ def main():
             user_data=module.params["user_data"],
             checkmode=module.check_mode,
         )
-        module.exit_json(**sc_sbm_server_reinstall.run())
+        module.exit_json(**with_client_info(sc_sbm_server_reinstall.run()))
     except SCBaseError as e:
-        module.fail_json(**e.fail())
+        module.fail_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,415 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# (c) 2026, Servers.com
+# GNU General Public License v3.0
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    "metadata_version": "1.1",
+    "status": ["preview"],
+    "supported_by": "community",
+}
+
+DOCUMENTATION = """
+---
+module: sbm_servers
+version_added: "1.2.0"
+author: "Servers.com Team (@serverscom)"
+short_description: Order many SBM (Scalable Baremetal) servers at once
+description: >
+    Order a batch of Scalable Baremetal servers and wait until all of them
+    are ready.
+    Servers with the same location, flavor and operating system are ordered
+    with a single request, and all ordered servers are watched in one polling
+    loop. Every ordered server gets a C(sc-ansible-order) label, unique to the
+    task run, and each poll lists only the servers with that label instead of
+    requesting each server. The label stays on the servers after the task.
+    If an order fails after others were placed, or an ordered server disappears
+    while waiting (it is missing from the listing and a request by its ID
+    returns 404, i.e. its order failed), the module fails and returns the
+    servers ordered so far.
+    Like M(serverscom.sc_api.sbm_server) with C(state=present), the module
+    always orders new servers and is not idempotent.
+extends_documentation_fragment: serverscom.sc_api.api_auth
+
+options:
+    hostnames:
+      type: list
+      elements: str
+      description:
+        - Hostnames of the servers to order.
+        - Mutually exclusive with I(count) and I(servers).
+
+    count:
+      type: int
+      description:
+        - Number of servers to order, named by I(hostname_template).
+        - Mutually exclusive with I(hostnames) and I(servers).
+
+    hostname_template:
+      type: str
+      default: "sbm-{index}"
+      description:
+        - Template for hostnames when I(count) is used.
+        - C({index}) is replaced with the server number, counting from I(start_index).
+          Python format specs are supported, e.g. V(node-{index:03d}).
+
+    start_index:
+      type: int
+      default: 1
+      description:
+        - First number used for C({index}) in I(hostname_template).
+
+    servers:
+      type: list
+      elements: dict
+      description:
+        - Servers to order, each with its own hostname.
+        - Every item may override the location, flavor and operating system
+          options given at the top level of the module.
+        - Mutually exclusive with I(hostnames) and I(count).
+      suboptions:
+        hostname:
+          type: str
+          required: true
+          description: Hostname for the server.
+        location_id:
+          type: int
+          description: Overrides I(location_id).
+        location_code:
+          type: str
+          description: Overrides I(location_code).
+        flavor_id:
+          type: int
+          description: Overrides I(flavor_id).
+        flavor_name:
+          type: str
+          description: Overrides I(flavor_name).
+        operating_system_id:
+          type: int
+          description: Overrides I(operating_system_id).
+        operating_system_name:
+          type: str
+          description: Overrides I(operating_system_name).
+        operating_system_regex:
+          type: str
+          description: Overrides I(operating_system_regex).
+
+    location_id:
+      type: int
+      description:
+        - ID of the location to order the servers in.
+        - Mutually exclusive with I(location_code).
+
+    location_code:
+      type: str
+      description:
+        - Code of the location to order the servers in (e.g. V(AMS7)).
+        - Mutually exclusive with I(location_id).
+
+    flavor_id:
+      type: int
+      description:
+        - ID of the SBM flavor model to order.
+        - Mutually exclusive with I(flavor_name).
+
+    flavor_name:
+      type: str
+      description:
+        - Human-readable name of the SBM flavor model (e.g. V(DL-01)).
+        - Mutually exclusive with I(flavor_id).
+
+    operating_system_id:
+      type: int
+      aliases: ['os_id']
+      description:
+        - ID of the operating system to install.
+        - Mutually exclusive with I(operating_system_name) and I(operating_system_regex).
+
+    operating_system_name:
+      type: str
+      aliases: ['os_name']
+      description:
+        - Full name of the operating system to install (exact match on C(full_name)).
+        - Mutually exclusive with I(operating_system_id) and I(operating_system_regex).
+
+    operating_system_regex:
+      type: str
+      aliases: ['os_regex']
+      description:
+        - Regular expression to match an operating system by C(full_name) (case insensitive).
+        - Must match exactly one OS option.
+        - Mutually exclusive with I(operating_system_id) and I(operating_system_name).
+
+    ssh_key_fingerprints:
+      type: list
+      elements: str
+      description:
+        - List of SSH key fingerprints to install on all servers.
+
+    user_data:
+      type: str
+      description:
+        - User data to pass to all new servers.
+
+    wait:
+      type: int
+      default: 86400
+      description:
+        - Time to wait (in seconds) until all servers become ready
+          (active, powered_on, normal).
+        - Value C(0) disables waiting (fire-and-forget mode).
+
+    update_interval:
+      type: int
+      default: 60
+      description:
+        - Polling interval (in seconds) for waiting.
+        - Each poll makes one listing request for the servers of this order
+          (by their C(sc-ansible-order) label).
+        - Polls start 1 second apart and back off up to this interval (for a long I(wait), up to 1% of it, at most 300 seconds).
+"""
+
+RETURN = """
+sbm_servers:
+  type: list
+  elements: dict
+  description:
+    - Ordered servers, in the same format as M(serverscom.sc_api.sbm_server) returns.
+    - If I(wait) is not C(0), all servers are ready.
+    - On a failed order, the servers ordered before it.
+  returned: on success, and when some orders or servers failed
+
+missing_sbm_servers:
+  type: list
+  elements: dict
+  description:
+    - Ordered servers which disappeared while waiting, as last seen.
+  returned: when ordered servers disappeared
+
+api_url:
+  type: str
+  description:
+    - URL of the failed request.
+  returned: on failure
+
+status_code:
+  type: int
+  description:
+    - HTTP status code of the response.
+  returned: on failure
+"""
+
+EXAMPLES = """
+- name: Order three SBM servers
+  serverscom.sc_api.sbm_servers:
+    token: '{{ sc_token }}'
+    hostnames: [web-01, web-02, web-03]
+    location_code: AMS7
+    flavor_name: DL-01
+    os_name: 'Debian 13 64-bit'
+  register: web
+
+- name: Order 100 nodes named node-001 ... node-100
+  serverscom.sc_api.sbm_servers:
+    token: '{{ sc_token }}'
+    count: 100
+    hostname_template: 'node-{index:03d}'
+    location_code: AMS7
+    flavor_name: DL-01
+    os_regex: 'Debian 13'
+    ssh_key_fingerprints:
+      - '{{ fingerprint }}'
+
+- name: Order servers in two locations (one order per location)
+  serverscom.sc_api.sbm_servers:
+    token: '{{ sc_token }}'
+    flavor_name: DL-01
+    os_name: 'Debian 13 64-bit'
+    servers:
+      - hostname: db-ams
+        location_code: AMS7
+      - hostname: db-dfw
+        location_code: DFW2
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    SCBaseError,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
+    AUTH_ARGS,
+    ModuleError,
+    configure_api_client,
+    with_client_info,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.sbm import (
+    ScSbmApi,
+    ScSbmServersCreate,
+    resolve_location_id,
+    resolve_operating_system_id,
+    resolve_sbm_flavor_model_id,
+)
+
+# Options which can be set per server (pairs are mutually exclusive).
+OVERRIDES = (
+    ("location_id", "location_code"),
+    ("flavor_id", "flavor_name"),
+    ("operating_system_id", "operating_system_name", "operating_system_regex"),
+)
+
+
+def server_specs(params):
+    """List of per-server option dicts, with top-level defaults applied."""
+    if params["hostnames"]:
+        servers = [{"hostname": hostname} for hostname in params["hostnames"]]
+    elif params["count"] is not None:
+        if params["count"] < 1:
+            raise ModuleError(f"count must be positive, got {params['count']}.")
+        try:
+            servers = [
+                {"hostname": params["hostname_template"].format(index=index)}
+                for index in range(
+                    params["start_index"], params["start_index"] + params["count"]
+                )
+            ]
+        except (KeyError, IndexError, ValueError) as e:
+            raise ModuleError(f"Invalid hostname_template: {e}")
+    else:
+        servers = params["servers"]
+    specs = []
+    for server in servers:
+        spec = {"hostname": server["hostname"]}
+        for group in OVERRIDES:
+            source = server if any(server.get(key) for key in group) else params
+            for key in group:
+                spec[key] = source.get(key)
+        specs.append(spec)
+    hostnames = [spec["hostname"] for spec in specs]
+    duplicates = sorted({name for name in hostnames if hostnames.count(name) > 1})
+    if duplicates:
+        raise ModuleError(f"Duplicate hostnames: {', '.join(duplicates)}.")
+    return specs
+
+
+def resolve_orders(api, specs):
+    """Group servers into orders by resolved location, flavor and OS."""
+    resolved = {}
+    orders = {}
+    for spec in specs:
+        key = tuple(spec[option] for group in OVERRIDES for option in group)
+        if key not in resolved:
+            location_id = resolve_location_id(
+                api,
+                location_id=spec["location_id"],
+                location_code=spec["location_code"],
+            )
+            sbm_flavor_model_id = resolve_sbm_flavor_model_id(
+                api,
+                location_id,
+                sbm_flavor_model_id=spec["flavor_id"],
+                sbm_flavor_model_name=spec["flavor_name"],
+            )
+            operating_system_id = resolve_operating_system_id(
+                api,
+                location_id,
+                sbm_flavor_model_id,
+                operating_system_id=spec["operating_system_id"],
+                operating_system_name=spec["operating_system_name"],
+                operating_system_regex=spec["operating_system_regex"],
+            )
+            resolved[key] = (location_id, sbm_flavor_model_id, operating_system_id)
+        order = orders.setdefault(
+            resolved[key],
+            {
+                "location_id": resolved[key][0],
+                "sbm_flavor_model_id": resolved[key][1],
+                "operating_system_id": resolved[key][2],
+                "hostnames": [],
+            },
+        )
+        order["hostnames"].append(spec["hostname"])
+    return list(orders.values())
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec={
+            **AUTH_ARGS,
+            "hostnames": {"type": "list", "elements": "str"},
+            "count": {"type": "int"},
+            "hostname_template": {"type": "str", "default": "sbm-{index}"},
+            "start_index": {"type": "int", "default": 1},
+            "servers": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "hostname": {"type": "str", "required": True},
+                    "location_id": {"type": "int"},
+                    "location_code": {"type": "str"},
+                    "flavor_id": {"type": "int"},
+                    "flavor_name": {"type": "str"},
+                    "operating_system_id": {"type": "int"},
+                    "operating_system_name": {"type": "str"},
+                    "operating_system_regex": {"type": "str"},
+                },
+                "mutually_exclusive": [list(group) for group in OVERRIDES],
+            },
+            "location_id": {"type": "int"},
+            "location_code": {"type": "str"},
+            "flavor_id": {"type": "int"},
+            "flavor_name": {"type": "str"},
+            "operating_system_id": {
+                "type": "int",
+                "aliases": ["os_id"],
+            },
+            "operating_system_name": {
+                "type": "str",
+                "aliases": ["os_name"],
+            },
+            "operating_system_regex": {
+                "type": "str",
+                "aliases": ["os_regex"],
+            },
+            "ssh_key_fingerprints": {
+                "type": "list",
+                "elements": "str",
+                "no_log": False,
+            },
+            "user_data": {"type": "str", "no_log": True},
+            "wait": {"type": "int", "default": 86400},
+            "update_interval": {"type": "int", "default": 60},
+        },
+        required_one_of=[["hostnames", "count", "servers"]],
+        mutually_exclusive=[
+            ["hostnames", "count", "servers"],
+            *[list(group) for group in OVERRIDES],
+        ],
+        supports_check_mode=True,
+    )
+    configure_api_client(module)
+    try:
+        api = ScSbmApi(module.params["token"], module.params["endpoint"])
+        orders = resolve_orders(api, server_specs(module.params))
+        instance = ScSbmServersCreate(
+            endpoint=module.params["endpoint"],
+            token=module.params["token"],
+            api=api,
+            orders=orders,
+            ssh_key_fingerprints=module.params.get("ssh_key_fingerprints"),
+            user_data=module.params.get("user_data"),
+            wait=module.params["wait"],
+            update_interval=module.params["update_interval"],
+            checkmode=module.check_mode,
+        )
+        module.exit_json(**with_client_info(instance.run()))
+    except SCBaseError as e:
+        module.fail_json(**with_client_info(e.fail()))
+
+
+if __name__ == "__main__":
+    main()
@@ -23,7 +23,10 @@ short_description: List SBM (Scalable Baremetal) servers
 description: >
     Returns a list of all Scalable Baremetal servers with optional filtering
     by search pattern, location, rack, or labels.
-extends_documentation_fragment: serverscom.sc_api.api_auth
+extends_documentation_fragment:
+  - serverscom.sc_api.api_auth
+  - serverscom.sc_api.projection
+  - serverscom.sc_api.projection.listing
 
 options:
     search_pattern:
@@ -59,7 +62,28 @@ sbm_servers:
   type: list
   description:
     - List of SBM servers.
-  returned: on success
+  returned: on success, unless I(dest) is set
+
+dest:
+  type: str
+  returned: when I(dest) is set
+  description:
+    - Path of the file the objects were written to, one JSON object per line.
+  sample: /var/tmp/listing.jsonl.gz
+
+count:
+  type: int
+  returned: when I(dest) is set
+  description:
+    - Number of objects written to I(dest).
+  sample: 250
+
+checksum:
+  type: str
+  returned: when I(dest) is set
+  description:
+    - SHA1 checksum of I(dest).
+  sample: 2aae6c35c94fcfb415dbe95f408b9ce91ee846ed
 
 api_url:
   description: URL for the failed request.
@@ -99,13 +123,19 @@ EXAMPLES = """
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
-    ScApi,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    PROJECTION_ARGS,
+    Projection,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.sbm import (
+    ScSbmApi,
     ScSbmServersInfo,
     resolve_location_id,
 )
@@ -115,6 +145,7 @@ def main():
     module = AnsibleModule(
         argument_spec={
             **AUTH_ARGS,
+            **PROJECTION_ARGS,
             "search_pattern": {"type": "str"},
             "location_id": {"type": "int"},
             "location_code": {"type": "str"},
@@ -124,10 +155,11 @@ def main():
         mutually_exclusive=[["location_id", "location_code"]],
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
+        api = ScSbmApi(module.params["token"], module.params["endpoint"])
         location_id = module.params["location_id"]
         if not location_id and module.params["location_code"]:
-            api = ScApi(module.params["token"], module.params["endpoint"])
             location_id = resolve_location_id(
                 api,
                 location_code=module.params["location_code"],
@@ -135,14 +167,16 @@ def main():
         servers_info = ScSbmServersInfo(
             endpoint=module.params["endpoint"],
             token=module.params["token"],
+            api=api,
             search_pattern=module.params["search_pattern"],
             location_id=location_id,
             rack_id=module.params["rack_id"],
             label_selector=module.params["label_selector"],
+            projection=Projection.from_module(module),
         )
-        module.exit_json(**servers_info.run())
+        module.exit_json(**with_client_info(servers_info.run()))
     except SCBaseError as e:
-        module.fail_json(**e.fail())
+        module.fail_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
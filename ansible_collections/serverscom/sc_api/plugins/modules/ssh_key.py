@@ -135,6 +135,8 @@ EXAMPLES = """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
 from ansible_collections.serverscom.sc_api.plugins.module_utils.ssh_key import (
@@ -161,6 +163,7 @@ def main():
         },
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
         sc_ssh_key = ScSshKey(
             endpoint=module.params["endpoint"],
@@ -173,9 +176,9 @@ def main():
             replace=module.params["replace"],
             checkmode=module.check_mode,
         )
-        module.exit_json(**sc_ssh_key.run())
+        module.exit_json(**with_client_info(sc_ssh_key.run()))
     except SCBaseError as e:
-        module.exit_json(**e.fail())
+        module.exit_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
@@ -23,7 +23,10 @@ short_description: Return all registered ssh public keys.
 description: >
     Return list of all registered ssh keys.
 
-extends_documentation_fragment: serverscom.sc_api.api_auth
+extends_documentation_fragment:
+  - serverscom.sc_api.api_auth
+  - serverscom.sc_api.projection
+  - serverscom.sc_api.projection.listing
 
 options:
     label_selector:
@@ -37,7 +40,7 @@ RETURN = """
 ssh_keys:
   type: list
   elements: dict
-  returned: on success
+  returned: on success, unless I(dest) is set
   description:
     - List of registered SSH public keys.
     - Empty list if none registered.
@@ -63,6 +66,27 @@ ssh_keys:
       description:
         - Timestamp of the key last update.
 
+dest:
+  type: str
+  returned: when I(dest) is set
+  description:
+    - Path of the file the objects were written to, one JSON object per line.
+  sample: /var/tmp/listing.jsonl.gz
+
+count:
+  type: int
+  returned: when I(dest) is set
+  description:
+    - Number of objects written to I(dest).
+  sample: 250
+
+checksum:
+  type: str
+  returned: when I(dest) is set
+  description:
+    - SHA1 checksum of I(dest).
+  sample: 2aae6c35c94fcfb415dbe95f408b9ce91ee846ed
+
 api_url:
   type: str
   returned: on failure
@@ -87,8 +111,14 @@ EXAMPLES = """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     AUTH_ARGS,
+    configure_api_client,
+    with_client_info,
     SCBaseError,
 )
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    PROJECTION_ARGS,
+    Projection,
+)
 from ansible_collections.serverscom.sc_api.plugins.module_utils.ssh_key import (
     ScSshKeysInfo,
 )
@@ -100,19 +130,22 @@ def main():
     module = AnsibleModule(
         argument_spec={
             **AUTH_ARGS,
+            **PROJECTION_ARGS,
             "label_selector": {"type": "str"},
         },
         supports_check_mode=True,
     )
+    configure_api_client(module)
     try:
         sc_ssh_key = ScSshKeysInfo(
             endpoint=module.params["endpoint"],
             token=module.params["token"],
             label_selector=module.params.get("label_selector"),
+            projection=Projection.from_module(module),
         )
-        module.exit_json(**sc_ssh_key.run())
+        module.exit_json(**with_client_info(sc_ssh_key.run()))
     except SCBaseError as e:
-        module.exit_json(**e.fail())
+        module.exit_json(**with_client_info(e.fail()))
 
 
 if __name__ == "__main__":
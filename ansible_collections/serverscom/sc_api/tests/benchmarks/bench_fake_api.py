@@ -0,0 +1,75 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Time ScApi calls end to end (real HTTP) against the fake API server.
+
+Unlike the other benchmarks, requests go through sockets, the threaded
+HTTP server and the simulated network latency, so this shows what a
+module would see on a slow link.
+
+Run from the collection directory with the repository root in PYTHONPATH:
+
+    PYTHONPATH=../../.. python tests/benchmarks/bench_fake_api.py
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import time
+
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_client import ScApi
+from ansible_collections.serverscom.sc_api.tests.fake_api import seed
+from ansible_collections.serverscom.sc_api.tests.fake_api.server import (
+    FakeApi,
+    start_in_thread,
+)
+
+
+__metaclass__ = type
+
+LATENCIES = (0.0, 0.02, 0.05)
+HOSTS = 500
+
+
+def populate(api):
+    location = seed.LOCATIONS[1]
+    flavor = seed.ORDER_OPTIONS["sbm_flavor_models"][0]
+    for index in range(HOSTS):
+        server_id = f"bench{index:05d}"
+        api.state["hosts"][server_id] = seed.sbm_server(
+            server_id, f"bench-{index}", location, flavor
+        )
+
+
+def timed(func):
+    start = time.monotonic()
+    func()
+    return time.monotonic() - start
+
+
+def main():
+    print(f"{'latency':>8}{'list_hosts':>14}{'page_size=100':>16}{'get x20':>10}{'requests':>10}")
+    for latency in LATENCIES:
+        fake = FakeApi({"latency": latency, "transition_delay": 0})
+        populate(fake)
+        server, endpoint = start_in_thread(api=fake)
+        try:
+            default = timed(lambda: list(ScApi("token", endpoint).list_hosts()))
+            large = timed(
+                lambda: list(ScApi("token", endpoint, page_size=100).list_hosts())
+            )
+            api = ScApi("token", endpoint)
+            gets = timed(
+                lambda: [api.get_sbm_servers(f"bench{i:05d}") for i in range(20)]
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+        print(
+            f"{latency:>8}{default:>13.2f}s{large:>15.2f}s{gets:>9.2f}s"
+            f"{fake.request_count:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Compare serial ScApi calls with ScL2SegmentInfo (concurrent GETs).
+
+Runs against the fake API server with simulated network latency.
+Run from the collection directory with the repository root in PYTHONPATH:
+
+    PYTHONPATH=../../.. python tests/benchmarks/bench_l2_segment_info.py
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import time
+
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_client import ScApi
+from ansible_collections.serverscom.sc_api.plugins.module_utils.l2_segment import (
+    ScL2SegmentInfo,
+)
+from ansible_collections.serverscom.sc_api.tests.fake_api.server import (
+    FakeApi,
+    start_in_thread,
+)
+
+
+__metaclass__ = type
+
+LATENCIES = (0.01, 0.05, 0.1, 0.2)
+ROUNDS = 5
+
+
+def serial(api, segment_id):
+    networks = list(api.list_l2_segment_networks(segment_id))
+    members = list(api.list_l2_segment_members(segment_id))
+    segment = api.get_l2_segment(segment_id)
+    return dict(segment, networks=networks, members=members)
+
+
+def timed(func):
+    start = time.monotonic()
+    for _round in range(ROUNDS):
+        func()
+    return (time.monotonic() - start) / ROUNDS
+
+
+def main():
+    print(f"{'latency':>8}{'serial':>10}{'threads':>10}")
+    for latency in LATENCIES:
+        fake = FakeApi({"transition_delay": 0})
+        server, endpoint = start_in_thread(api=fake)
+        try:
+            api = ScApi("token", endpoint)
+            segment_id = api.post_l2_segment(
+                "bench", "private", 1, [{"id": "Vmrzwomx", "mode": "native"}]
+            )["id"]
+            fake.config["latency"] = latency
+            sync = timed(lambda: serial(api, segment_id))
+            info = ScL2SegmentInfo(endpoint, "token", id=segment_id, name=None)
+            threaded = timed(info.run)
+        finally:
+            server.shutdown()
+            server.server_close()
+        print(f"{latency:>8}{sync:>9.3f}s{threaded:>9.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Compare peak memory and time of decoding list pages whole and item by item.
+
+Every page is a gzipped JSON array of synthetic SBM servers, served from
+memory through a real requests Response (urllib3 does the gunzipping, as
+it does for the API). "whole" is response.json() followed by iterating
+over the list, the way pages were decoded before; "items" is
+ApiHelper.decode_items. Items are dropped as soon as they are seen, the
+way info modules with dest do it.
+
+The "revalidate" columns decode pages carrying an ETag with revalidation
+in memory on: "stored" stores the page's validators and body before
+decoding it (which reads it whole), "streamed" goes through
+send_get_request(stream=True), as make_multipage_request does.
+
+Run from the collection directory with the repository root in PYTHONPATH:
+
+    PYTHONPATH=../../.. python tests/benchmarks/bench_page_decode.py
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import gzip
+import io
+import json
+import time
+import tracemalloc
+
+import requests
+from urllib3.response import HTTPResponse
+
+from ansible_collections.serverscom.sc_api.plugins.module_utils import revalidate
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    CLIENT_DEFAULTS,
+    REVALIDATE_MEMORY,
+    ApiHelper,
+)
+from ansible_collections.serverscom.sc_api.tests.fake_api import seed
+
+
+__metaclass__ = type
+
+ITEMS = (100, 1000, 5000)
+URL = "http://fake/v1/hosts/sbm_servers"
+PADDING = (0, 4096)  # extra bytes of labels per item, for "fat" objects
+
+
+def make_page(count, padding):
+    items = []
+    for number in range(count):
+        item = seed.sbm_server(
+            f"sbm{number:06d}",
+            f"node{number}",
+            seed.LOCATIONS[0],
+            seed.ORDER_OPTIONS["sbm_flavor_models"][0],
+        )
+        if padding:
+            item["labels"] = {"blob": "x" * padding}
+        items.append(item)
+    return json.dumps(items).encode("utf-8")
+
+
+def make_response(body):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers = requests.structures.CaseInsensitiveDict(
+        {
+            "Content-Encoding": "gzip",
+            "Content-Length": str(len(body)),
+            "ETag": '"page-1"',
+        }
+    )
+    response.url = URL
+    response.raw = HTTPResponse(
+        body=io.BytesIO(body),
+        headers=dict(response.headers),
+        status=200,
+        preload_content=False,
+        decode_content=True,
+    )
+    return response
+
+
+def decode_whole(helper, response):
+    for _item in helper.decode(response):
+        pass
+
+
+def decode_items(helper, response):
+    for _item in helper.decode_items(response):
+        pass
+
+
+def decode_stored(helper, response):
+    # What send_get_request did with streamed pages before they were
+    # left out of the validator store.
+    decode_items(helper, helper.revalidated(URL, None, response))
+
+
+def decode_streamed(helper, response):
+    helper.send_retrying = lambda *args: response
+    decode_items(helper, helper.send_get_request(URL, stream=True))
+
+
+def measure(decode, helper, body):
+    response = make_response(body)
+    tracemalloc.start()
+    started = time.perf_counter()
+    decode(helper, response)
+    seconds = time.perf_counter() - started
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, seconds
+
+
+def main():
+    CLIENT_DEFAULTS["revalidate"] = REVALIDATE_MEMORY
+    helper = ApiHelper("token", "http://fake/v1")
+    print("peak KiB / ms")
+    print(
+        f"{'items':>6}{'padding':>8}{'json KiB':>10}{'gzip KiB':>10}"
+        f"{'whole':>14}{'items':>14}{'reval. stored':>16}{'reval. streamed':>17}"
+    )
+    for count in ITEMS:
+        for padding in PADDING:
+            raw = make_page(count, padding)
+            body = gzip.compress(raw)
+            columns = []
+            for decode in (decode_whole, decode_items, decode_stored, decode_streamed):
+                revalidate.MEMORY.clear()
+                peak, seconds = measure(decode, helper, body)
+                columns.append(f"{peak // 1024} / {seconds * 1000:.0f}")
+            print(
+                f"{count:>6}{padding:>8}{len(raw) // 1024:>10}{len(body) // 1024:>10}"
+                f"{columns[0]:>14}{columns[1]:>14}{columns[2]:>16}{columns[3]:>17}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Count requests needed by ScApi listings for different page sizes.
+
+Run from the collection directory with the repository root in PYTHONPATH:
+
+    PYTHONPATH=../../.. python tests/benchmarks/bench_page_size.py
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_client import ScApi
+from ansible_collections.serverscom.sc_api.tests.benchmarks.fake_endpoint import (
+    FakeEndpoint,
+    make_items,
+)
+
+
+__metaclass__ = type
+
+LISTINGS = {
+    "list_hosts": "/hosts",
+    "list_sbm_servers": "/hosts/sbm_servers",
+    "list_instances": "/cloud_computing/instances",
+    "list_rbs_volumes": "/remote_block_storage/volumes",
+    "list_l2_segments": "/l2_segments",
+    "list_ssh_keys": "/ssh_keys",
+}
+SIZES = (100, 1000, 4000)
+PAGE_SIZES = (0, 50, 100)  # 0 means "don't send per_page"
+
+
+def count_requests(method, path, size, page_size):
+    api = ScApi("token", "http://fake/v1", page_size=page_size)
+    endpoint = FakeEndpoint({path: make_items(size)}).attach(api.api_helper)
+    items = list(getattr(api, method)())
+    assert len(items) == size
+    return len(endpoint.requests)
+
+
+def main():
+    header = f"{'listing':<20}{'objects':>8}" + "".join(
+        f"{'per_page=' + (str(p) if p else 'default'):>20}" for p in PAGE_SIZES
+    )
+    print(header)
+    for method, path in LISTINGS.items():
+        for size in SIZES:
+            counts = [count_requests(method, path, size, p) for p in PAGE_SIZES]
+            print(f"{method:<20}{size:>8}" + "".join(f"{c:>20}" for c in counts))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Measure AnsiballZ payload size and cold import time of every module.
+
+The payload is built the same way ansible builds it for a task. The
+import time is measured by importing the module from the payload's zip
+in a fresh interpreter (as AnsiballZ does: sources are compiled on
+every run, nothing is cached), median of several runs. ansible's own
+module_utils (basic.py and friends) are imported first, so "import ms"
+is the time spent in this collection's code only.
+
+Run from the collection directory with the repository root in PYTHONPATH:
+
+    PYTHONPATH=../../.. python tests/benchmarks/bench_payload.py [module ...]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import base64
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import zipfile
+
+from ansible.executor.module_common import modify_module
+from ansible.parsing.dataloader import DataLoader
+from ansible.template import Templar
+from ansible.utils.collection_loader._collection_finder import (
+    _AnsibleCollectionFinder,
+)
+
+
+__metaclass__ = type
+
+COLLECTION = "ansible_collections.serverscom.sc_api"
+MODULES_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "plugins", "modules")
+RUNS = 5
+
+IMPORT_SCRIPT = """
+import sys, time
+sys.path.insert(0, sys.argv[1])
+import ansible.module_utils.basic
+started = time.perf_counter()
+import {module}
+print(time.perf_counter() - started)
+"""
+
+
+def build_payload(name):
+    path = os.path.abspath(os.path.join(MODULES_DIR, name + ".py"))
+    data, _style, _shebang = modify_module(
+        f"serverscom.sc_api.{name}",
+        path,
+        {},
+        Templar(loader=DataLoader()),
+        task_vars={"ansible_python_interpreter": sys.executable},
+    )
+    zipdata = re.search(rb"ZIPDATA = b?'([^']*)'", data).group(1)
+    return data, base64.b64decode(zipdata)
+
+
+def import_time(zip_path, name):
+    script = IMPORT_SCRIPT.format(module=f"{COLLECTION}.plugins.modules.{name}")
+    times = []
+    for _run in range(RUNS):
+        output = subprocess.check_output(
+            [sys.executable, "-I", "-c", script, zip_path], env={}
+        )
+        times.append(float(output))
+    return statistics.median(times)
+
+
+def main():
+    root = os.path.abspath(os.path.join(MODULES_DIR, "..", "..", "..", "..", ".."))
+    _AnsibleCollectionFinder(paths=[root])._install()
+    names = sys.argv[1:] or sorted(
+        f[:-3] for f in os.listdir(MODULES_DIR) if f.endswith(".py") and f != "__init__.py"
+    )
+    print(f"{'module':<36}{'payload':>10}{'utils':>7}{'utils bytes':>13}{'import ms':>11}")
+    totals = [0, 0.0]
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in names:
+            data, zipped = build_payload(name)
+            zip_path = os.path.join(tmp, name + ".zip")
+            with open(zip_path, "wb") as f:
+                f.write(zipped)
+            with zipfile.ZipFile(zip_path) as z:
+                utils = [
+                    n for n in z.namelist()
+                    if n.startswith("ansible_collections/serverscom/sc_api/plugins/module_utils/")
+                    and not n.endswith("__init__.py")
+                ]
+                size = sum(z.getinfo(n).file_size for n in utils)
+            seconds = import_time(zip_path, name)
+            totals[0] += len(data)
+            totals[1] += seconds
+            print(f"{name:<36}{len(data):>10}{len(utils):>7}{size:>13}{seconds * 1000:>11.1f}")
+    print(f"{'average':<36}{totals[0] // len(names):>10}{'':>7}{'':>13}{totals[1] * 1000 / len(names):>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Time rbs_volume_info listings with credentials against a slow endpoint.
+
+Every request to the fake endpoint takes LATENCY seconds, like a real
+round trip to the API. Run from the collection directory with the
+repository root in PYTHONPATH:
+
+    PYTHONPATH=../../.. python tests/benchmarks/bench_rbs_credentials.py
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import time
+
+from ansible_collections.serverscom.sc_api.plugins.module_utils.rbs import (
+    CREDENTIALS_WORKERS,
+    ScRBSVolumeList,
+)
+from ansible_collections.serverscom.sc_api.tests.benchmarks.fake_endpoint import (
+    FakeEndpoint,
+    make_items,
+)
+
+
+__metaclass__ = type
+
+VOLUMES_PATH = "/remote_block_storage/volumes"
+LATENCY = 0.05
+SIZES = (20, 100, 300)
+MODES = {
+    "serial": {"credentials_workers": 1},
+    f"{CREDENTIALS_WORKERS} workers": {},
+    "credentials_for=1": {"credentials_for": ["vol000000"]},
+    "no credentials": {"include_credentials": False},
+}
+
+
+def run(size, options):
+    volumes = make_items(size, prefix="vol")
+    credentials = {
+        f"{VOLUMES_PATH}/{volume['id']}/credentials": {
+            "username": volume["id"],
+            "password": "secret",
+        }
+        for volume in volumes
+    }
+    worker = ScRBSVolumeList(
+        endpoint="http://fake/v1", token="token", location_id=1, **options
+    )
+    endpoint = FakeEndpoint(
+        {VOLUMES_PATH: volumes}, latency=LATENCY, objects=credentials
+    ).attach(worker.api.api_helper)
+    start = time.time()
+    result = worker.run()
+    elapsed = time.time() - start
+    assert len(result["rbs_volumes"]) == size
+    return elapsed, len(endpoint.requests)
+
+
+def main():
+    print(f"latency {LATENCY * 1000:.0f} ms per request")
+    print(f"{'volumes':>8}" + "".join(f"{mode:>24}" for mode in MODES))
+    for size in SIZES:
+        cells = []
+        for options in MODES.values():
+            elapsed, requests = run(size, options)
+            cells.append(f"{elapsed:.2f}s/{requests} req")
+        print(f"{size:>8}" + "".join(f"{cell:>24}" for cell in cells))
+
+
+if __name__ == "__main__":
+    main()
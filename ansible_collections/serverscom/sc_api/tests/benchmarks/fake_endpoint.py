@@ -0,0 +1,108 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""In-process stand-in for the API used by benchmarks.
+
+Replaces ``session.send`` of an ApiHelper and answers list requests the
+way the API does: ``page``/``per_page`` query parameters, 20 items per
+page by default, at most 100, and ``Link`` headers with next/last pages.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import json
+import threading
+import time
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+
+
+__metaclass__ = type
+
+SERVER_DEFAULT_PER_PAGE = 20
+SERVER_MAX_PER_PAGE = 100
+
+
+class FakeResponse:
+    def __init__(self, url, status_code, json_data, links, headers=None):
+        self.url = url
+        self.status_code = status_code
+        self._json_data = json_data
+        self.links = links
+        self.headers = headers or {}
+        self.content = b""
+
+    def json(self):
+        return self._json_data
+
+    def iter_content(self, _chunk_size):
+        yield json.dumps(self._json_data).encode("utf-8")
+
+    def close(self):
+        pass
+
+
+class FakeEndpoint:
+    """Serve collections of objects by path, counting requests.
+
+    collections: dict path -> list of objects (path without endpoint).
+    objects: dict path -> single object, for other GET requests.
+    latency: seconds to sleep on every request.
+    """
+
+    def __init__(self, collections, latency=0.0, objects=None):
+        self.collections = collections
+        self.objects = objects or {}
+        self.latency = latency
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def attach(self, api_helper):
+        api_helper.session.send = self
+        return self
+
+    def __call__(self, prep_request, **_kwargs):
+        with self._lock:
+            self.requests.append(prep_request.url)
+        if self.latency:
+            time.sleep(self.latency)
+        parsed = urlparse(prep_request.url)
+        path = parsed.path.split("/v1", 1)[-1]
+        query = parse_qs(parsed.query)
+        if path in self.collections:
+            return self.list_page(parsed, query, self.collections[path])
+        if path in self.objects:
+            return FakeResponse(prep_request.url, 200, self.objects[path], {})
+        for collection_path, items in self.collections.items():
+            for item in items:
+                if path == f"{collection_path}/{item['id']}":
+                    return FakeResponse(prep_request.url, 200, item, {})
+        return FakeResponse(prep_request.url, 404, {"message": "Not found"}, {})
+
+    @staticmethod
+    def list_page(parsed, query, items):
+        per_page = int(query.get("per_page", [SERVER_DEFAULT_PER_PAGE])[0])
+        per_page = min(per_page, SERVER_MAX_PER_PAGE)
+        page = int(query.get("page", ["1"])[0])
+        last = max(1, -(-len(items) // per_page))
+
+        def page_url(number):
+            new_query = dict(query, page=[str(number)], per_page=[str(per_page)])
+            return urlunparse(parsed._replace(query=urlencode(new_query, doseq=True)))
+
+        links = {"first": {"url": page_url(1)}, "last": {"url": page_url(last)}}
+        if page < last:
+            links["next"] = {"url": page_url(page + 1)}
+        if page > 1:
+            links["prev"] = {"url": page_url(page - 1)}
+        return FakeResponse(
+            urlunparse(parsed),
+            200,
+            items[(page - 1) * per_page:page * per_page],
+            links,
+            headers={"X-Total-Count": str(len(items))},
+        )
+
+
+def make_items(count, prefix="obj"):
+    return [{"id": f"{prefix}{n:06d}", "name": f"{prefix}-{n}"} for n in range(count)]
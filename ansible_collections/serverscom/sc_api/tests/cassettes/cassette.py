@@ -0,0 +1,233 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Record API exchanges of module runs to files and replay them offline."""
+
+from __future__ import absolute_import, division, print_function
+
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+
+import mock
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    ApiHelper,
+    SCBaseError,
+)
+
+
+__metaclass__ = type
+
+
+CASSETTE_RECORD = "record"
+CASSETTE_REPLAY = "replay"
+CASSETTE_MODES = [CASSETTE_RECORD, CASSETTE_REPLAY]
+# Cassette latency: replay each answer after the time it took when recorded.
+LATENCY_RECORDED = "recorded"
+
+CASSETTE_VERSION = 1
+TOKEN_PLACEHOLDER = "<TOKEN>"
+ENDPOINT_PLACEHOLDER = "<ENDPOINT>"
+
+# Headers which are not recorded: bodies are stored decoded, and the
+# rest differs on every request or may carry credentials.
+_DROPPED_HEADERS = frozenset(
+    (
+        "connection content-encoding content-length date keep-alive server "
+        "set-cookie transfer-encoding x-correlation-id"
+    ).split()
+)
+
+_send_live = ApiHelper._send
+
+
+class CassetteError(SCBaseError):
+    """A replayed request has no recorded answer."""
+
+    def __init__(self, msg):
+        self.msg = msg
+
+
+class Cassette:
+    """API exchanges recorded in a file, to replay module runs offline.
+
+    With ApiHelper._send replaced by sender() (see patch()), every
+    ApiHelper sends through the cassette.
+    In record mode requests are sent as usual and every exchange
+    (method, URL and body of the request; status, headers and decoded
+    body of the answer; the time it took) is added to the file at path,
+    after the ones already there. The token and the endpoint are replaced
+    with placeholders, so a cassette replays against any endpoint, but
+    bodies are kept as they are: record against the fake API (see
+    tests/cassettes/record.py), not real accounts, whose answers carry
+    passwords, RBS credentials and user_data. The file is written 0600.
+
+    In replay mode nothing is sent: a request gets the next recorded
+    answer to the same method, URL and body, in recorded order; when
+    they are used up, the last one is repeated (e.g. for an extra poll).
+    latency: None answers at once, LATENCY_RECORDED after the recorded
+    time, a number after that many seconds.
+    """
+
+    def __init__(self, path, mode=CASSETTE_REPLAY, latency=None):
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.interactions = []
+        if mode == CASSETTE_REPLAY or os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.interactions = json.load(f)["interactions"]
+        self.answers = None  # recorded answers by request key, for replay
+
+    @property
+    def recording(self):
+        return self.mode == CASSETTE_RECORD
+
+    @staticmethod
+    def scrub(text, token, endpoint):
+        if text is None:
+            return None
+        text = text.replace(endpoint, ENDPOINT_PLACEHOLDER)
+        if token:
+            text = text.replace(token, TOKEN_PLACEHOLDER)
+        return text
+
+    @staticmethod
+    def unscrub(text, endpoint):
+        return text.replace(ENDPOINT_PLACEHOLDER, endpoint)
+
+    def scrub_request(self, request, token, endpoint):
+        return {
+            key: self.scrub(request[key], token, endpoint)
+            for key in ("method", "url", "body")
+        }
+
+    @staticmethod
+    def key(request):
+        return request["method"], request["url"], request["body"]
+
+    def record(self, token, endpoint, request, answer, elapsed):
+        """Add an exchange and write the cassette.
+
+        request: dict with method, url and body (text or None); answer:
+        dict with status, headers, url and body (decoded text).
+        """
+        interaction = {
+            "request": self.scrub_request(request, token, endpoint),
+            "response": {
+                "status": answer["status"],
+                "headers": {
+                    name: self.scrub(value, token, endpoint)
+                    for name, value in sorted(answer["headers"].items())
+                    if name.lower() not in _DROPPED_HEADERS
+                },
+                "url": self.scrub(answer["url"], token, endpoint),
+                "body": self.scrub(answer["body"], token, endpoint),
+            },
+            "elapsed": round(elapsed, 4),
+        }
+        with self.lock:
+            self.interactions.append(interaction)
+            self._write()
+
+    def play(self, token, endpoint, request):
+        """The recorded answer to request (as in record).
+
+        Raises CassetteError if there is none.
+        """
+        key = self.key(self.scrub_request(request, token, endpoint))
+        with self.lock:
+            if self.answers is None:
+                self.answers = {}
+                for interaction in self.interactions:
+                    self.answers.setdefault(
+                        self.key(interaction["request"]), deque()
+                    ).append(interaction)
+            recorded = self.answers.get(key)
+            if not recorded:
+                raise CassetteError(
+                    msg=f"No answer to {key[0]} {key[1]} in cassette {self.path}."
+                )
+            interaction = recorded.popleft() if len(recorded) > 1 else recorded[0]
+        delay = self.latency
+        if delay == LATENCY_RECORDED:
+            delay = interaction["elapsed"]
+        if delay:
+            time.sleep(delay)
+        answer = interaction["response"]
+        return {
+            "status": answer["status"],
+            "headers": {
+                name: self.unscrub(value, endpoint)
+                for name, value in answer["headers"].items()
+            },
+            "url": self.unscrub(answer["url"], endpoint),
+            "body": self.unscrub(answer["body"], endpoint),
+        }
+
+    def patch(self):
+        """A mock patcher which makes ApiHelpers send through the cassette."""
+        return mock.patch.object(ApiHelper, "_send", self.sender())
+
+    def sender(self):
+        """A replacement for ApiHelper._send."""
+        cassette = self
+
+        def send(helper, prep_request, stream=False, timeout=None):
+            # Recorded responses are read whole, so there is a body to store.
+            body = prep_request.body
+            if isinstance(body, bytes):
+                body = body.decode("utf-8")
+            request = {"method": prep_request.method, "url": prep_request.url, "body": body}
+            if cassette.recording:
+                started = time.monotonic()
+                response = _send_live(helper, prep_request, timeout=timeout)
+                cassette.record(
+                    helper.token,
+                    helper.endpoint,
+                    request,
+                    {
+                        "status": response.status_code,
+                        "headers": dict(response.headers),
+                        "url": response.url,
+                        "body": response.content.decode("utf-8", "replace"),
+                    },
+                    time.monotonic() - started,
+                )
+                return response
+            answer = cassette.play(helper.token, helper.endpoint, request)
+            return helper.build_response(
+                prep_request,
+                answer["status"],
+                answer["headers"],
+                answer["url"],
+                answer["body"].encode("utf-8"),
+            )
+
+        return send
+
+    def _write(self):
+        """Replace the file atomically, so an interrupted run leaves a valid one."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            os.chmod(tmp, 0o600)  # bodies aren't scrubbed
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": CASSETTE_VERSION, "interactions": self.interactions},
+                    f,
+                    indent=1,
+                    ensure_ascii=False,
+                )
+                f.write("\n")
+            os.replace(tmp, self.path)
+            tmp = None
+        finally:
+            if tmp is not None:
+                os.unlink(tmp)
@@ -0,0 +1,60 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Record the cassettes of scenarios.py against the fake API server.
+
+Run from the collection directory with the repository root in PYTHONPATH:
+
+    PYTHONPATH=../../.. python tests/cassettes/record.py [scenario ...]
+
+Without arguments, every cassette is recorded again. Cassettes are
+only recorded against the fake API: response bodies are stored as they
+are, so a recording of a real account would hold its secrets.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import sys
+
+from ansible_collections.serverscom.sc_api.tests.cassettes.cassette import (
+    CASSETTE_RECORD,
+    Cassette,
+)
+from ansible_collections.serverscom.sc_api.tests.cassettes.scenarios import (
+    SCENARIOS,
+    TOKEN,
+)
+from ansible_collections.serverscom.sc_api.tests.fake_api.server import (
+    FakeApi,
+    start_in_thread,
+)
+
+
+__metaclass__ = type
+
+
+def record(scenario):
+    if os.path.exists(scenario.cassette):
+        os.unlink(scenario.cassette)
+    fake = FakeApi({"transition_delay": 0, "token": TOKEN})
+    scenario.prepare(fake)
+    server, endpoint = start_in_thread(api=fake)
+    try:
+        with Cassette(scenario.cassette, CASSETTE_RECORD).patch():
+            scenario.run(endpoint, TOKEN)
+    finally:
+        server.shutdown()
+        server.server_close()
+    print(f"{scenario.name}: {len(Cassette(scenario.cassette).interactions)} requests")
+
+
+def main(names):
+    for scenario in SCENARIOS:
+        if not names or scenario.name in names:
+            record(scenario)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
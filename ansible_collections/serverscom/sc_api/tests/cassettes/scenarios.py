@@ -0,0 +1,165 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Module runs recorded in the cassettes next to this file.
+
+Each scenario seeds the fake API, runs a module's worker class and knows
+how many requests the run takes and in how many round-trips (requests
+which can't overlap). tests/unit/plugins/modules/test_perf_regression.py
+replays the cassettes with a fixed latency per request and checks both,
+so a change which adds requests (e.g. one GET per listed object) or makes
+concurrent ones serial fails. After a change of the requests a module
+makes, record the cassettes again with record.py and update the numbers.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import os
+
+from ansible_collections.serverscom.sc_api.plugins.module_utils.l2_segment import (
+    ScL2SegmentInfo,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.ptr_records import (
+    ScPtrRecords,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.sbm import (
+    ScSbmServerInfo,
+    ScSbmServersInfo,
+)
+from ansible_collections.serverscom.sc_api.tests.fake_api import seed
+
+
+__metaclass__ = type
+
+CASSETTE_DIR = os.path.dirname(os.path.abspath(__file__))
+# The token the cassettes were recorded with; it is scrubbed from them.
+TOKEN = "cassette-recording-token"
+
+
+class Scenario:
+    def __init__(self, name, prepare, run, requests, round_trips):
+        self.name = name
+        self.prepare = prepare  # prepare(fake_api): seeds the state
+        self.run = run  # run(endpoint, token), a module run
+        self.requests = requests  # {(method, path template): count}
+        self.round_trips = round_trips
+
+    @property
+    def cassette(self):
+        return os.path.join(CASSETTE_DIR, f"{self.name}.json")
+
+
+def add_sbm_servers(fake_api, count):
+    for number in range(count):
+        server_id = f"sbm{number:03d}"
+        fake_api.state["hosts"][server_id] = seed.sbm_server(
+            server_id,
+            f"node{number}",
+            seed.LOCATIONS[0],
+            seed.ORDER_OPTIONS["sbm_flavor_models"][0],
+        )
+
+
+def seed_ptr_owners(fake_api):
+    add_sbm_servers(fake_api, 20)
+    fake_api.state["instances"]["i1"] = seed.instance(
+        "i1", "web1", seed.CLOUD_REGIONS[0], seed.CLOUD_FLAVORS[0], seed.CLOUD_IMAGES[0]
+    )
+
+
+def ptr_records():
+    records = [
+        {
+            "owner_id": f"sbm{number:03d}",
+            "ip": f"198.51.100.{number}",
+            "domain": f"node{number}.example.com",
+        }
+        for number in range(20)
+    ]
+    records.append(
+        {"owner_type": "cloud_instance", "owner_id": "i1", "ip": "203.0.113.20", "domain": "web.example.com"}
+    )
+    return records
+
+
+def seed_l2_segment(fake_api):
+    group = seed.L2_LOCATION_GROUPS[0]
+    members = []
+    for host in list(fake_api.state["hosts"].values())[:2]:
+        members.append(
+            {
+                "id": host["id"],
+                "title": host["title"],
+                "mode": "native",
+                "vlan": None,
+                "status": "active",
+                "labels": {},
+                "created_at": seed.CREATED_AT,
+                "updated_at": seed.CREATED_AT,
+            }
+        )
+    fake_api.state["l2_segments"]["l2seg1"] = {
+        "id": "l2seg1",
+        "name": "backend",
+        "type": "private",
+        "status": "active",
+        "location_group_id": group["id"],
+        "location_group_code": group["code"],
+        "labels": {},
+        "created_at": seed.CREATED_AT,
+        "updated_at": seed.CREATED_AT,
+        "members": members,
+        "networks": [],
+    }
+
+
+SCENARIOS = [
+    Scenario(
+        "sbm_server_info",
+        lambda fake_api: add_sbm_servers(fake_api, 1),
+        lambda endpoint, token: ScSbmServerInfo(
+            endpoint, token, "sbm000", fail_on_absent=True
+        ).run(),
+        {("GET", "/hosts/sbm_servers/{id}"): 1},
+        round_trips=1,
+    ),
+    Scenario(
+        # Three pages; the last two are prefetched together.
+        "sbm_servers_info",
+        lambda fake_api: add_sbm_servers(fake_api, 250),
+        lambda endpoint, token: ScSbmServersInfo(endpoint, token).run(),
+        {("GET", "/hosts/sbm_servers"): 3},
+        round_trips=2,
+    ),
+    Scenario(
+        # Search by name, then the segment, its members and networks at once.
+        "l2_segment_info",
+        seed_l2_segment,
+        lambda endpoint, token: ScL2SegmentInfo(
+            endpoint, token, id=None, name="backend"
+        ).run(),
+        {
+            ("GET", "/l2_segments"): 1,
+            ("GET", "/l2_segments/{id}"): 1,
+            ("GET", "/l2_segments/{id}/members"): 1,
+            ("GET", "/l2_segments/{id}/networks"): 1,
+        },
+        round_trips=2,
+    ),
+    Scenario(
+        # 21 owners listed, then 21 records created, 5 requests at a time.
+        "ptr_records",
+        seed_ptr_owners,
+        lambda endpoint, token: ScPtrRecords(
+            endpoint, token, ptr_records(), concurrency=5
+        ).run(),
+        {
+            ("GET", "/hosts/sbm_servers/{id}/ptr_records"): 20,
+            ("POST", "/hosts/sbm_servers/{id}/ptr_records"): 20,
+            ("GET", "/cloud_computing/instances/{id}/ptr_records"): 1,
+            ("POST", "/cloud_computing/instances/{id}/ptr_records"): 1,
+        },
+        round_trips=10,
+    ),
+]
@@ -0,0 +1,357 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Initial state of the fake API.
+
+IDs match integration_config.yml in this directory, so the integration
+targets find the same "pre-existing" resources they expect on the real
+account.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import base64
+import hashlib
+
+
+__metaclass__ = type
+
+CREATED_AT = "2026-01-01T00:00:00Z"
+
+LOCATIONS = [
+    {
+        "id": 34,
+        "name": "AMS1 (Amsterdam, NL)",
+        "code": "AMS1",
+        "status": "active",
+        "supported_features": ["disaggregated_public_ports", "private_racks", "load_balancers"],
+        "l2_segments_enabled": True,
+        "private_racks_enabled": True,
+        "load_balancers_enabled": True,
+    },
+    {
+        "id": 46,
+        "name": "AMS7 (Amsterdam, NL)",
+        "code": "AMS7",
+        "status": "active",
+        "supported_features": ["sbm", "remote_block_storage", "load_balancers"],
+        "l2_segments_enabled": True,
+        "private_racks_enabled": False,
+        "load_balancers_enabled": True,
+    },
+    {
+        "id": 32,
+        "name": "DFW1 (Dallas, US)",
+        "code": "DFW1",
+        "status": "active",
+        "supported_features": ["sbm", "load_balancers"],
+        "l2_segments_enabled": True,
+        "private_racks_enabled": False,
+        "load_balancers_enabled": True,
+    },
+]
+
+OPERATING_SYSTEMS = [
+    {
+        "id": 49,
+        "full_name": "Ubuntu 22.04-server x86_64",
+        "name": "Ubuntu",
+        "version": "22.04-server",
+        "arch": "x86_64",
+        "filesystems": ["ext4", "xfs"],
+    },
+    {
+        "id": 50,
+        "full_name": "Debian 12 64-bit",
+        "name": "Debian",
+        "version": "12",
+        "arch": "x86_64",
+        "filesystems": ["ext4", "xfs"],
+    },
+]
+
+SBM_OPERATING_SYSTEMS = [
+    {
+        "id": 80,
+        "full_name": "Debian 13 64-bit",
+        "name": "Debian",
+        "version": "13",
+        "arch": "x86_64",
+        "filesystems": ["ext4"],
+    },
+    {
+        "id": 81,
+        "full_name": "Ubuntu 24.04-server x86_64",
+        "name": "Ubuntu",
+        "version": "24.04-server",
+        "arch": "x86_64",
+        "filesystems": ["ext4"],
+    },
+]
+
+ORDER_OPTIONS = {
+    "server_models": [
+        {
+            "id": 11940,
+            "name": "Dell R730xd / 2xIntel Xeon E5-2680 v3 / 32 GB RAM / 4x600 GB SAS",
+            "cpu_name": "Intel Xeon E5-2680 v3",
+            "cpu_count": 2,
+            "ram": 32768,
+            "max_ram": 786432,
+            "has_raid_controller": True,
+            "raid_controller_name": "PERC H730",
+            "drive_slots_count": 4,
+        },
+    ],
+    "sbm_flavor_models": [
+        {
+            "id": 3091,
+            "name": "DL-01",
+            "cpu_name": "Intel Xeon E-2276G",
+            "cpu_count": 1,
+            "cpu_cores_count": 6,
+            "ram_size": 32768,
+            "drives_configuration": "1 x 480 GB SSD",
+            "public_uplink_model_name": "Public 1 Gbps",
+            "private_uplink_model_name": "Private 1 Gbps",
+            "bandwidth_name": "20 TB",
+        },
+    ],
+    "rbs_flavors": [
+        {
+            "id": 18590,
+            "name": "Performance",
+            "iops_per_gb": 50,
+            "bandwidth_per_gb": 0.5,
+            "min_size_gb": 10,
+        },
+    ],
+}
+
+CLOUD_REGIONS = [
+    {"id": 2, "name": "Washington", "code": "WAS1"},
+    {"id": 3, "name": "Amsterdam", "code": "AMS1"},
+]
+
+CLOUD_CREDENTIALS = {
+    "password": "fake-password",
+    "tenant_id": "0123456789abcdef",
+    "url": "https://auth.fake.local:5000/v3/",
+    "user_id": "fake-user",
+    "username": "fake-user",
+}
+
+CLOUD_FLAVORS = [
+    {"id": "33227-1", "name": "SSD.30"},
+    {"id": "33228-1", "name": "SSD.50"},
+]
+
+CLOUD_IMAGES = [
+    {"id": "img-ubuntu-2404", "name": "ubuntu-24.04-x64"},
+    {"id": "img-debian-13", "name": "debian-13-x64"},
+]
+
+L2_LOCATION_GROUPS = [
+    {"id": 1, "name": "AMS1", "code": "ams1", "group_type": "private", "location_ids": [34]},
+    {"id": 2, "name": "AMS", "code": "ams", "group_type": "public", "location_ids": [34, 46]},
+    {"id": 3, "name": "DFW", "code": "dfw", "group_type": "public", "location_ids": [32]},
+]
+
+DEDICATED_FEATURES = (
+    "disaggregated_public_ports",
+    "disaggregated_private_ports",
+    "no_public_network",
+    "no_private_ip",
+    "host_rescue_mode",
+    "oob_public_access",
+    "private_ipxe_boot",
+    "public_ipxe_boot",
+)
+
+SSH_KEY = (
+    "ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAAIFakeKeyForTheFakeServersComApiOnly amarao"
+)
+
+
+def fingerprint(public_key):
+    """MD5 fingerprint of an OpenSSH public key, as the API reports it."""
+    try:
+        blob = base64.b64decode(public_key.split()[1])
+    except (IndexError, ValueError):
+        blob = public_key.encode("utf-8")
+    digest = hashlib.md5(blob).hexdigest()  # nosec - matches the API format
+    return ":".join(digest[i:i + 2] for i in range(0, 32, 2))
+
+
+def dedicated_server(server_id, title, location, index):
+    return {
+        "id": server_id,
+        "type": "dedicated_server",
+        "title": title,
+        "location_id": location["id"],
+        "location_code": location["code"],
+        "rack_id": "rack-1",
+        "status": "active",
+        "operational_status": "normal",
+        "power_status": "powered_on",
+        "configuration": "Dell R730xd / 2xIntel Xeon E5-2680 v3 / 32 GB RAM / 4x600 GB SAS",
+        "configuration_details": {
+            "server_model_id": 11940,
+            "server_model_name": "Dell R730xd / 2xIntel Xeon E5-2680 v3 / 32 GB RAM / 4x600 GB SAS",
+            "ram_size": 32768,
+            "bandwidth_id": 1,
+            "bandwidth_name": "20 TB",
+            "private_uplink_id": 1,
+            "private_uplink_name": "Private 1 Gbps",
+            "public_uplink_id": 2,
+            "public_uplink_name": "Public 1 Gbps",
+            "operating_system_id": 49,
+            "operating_system_full_name": "Ubuntu 22.04-server x86_64",
+        },
+        "private_ipv4_address": f"10.0.0.{index}",
+        "public_ipv4_address": f"198.51.100.{index}",
+        "lease_start_at": "2026-01-01",
+        "scheduled_release_at": None,
+        "oob_ipv4_address": None,
+        "ipxe_config": None,
+        "labels": {"env": "test"},
+        "created_at": CREATED_AT,
+        "updated_at": CREATED_AT,
+        "features": [
+            {"name": name, "status": "deactivated"} for name in DEDICATED_FEATURES
+        ],
+        "ptr_records": [],
+        "networks": [],
+    }
+
+
+def sbm_server(server_id, title, location, flavor):
+    return {
+        "id": server_id,
+        "type": "sbm_server",
+        "title": title,
+        "location_id": location["id"],
+        "location_code": location["code"],
+        "rack_id": None,
+        "status": "active",
+        "operational_status": "normal",
+        "power_status": "powered_on",
+        "configuration": flavor["name"],
+        "configuration_details": {
+            "ram_size": flavor["ram_size"],
+            "sbm_flavor_model_id": flavor["id"],
+            "sbm_flavor_model_name": flavor["name"],
+            "bandwidth_name": flavor["bandwidth_name"],
+            "public_uplink_name": flavor["public_uplink_model_name"],
+            "private_uplink_name": flavor["private_uplink_model_name"],
+        },
+        "private_ipv4_address": None,
+        "public_ipv4_address": None,
+        "lease_start_at": None,
+        "scheduled_release_at": None,
+        "labels": {},
+        "created_at": CREATED_AT,
+        "updated_at": CREATED_AT,
+        "ptr_records": [],
+        "networks": [
+            {
+                "id": f"{server_id}-pub",
+                "title": None,
+                "status": "active",
+                "cidr": "198.51.100.0/29",
+                "family": "ipv4",
+                "interface_type": "public",
+                "distribution_method": "gateway",
+                "additional": False,
+                "created_at": CREATED_AT,
+                "updated_at": CREATED_AT,
+            },
+        ],
+    }
+
+
+def instance(instance_id, name, region, flavor, image):
+    return {
+        "id": instance_id,
+        "name": name,
+        "region_id": region["id"],
+        "region_code": region["code"],
+        "openstack_uuid": instance_id,
+        "status": "ACTIVE",
+        "flavor_id": flavor["id"],
+        "flavor_name": flavor["name"],
+        "image_id": image["id"],
+        "image_name": image["name"],
+        "public_ipv4_address": "203.0.113.20",
+        "private_ipv4_address": "10.10.0.20",
+        "public_ipv6_address": None,
+        "gpn_enabled": False,
+        "ipv6_enabled": False,
+        "backup_copies": 0,
+        "public_port_blocked": False,
+        "labels": {},
+        "created_at": CREATED_AT,
+        "updated_at": CREATED_AT,
+        "ptr_records": [],
+    }
+
+
+def volume(volume_id, name, size, location, flavor):
+    return {
+        "id": volume_id,
+        "name": name,
+        "size": size,
+        "status": "active",
+        "location_id": location["id"],
+        "location_code": location["code"],
+        "flavor_id": flavor["id"],
+        "flavor_name": flavor["name"],
+        "iops": size * flavor["iops_per_gb"],
+        "bandwidth": size * flavor["bandwidth_per_gb"],
+        "ip_address": "10.20.0.10",
+        "target_iqn": f"iqn.2026-01.local.fake:{volume_id}",
+        "labels": {},
+        "created_at": CREATED_AT,
+        "updated_at": CREATED_AT,
+        "credentials": {
+            "username": f"user-{volume_id}",
+            "password": "fake-password",
+            "ip_address": "10.20.0.10",
+            "target_iqn": f"iqn.2026-01.local.fake:{volume_id}",
+        },
+    }
+
+
+def _by_id(items):
+    return {item["id"]: item for item in items}
+
+
+STATE = {
+    "locations": _by_id(LOCATIONS),
+    "cloud_regions": _by_id(CLOUD_REGIONS),
+    "hosts": _by_id(
+        dedicated_server(server_id, f"existing-{index}", LOCATIONS[0], index)
+        for index, server_id in enumerate(("Vmrzwomx", "3dzAvZmK", "bdkMlWpL"), start=1)
+    ),
+    "ssh_keys": {
+        "f7:90:27:e6:97:5e:6d:ad:31:51:65:26:8d:82:ac:f9": {
+            "name": "amarao",
+            "fingerprint": "f7:90:27:e6:97:5e:6d:ad:31:51:65:26:8d:82:ac:f9",
+            "labels": {},
+            "created_at": CREATED_AT,
+            "updated_at": CREATED_AT,
+        },
+        "9b:08:4d:a5:6d:45:26:72:2c:e0:9a:ee:bf:7d:03:a6": {
+            "name": "cloud-test",
+            "fingerprint": "9b:08:4d:a5:6d:45:26:72:2c:e0:9a:ee:bf:7d:03:a6",
+            "labels": {},
+            "created_at": CREATED_AT,
+            "updated_at": CREATED_AT,
+        },
+    },
+    "instances": {},
+    "l2_segments": {},
+    "load_balancers": {},
+    "volumes": {},
+}
@@ -0,0 +1,1167 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Local stand-in for the Servers.com API.
+
+Serves the endpoints ScApi uses under /v1, keeps state between requests
+(objects created by modules can be read back, changed and deleted), and
+moves objects through their statuses over time, the way the real API
+does (e.g. an SBM server goes init -> pending -> active).
+
+Run from the repository root:
+
+    python -m ansible_collections.serverscom.sc_api.tests.fake_api.server \\
+        --port 8080 --latency 0.05
+
+and point the modules' ``endpoint`` option at http://127.0.0.1:8080/v1.
+Any bearer token is accepted unless --token is given.
+
+Failure injection:
+
+    --throttle-every N   every N-th request gets 429 with Retry-After
+    --conflict-every N   every N-th changing request (POST/PUT/DELETE) gets 409
+    --transition-delay S seconds between status transitions
+    --reinstall-lag S    seconds a reinstalled server keeps its old status
+    --power-lag S        seconds a server keeps its old power status
+    --no-etags           don't send ETag, never answer 304
+    --no-compress        never gzip response bodies
+
+Requests that change an object while it is still moving between
+statuses get 409, like on the real API.
+
+Successful GETs carry an ETag (a hash of the body); a GET with a
+matching If-None-Match gets 304 Not Modified without a body. Bodies of
+GZIP_MIN_SIZE bytes or more are gzipped for clients which accept it.
+
+The same settings can be changed at runtime with
+``PUT /_fake/config`` (JSON body) and the state can be reset with
+``POST /_fake/reset``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import copy
+import gzip
+import hashlib
+import json
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+from ansible_collections.serverscom.sc_api.tests.fake_api import seed
+
+
+__metaclass__ = type
+
+API_PREFIX = "/v1"
+DEFAULT_PER_PAGE = 20
+MAX_PER_PAGE = 100
+GZIP_MIN_SIZE = 1024
+
+DEFAULT_CONFIG = {
+    "latency": 0.0,
+    "throttle_every": 0,
+    "retry_after": 1,
+    "conflict_every": 0,
+    "transition_delay": 2.0,
+    "reinstall_lag": 0.0,
+    "power_lag": 0.0,
+    "token": None,
+    "etags": True,
+    "compress": True,
+}
+
+
+def now_iso():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class HttpError(Exception):
+    def __init__(self, status, message, headers=None, code=None):
+        super(HttpError, self).__init__(message)
+        self.status = status
+        self.message = message
+        self.headers = headers or {}
+        self.code = code
+
+
+def route(method, pattern):
+    """Mark a FakeApi method as the handler for METHOD /pattern."""
+
+    def decorator(handler):
+        handler.routes = getattr(handler, "routes", ()) + ((method, pattern),)
+        return handler
+
+    return decorator
+
+
+def match_labels(labels, selector):
+    """Check labels against a selector like ``env=prod,role!=db,team``."""
+    for term in filter(None, (t.strip() for t in selector.split(","))):
+        match = re.match(r"^([^!=]+?)\s*(==|=|!=)\s*(.*)$", term)
+        if not match:
+            if term.startswith("!"):
+                if term[1:] in labels:
+                    return False
+            elif term not in labels:
+                return False
+            continue
+        key, operator, value = match.groups()
+        if operator == "!=":
+            if labels.get(key) == value:
+                return False
+        elif labels.get(key) != value:
+            return False
+    return True
+
+
+def match_search(obj, pattern):
+    pattern = pattern.lower()
+    return any(
+        pattern in str(obj.get(field) or "").lower()
+        for field in ("id", "name", "title", "code", "full_name", "fingerprint")
+    )
+
+
+class FakeApi:
+    """State and request handling, without HTTP.
+
+    handle() takes a parsed request and returns (status, headers, body).
+    clock is used for status transitions (tests can pass a fake one).
+    """
+
+    def __init__(self, config=None, clock=time.time):
+        self.config = dict(DEFAULT_CONFIG, **(config or {}))
+        self.clock = clock
+        self.lock = threading.RLock()
+        self.routes = self._routes()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.state = copy.deepcopy(seed.STATE)
+            self.transitions = []  # [due, kind, obj_id, changes or None]
+            self.request_count = 0
+            self.change_count = 0
+            self.counter = 0
+
+    # ─── plumbing ───
+
+    def new_id(self, prefix):
+        self.counter += 1
+        return f"{prefix}{self.counter:06d}"
+
+    def schedule(self, kind, obj_id, *steps, after=0.0):
+        """Apply steps (dicts of changes, None to delete) one per transition_delay.
+
+        after: seconds to wait before the first one.
+        """
+        delay = self.config["transition_delay"]
+        start = self.clock() + after
+        for number, changes in enumerate(steps, start=1):
+            self.transitions.append([start + delay * number, kind, obj_id, changes])
+        if not delay and not after:
+            self.apply_transitions()
+
+    def busy(self, kind, obj_id):
+        return any(t[1] == kind and t[2] == obj_id for t in self.transitions)
+
+    def apply_transitions(self):
+        now = self.clock()
+        due = sorted((t for t in self.transitions if t[0] <= now), key=lambda t: t[0])
+        self.transitions = [t for t in self.transitions if t[0] > now]
+        for _due, kind, obj_id, changes in due:
+            objects = self.state[kind]
+            if obj_id not in objects:
+                continue
+            if changes is None:
+                del objects[obj_id]
+                self.transitions = [
+                    t for t in self.transitions if not (t[1] == kind and t[2] == obj_id)
+                ]
+            elif callable(changes):
+                changes(objects[obj_id])
+            else:
+                objects[obj_id].update(changes, updated_at=now_iso())
+
+    def get(self, kind, obj_id):
+        try:
+            return self.state[kind][obj_id]
+        except KeyError:
+            raise HttpError(404, f"{kind} {obj_id} not found")
+
+    def change(self, kind, obj_id):
+        """Get an object which is about to be changed by a request."""
+        obj = self.get(kind, obj_id)
+        if self.busy(kind, obj_id):
+            raise HttpError(409, f"{kind} {obj_id} is busy, try again later")
+        return obj
+
+    def handle(self, method, path, query=None, body=None, headers=None, base_url=""):
+        query = query or {}
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        with self.lock:
+            try:
+                self.request_count += 1
+                self.check_auth(headers)
+                self.inject_failures(method)
+                self.apply_transitions()
+                status, response_headers, response = self.dispatch(
+                    method, path, query, body, base_url
+                )
+            except HttpError as e:
+                status = e.status
+                response_headers = e.headers
+                response = {"message": e.message}
+                if e.code:
+                    response["code"] = e.code
+        response_headers = dict(response_headers, **{"X-Correlation-ID": str(uuid.uuid4())})
+        return status, response_headers, response
+
+    def check_auth(self, headers):
+        auth = headers.get("authorization", "")
+        if not auth.startswith("Bearer ") or not auth[7:]:
+            raise HttpError(401, "Unauthorized")
+        if self.config["token"] and auth[7:] != self.config["token"]:
+            raise HttpError(401, "Unauthorized")
+
+    def inject_failures(self, method):
+        every = self.config["throttle_every"]
+        if every and self.request_count % every == 0:
+            raise HttpError(
+                429,
+                "Too many requests",
+                headers={"Retry-After": str(self.config["retry_after"])},
+            )
+        if method != "GET":
+            self.change_count += 1
+            every = self.config["conflict_every"]
+            if every and self.change_count % every == 0:
+                raise HttpError(409, "Conflict (injected)")
+
+    def dispatch(self, method, path, query, body, base_url):
+        if path.startswith(API_PREFIX):
+            path = path[len(API_PREFIX):]
+        path = path.rstrip("/") or "/"
+        path_matched = False
+        for route_method, pattern, handler in self.routes:
+            match = pattern.match(path)
+            if not match:
+                continue
+            path_matched = True
+            if route_method != method:
+                continue
+            result = handler(query=query, body=body or {}, **match.groupdict())
+            if isinstance(result, Page):
+                return result.response(base_url + API_PREFIX + path, query)
+            status, response = result
+            return status, {}, response
+        if path_matched:
+            raise HttpError(405, f"Method {method} not allowed for {path}")
+        raise HttpError(404, f"Unknown path {path}")
+
+    def _routes(self):
+        routes = []
+        for name in dir(self):
+            handler = getattr(self, name)
+            for method, pattern in getattr(handler, "routes", ()):
+                regex = re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", pattern)
+                routes.append((method, re.compile(f"^{regex}$"), handler))
+        # Literal paths before parametrized ones (/l2_segments/location_groups).
+        routes.sort(key=lambda route: route[1].pattern.count("(?P"))
+        return routes
+
+    # ─── listings ───
+
+    def listing(self, kind, query, filters=()):
+        items = list(self.state[kind].values())
+        if query.get("search_pattern"):
+            items = [i for i in items if match_search(i, query["search_pattern"])]
+        if query.get("label_selector"):
+            items = [
+                i
+                for i in items
+                if match_labels(i.get("labels") or {}, query["label_selector"])
+            ]
+        for key in filters:
+            if query.get(key):
+                items = [i for i in items if str(i.get(key)) == str(query[key])]
+        return Page(items)
+
+    @staticmethod
+    def public(obj, hidden=()):
+        return {k: v for k, v in obj.items() if k not in hidden}
+
+    # ─── reference data ───
+
+    @route("GET", "/locations")
+    def list_locations(self, query, body):
+        return self.listing("locations", query)
+
+    @route("GET", "/locations/{location_id}/order_options/server_models")
+    def list_server_models(self, query, body, location_id):
+        return Page(self.options("server_models", location_id), query)
+
+    @route("GET", "/locations/{location_id}/order_options/server_models/{model_id}/operating_systems")
+    def list_server_model_os(self, query, body, location_id, model_id):
+        self.options("server_models", location_id)
+        return Page(seed.OPERATING_SYSTEMS)
+
+    @route("GET", "/locations/{location_id}/order_options/sbm_flavor_models")
+    def list_sbm_flavor_models(self, query, body, location_id):
+        return Page(self.options("sbm_flavor_models", location_id), query)
+
+    @route("GET", "/locations/{location_id}/order_options/sbm_flavor_models/{flavor_id}/operating_systems")
+    def list_sbm_flavor_os(self, query, body, location_id, flavor_id):
+        self.options("sbm_flavor_models", location_id)
+        return Page(seed.SBM_OPERATING_SYSTEMS)
+
+    @route("GET", "/locations/{location_id}/order_options/remote_block_storage/flavors")
+    def list_rbs_flavors(self, query, body, location_id):
+        return Page(self.options("rbs_flavors", location_id))
+
+    def options(self, kind, location_id):
+        self.get("locations", int(location_id))
+        return seed.ORDER_OPTIONS[kind]
+
+    @route("GET", "/cloud_computing/regions")
+    def list_regions(self, query, body):
+        return self.listing("cloud_regions", query)
+
+    @route("GET", "/cloud_computing/regions/{region_id}/credentials")
+    def get_region_credentials(self, query, body, region_id):
+        region = self.get("cloud_regions", int(region_id))
+        return 200, dict(seed.CLOUD_CREDENTIALS, tenant_name=f"tenant-{region['code']}")
+
+    @route("GET", "/cloud_computing/regions/{region_id}/flavors")
+    def list_cloud_flavors(self, query, body, region_id):
+        self.get("cloud_regions", int(region_id))
+        return Page(seed.CLOUD_FLAVORS)
+
+    @route("GET", "/cloud_computing/regions/{region_id}/images")
+    def list_cloud_images(self, query, body, region_id):
+        self.get("cloud_regions", int(region_id))
+        return Page(seed.CLOUD_IMAGES)
+
+    # ─── hosts ───
+
+    @route("GET", "/hosts")
+    def list_hosts(self, query, body):
+        page = self.listing("hosts", query, filters=("type", "location_id", "rack_id"))
+        page.items = [self.public(host, ("features", "ptr_records", "networks")) for host in page.items]
+        return page
+
+    def host(self, host_type, server_id):
+        host = self.get("hosts", server_id)
+        if host["type"] != host_type:
+            raise HttpError(404, f"{host_type} {server_id} not found")
+        return host
+
+    @route("GET", "/hosts/dedicated_servers/{server_id}")
+    def get_dedicated_server(self, query, body, server_id):
+        return 200, self.public(self.host("dedicated_server", server_id), ("features",))
+
+    @route("PUT", "/hosts/dedicated_servers/{server_id}")
+    def put_dedicated_server(self, query, body, server_id):
+        server = self.host("dedicated_server", server_id)
+        for key in ("labels", "ipxe_config"):
+            if key in body:
+                server[key] = body[key]
+        server["updated_at"] = now_iso()
+        return 200, self.public(server, ("features",))
+
+    @route("POST", "/hosts/dedicated_servers/{server_id}/power_on")
+    def dedicated_power_on(self, query, body, server_id):
+        return self.power("dedicated_server", server_id, "powering_on", "powered_on")
+
+    @route("POST", "/hosts/dedicated_servers/{server_id}/power_off")
+    def dedicated_power_off(self, query, body, server_id):
+        return self.power("dedicated_server", server_id, "powering_off", "powered_off")
+
+    @route("POST", "/hosts/sbm_servers/{server_id}/power_on")
+    def sbm_power_on(self, query, body, server_id):
+        return self.power("sbm_server", server_id, "powering_on", "powered_on")
+
+    @route("POST", "/hosts/sbm_servers/{server_id}/power_off")
+    def sbm_power_off(self, query, body, server_id):
+        return self.power("sbm_server", server_id, "powering_off", "powered_off")
+
+    @route("POST", "/hosts/sbm_servers/{server_id}/power_cycle")
+    def sbm_power_cycle(self, query, body, server_id):
+        return self.power("sbm_server", server_id, "power_cycling", "powered_on")
+
+    def power(self, host_type, server_id, transitional, final):
+        self.host(host_type, server_id)
+        server = self.change("hosts", server_id)
+        lag = self.config["power_lag"]
+        if lag:
+            # The real API may report the old power status for a while.
+            self.schedule(
+                "hosts",
+                server_id,
+                {"power_status": transitional},
+                {"power_status": final},
+                after=lag - self.config["transition_delay"],
+            )
+        else:
+            server["power_status"] = transitional
+            self.schedule("hosts", server_id, {"power_status": final})
+        return 202, self.public(server, ("features",))
+
+    @route("POST", "/hosts/dedicated_servers/{server_id}/reinstall")
+    def dedicated_reinstall(self, query, body, server_id):
+        return self.reinstall("dedicated_server", server_id, body)
+
+    @route("POST", "/hosts/sbm_servers/{server_id}/reinstall")
+    def sbm_reinstall(self, query, body, server_id):
+        return self.reinstall("sbm_server", server_id, body)
+
+    def reinstall(self, host_type, server_id, body):
+        self.host(host_type, server_id)
+        server = self.change("hosts", server_id)
+        if not body.get("operating_system_id"):
+            raise HttpError(400, "operating_system_id is required")
+        server["title"] = body.get("hostname") or server["title"]
+        lag = self.config["reinstall_lag"]
+        if lag:
+            # The real API may report the old status for a while.
+            self.schedule(
+                "hosts",
+                server_id,
+                {"operational_status": "installation"},
+                {"operational_status": "normal"},
+                after=lag - self.config["transition_delay"],
+            )
+        else:
+            server["operational_status"] = "installation"
+            self.schedule("hosts", server_id, {"operational_status": "normal"})
+        return 202, self.public(server, ("features",))
+
+    @route("GET", "/hosts/dedicated_servers/{server_id}/features")
+    def list_features(self, query, body, server_id):
+        return Page(self.host("dedicated_server", server_id)["features"])
+
+    @route("POST", "/hosts/dedicated_servers/{server_id}/features/{name}/activate")
+    def activate_feature(self, query, body, server_id, name):
+        return self.switch_feature(server_id, name, "activation", "activated")
+
+    @route("POST", "/hosts/dedicated_servers/{server_id}/features/{name}/deactivate")
+    def deactivate_feature(self, query, body, server_id, name):
+        return self.switch_feature(server_id, name, "deactivation", "deactivated")
+
+    def switch_feature(self, server_id, name, transitional, final):
+        server = self.host("dedicated_server", server_id)
+        features = {feature["name"]: feature for feature in server["features"]}
+        if name not in features:
+            raise HttpError(404, f"Feature {name} not found")
+        if self.busy("hosts", server_id):
+            raise HttpError(409, f"Server {server_id} is busy, try again later")
+        features[name]["status"] = transitional
+
+        def done(host):
+            for feature in host["features"]:
+                if feature["name"] == name:
+                    feature["status"] = final
+
+        self.schedule("hosts", server_id, done)
+        return 202, features[name]
+
+    # ─── SBM servers ───
+
+    @route("GET", "/hosts/sbm_servers")
+    def list_sbm_servers(self, query, body):
+        page = self.listing("hosts", dict(query), filters=("location_id", "rack_id"))
+        page.items = [
+            self.public(host, ("features", "ptr_records", "networks"))
+            for host in page.items
+            if host["type"] == "sbm_server"
+        ]
+        return page
+
+    @route("POST", "/hosts/sbm_servers")
+    def create_sbm_servers(self, query, body):
+        location = self.get("locations", body.get("location_id"))
+        flavors = {f["id"]: f for f in seed.ORDER_OPTIONS["sbm_flavor_models"]}
+        flavor = flavors.get(body.get("sbm_flavor_model_id"))
+        if flavor is None or not body.get("hosts") or not body.get("operating_system_id"):
+            raise HttpError(400, "Invalid SBM order")
+        servers = []
+        for host in body["hosts"]:
+            server_id = self.new_id("sbm")
+            server = seed.sbm_server(server_id, host["hostname"], location, flavor)
+            server.update(
+                status="init",
+                operational_status="provisioning",
+                power_status="unknown",
+                labels=host.get("labels") or {},
+            )
+            self.state["hosts"][server_id] = server
+            self.schedule(
+                "hosts",
+                server_id,
+                {"status": "pending", "operational_status": "installation"},
+                {"status": "active", "operational_status": "normal", "power_status": "powered_on"},
+            )
+            servers.append(self.public(server, ("ptr_records", "networks")))
+        return 202, servers
+
+    @route("GET", "/hosts/sbm_servers/{server_id}")
+    def get_sbm_server(self, query, body, server_id):
+        return 200, self.public(self.host("sbm_server", server_id), ("ptr_records", "networks"))
+
+    @route("PUT", "/hosts/sbm_servers/{server_id}")
+    def put_sbm_server(self, query, body, server_id):
+        server = self.host("sbm_server", server_id)
+        if "labels" in body:
+            server["labels"] = body["labels"]
+        return 200, self.public(server, ("ptr_records", "networks"))
+
+    @route("DELETE", "/hosts/sbm_servers/{server_id}")
+    def delete_sbm_server(self, query, body, server_id):
+        self.host("sbm_server", server_id)
+        server = self.change("hosts", server_id)
+        self.schedule("hosts", server_id, None)
+        return 200, self.public(server, ("ptr_records", "networks"))
+
+    @route("GET", "/hosts/sbm_servers/{server_id}/ptr_records")
+    def list_sbm_ptr(self, query, body, server_id):
+        return Page(self.host("sbm_server", server_id)["ptr_records"])
+
+    @route("POST", "/hosts/sbm_servers/{server_id}/ptr_records")
+    def create_sbm_ptr(self, query, body, server_id):
+        server = self.host("sbm_server", server_id)
+        return 201, self.add_ptr(server, body.get("ip"), body.get("domain"), body)
+
+    @route("DELETE", "/hosts/sbm_servers/{server_id}/ptr_records/{record_id}")
+    def delete_sbm_ptr(self, query, body, server_id, record_id):
+        return self.delete_ptr(self.host("sbm_server", server_id), record_id)
+
+    def add_ptr(self, owner, ip, domain, options):
+        if not ip or not domain:
+            raise HttpError(400, "ip and domain are required")
+        record = {
+            "id": self.new_id("ptr"),
+            "ip": ip,
+            "domain": domain,
+            "priority": int(options.get("priority") or 0),
+            "ttl": int(options.get("ttl") or 60),
+        }
+        owner["ptr_records"].append(record)
+        return record
+
+    @staticmethod
+    def delete_ptr(owner, record_id):
+        records = [r for r in owner["ptr_records"] if r["id"] != record_id]
+        if len(records) == len(owner["ptr_records"]):
+            raise HttpError(404, f"PTR record {record_id} not found")
+        owner["ptr_records"] = records
+        return 204, None
+
+    @route("GET", "/hosts/sbm_servers/{server_id}/networks")
+    def list_sbm_networks(self, query, body, server_id):
+        networks = self.host("sbm_server", server_id)["networks"]
+        for key in ("family", "interface_type", "distribution_method"):
+            if query.get(key):
+                networks = [n for n in networks if n.get(key) == query[key]]
+        if query.get("search_pattern"):
+            networks = [n for n in networks if match_search(n, query["search_pattern"])]
+        return Page(networks)
+
+    @route("GET", "/hosts/sbm_servers/{server_id}/networks/{network_id}")
+    def get_sbm_network(self, query, body, server_id, network_id):
+        return 200, self.network(server_id, network_id)
+
+    def network(self, server_id, network_id):
+        for network in self.host("sbm_server", server_id)["networks"]:
+            if network["id"] == network_id:
+                return network
+        raise HttpError(404, f"Network {network_id} not found")
+
+    @route("POST", "/hosts/sbm_servers/{server_id}/networks/private_ipv4")
+    def create_sbm_network(self, query, body, server_id):
+        server = self.change("hosts", server_id)
+        network = {
+            "id": self.new_id("net"),
+            "title": None,
+            "status": "new",
+            "cidr": f"10.{len(server['networks'])}.0.0/{body.get('mask', 32)}",
+            "family": "ipv4",
+            "interface_type": "private",
+            "distribution_method": body.get("distribution_method") or "gateway",
+            "additional": True,
+            "created_at": now_iso(),
+            "updated_at": now_iso(),
+        }
+        server["networks"].append(network)
+        self.schedule("hosts", server_id, self.network_status(network["id"], "active"))
+        return 202, network
+
+    @route("DELETE", "/hosts/sbm_servers/{server_id}/networks/{network_id}")
+    def delete_sbm_network(self, query, body, server_id, network_id):
+        network = self.network(server_id, network_id)
+        self.change("hosts", server_id)
+        network["status"] = "removing"
+        self.schedule("hosts", server_id, self.network_status(network_id, None))
+        return 202, network
+
+    @staticmethod
+    def network_status(network_id, status):
+        def done(server):
+            if status is None:
+                server["networks"] = [n for n in server["networks"] if n["id"] != network_id]
+            else:
+                for network in server["networks"]:
+                    if network["id"] == network_id:
+                        network["status"] = status
+
+        return done
+
+    # ─── SSH keys ───
+
+    @route("GET", "/ssh_keys")
+    def list_ssh_keys(self, query, body):
+        return self.listing("ssh_keys", query)
+
+    @route("POST", "/ssh_keys")
+    def create_ssh_key(self, query, body):
+        if not body.get("name") or not body.get("public_key"):
+            raise HttpError(400, "name and public_key are required")
+        fingerprint = seed.fingerprint(body["public_key"])
+        if fingerprint in self.state["ssh_keys"]:
+            raise HttpError(409, "SSH key already exists")
+        key = {
+            "name": body["name"],
+            "fingerprint": fingerprint,
+            "labels": body.get("labels") or {},
+            "created_at": now_iso(),
+            "updated_at": now_iso(),
+        }
+        self.state["ssh_keys"][fingerprint] = key
+        return 201, key
+
+    @route("DELETE", "/ssh_keys/{fingerprint}")
+    def delete_ssh_key(self, query, body, fingerprint):
+        self.get("ssh_keys", fingerprint)
+        del self.state["ssh_keys"][fingerprint]
+        return 204, None
+
+    # ─── cloud instances ───
+
+    @route("GET", "/cloud_computing/instances")
+    def list_instances(self, query, body):
+        page = self.listing("instances", query, filters=("region_id",))
+        page.items = [self.public(i, ("ptr_records",)) for i in page.items]
+        return page
+
+    @route("POST", "/cloud_computing/instances")
+    def create_instance(self, query, body):
+        region = self.get("cloud_regions", body.get("region_id"))
+        flavors = {f["id"]: f for f in seed.CLOUD_FLAVORS}
+        images = {i["id"]: i for i in seed.CLOUD_IMAGES}
+        if body.get("flavor_id") not in flavors or body.get("image_id") not in images:
+            raise HttpError(400, "Unknown flavor_id or image_id")
+        if not body.get("name"):
+            raise HttpError(400, "name is required")
+        instance_id = self.new_id("inst")
+        instance = seed.instance(
+            instance_id,
+            body["name"],
+            region,
+            flavors[body["flavor_id"]],
+            images[body["image_id"]],
+        )
+        instance.update(
+            status="BUILD",
+            gpn_enabled=bool(body.get("gpn_enabled")),
+            ipv6_enabled=bool(body.get("ipv6_enabled")),
+            backup_copies=body.get("backup_copies") or 0,
+            labels=body.get("labels") or {},
+        )
+        if body.get("ipv4_enabled") is False:
+            instance["public_ipv4_address"] = None
+        self.state["instances"][instance_id] = instance
+        self.schedule("instances", instance_id, {"status": "ACTIVE"})
+        return 202, self.public(instance, ("ptr_records",))
+
+    @route("GET", "/cloud_computing/instances/{instance_id}")
+    def get_instance(self, query, body, instance_id):
+        return 200, self.public(self.get("instances", instance_id), ("ptr_records",))
+
+    @route("DELETE", "/cloud_computing/instances/{instance_id}")
+    def delete_instance(self, query, body, instance_id):
+        instance = self.change("instances", instance_id)
+        instance["status"] = "DELETING"
+        self.schedule("instances", instance_id, None)
+        return 202, self.public(instance, ("ptr_records",))
+
+    def instance_action(self, instance_id, transitional, final, allowed=None):
+        instance = self.change("instances", instance_id)
+        if allowed and instance["status"] not in allowed:
+            raise HttpError(409, f"Instance is {instance['status']}")
+        instance["status"] = transitional
+        self.schedule("instances", instance_id, {"status": final})
+        return 202, self.public(instance, ("ptr_records",))
+
+    @route("POST", "/cloud_computing/instances/{instance_id}/reinstall")
+    def reinstall_instance(self, query, body, instance_id):
+        return self.instance_action(instance_id, "REBUILDING", "ACTIVE")
+
+    @route("POST", "/cloud_computing/instances/{instance_id}/switch_on")
+    def switch_on_instance(self, query, body, instance_id):
+        return self.instance_action(instance_id, "SWITCHING_ON", "ACTIVE", ["SWITCHED_OFF"])
+
+    @route("POST", "/cloud_computing/instances/{instance_id}/switch_off")
+    def switch_off_instance(self, query, body, instance_id):
+        return self.instance_action(instance_id, "SWITCHING_OFF", "SWITCHED_OFF", ["ACTIVE"])
+
+    @route("POST", "/cloud_computing/instances/{instance_id}/rescue")
+    def rescue_instance(self, query, body, instance_id):
+        return self.instance_action(instance_id, "RESCUING", "RESCUE")
+
+    @route("POST", "/cloud_computing/instances/{instance_id}/unrescue")
+    def unrescue_instance(self, query, body, instance_id):
+        return self.instance_action(instance_id, "UNRESCUING", "ACTIVE", ["RESCUE"])
+
+    @route("POST", "/cloud_computing/instances/{instance_id}/reboot")
+    def reboot_instance(self, query, body, instance_id):
+        return self.instance_action(instance_id, "REBOOTING", "ACTIVE")
+
+    @route("POST", "/cloud_computing/instances/{instance_id}/approve_upgrade")
+    def approve_upgrade(self, query, body, instance_id):
+        return 201, self.public(self.change("instances", instance_id), ("ptr_records",))
+
+    @route("POST", "/cloud_computing/instances/{instance_id}/revert_upgrade")
+    def revert_upgrade(self, query, body, instance_id):
+        return 201, self.public(self.change("instances", instance_id), ("ptr_records",))
+
+    @route("GET", "/cloud_computing/instances/{instance_id}/ptr_records")
+    def list_instance_ptr(self, query, body, instance_id):
+        return Page(self.get("instances", instance_id)["ptr_records"])
+
+    @route("POST", "/cloud_computing/instances/{instance_id}/ptr_records")
+    def create_instance_ptr(self, query, body, instance_id):
+        instance = self.get("instances", instance_id)
+        return 201, self.add_ptr(instance, query.get("ip"), query.get("data"), query)
+
+    @route("DELETE", "/cloud_computing/instances/{instance_id}/ptr_records/{record_id}")
+    def delete_instance_ptr(self, query, body, instance_id, record_id):
+        return self.delete_ptr(self.get("instances", instance_id), record_id)
+
+    # ─── L2 segments ───
+
+    @route("GET", "/l2_segments")
+    def list_l2_segments(self, query, body):
+        page = self.listing("l2_segments", query)
+        page.items = [self.public(s, ("members", "networks")) for s in page.items]
+        return page
+
+    @route("GET", "/l2_segments/location_groups")
+    def list_l2_location_groups(self, query, body):
+        return Page(seed.L2_LOCATION_GROUPS)
+
+    @route("POST", "/l2_segments")
+    def create_l2_segment(self, query, body):
+        groups = {g["id"]: g for g in seed.L2_LOCATION_GROUPS}
+        group = groups.get(body.get("location_group_id"))
+        if group is None or body.get("type") not in ("public", "private"):
+            raise HttpError(400, "Invalid location_group_id or type")
+        segment_id = self.new_id("l2")
+        segment = {
+            "id": segment_id,
+            "name": body.get("name") or segment_id,
+            "type": body["type"],
+            "status": "pending",
+            "location_group_id": group["id"],
+            "location_group_code": group["code"],
+            "labels": body.get("labels") or {},
+            "created_at": now_iso(),
+            "updated_at": now_iso(),
+            "members": [],
+            "networks": [],
+        }
+        self.set_members(segment, body.get("members") or [])
+        self.state["l2_segments"][segment_id] = segment
+        self.schedule("l2_segments", segment_id, self.l2_active)
+        return 202, self.public(segment, ("members", "networks"))
+
+    def set_members(self, segment, members):
+        segment["members"] = []
+        for member in members:
+            host = self.get("hosts", member.get("id"))
+            segment["members"].append(
+                {
+                    "id": host["id"],
+                    "title": host["title"],
+                    "mode": member.get("mode", "native"),
+                    "vlan": None if member.get("mode") != "trunk" else 100 + len(segment["members"]),
+                    "status": "new",
+                    "labels": {},
+                    "created_at": now_iso(),
+                    "updated_at": now_iso(),
+                }
+            )
+
+    @staticmethod
+    def l2_active(segment):
+        segment["status"] = "active"
+        for item in segment["members"] + segment["networks"]:
+            item["status"] = "active"
+
+    @route("GET", "/l2_segments/{segment_id}")
+    def get_l2_segment(self, query, body, segment_id):
+        return 200, self.public(self.get("l2_segments", segment_id), ("members", "networks"))
+
+    @route("PUT", "/l2_segments/{segment_id}")
+    def put_l2_segment(self, query, body, segment_id):
+        segment = self.change("l2_segments", segment_id)
+        if "members" in body:
+            self.set_members(segment, body["members"])
+        if body.get("labels"):
+            segment["labels"] = body["labels"]
+        segment["status"] = "pending"
+        self.schedule("l2_segments", segment_id, self.l2_active)
+        return 202, self.public(segment, ("members", "networks"))
+
+    @route("DELETE", "/l2_segments/{segment_id}")
+    def delete_l2_segment(self, query, body, segment_id):
+        segment = self.change("l2_segments", segment_id)
+        segment["status"] = "removing"
+        self.schedule("l2_segments", segment_id, None)
+        return 202, None
+
+    @route("GET", "/l2_segments/{segment_id}/members")
+    def list_l2_members(self, query, body, segment_id):
+        return Page(self.get("l2_segments", segment_id)["members"])
+
+    @route("GET", "/l2_segments/{segment_id}/networks")
+    def list_l2_networks(self, query, body, segment_id):
+        return Page(self.get("l2_segments", segment_id)["networks"])
+
+    @route("PUT", "/l2_segments/{segment_id}/networks")
+    def put_l2_networks(self, query, body, segment_id):
+        segment = self.change("l2_segments", segment_id)
+        delete = set(body.get("delete") or [])
+        segment["networks"] = [n for n in segment["networks"] if n["id"] not in delete]
+        for network in body.get("create") or []:
+            segment["networks"].append(
+                {
+                    "id": self.new_id("net"),
+                    "cidr": f"100.64.{len(segment['networks'])}.0/{network.get('mask', 29)}",
+                    "family": "ipv4",
+                    "interface_type": "public",
+                    "distribution_method": network.get("distribution_method", "route"),
+                    "status": "new",
+                    "created_at": now_iso(),
+                    "updated_at": now_iso(),
+                }
+            )
+        segment["status"] = "pending"
+        self.schedule("l2_segments", segment_id, self.l2_active)
+        return 202, self.public(segment, ("members", "networks"))
+
+    # ─── load balancers ───
+
+    @route("GET", "/load_balancers")
+    def list_load_balancers(self, query, body):
+        page = self.listing("load_balancers", query, filters=("location_id", "type"))
+        page.items = [
+            self.public(lb, ("vhost_zones", "upstream_zones", "geoip")) for lb in page.items
+        ]
+        return page
+
+    @route("POST", "/load_balancers/{lb_type}")
+    def create_load_balancer(self, query, body, lb_type):
+        self.lb_type(lb_type)
+        self.get("locations", body.get("location_id"))
+        if not body.get("name"):
+            raise HttpError(400, "name is required")
+        lb_id = self.new_id("lb")
+        lb = {
+            "id": lb_id,
+            "name": body["name"],
+            "type": f"{lb_type}",
+            "status": "pending",
+            "location_id": body["location_id"],
+            "cluster_id": body.get("cluster_id"),
+            "shared_cluster": body.get("shared_cluster", True),
+            "store_logs": body.get("store_logs", False),
+            "store_logs_region_id": body.get("store_logs_region_id"),
+            "external_addresses": [f"203.0.113.{len(self.state['load_balancers']) + 10}"],
+            "vhost_zones": body.get("vhost_zones") or [],
+            "upstream_zones": body.get("upstream_zones") or [],
+            "labels": body.get("labels") or {},
+            "created_at": now_iso(),
+            "updated_at": now_iso(),
+        }
+        if lb_type == "l7":
+            lb["geoip"] = body.get("geoip", False)
+        self.state["load_balancers"][lb_id] = lb
+        self.schedule("load_balancers", lb_id, {"status": "active"})
+        return 202, lb
+
+    @staticmethod
+    def lb_type(lb_type):
+        if lb_type not in ("l4", "l7"):
+            raise HttpError(404, f"Unknown load balancer type {lb_type}")
+
+    def load_balancer(self, lb_type, lb_id):
+        self.lb_type(lb_type)
+        lb = self.get("load_balancers", lb_id)
+        if lb["type"] != lb_type:
+            raise HttpError(404, f"{lb_type} load balancer {lb_id} not found")
+        return lb
+
+    @route("GET", "/load_balancers/{lb_type}/{lb_id}")
+    def get_load_balancer(self, query, body, lb_type, lb_id):
+        return 200, self.load_balancer(lb_type, lb_id)
+
+    @route("PUT", "/load_balancers/{lb_type}/{lb_id}")
+    def put_load_balancer(self, query, body, lb_type, lb_id):
+        self.load_balancer(lb_type, lb_id)
+        lb = self.change("load_balancers", lb_id)
+        for key, value in body.items():
+            if key in lb:
+                lb[key] = value
+        lb["status"] = "pending"
+        self.schedule("load_balancers", lb_id, {"status": "active"})
+        return 202, lb
+
+    @route("DELETE", "/load_balancers/{lb_type}/{lb_id}")
+    def delete_load_balancer(self, query, body, lb_type, lb_id):
+        self.load_balancer(lb_type, lb_id)
+        lb = self.change("load_balancers", lb_id)
+        lb["status"] = "deleting"
+        self.schedule("load_balancers", lb_id, None)
+        return 204, None
+
+    # ─── remote block storage ───
+
+    @route("GET", "/remote_block_storage/volumes")
+    def list_volumes(self, query, body):
+        page = self.listing("volumes", query, filters=("location_id",))
+        page.items = [self.public(v, ("credentials",)) for v in page.items]
+        return page
+
+    @route("POST", "/remote_block_storage/volumes")
+    def create_volume(self, query, body):
+        location = self.get("locations", body.get("location_id"))
+        flavors = {f["id"]: f for f in seed.ORDER_OPTIONS["rbs_flavors"]}
+        flavor = flavors.get(body.get("flavor_id"))
+        if flavor is None or not body.get("name") or not body.get("size"):
+            raise HttpError(400, "Invalid volume")
+        volume_id = self.new_id("vol")
+        volume = seed.volume(volume_id, body["name"], body["size"], location, flavor)
+        volume.update(status="creating", labels=body.get("labels") or {})
+        self.state["volumes"][volume_id] = volume
+        self.schedule("volumes", volume_id, {"status": "active"})
+        return 202, self.public(volume, ("credentials",))
+
+    @route("GET", "/remote_block_storage/volumes/{volume_id}")
+    def get_volume(self, query, body, volume_id):
+        return 200, self.public(self.get("volumes", volume_id), ("credentials",))
+
+    @route("PUT", "/remote_block_storage/volumes/{volume_id}")
+    def put_volume(self, query, body, volume_id):
+        volume = self.change("volumes", volume_id)
+        for key in ("name", "size", "labels"):
+            if key in body:
+                volume[key] = body[key]
+        if "size" in body:
+            volume["status"] = "pending"
+            self.schedule("volumes", volume_id, {"status": "active"})
+        return 202, self.public(volume, ("credentials",))
+
+    @route("DELETE", "/remote_block_storage/volumes/{volume_id}")
+    def delete_volume(self, query, body, volume_id):
+        volume = self.change("volumes", volume_id)
+        volume["status"] = "removing"
+        self.schedule("volumes", volume_id, None)
+        return 204, None
+
+    @route("GET", "/remote_block_storage/volumes/{volume_id}/credentials")
+    def get_volume_credentials(self, query, body, volume_id):
+        return 200, self.get("volumes", volume_id)["credentials"]
+
+    @route("POST", "/remote_block_storage/volumes/{volume_id}/reset_credentials")
+    def reset_volume_credentials(self, query, body, volume_id):
+        volume = self.change("volumes", volume_id)
+        volume["credentials"]["password"] = uuid.uuid4().hex
+        return 202, self.public(volume, ("credentials",))
+
+
+class Page:
+    """A listing answered with pagination, like the API does."""
+
+    def __init__(self, items, query=None):
+        self.items = list(items)
+        if query and query.get("search_pattern"):
+            self.items = [i for i in self.items if match_search(i, query["search_pattern"])]
+
+    def response(self, url, query):
+        try:
+            per_page = min(int(query.get("per_page", DEFAULT_PER_PAGE)), MAX_PER_PAGE)
+            page = int(query.get("page", 1))
+        except ValueError:
+            raise HttpError(400, "page and per_page must be integers")
+        if per_page < 1 or page < 1:
+            raise HttpError(400, "page and per_page must be positive")
+        last = max(1, -(-len(self.items) // per_page))
+
+        def page_url(number):
+            return f"{url}?{urlencode(dict(query, page=number, per_page=per_page))}"
+
+        links = [(page_url(1), "first"), (page_url(last), "last")]
+        if page < last:
+            links.append((page_url(page + 1), "next"))
+        if page > 1:
+            links.append((page_url(page - 1), "prev"))
+        headers = {
+            "Link": ", ".join(f'<{link}>; rel="{rel}"' for link, rel in links),
+            "X-Total-Count": str(len(self.items)),
+        }
+        return 200, headers, self.items[(page - 1) * per_page:page * per_page]
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    api = None  # set by make_server
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # headers and body go out in separate writes
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        if self.server.verbose:
+            BaseHTTPRequestHandler.log_message(self, format, *args)
+
+    def _handle(self):
+        parsed = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+        try:
+            body = json.loads(raw_body) if raw_body else None
+        except ValueError:
+            self._reply(400, {}, {"message": "Invalid JSON"})
+            return
+        if parsed.path.startswith("/_fake/"):
+            self._control(parsed.path, body)
+            return
+        latency = self.api.config["latency"]
+        if latency:
+            time.sleep(latency)
+        base_url = f"http://{self.headers.get('Host', 'localhost')}"
+        status, headers, response = self.api.handle(
+            self.command, parsed.path, query, body, dict(self.headers), base_url
+        )
+        if self.command == "GET" and status == 200 and self.api.config["etags"]:
+            data = json.dumps(response).encode("utf-8")
+            headers = dict(headers, ETag=f'"{hashlib.sha1(data).hexdigest()}"')
+            if self.headers.get("If-None-Match") == headers["ETag"]:
+                status, response = 304, None
+        self._reply(status, headers, response)
+
+    def _control(self, path, body):
+        if path == "/_fake/reset" and self.command == "POST":
+            self.api.reset()
+            self._reply(204, {}, None)
+        elif path == "/_fake/config" and self.command == "PUT":
+            unknown = set(body or {}) - set(DEFAULT_CONFIG)
+            if unknown:
+                self._reply(400, {}, {"message": f"Unknown settings: {sorted(unknown)}"})
+                return
+            self.api.config.update(body or {})
+            self._reply(200, {}, self.api.config)
+        elif path == "/_fake/config" and self.command == "GET":
+            self._reply(200, {}, self.api.config)
+        else:
+            self._reply(404, {}, {"message": "Unknown control path"})
+
+    def _reply(self, status, headers, response):
+        data = b"" if response is None else json.dumps(response).encode("utf-8")
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        if data:
+            self.send_header("Content-Type", "application/json")
+            if (
+                self.api.config["compress"]
+                and len(data) >= GZIP_MIN_SIZE
+                and "gzip" in self.headers.get("Accept-Encoding", "")
+            ):
+                data = gzip.compress(data, compresslevel=5)
+                self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+
+def make_server(host="127.0.0.1", port=0, api=None, verbose=False):
+    """Create (but don't start) a threaded HTTP server for a FakeApi.
+
+    With port 0 a free port is picked; see server.server_address.
+    """
+    handler = type("BoundRequestHandler", (RequestHandler,), {"api": api or FakeApi()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.verbose = verbose
+    server.api = handler.api
+    return server
+
+
+def start_in_thread(**kwargs):
+    """Start a server in a daemon thread; returns (server, endpoint URL)."""
+    server = make_server(**kwargs)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}{API_PREFIX}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per request")
+    parser.add_argument("--throttle-every", type=int, default=0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--conflict-every", type=int, default=0)
+    parser.add_argument("--transition-delay", type=float, default=2.0)
+    parser.add_argument("--reinstall-lag", type=float, default=0.0)
+    parser.add_argument("--power-lag", type=float, default=0.0)
+    parser.add_argument("--token", help="accept only this token")
+    parser.add_argument("--no-etags", action="store_true", help="never answer 304")
+    parser.add_argument("--no-compress", action="store_true", help="never gzip bodies")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+    api = FakeApi(
+        {
+            "latency": args.latency,
+            "throttle_every": args.throttle_every,
+            "retry_after": args.retry_after,
+            "conflict_every": args.conflict_every,
+            "transition_delay": args.transition_delay,
+            "reinstall_lag": args.reinstall_lag,
+            "power_lag": args.power_lag,
+            "token": args.token,
+            "etags": not args.no_etags,
+            "compress": not args.no_compress,
+        }
+    )
+    server = make_server(args.host, args.port, api, verbose=args.verbose)
+    print(f"Fake Servers.com API on http://{args.host}:{server.server_address[1]}{API_PREFIX}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
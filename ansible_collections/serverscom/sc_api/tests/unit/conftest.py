@@ -0,0 +1,58 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+import pytest
+
+from ansible_collections.serverscom.sc_api.plugins.module_utils import modules
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    CLIENT_DEFAULTS,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.ratelimit import (
+    THROTTLE_STATS,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.tracing import (
+    TRACE,
+)
+
+
+__metaclass__ = type
+
+
+@pytest.fixture(autouse=True)
+def restore_client_defaults():
+    """Modules' main() changes process-wide client settings; undo that."""
+    saved = dict(CLIENT_DEFAULTS)
+    saved_stats = dict(THROTTLE_STATS)
+    yield
+    CLIENT_DEFAULTS.clear()
+    CLIENT_DEFAULTS.update(saved)
+    THROTTLE_STATS.update(saved_stats)
+    TRACE.enabled = False
+    TRACE.reset()
+
+
+class PollClock:
+    """Fake clock for Poller: sleeping moves time forward."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def poll_clock(monkeypatch):
+    clock = PollClock()
+    monkeypatch.setattr(modules.time, "time", clock.time)
+    monkeypatch.setattr(modules.time, "sleep", clock.sleep)
+    monkeypatch.setattr(modules.random, "uniform", lambda _a, _b: 1.0)
+    return clock
@@ -0,0 +1,117 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+import mock
+import pytest
+import requests
+from ansible.module_utils.connection import ConnectionError
+
+from ansible_collections.serverscom.sc_api.plugins.httpapi.serverscom import HttpApi
+from ansible_collections.serverscom.sc_api.plugins.module_utils import api as sc_api
+
+
+__metaclass__ = type
+
+
+@pytest.fixture
+def plugin():
+    connection = mock.Mock()
+    connection.get_option.side_effect = {
+        "validate_certs": True,
+        "persistent_command_timeout": 30,
+    }.__getitem__
+    plugin = HttpApi(connection)
+    plugin._session = mock.Mock()
+    return plugin
+
+
+def test_send_request(plugin):
+    plugin._session.request.return_value = mock.Mock(
+        status_code=201,
+        headers={"Link": '<http://api/x?page=2>; rel="next"'},
+        url="http://api/x",
+        text='{"id": "a"}',
+    )
+
+    reply = plugin.send_request(
+        '{"name": "a"}', method="POST", url="http://api/x", headers={"A": "b"}
+    )
+
+    assert reply == {
+        "status": 201,
+        "headers": {"Link": '<http://api/x?page=2>; rel="next"'},
+        "url": "http://api/x",
+        "body": '{"id": "a"}',
+    }
+    plugin._session.request.assert_called_once_with(
+        "POST", "http://api/x", data=b'{"name": "a"}', headers={"A": "b"}, timeout=30
+    )
+
+
+def test_send_request_connection_error(plugin):
+    plugin._session.request.side_effect = requests.exceptions.ConnectionError("boom")
+    with pytest.raises(ConnectionError, match="boom"):
+        plugin.send_request(None, url="http://api/x")
+
+
+def test_session_is_reused():
+    plugin = HttpApi(mock.Mock())
+    assert plugin.session is plugin.session
+
+
+@pytest.fixture
+def connection(monkeypatch):
+    monkeypatch.setitem(sc_api.CLIENT_DEFAULTS, "socket_path", "/tmp/socket")
+    with mock.patch("ansible.module_utils.connection.Connection") as connection:
+        yield connection
+
+
+def test_api_helper_uses_connection(connection):
+    connection.return_value.send_request.return_value = {
+        "status": 200,
+        "headers": {
+            "link": '<http://api/items?page=2>; rel="next"',
+            "X-Correlation-ID": "c1",
+        },
+        "url": "http://api/items",
+        "body": '[{"id": 1}]',
+    }
+    helper = sc_api.ApiHelper(token="secret", endpoint="http://api")
+    helper.session = mock.Mock()
+
+    response = helper.send_get_request("http://api/items")
+
+    assert helper.decode(response) == [{"id": 1}]
+    assert response.links["next"]["url"] == "http://api/items?page=2"
+    assert response.headers["x-correlation-id"] == "c1"
+    connection.assert_called_once_with("/tmp/socket")
+    body, kwargs = connection.return_value.send_request.call_args
+    assert body == (None,)
+    assert kwargs["method"] == "GET"
+    assert kwargs["headers"]["Authorization"] == "Bearer secret"
+    helper.session.send.assert_not_called()
+
+
+def test_api_helper_connection_status_codes(connection):
+    connection.return_value.send_request.return_value = {
+        "status": 404,
+        "headers": {},
+        "url": "http://api/items/1",
+        "body": "",
+    }
+    helper = sc_api.ApiHelper(token="secret", endpoint="http://api")
+    with pytest.raises(sc_api.APIError404):
+        helper.make_get_request("/items/1")
+
+
+def test_api_helper_connection_error(connection):
+    connection.return_value.send_request.side_effect = ConnectionError("socket gone")
+    helper = sc_api.ApiHelper(token="secret", endpoint="http://api")
+    with pytest.raises(sc_api.SCConnectionError) as exc_info:
+        helper.make_post_request("/items", {"a": 1}, None, [201])
+    assert "socket gone" in exc_info.value.msg
+    body, _kwargs = connection.return_value.send_request.call_args
+    assert body == ('{"a": 1}',)
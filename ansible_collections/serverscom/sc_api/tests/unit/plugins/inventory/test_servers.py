@@ -0,0 +1,186 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+import mock
+import pytest
+from ansible.errors import AnsibleError
+from ansible.inventory.data import InventoryData
+from ansible.parsing.dataloader import DataLoader
+
+from ansible_collections.serverscom.sc_api.plugins.inventory.servers import (
+    InventoryModule,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import APIError401
+
+
+__metaclass__ = type
+
+DEDICATED = {
+    "id": "d1",
+    "title": "db1",
+    "type": "dedicated_server",
+    "location_code": "AMS1",
+    "public_ipv4_address": "192.0.2.1",
+    "labels": {"env": "prod"},
+}
+SBM = {
+    "id": "s1",
+    "title": "web1",
+    "type": "sbm_server",
+    "location_code": "DFW2",
+    "public_ipv4_address": None,
+    "private_ipv4_address": "10.0.0.2",
+    "labels": {},
+}
+INSTANCE = {
+    "id": "i1",
+    "name": "cache1",
+    "region_code": "NL01",
+    "public_ipv4_address": "198.51.100.3",
+    "labels": {"env": "prod", "role": "cache.v2"},
+}
+
+OPTIONS = {
+    "token": "token",
+    "endpoint": "http://api",
+    "page_size": 100,
+    "resources": ["dedicated_server", "sbm_server", "cloud_instance"],
+    "label_selector": None,
+    "group_prefix": "serverscom_",
+    "strict": False,
+    "compose": {},
+    "groups": {},
+    "keyed_groups": [],
+    "cache": False,
+}
+
+
+@pytest.fixture
+def plugin():
+    plugin = InventoryModule()
+    plugin.inventory = InventoryData()
+    plugin.templar = mock.Mock()
+    options = dict(OPTIONS)
+    plugin.get_option = lambda name: options[name]
+    plugin.set_options = mock.Mock()
+    plugin.options = options
+    return plugin
+
+
+@pytest.fixture
+def api():
+    with mock.patch(
+        "ansible_collections.serverscom.sc_api.plugins.inventory.servers.ScApi"
+    ) as sc_api:
+        sc_api.return_value.list_hosts.side_effect = lambda type, label_selector: {
+            "dedicated_server": [DEDICATED],
+            "sbm_server": [SBM],
+        }[type]
+        sc_api.return_value.list_instances.return_value = [INSTANCE]
+        yield sc_api.return_value
+
+
+def test_verify_file(plugin, tmp_path):
+    good = tmp_path / "prod.serverscom.yml"
+    bad = tmp_path / "hosts.yml"
+    good.write_text("")
+    bad.write_text("")
+    assert plugin.verify_file(str(good))
+    assert not plugin.verify_file(str(bad))
+
+
+def test_fetch_all_resources(plugin, api):
+    objects = plugin.fetch()
+
+    assert sorted(obj["id"] for obj in objects) == ["d1", "i1", "s1"]
+    assert {obj["id"]: obj["resource"] for obj in objects} == {
+        "d1": "dedicated_server",
+        "s1": "sbm_server",
+        "i1": "cloud_instance",
+    }
+
+
+def test_fetch_only_requested_resources(plugin, api):
+    plugin.options["resources"] = ["sbm_server"]
+    plugin.options["label_selector"] = "env=prod"
+
+    assert [obj["id"] for obj in plugin.fetch()] == ["s1"]
+    api.list_hosts.assert_called_once_with(type="sbm_server", label_selector="env=prod")
+    api.list_instances.assert_not_called()
+
+
+def test_fetch_api_error(plugin, api):
+    api.list_instances.side_effect = APIError401(
+        msg="401 Unauthorized.", api_url="http://api", status_code=401
+    )
+    with pytest.raises(AnsibleError, match="401 Unauthorized"):
+        plugin.fetch()
+
+
+def test_populate_hosts_and_groups(plugin, api):
+    plugin.populate(plugin.fetch())
+    inventory = plugin.inventory
+
+    assert set(inventory.hosts) == {"db1", "web1", "cache1"}
+    assert inventory.get_host("db1").vars["ansible_host"] == "192.0.2.1"
+    assert inventory.get_host("web1").vars["ansible_host"] == "10.0.0.2"
+    assert inventory.get_host("cache1").vars["serverscom_region_code"] == "NL01"
+
+    def members(group):
+        return sorted(host.name for host in inventory.groups[group].get_hosts())
+
+    assert members("serverscom_dedicated_servers") == ["db1"]
+    assert members("serverscom_sbm_servers") == ["web1"]
+    assert members("serverscom_cloud_instances") == ["cache1"]
+    assert members("serverscom_location_AMS1") == ["db1"]
+    assert members("serverscom_region_NL01") == ["cache1"]
+    assert members("serverscom_label_env_prod") == ["cache1", "db1"]
+    assert members("serverscom_label_role_cache_v2") == ["cache1"]
+
+
+def test_parse_uses_cache(plugin, api):
+    plugin.options["cache"] = True
+    plugin._cache = {}
+    plugin._read_config_data = mock.Mock()
+    plugin.get_cache_key = mock.Mock(return_value="key")
+
+    plugin.parse(InventoryData(), DataLoader(), "serverscom.yml", cache=False)
+    assert api.list_instances.call_count == 1
+    assert "key" in plugin._cache
+
+    plugin.parse(InventoryData(), DataLoader(), "serverscom.yml", cache=True)
+    assert api.list_instances.call_count == 1
+    assert "cache1" in plugin.inventory.hosts
+
+
+def test_duplicate_names_get_ids(plugin):
+    other_sbm = dict(SBM, id="s2", private_ipv4_address="10.0.0.3")
+    instance = dict(INSTANCE, name="web1")
+    with mock.patch(
+        "ansible_collections.serverscom.sc_api.plugins.inventory.servers.display"
+    ) as display:
+        plugin.populate(
+            [
+                dict(DEDICATED, resource="dedicated_server"),
+                dict(SBM, resource="sbm_server"),
+                dict(other_sbm, resource="sbm_server"),
+                dict(instance, resource="cloud_instance"),
+            ]
+        )
+    hosts = plugin.inventory.hosts
+    assert set(hosts) == {"db1", "web1_s1", "web1_s2", "web1_i1"}
+    assert hosts["web1_s2"].vars["ansible_host"] == "10.0.0.3"
+    display.warning.assert_called_once_with(
+        "3 Servers.com objects are named web1, "
+        "adding their IDs to their inventory host names."
+    )
+
+
+def test_fetch_rejects_large_pages(plugin, api):
+    plugin.options["page_size"] = 500
+    with pytest.raises(AnsibleError, match="page_size must be between 1 and 100"):
+        plugin.fetch()
+    api.list_instances.assert_not_called()
@@ -1,7 +1,17 @@
+import ast
+import importlib
+import inspect
+import json
+import os
+import subprocess
+import sys
+
 import pytest
 import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
 
 from ansible_collections.serverscom.sc_api.plugins.module_utils import api as sc_api
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_client import ScApi
 
 
 class FakeResponse:
@@ -16,13 +26,19 @@ class FakeResponse:
     def json(self):
         return self._json_data
 
+    def iter_content(self, _chunk_size):
+        yield json.dumps(self._json_data).encode("utf-8")
+
+    def close(self):
+        pass
+
 
 class SendSequencer:
     def __init__(self, sequence):
         self.sequence = list(sequence)
         self.calls = 0
 
-    def __call__(self, _prep_request):
+    def __call__(self, _prep_request, **_kwargs):
         self.calls += 1
         item = self.sequence.pop(0)
         if isinstance(item, Exception):
@@ -85,7 +101,7 @@ def test_make_get_request_retries_then_ok(api_helper, clock):
 
 
 def test_make_get_request_retry_timeout(api_helper, clock):
-    def always_426(_prep_request):
+    def always_426(_prep_request, **_kwargs):
         always_426.calls += 1
         return FakeResponse(426, {})
 
@@ -117,9 +133,9 @@ def test_make_get_request_retries_connection_error(api_helper, clock):
     assert clock.now == 1.0
 
 
-def test_make_get_request_connection_error_no_retry(api_helper, clock):
+def test_make_get_request_connection_error_default_policy(api_helper, clock):
     sequencer = SendSequencer(
-        [requests.exceptions.ConnectionError("Connection refused")]
+        [requests.exceptions.ConnectionError("Connection refused")] * 4
     )
     api_helper.session.send = sequencer
 
@@ -130,6 +146,106 @@ def test_make_get_request_connection_error_no_retry(api_helper, clock):
     fail_dict = exc_info.value.fail()
     assert fail_dict["failed"] is True
     assert "api_url" in fail_dict
+    assert fail_dict["attempts"] == 4
+    assert sequencer.calls == 4
+
+
+def refused():
+    return requests.exceptions.ConnectionError(
+        MaxRetryError(None, "/path", NewConnectionError(None, "Connection refused"))
+    )
+
+
+@pytest.mark.parametrize(
+    "first, calls",
+    [
+        (refused(), 2),  # never sent
+        (FakeResponse(429, {}), 2),  # rejected before processing
+        (requests.exceptions.ConnectionError("Connection reset by peer"), 1),
+        (requests.exceptions.ReadTimeout("Read timed out"), 1),
+        (FakeResponse(503, {}), 1),
+    ],
+)
+def test_make_post_request_retried_only_if_not_processed(api_helper, clock, first, calls):
+    sequencer = SendSequencer([first, FakeResponse(201, {}, json_data={"id": "x"})])
+    api_helper.session.send = sequencer
+
+    try:
+        assert api_helper.make_post_request("/path", {}, None, [201]) == {"id": "x"}
+    except (sc_api.APIError, sc_api.SCConnectionError):
+        assert calls == 1
+    assert sequencer.calls == calls
+
+
+@pytest.mark.parametrize("method", ["PUT", "DELETE"])
+@pytest.mark.parametrize(
+    "first",
+    [
+        FakeResponse(503, {}),
+        requests.exceptions.ConnectionError("Connection reset by peer"),
+        requests.exceptions.ReadTimeout("Read timed out"),
+    ],
+)
+def test_put_and_delete_are_retried(api_helper, clock, method, first):
+    sequencer = SendSequencer([first, FakeResponse(200, {}, json_data={})])
+    api_helper.session.send = sequencer
+
+    if method == "PUT":
+        api_helper.make_put_request("/path", {}, None, [200])
+    else:
+        api_helper.make_delete_request("/path", None, None, [200])
+
+    assert sequencer.calls == 2
+
+
+def test_retry_after_is_respected(api_helper, clock):
+    sequencer = SendSequencer(
+        [
+            FakeResponse(503, {"Retry-After": "7"}),
+            FakeResponse(200, {}, json_data={"ok": True}),
+        ]
+    )
+    api_helper.session.send = sequencer
+
+    assert api_helper.make_get_request("/path") == {"ok": True}
+    assert clock.now == 7.0
+
+
+def test_retry_after_past_max_wait_gives_up(api_helper, clock):
+    sequencer = SendSequencer([FakeResponse(503, {"Retry-After": "3600"})])
+    api_helper.session.send = sequencer
+
+    with pytest.raises(sc_api.APIError) as exc_info:
+        api_helper.make_get_request("/path")
+
+    assert exc_info.value.retry_after == 3600
+    assert clock.now == 0.0
+
+
+def test_backoff_with_full_jitter(monkeypatch):
+    bounds = []
+    monkeypatch.setattr(
+        sc_api.random, "uniform", lambda low, high: bounds.append((low, high)) or high
+    )
+    policy = sc_api.RetryPolicy(max_attempts=None, base_delay=0.5, max_delay=3)
+    error = sc_api.APIError("busy", "http://api", 503)
+
+    delays = [policy.delay("GET", error, attempts, 0) for attempts in range(1, 6)]
+
+    assert delays == [0.5, 1, 2, 3, 3]
+    assert all(low == 0 for low, _high in bounds)
+    assert policy.delay("GET", error, 1, 30) is None
+    assert sc_api.RetryPolicy(max_attempts=2).delay("GET", error, 2, 0) is None
+
+
+def test_default_policy_codes(api_helper, clock):
+    sequencer = SendSequencer([FakeResponse(500, {})])
+    api_helper.session.send = sequencer
+
+    with pytest.raises(sc_api.APIError):
+        api_helper.make_get_request("/path")
+
+    assert sequencer.calls == 1
 
 
 def test_make_get_request_404_no_retry(api_helper, clock):
@@ -206,7 +322,7 @@ def test_decode_error_includes_correlation_id(api_helper, clock):
 
 @pytest.fixture
 def sc_api_obj():
-    return sc_api.ScApi(token="token", endpoint="http://api")
+    return ScApi(token="token", endpoint="http://api")
 
 
 class TestGetDedicatedServerFeatures:
@@ -333,3 +449,296 @@ def test_correlation_id_all_error_codes(api_helper, clock):
         assert exc_info.value.correlation_id == "test-corr", (
             f"Failed for status code {code}"
         )
+
+
+class UrlRouter:
+    """Fake session.send answering by URL, safe for concurrent page fetches."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.urls = []
+
+    def __call__(self, prep_request, **_kwargs):
+        self.urls.append(prep_request.url)
+        return self.pages[prep_request.url]
+
+
+def _page(items, page, last, headers=None, last_link=True):
+    links = {}
+    if page < last:
+        links["next"] = {"url": f"http://api/path?page={page + 1}&per_page=2"}
+        if last_link:
+            links["last"] = {"url": f"http://api/path?page={last}&per_page=2"}
+    return FakeResponse(200, headers or {}, json_data=items, links=links)
+
+
+def test_make_multipage_request_prefetch_by_last_link(api_helper, clock):
+    router = UrlRouter(
+        {
+            "http://api/path?per_page=2": _page([1, 2], 1, 4),
+            "http://api/path?page=2&per_page=2": _page([3, 4], 2, 4),
+            "http://api/path?page=3&per_page=2": _page([5, 6], 3, 4),
+            "http://api/path?page=4&per_page=2": _page([7], 4, 4),
+        }
+    )
+    api_helper.session.send = router
+
+    result = list(api_helper.make_multipage_request("/path", {"per_page": 2}))
+
+    assert result == [1, 2, 3, 4, 5, 6, 7]
+    assert sorted(router.urls) == sorted(router.pages)
+
+
+def test_make_multipage_request_prefetch_by_total_count(api_helper, clock):
+    router = UrlRouter(
+        {
+            "http://api/path?per_page=2": _page(
+                [1, 2], 1, 3, headers={"X-Total-Count": "5"}, last_link=False
+            ),
+            "http://api/path?page=2&per_page=2": _page([3, 4], 2, 3),
+            "http://api/path?page=3&per_page=2": _page([5], 3, 3),
+        }
+    )
+    api_helper.session.send = router
+
+    result = list(api_helper.make_multipage_request("/path", {"per_page": 2}))
+
+    assert result == [1, 2, 3, 4, 5]
+    assert len(router.urls) == 3
+
+
+def test_make_multipage_request_follows_next_without_page_count(api_helper, clock):
+    router = UrlRouter(
+        {
+            "http://api/path?per_page=2": _page([1, 2], 1, 3, last_link=False),
+            "http://api/path?page=2&per_page=2": _page([3, 4], 2, 3, last_link=False),
+            "http://api/path?page=3&per_page=2": _page([5], 3, 3, last_link=False),
+        }
+    )
+    api_helper.session.send = router
+
+    result = list(api_helper.make_multipage_request("/path", {"per_page": 2}))
+
+    assert result == [1, 2, 3, 4, 5]
+    assert router.urls == [
+        "http://api/path?per_page=2",
+        "http://api/path?page=2&per_page=2",
+        "http://api/path?page=3&per_page=2",
+    ]
+
+
+def test_make_multipage_request_prefetch_retries_page(api_helper, clock):
+    second_page = _page([3], 2, 2)
+    answers = {
+        "http://api/path?per_page=2": [_page([1, 2], 1, 2)],
+        "http://api/path?page=2&per_page=2": [FakeResponse(429, {}), second_page],
+    }
+
+    def send(prep_request, **_kwargs):
+        return answers[prep_request.url].pop(0)
+
+    api_helper.session.send = send
+    retry_rules = {"codes": {429}, "delay": 1, "max_wait": 10}
+
+    result = list(
+        api_helper.make_multipage_request("/path", {"per_page": 2}, retry_rules)
+    )
+
+    assert result == [1, 2, 3]
+
+
+def test_make_multipage_request_retries_late_page(api_helper, clock):
+    # Each page takes 40 seconds, more than the default max_wait: a late
+    # page still gets its own retries.
+    answers = {
+        "http://api/path?per_page=2": [_page([1, 2], 1, 3, last_link=False)],
+        "http://api/path?page=2&per_page=2": [_page([3, 4], 2, 3, last_link=False)],
+        "http://api/path?page=3&per_page=2": [
+            FakeResponse(503, {}),
+            _page([5], 3, 3, last_link=False),
+        ],
+    }
+    calls = []
+
+    def send(prep_request, **_kwargs):
+        calls.append(prep_request.url)
+        response = answers[prep_request.url].pop(0)
+        if response.status_code == 200:
+            clock.now += 40
+        return response
+
+    api_helper.session.send = send
+
+    result = list(api_helper.make_multipage_request("/path", {"per_page": 2}))
+
+    assert result == [1, 2, 3, 4, 5]
+    assert len(calls) == 4
+
+
+def test_make_multipage_request_prefetch_disabled(clock):
+    api_helper = sc_api.ApiHelper(token="token", endpoint="http://api", prefetch_workers=1)
+    router = UrlRouter(
+        {
+            "http://api/path?per_page=2": _page([1, 2], 1, 3),
+            "http://api/path?page=2&per_page=2": _page([3, 4], 2, 3),
+            "http://api/path?page=3&per_page=2": _page([5], 3, 3),
+        }
+    )
+    api_helper.session.send = router
+
+    result = list(api_helper.make_multipage_request("/path", {"per_page": 2}))
+
+    assert result == [1, 2, 3, 4, 5]
+    assert router.urls == [
+        "http://api/path?per_page=2",
+        "http://api/path?page=2&per_page=2",
+        "http://api/path?page=3&per_page=2",
+    ]
+
+
+def test_make_multipage_request_sends_page_size(clock):
+    api_helper = sc_api.ApiHelper(token="token", endpoint="http://api", page_size=50)
+    router = UrlRouter({"http://api/path?type=x&per_page=50": _page([1], 1, 1)})
+    api_helper.session.send = router
+
+    result = list(api_helper.make_multipage_request("/path", {"type": "x"}))
+
+    assert result == [1]
+    assert router.urls == ["http://api/path?type=x&per_page=50"]
+
+
+def test_make_multipage_request_keeps_explicit_per_page(clock):
+    api_helper = sc_api.ApiHelper(token="token", endpoint="http://api", page_size=50)
+    router = UrlRouter({"http://api/path?per_page=2": _page([1], 1, 1)})
+    api_helper.session.send = router
+
+    assert list(api_helper.make_multipage_request("/path", {"per_page": 2})) == [1]
+
+
+def test_make_multipage_request_page_size_disabled(clock):
+    api_helper = sc_api.ApiHelper(token="token", endpoint="http://api", page_size=0)
+    router = UrlRouter({"http://api/path": _page([1], 1, 1)})
+    api_helper.session.send = router
+
+    assert list(api_helper.make_multipage_request("/path")) == [1]
+
+
+def test_requests_session_created_on_first_use(clock):
+    api = ScApi(token="token", endpoint="http://api")
+    assert api.api_helper._requests is None
+    assert api.api_helper._session is None
+
+    api.api_helper.session.send = lambda prep_request, **_kwargs: FakeResponse(
+        200, {}, json_data=[]
+    )
+    assert list(api.list_ssh_keys()) == []
+    assert api.api_helper.requests is requests
+    assert api.api_helper.session is api.api_helper.session
+
+
+def test_scapi_list_methods_use_page_size(clock):
+    api = ScApi(token="token", endpoint="http://api", page_size=100)
+    seen = []
+
+    def send(prep_request, **_kwargs):
+        seen.append(prep_request.url)
+        return FakeResponse(200, {}, json_data=[])
+
+    api.api_helper.session.send = send
+
+    list(api.list_hosts())
+    list(api.list_sbm_servers())
+    list(api.list_instances())
+    list(api.list_rbs_volumes())
+    list(api.list_l2_segments())
+    list(api.list_ssh_keys())
+    list(api.list_locations())
+
+    assert len(seen) == 7
+    assert all("per_page=100" in url for url in seen)
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["baremetal_power", "cloud_computing", "dedicated_server", "l2_segment", "load_balancer", "ptr_records", "rbs", "sbm", "ssh_key"],
+)
+def test_resource_clients_have_every_used_method(name):
+    """Each class's self.api client has the mixins for the methods it calls."""
+    module = importlib.import_module(
+        f"ansible_collections.serverscom.sc_api.plugins.module_utils.{name}"
+    )
+    tree = ast.parse(inspect.getsource(module))
+    checked = 0
+    for cls in (node for node in tree.body if isinstance(node, ast.ClassDef)):
+        clients = {
+            call.func.id
+            for node in ast.walk(cls)
+            if isinstance(node, ast.Assign) and ast.unparse(node.targets[0]) == "self.api"
+            for call in ast.walk(node.value)
+            if isinstance(call, ast.Call)
+        }
+        if not clients:
+            continue
+        (client,) = clients
+        client = getattr(module, client)
+        owners = {"self.api": client, "self.api.toolbox": client.toolbox_class}
+        for node in ast.walk(cls):
+            if not isinstance(node, ast.Attribute) or node.attr == "toolbox":
+                continue
+            owner = owners.get(ast.unparse(node.value))
+            if owner is not None:
+                assert hasattr(owner, node.attr), f"{cls.name}: no self.api.{node.attr}"
+                checked += 1
+    assert checked
+
+
+def test_optional_module_utils_are_imported_on_first_use():
+    # AnsiballZ compiles every imported module_util on every run.
+    script = (
+        "import sys\n"
+        "import ansible_collections.serverscom.sc_api.plugins.modules.sbm_server_info\n"
+        "print(' '.join(sorted(sys.modules)))\n"
+    )
+    output = subprocess.check_output(
+        [sys.executable, "-c", script],
+        env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+        text=True,
+    )
+    imported = set(output.split())
+    for name in ("cache", "jsonstream", "ratelimit", "revalidate", "tracing"):
+        assert f"ansible_collections.serverscom.sc_api.plugins.module_utils.{name}" not in imported
+    assert "concurrent.futures" not in imported
+
+
+def test_default_run_imports_no_optional_module_utils():
+    # They ship in every payload; with default options a run never needs them.
+    script = (
+        "import json, sys\n"
+        "from ansible.module_utils import basic\n"
+        "from ansible_collections.serverscom.sc_api.tests.fake_api.server import start_in_thread\n"
+        "from ansible_collections.serverscom.sc_api.plugins.modules import ssh_keys_info\n"
+        "server, endpoint = start_in_thread()\n"
+        "args = {'token': 'token', 'endpoint': endpoint, 'cache_dir': sys.argv[1]}\n"
+        "basic._ANSIBLE_ARGS = json.dumps({'ANSIBLE_MODULE_ARGS': args}).encode()\n"
+        "basic._ANSIBLE_PROFILE = 'legacy'\n"
+        "try:\n"
+        "    ssh_keys_info.main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(' '.join(sorted(sys.modules)), file=sys.stderr)\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    for name in list(env):
+        if name.startswith("SERVERSCOM_API_") or name == "SC_TOKEN":
+            del env[name]
+    result = subprocess.run(
+        [sys.executable, "-c", script, "/nonexistent"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert json.loads(result.stdout)["ssh_keys"]
+    imported = set(result.stderr.split())
+    for name in ("jsonstream", "ratelimit", "revalidate", "tracing"):
+        assert f"ansible_collections.serverscom.sc_api.plugins.module_utils.{name}" not in imported
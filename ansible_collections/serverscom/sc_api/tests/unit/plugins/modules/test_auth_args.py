@@ -11,7 +11,14 @@ import pytest
 from ansible.module_utils import basic
 
 from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    CLIENT_DEFAULTS,
     DEFAULT_API_ENDPOINT,
+    DEFAULT_PAGE_SIZE,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.cache import (
+    CACHE_BYPASS,
+    CACHE_REFRESH,
+    CACHE_USE,
 )
 
 
@@ -39,7 +46,7 @@ def _run_module(monkeypatch, module_args, env=None):
 
     captured = {}
 
-    def fake_init(self, endpoint, token, label_selector):
+    def fake_init(self, endpoint, token, label_selector, projection=None):
         captured["token"] = token
         captured["endpoint"] = endpoint
 
@@ -146,3 +153,89 @@ def test_no_token_fails(monkeypatch):
     with pytest.raises(SystemExit) as exc_info:
         ssh_keys_info.main()
     assert exc_info.value.code != 0
+
+
+def test_page_size_default(monkeypatch):
+    monkeypatch.delenv("SERVERSCOM_API_PAGE_SIZE", raising=False)
+    monkeypatch.setitem(CLIENT_DEFAULTS, "page_size", None)
+    _run_module(monkeypatch, {"token": "t"})
+    assert CLIENT_DEFAULTS["page_size"] == DEFAULT_PAGE_SIZE
+
+
+def test_page_size_from_param(monkeypatch):
+    monkeypatch.setitem(CLIENT_DEFAULTS, "page_size", DEFAULT_PAGE_SIZE)
+    _run_module(
+        monkeypatch,
+        {"token": "t", "page_size": 25},
+        env={"SERVERSCOM_API_PAGE_SIZE": "50"},
+    )
+    assert CLIENT_DEFAULTS["page_size"] == 25
+
+
+def test_page_size_from_env(monkeypatch):
+    monkeypatch.setitem(CLIENT_DEFAULTS, "page_size", DEFAULT_PAGE_SIZE)
+    _run_module(monkeypatch, {"token": "t"}, env={"SERVERSCOM_API_PAGE_SIZE": "50"})
+    assert CLIENT_DEFAULTS["page_size"] == 50
+
+
+def test_cache_default(monkeypatch):
+    monkeypatch.delenv("SERVERSCOM_API_CACHE", raising=False)
+    monkeypatch.delenv("SERVERSCOM_API_CACHE_DIR", raising=False)
+    _run_module(monkeypatch, {"token": "t"})
+    assert CLIENT_DEFAULTS["cache"] == CACHE_USE
+    assert CLIENT_DEFAULTS["cache_dir"] is None
+
+
+def test_cache_from_param(monkeypatch, tmp_path):
+    _run_module(
+        monkeypatch,
+        {"token": "t", "cache": "bypass", "cache_dir": str(tmp_path)},
+        env={"SERVERSCOM_API_CACHE": "refresh"},
+    )
+    assert CLIENT_DEFAULTS["cache"] == CACHE_BYPASS
+    assert CLIENT_DEFAULTS["cache_dir"] == str(tmp_path)
+
+
+def test_cache_from_env(monkeypatch, tmp_path):
+    _run_module(
+        monkeypatch,
+        {"token": "t"},
+        env={"SERVERSCOM_API_CACHE": "refresh", "SERVERSCOM_API_CACHE_DIR": str(tmp_path)},
+    )
+    assert CLIENT_DEFAULTS["cache"] == "refresh"
+    assert CLIENT_DEFAULTS["cache_dir"] == str(tmp_path)
+
+
+@pytest.mark.parametrize(
+    "env, cache", [({}, CACHE_REFRESH), ({"SERVERSCOM_API_CACHE": "use"}, CACHE_USE)]
+)
+def test_reference_info_modules_refresh_cache(monkeypatch, env, cache):
+    monkeypatch.delenv("SERVERSCOM_API_CACHE", raising=False)
+    for key, val in env.items():
+        monkeypatch.setenv(key, val)
+    _set_module_args({"token": "t"})
+    from ansible_collections.serverscom.sc_api.plugins.modules import (
+        baremetal_locations_info,
+    )
+
+    with mock.patch.object(
+        baremetal_locations_info, "ScBaremetalLocationsInfo"
+    ) as locations_info:
+        locations_info.return_value.run.return_value = {"changed": False}
+        with pytest.raises(SystemExit) as exc_info:
+            baremetal_locations_info.main()
+    assert exc_info.value.code == 0
+    assert CLIENT_DEFAULTS["cache"] == cache
+
+
+@pytest.mark.parametrize("page_size", [0, DEFAULT_PAGE_SIZE + 1])
+def test_page_size_out_of_range(monkeypatch, capsys, page_size):
+    _set_module_args({"token": "secret-token", "page_size": page_size})
+    from ansible_collections.serverscom.sc_api.plugins.modules import ssh_keys_info
+
+    with pytest.raises(SystemExit) as exc_info:
+        ssh_keys_info.main()
+    assert exc_info.value.code != 0
+    assert json.loads(capsys.readouterr().out)["msg"] == (
+        f"page_size must be between 1 and {DEFAULT_PAGE_SIZE}, got {page_size}."
+    )
@@ -0,0 +1,220 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+import pytest
+from ansible_collections.serverscom.sc_api.plugins.module_utils.baremetal_power import (
+    ScBaremetalPowerBulk,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
+    PartialFailureError,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.tracing import (
+    TRACE,
+)
+from ansible_collections.serverscom.sc_api.tests.fake_api import seed
+from ansible_collections.serverscom.sc_api.tests.fake_api.server import (
+    FakeApi,
+    HttpError,
+    start_in_thread,
+)
+
+
+__metaclass__ = type
+
+
+class RecordingFakeApi(FakeApi):
+    """Remembers how many servers were in transition at most."""
+
+    conflicts = 0
+
+    def power(self, host_type, server_id, transitional, final):
+        if self.conflicts:
+            self.conflicts -= 1
+            raise HttpError(409, "Power management is busy", code="CONFLICT")
+        result = super(RecordingFakeApi, self).power(
+            host_type, server_id, transitional, final
+        )
+        in_transition = sum(1 for host_id in self.state["hosts"] if self.busy("hosts", host_id))
+        self.max_in_transition = max(getattr(self, "max_in_transition", 0), in_transition)
+        return result
+
+
+@pytest.fixture
+def fake(poll_clock, monkeypatch):
+    monkeypatch.setattr(TRACE, "enabled", True)
+    api = RecordingFakeApi({"transition_delay": 3}, clock=poll_clock.time)
+    for number in range(6):
+        server = seed.sbm_server(
+            f"sbm{number}",
+            f"node{number}",
+            seed.LOCATIONS[0],
+            seed.ORDER_OPTIONS["sbm_flavor_models"][0],
+        )
+        server["labels"] = {"rack": "r1"}
+        api.state["hosts"][server["id"]] = server
+    server, endpoint = start_in_thread(api=api)
+    yield api, endpoint
+    server.shutdown()
+    server.server_close()
+
+
+def requests_by_path():
+    return {
+        (stats["method"], stats["path"]): stats["requests"]
+        for stats in TRACE.stats()["endpoints"]
+    }
+
+
+def test_rolling_cycle_respects_concurrency(fake, poll_clock):
+    fake_api, endpoint = fake
+    result = ScBaremetalPowerBulk(
+        endpoint,
+        "token",
+        "cycle",
+        label_selector="rack=r1",
+        concurrency=2,
+        wait=600,
+        update_interval=5,
+    ).run()
+    assert result["changed"] is True
+    assert result["failed_count"] == 0
+    assert [server["id"] for server in result["servers"]] == [
+        f"sbm{number}" for number in range(6)
+    ]
+    assert {server["result"] for server in result["servers"]} == {"changed"}
+    assert {server["power_status"] for server in result["servers"]} == {"powered_on"}
+    assert fake_api.max_in_transition == 2
+    requests = requests_by_path()
+    assert requests[("POST", "/hosts/sbm_servers/{id}/power_cycle")] == 6
+    # one listing to select servers and one per poll, no per-server GETs
+    assert requests[("GET", "/hosts")] == len(poll_clock.sleeps) + 1
+    assert set(requests) == {
+        ("GET", "/hosts"),
+        ("POST", "/hosts/sbm_servers/{id}/power_cycle"),
+    }
+
+
+def test_cycle_waits_for_slow_start(fake, poll_clock):
+    fake_api, endpoint = fake
+    # servers stay powered_on for a while before power_cycling
+    fake_api.config["power_lag"] = 5
+    result = ScBaremetalPowerBulk(
+        endpoint,
+        "token",
+        "cycle",
+        label_selector="rack=r1",
+        concurrency=2,
+        wait=600,
+        update_interval=5,
+    ).run()
+    assert result["failed_count"] == 0
+    assert {server["result"] for server in result["servers"]} == {"changed"}
+    assert {server["power_status"] for server in result["servers"]} == {"powered_on"}
+    assert fake_api.max_in_transition == 2
+    assert not fake_api.transitions
+
+
+def test_dedicated_cycle_and_already_on(fake, poll_clock):
+    fake_api, endpoint = fake
+    result = ScBaremetalPowerBulk(
+        endpoint,
+        "token",
+        "on",
+        server_ids=["Vmrzwomx", "3dzAvZmK"],
+        wait=600,
+        update_interval=5,
+    ).run()
+    assert result["changed"] is False
+    assert [server["result"] for server in result["servers"]] == ["unchanged"] * 2
+
+    result = ScBaremetalPowerBulk(
+        endpoint,
+        "token",
+        "cycle",
+        server_ids=["Vmrzwomx"],
+        wait=600,
+        update_interval=5,
+    ).run()
+    assert result["servers"][0]["result"] == "changed"
+    assert result["servers"][0]["power_status"] == "powered_on"
+    requests = requests_by_path()
+    assert requests[("POST", "/hosts/dedicated_servers/{id}/power_off")] == 1
+    assert requests[("POST", "/hosts/dedicated_servers/{id}/power_on")] == 1
+
+
+def test_missing_server_within_max_failures(fake, poll_clock):
+    fake_api, endpoint = fake
+    result = ScBaremetalPowerBulk(
+        endpoint,
+        "token",
+        "off",
+        server_ids=["nope", "sbm1"],
+        max_failures=1,
+        wait=600,
+        update_interval=5,
+    ).run()
+    assert result["failed_count"] == 1
+    assert [server["id"] for server in result["servers"]] == ["nope", "sbm1"]
+    assert result["servers"][0]["msg"] == "Server nope not found."
+    assert result["servers"][1]["result"] == "changed"
+    assert fake_api.state["hosts"]["sbm1"]["power_status"] == "powered_off"
+
+
+def test_failures_stop_new_servers(fake, poll_clock):
+    fake_api, endpoint = fake
+    fake_api.config["conflict_every"] = 1
+    with pytest.raises(PartialFailureError) as exc:
+        ScBaremetalPowerBulk(
+            endpoint,
+            "token",
+            "cycle",
+            label_selector="rack=r1",
+            concurrency=2,
+            wait=600,
+            update_interval=5,
+        ).run()
+    failed = exc.value.fail()
+    assert failed["failed"] is True
+    assert failed["msg"] == "2 of 6 servers failed (max_failures=0)."
+    assert [server["result"] for server in failed["servers"]] == (
+        ["failed"] * 2 + ["skipped"] * 4
+    )
+    assert requests_by_path()[("POST", "/hosts/sbm_servers/{id}/power_cycle")] == 2
+
+
+def test_conflict_is_retried_on_next_poll(fake, poll_clock):
+    fake_api, endpoint = fake
+    fake_api.conflicts = 1
+    result = ScBaremetalPowerBulk(
+        endpoint,
+        "token",
+        "off",
+        server_ids=["sbm2"],
+        wait=600,
+        update_interval=5,
+    ).run()
+    assert result["servers"][0]["result"] == "changed"
+    assert result["servers"][0]["power_status"] == "powered_off"
+    assert requests_by_path()[("POST", "/hosts/sbm_servers/{id}/power_off")] == 2
+
+
+def test_check_mode(fake, poll_clock):
+    fake_api, endpoint = fake
+    result = ScBaremetalPowerBulk(
+        endpoint,
+        "token",
+        "off",
+        label_selector="rack=r1",
+        checkmode=True,
+    ).run()
+    assert result["changed"] is True
+    assert len(result["servers"]) == 6
+    assert set(requests_by_path()) == {("GET", "/hosts")}
+    assert {
+        host["power_status"]
+        for host in fake_api.state["hosts"].values()
+        if host["type"] == "sbm_server"
+    } == {"powered_on"}
@@ -0,0 +1,199 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+import json
+import os
+
+import mock
+import pytest
+
+from ansible_collections.serverscom.sc_api.plugins.module_utils import api as sc_api
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_client import ScApi
+from ansible_collections.serverscom.sc_api.plugins.module_utils import cache as sc_cache
+from ansible_collections.serverscom.sc_api.plugins.module_utils.cache import (
+    ReferenceCache,
+)
+
+
+__metaclass__ = type
+
+
+class Fetcher:
+    def __init__(self, items):
+        self.items = items
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return iter(self.items)
+
+
+@pytest.fixture
+def now(monkeypatch):
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(sc_cache.time, "time", lambda: clock["now"])
+    return clock
+
+
+def make_cache(tmp_path, mode="use", token="token"):
+    return ReferenceCache(token, "http://api", mode=mode, cache_dir=str(tmp_path))
+
+
+def test_miss_fetches_and_stores(tmp_path, now):
+    fetch = Fetcher([{"id": 1}])
+    cache = make_cache(tmp_path)
+
+    assert cache.get("locations", "/locations", None, fetch) == [{"id": 1}]
+    assert fetch.calls == 1
+    entries = [name for name in os.listdir(tmp_path) if name.endswith(".json")]
+    assert len(entries) == 1
+    with open(tmp_path / entries[0]) as f:
+        assert json.load(f) == {"fetched_at": 1000.0, "items": [{"id": 1}]}
+
+
+def test_hit_does_not_fetch(tmp_path, now):
+    fetch = Fetcher([{"id": 1}])
+    make_cache(tmp_path).get("locations", "/locations", None, fetch)
+
+    assert make_cache(tmp_path).get("locations", "/locations", None, fetch) == [
+        {"id": 1}
+    ]
+    assert fetch.calls == 1
+
+
+def test_stale_entry_is_refetched(tmp_path, now):
+    fetch = Fetcher([{"id": 1}])
+    cache = make_cache(tmp_path)
+    cache.get("cloud_images", "/images", None, fetch)
+
+    now["now"] += sc_cache.CACHE_TTLS["cloud_images"] - 1
+    cache.get("cloud_images", "/images", None, fetch)
+    assert fetch.calls == 1
+
+    now["now"] += 1
+    cache.get("cloud_images", "/images", None, fetch)
+    assert fetch.calls == 2
+
+
+def test_refresh_always_fetches_and_stores(tmp_path, now):
+    make_cache(tmp_path).get("locations", "/locations", None, Fetcher([{"id": 1}]))
+
+    fetch = Fetcher([{"id": 2}])
+    assert make_cache(tmp_path, mode="refresh").get(
+        "locations", "/locations", None, fetch
+    ) == [{"id": 2}]
+    assert fetch.calls == 1
+    assert make_cache(tmp_path).get("locations", "/locations", None, fetch) == [
+        {"id": 2}
+    ]
+    assert fetch.calls == 1
+
+
+def test_bypass_does_not_touch_disk(tmp_path, now):
+    fetch = Fetcher([{"id": 1}])
+    cache = make_cache(tmp_path, mode="bypass")
+
+    cache.get("locations", "/locations", None, fetch)
+    cache.get("locations", "/locations", None, fetch)
+
+    assert fetch.calls == 2
+    assert os.listdir(tmp_path) == []
+
+
+def test_entries_are_per_account_and_query(tmp_path, now):
+    fetch = Fetcher([])
+    make_cache(tmp_path).get("locations", "/locations", None, fetch)
+    make_cache(tmp_path, token="other").get("locations", "/locations", None, fetch)
+    make_cache(tmp_path).get("locations", "/locations", {"search_pattern": "x"}, fetch)
+    assert fetch.calls == 3
+
+
+def test_corrupted_entry_is_refetched(tmp_path, now):
+    cache = make_cache(tmp_path)
+    key = cache.key("/locations")
+    with open(cache.entry_path(key), "w") as f:
+        f.write("{not json")
+    fetch = Fetcher([{"id": 1}])
+
+    assert cache.get("locations", "/locations", None, fetch) == [{"id": 1}]
+    assert fetch.calls == 1
+
+
+def test_unwritable_dir_is_not_an_error(tmp_path, now):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    cache = ReferenceCache("token", "http://api", cache_dir=str(blocker / "sub"))
+    fetch = Fetcher([{"id": 1}])
+
+    assert cache.get("locations", "/locations", None, fetch) == [{"id": 1}]
+    assert cache.get("locations", "/locations", None, fetch) == [{"id": 1}]
+    assert fetch.calls == 2
+
+
+def test_fetch_error_leaves_no_entry(tmp_path, now):
+    def fetch():
+        raise sc_api.APIError(msg="boom", api_url="http://api", status_code=500)
+
+    with pytest.raises(sc_api.APIError):
+        make_cache(tmp_path).get("locations", "/locations", None, fetch)
+    assert [name for name in os.listdir(tmp_path) if not name.endswith(".lock")] == []
+
+
+def test_scapi_catalogs_use_cache(tmp_path, monkeypatch):
+    monkeypatch.setitem(sc_api.CLIENT_DEFAULTS, "cache", "use")
+    monkeypatch.setitem(sc_api.CLIENT_DEFAULTS, "cache_dir", str(tmp_path))
+    response = mock.Mock(status_code=200, links={}, headers={})
+    response.iter_content.return_value = [b'[{"id": 1, "code": "AMS1"}]']
+    calls = []
+    for _attempt in range(3):
+        api = ScApi("token", "http://api")
+        api.api_helper.session.send = mock.Mock(return_value=response)
+        assert list(api.list_locations()) == [{"id": 1, "code": "AMS1"}]
+        calls.append(api.api_helper.session.send.call_count)
+    assert calls == [1, 0, 0]
+
+
+def test_scapi_non_catalogs_are_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setitem(sc_api.CLIENT_DEFAULTS, "cache", "use")
+    monkeypatch.setitem(sc_api.CLIENT_DEFAULTS, "cache_dir", str(tmp_path))
+    response = mock.Mock(status_code=200, links={}, headers={})
+    response.iter_content.return_value = [b"[]"]
+    api = ScApi("token", "http://api")
+    api.api_helper.session.send = mock.Mock(return_value=response)
+
+    list(api.list_hosts())
+    list(api.list_hosts())
+
+    assert api.api_helper.session.send.call_count == 2
+    assert os.listdir(tmp_path) == []
+
+
+def test_name_index(tmp_path, now):
+    cache = make_cache(tmp_path)
+    assert cache.lookup_name("l2_segments", "net1") is None
+
+    cache.update_index("l2_segments", "net1", "id1")
+    cache.update_index("l2_segments", "net2", "id2")
+    cache.update_index("cloud_instances", "net1", "other")
+    assert cache.lookup_name("l2_segments", "net1") == "id1"
+    assert make_cache(tmp_path, token="other").lookup_name("l2_segments", "net1") is None
+
+    cache.update_index("l2_segments", "net1", "id3")
+    assert cache.lookup_name("l2_segments", "net1") == "id3"
+    cache.update_index("l2_segments", obj_id="id3", forget=True)
+    assert cache.lookup_name("l2_segments", "net1") is None
+    cache.update_index("l2_segments", "net2", forget=True)
+    assert cache.lookup_name("l2_segments", "net2") is None
+    assert cache.lookup_name("cloud_instances", "net1") == "other"
+
+
+def test_name_index_modes(tmp_path, now):
+    make_cache(tmp_path, mode="bypass").update_index("l2_segments", "net1", "id1")
+    assert make_cache(tmp_path).lookup_name("l2_segments", "net1") is None
+
+    make_cache(tmp_path, mode="refresh").update_index("l2_segments", "net1", "id1")
+    assert make_cache(tmp_path, mode="refresh").lookup_name("l2_segments", "net1") is None
+    assert make_cache(tmp_path).lookup_name("l2_segments", "net1") == "id1"
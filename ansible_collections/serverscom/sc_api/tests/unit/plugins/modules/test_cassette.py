@@ -0,0 +1,178 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+import json
+import os
+import stat
+
+import mock
+import pytest
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    APIError404,
+    ApiHelper,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_client import (
+    ScApi,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.tracing import (
+    TRACE,
+)
+from ansible_collections.serverscom.sc_api.tests.cassettes import cassette
+from ansible_collections.serverscom.sc_api.tests.cassettes.cassette import (
+    CASSETTE_RECORD,
+    LATENCY_RECORDED,
+    Cassette,
+    CassetteError,
+)
+from ansible_collections.serverscom.sc_api.tests.fake_api import seed
+from ansible_collections.serverscom.sc_api.tests.fake_api.server import (
+    FakeApi,
+    start_in_thread,
+)
+
+
+__metaclass__ = type
+
+TOKEN = "secret-token"
+REPLAY_ENDPOINT = "http://replay.invalid/v1"
+
+
+@pytest.fixture
+def fake():
+    api = FakeApi({"transition_delay": 0, "token": TOKEN})
+    for number in range(5):
+        api.state["hosts"][f"sbm{number}"] = seed.sbm_server(
+            f"sbm{number}",
+            f"node{number}",
+            seed.LOCATIONS[0],
+            seed.ORDER_OPTIONS["sbm_flavor_models"][0],
+        )
+    server, endpoint = start_in_thread(api=api)
+    yield api, endpoint
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "cassette.json")
+
+
+def recording(monkeypatch, path):
+    monkeypatch.setattr(ApiHelper, "_send", Cassette(path, CASSETTE_RECORD).sender())
+
+
+def replaying(monkeypatch, path, **kwargs):
+    monkeypatch.setattr(ApiHelper, "_send", Cassette(path, **kwargs).sender())
+
+
+def test_record_and_replay(fake, path, monkeypatch):
+    _fake_api, endpoint = fake
+    recording(monkeypatch, path)
+    api = ScApi(TOKEN, endpoint, page_size=2)
+    servers = list(api.list_sbm_servers())
+    server = api.get_sbm_servers("sbm1")
+    labelled = api.put_sbm_server("sbm1", {"env": "test"})
+
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    assert TOKEN not in text
+    assert endpoint not in text
+    assert len(json.loads(text)["interactions"]) == 5  # 3 pages, GET, PUT
+
+    monkeypatch.setattr(TRACE, "enabled", True)
+    replaying(monkeypatch, path)
+    api = ScApi(TOKEN, REPLAY_ENDPOINT, page_size=2)
+    assert list(api.list_sbm_servers()) == servers
+    assert api.get_sbm_servers("sbm1") == server
+    assert api.put_sbm_server("sbm1", {"env": "test"}) == labelled
+    assert TRACE.stats()["requests"] == 5
+
+
+def test_answers_are_replayed_in_order(fake, path, monkeypatch):
+    fake_api, endpoint = fake
+    recording(monkeypatch, path)
+    api = ScApi(TOKEN, endpoint)
+    api.get_sbm_servers("sbm0")
+    fake_api.state["hosts"]["sbm0"]["power_status"] = "powered_off"
+    api.get_sbm_servers("sbm0")
+
+    replaying(monkeypatch, path)
+    api = ScApi(TOKEN, REPLAY_ENDPOINT)
+    statuses = [api.get_sbm_servers("sbm0")["power_status"] for _ in range(3)]
+    # The last answer is repeated once they are used up.
+    assert statuses == ["powered_on", "powered_off", "powered_off"]
+
+
+def test_request_without_answer(fake, path, monkeypatch):
+    _fake_api, endpoint = fake
+    recording(monkeypatch, path)
+    ScApi(TOKEN, endpoint).get_sbm_servers("sbm0")
+
+    replaying(monkeypatch, path)
+    api = ScApi(TOKEN, REPLAY_ENDPOINT)
+    with pytest.raises(CassetteError) as exc:
+        api.get_sbm_servers("sbm1")
+    assert exc.value.msg == (
+        f"No answer to GET <ENDPOINT>/hosts/sbm_servers/sbm1 in cassette {path}."
+    )
+    # Bodies are part of the request.
+    with pytest.raises(CassetteError):
+        api.put_sbm_server("sbm0", {"env": "test"})
+
+
+def test_error_answers_are_replayed(fake, path, monkeypatch):
+    _fake_api, endpoint = fake
+    recording(monkeypatch, path)
+    with pytest.raises(APIError404):
+        ScApi(TOKEN, endpoint).get_sbm_servers("nope")
+
+    replaying(monkeypatch, path)
+    with pytest.raises(APIError404):
+        ScApi(TOKEN, REPLAY_ENDPOINT).get_sbm_servers("nope")
+
+
+def test_recording_appends(fake, path, monkeypatch):
+    _fake_api, endpoint = fake
+    for server_id in ("sbm0", "sbm1"):
+        recording(monkeypatch, path)
+        ScApi(TOKEN, endpoint).get_sbm_servers(server_id)
+    assert len(Cassette(path).interactions) == 2
+
+
+@pytest.mark.parametrize("latency, sleeps", [(None, []), (0.25, [0.25, 0.25])])
+def test_latency(fake, path, monkeypatch, latency, sleeps):
+    _fake_api, endpoint = fake
+    recording(monkeypatch, path)
+    ScApi(TOKEN, endpoint).get_sbm_servers("sbm0")
+    ScApi(TOKEN, endpoint).get_sbm_servers("sbm1")
+
+    replaying(monkeypatch, path, latency=latency)
+    with mock.patch.object(cassette.time, "sleep") as sleep:
+        api = ScApi(TOKEN, REPLAY_ENDPOINT)
+        api.get_sbm_servers("sbm0")
+        api.get_sbm_servers("sbm1")
+    assert [call.args[0] for call in sleep.call_args_list] == sleeps
+
+
+def test_recorded_latency(fake, path, monkeypatch):
+    _fake_api, endpoint = fake
+    recording(monkeypatch, path)
+    ScApi(TOKEN, endpoint).get_sbm_servers("sbm0")
+    elapsed = Cassette(path).interactions[0]["elapsed"]
+
+    replaying(monkeypatch, path, latency=LATENCY_RECORDED)
+    with mock.patch.object(cassette.time, "sleep") as sleep:
+        ScApi(TOKEN, REPLAY_ENDPOINT).get_sbm_servers("sbm0")
+    sleep.assert_called_once_with(elapsed)
+
+
+def test_cassette_is_private(fake, path, monkeypatch):
+    # Response bodies are recorded as they are.
+    _fake_api, endpoint = fake
+    recording(monkeypatch, path)
+    ScApi(TOKEN, endpoint).get_sbm_servers("sbm0")
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
@@ -0,0 +1,175 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+import pytest
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    APIError404,
+    CLIENT_DEFAULTS,
+    ToolboxError,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.cloud_computing import (
+    ScCloudComputingInstanceCreate,
+    ScCloudComputingInstanceDelete,
+    ScCloudComputingInstanceInfo,
+    ScCloudComputingInstanceState,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
+    ModuleError,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.tracing import (
+    TRACE,
+)
+from ansible_collections.serverscom.sc_api.tests.fake_api import seed
+from ansible_collections.serverscom.sc_api.tests.fake_api.server import (
+    FakeApi,
+    start_in_thread,
+)
+
+
+__metaclass__ = type
+
+
+@pytest.fixture
+def fake():
+    api = FakeApi({"transition_delay": 0})
+    api.state["instances"]["i1"] = seed.instance(
+        "i1", "web1", seed.CLOUD_REGIONS[0], seed.CLOUD_FLAVORS[0], seed.CLOUD_IMAGES[0]
+    )
+    server, endpoint = start_in_thread(api=api)
+    yield api, endpoint
+    server.shutdown()
+    server.server_close()
+
+
+def test_info_constructor_makes_no_requests(fake):
+    fake_api, endpoint = fake
+    info = ScCloudComputingInstanceInfo(endpoint, "token", None, "web1", None)
+    assert fake_api.request_count == 0
+    assert info.api.api_helper._session is None
+
+    result = info.run()
+    assert result["id"] == "i1"
+    assert result["changed"] is False
+    assert fake_api.request_count == 2  # list, then the full object
+
+
+def test_info_by_id_is_one_request(fake):
+    fake_api, endpoint = fake
+    result = ScCloudComputingInstanceInfo(endpoint, "token", "i1", None, None).run()
+    assert result["name"] == "web1"
+    assert fake_api.request_count == 1
+
+
+def test_state_errors_are_raised_by_run(fake):
+    fake_api, endpoint = fake
+    by_name = ScCloudComputingInstanceState(
+        endpoint, "token", "normal", None, "nope", None, None, None, 0, 1, True
+    )
+    by_id = ScCloudComputingInstanceState(
+        endpoint, "token", "normal", "nope", None, None, None, None, 0, 1, True
+    )
+    assert fake_api.request_count == 0
+    with pytest.raises(ToolboxError):
+        by_name.run()
+    with pytest.raises(APIError404):
+        by_id.run()
+
+
+def test_state_by_id(fake):
+    fake_api, endpoint = fake
+    state = ScCloudComputingInstanceState(
+        endpoint, "token", "normal", "i1", None, None, None, None, 0, 1, True
+    )
+    result = state.run()
+    assert result["status"] == "ACTIVE"
+    assert result["changed"] is False
+    assert fake_api.request_count == 1
+
+
+@pytest.mark.parametrize(
+    "flavor_id, flavor_name, msg",
+    [
+        (None, None, "Need either flavor_id or flavor_name."),
+        ("33227-1", "SSD.30", "Both flavor_id and flavor_name are present."),
+    ],
+)
+def test_create_validation_before_requests(fake, flavor_id, flavor_name, msg):
+    fake_api, endpoint = fake
+    with pytest.raises(ModuleError) as exc:
+        ScCloudComputingInstanceCreate(
+            endpoint=endpoint,
+            token="token",
+            region_id=2,
+            name="web2",
+            image_id="img-ubuntu-2404",
+            image_regexp=None,
+            flavor_id=flavor_id,
+            flavor_name=flavor_name,
+            gpn_enabled=False,
+            ipv4_enabled=True,
+            ipv6_enabled=False,
+            ssh_key_fingerprint=None,
+            ssh_key_name=None,
+            backup_copies=0,
+            user_data=None,
+            labels=None,
+            wait=0,
+            update_interval=1,
+            checkmode=True,
+        )
+    assert exc.value.msg == msg
+    assert fake_api.request_count == 0
+
+
+def test_delete_polls_the_instance_not_the_fleet(poll_clock, monkeypatch):
+    monkeypatch.setattr(TRACE, "enabled", True)
+    api = FakeApi({"transition_delay": 3}, clock=poll_clock.time)
+    for number in range(150):
+        api.state["instances"][f"i{number}"] = seed.instance(
+            f"i{number}",
+            f"web{number}",
+            seed.CLOUD_REGIONS[0],
+            seed.CLOUD_FLAVORS[0],
+            seed.CLOUD_IMAGES[0],
+        )
+    server, endpoint = start_in_thread(api=api)
+    try:
+        result = ScCloudComputingInstanceDelete(
+            endpoint, "token", None, None, "web7", 60, 5, False, False
+        ).run()
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert result["id"] == "i7"
+    assert result["changed"] is True
+    assert "i7" not in api.state["instances"]
+    assert poll_clock.sleeps == [1, 1.5, 2.25]
+    requests = {
+        (stats["method"], stats["path"]): stats["requests"]
+        for stats in TRACE.stats()["endpoints"]
+    }
+    # The name is resolved once (one page filtered by search_pattern),
+    # then the instance itself is polled at 0, 1, 2.5 and 4.75 seconds.
+    assert requests == {
+        ("GET", "/cloud_computing/instances"): 1,
+        ("DELETE", "/cloud_computing/instances/{id}"): 1,
+        ("GET", "/cloud_computing/instances/{id}"): 4,
+    }
+
+
+def test_info_by_name_uses_name_index(fake, tmp_path, monkeypatch):
+    fake_api, endpoint = fake
+    monkeypatch.setitem(CLIENT_DEFAULTS, "cache", "use")
+    monkeypatch.setitem(CLIENT_DEFAULTS, "cache_dir", str(tmp_path))
+    monkeypatch.setattr(TRACE, "enabled", True)
+    ScCloudComputingInstanceInfo(endpoint, "token", None, "web1", None).run()
+    TRACE.reset()
+
+    result = ScCloudComputingInstanceInfo(endpoint, "token", None, "web1", None).run()
+    assert result["id"] == "i1"
+    assert [
+        (stats["method"], stats["path"]) for stats in TRACE.stats()["endpoints"]
+    ] == [("GET", "/cloud_computing/instances/{id}")]
@@ -3,6 +3,8 @@
 # (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 
 from __future__ import absolute_import, division, print_function
+from itertools import chain, repeat
+
 import pytest
 import mock
 from ansible_collections.serverscom.sc_api.plugins.module_utils.dedicated_server import (
@@ -444,15 +446,7 @@ class TestModeSwitch:
             body={"ipxe_config": "#!ipxe\nchain http://boot.example.com"},
         )
 
-    @mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.dedicated_server.time")
-    def test_switch_opposite_in_deactivation(self, mock_time):
-        mock_time.time.side_effect = [
-            # wait_for_status("deactivated") for opposite
-            0, 0, 5, 5, 10,
-            # wait_for_status("activated") for private
-            10, 10, 15,
-        ]
-        mock_time.sleep = mock.MagicMock()
+    def test_switch_opposite_in_deactivation(self, poll_clock):
 
         handler = _make_handler(
             state="private",
@@ -561,15 +555,7 @@ class TestModeSwitch:
         handler.api.post_dedicated_server_feature_deactivate.assert_not_called()
         handler.api.post_dedicated_server_feature_activate.assert_not_called()
 
-    @mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.dedicated_server.time")
-    def test_switch_with_wait_full_cycle(self, mock_time):
-        mock_time.time.side_effect = [
-            # _deactivate_opposite wait_for_status: start, elapsed, sleep, elapsed
-            0, 0, 5, 5, 10,
-            # _ensure_present wait_for_status: start, elapsed, sleep, elapsed
-            10, 10, 15, 15, 20,
-        ]
-        mock_time.sleep = mock.MagicMock()
+    def test_switch_with_wait_full_cycle(self, poll_clock):
 
         handler = _make_handler(
             state="private",
@@ -651,10 +637,7 @@ class TestModeSwitch:
 
 
 class TestWait:
-    @mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.dedicated_server.time")
-    def test_wait_for_activation(self, mock_time):
-        mock_time.time.side_effect = [0, 0, 5, 5, 10]
-        mock_time.sleep = mock.MagicMock()
+    def test_wait_for_activation(self, poll_clock):
 
         handler = _make_handler(
             state="public", wait=60, update_interval=5,
@@ -673,10 +656,7 @@ class TestWait:
         assert result["feature"]["status"] == "activated"
         assert handler.api.post_dedicated_server_feature_activate.call_count == 1
 
-    @mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.dedicated_server.time")
-    def test_wait_for_deactivation(self, mock_time):
-        mock_time.time.side_effect = [0, 0, 5, 5, 10]
-        mock_time.sleep = mock.MagicMock()
+    def test_wait_for_deactivation(self, poll_clock):
 
         handler = _make_handler(state="absent", wait=60, update_interval=5)
         handler.api = mock.MagicMock()
@@ -697,25 +677,24 @@ class TestWait:
         assert result["changed"] is True
         assert result["feature"]["status"] == "deactivated"
 
-    @mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.dedicated_server.time")
-    def test_wait_timeout(self, mock_time):
-        # time.time() calls: start=0, loop1_check=1, loop1_retry=2, loop2_check=601
-        mock_time.time.side_effect = [0, 1, 2, 601]
-        mock_time.sleep = mock.MagicMock()
+    def test_wait_timeout(self, poll_clock):
 
         handler = _make_handler(
             state="public", wait=600, update_interval=10,
             ipxe_config="#!ipxe\nchain http://boot.example.com",
         )
         handler.api = mock.MagicMock()
-        handler.api.get_dedicated_server_features.side_effect = [
-            # _get_feature_status
-            [_make_feature("public_ipxe_boot", "deactivated")],
-            # _get_opposite_feature_status (no opposite found)
-            [_make_feature("public_ipxe_boot", "deactivated")],
-            # wait poll: still activating
-            [_make_feature("public_ipxe_boot", "activation")],
-        ]
+        handler.api.get_dedicated_server_features.side_effect = chain(
+            [
+                # _get_feature_status
+                [_make_feature("public_ipxe_boot", "deactivated")],
+                # _get_opposite_feature_status (no opposite found)
+                [_make_feature("public_ipxe_boot", "deactivated")],
+            ],
+            # wait polls: still activating
+            repeat([_make_feature("public_ipxe_boot", "activation")]),
+        )
 
-        with pytest.raises(WaitError):
+        with pytest.raises(WaitError) as exc_info:
             handler.run()
+        assert exc_info.value.timeout == 600
@@ -0,0 +1,96 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+import pytest
+import mock
+from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
+    ModuleError,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.dedicated_server import (
+    ScDedicatedServerReinstall,
+)  # noqa
+
+
+__metaclass__ = type
+
+
+SERVER_DATA = {
+    "id": "test-server",
+    "title": "my-dedicated-server",
+    "status": "active",
+    "power_status": "powered_on",
+    "operational_status": "normal",
+    "location_id": 1,
+    "location_code": "NYC",
+    "configuration_details": {
+        "server_model_id": 200,
+        "server_model_name": "Dedicated-Test",
+        "operating_system_id": 49,
+    },
+}
+
+
+@pytest.fixture
+def mock_api():
+    with mock.patch(
+        "ansible_collections.serverscom.sc_api.plugins.module_utils"
+        ".dedicated_server.ScDedicatedServerApi"
+    ) as mock_api_class:
+        mock_instance = mock_api_class.return_value
+        mock_instance.get_dedicated_servers.return_value = SERVER_DATA.copy()
+        mock_instance.list_os_images_by_model_id.return_value = [
+            {"id": 49, "full_name": "Ubuntu 22.04 LTS"},
+            {"id": 51, "full_name": "Debian 11"},
+        ]
+        mock_instance.toolbox.get_ssh_fingerprints_by_key_name.return_value = (
+            "aa:bb:cc:dd"
+        )
+        yield mock_instance
+
+
+def create_reinstall(**kwargs):
+    args = dict(
+        endpoint="https://api.servers.com/v1",
+        token="test-token",
+        server_id="test-server",
+        hostname=None,
+        drives_layout_template="raid1-simple",
+        drives_layout=None,
+        operating_system_id=None,
+        operating_system_regex=None,
+        ssh_keys=None,
+        ssh_key_name=None,
+        wait=0,
+        update_interval=60,
+        user_data=None,
+        checkmode=True,
+    )
+    args.update(kwargs)
+    return ScDedicatedServerReinstall(**args)
+
+
+def test_lookups_happen_in_run(mock_api):
+    reinstall = create_reinstall(operating_system_regex="debian", ssh_key_name="my-key")
+    assert not mock_api.method_calls
+    assert reinstall.run() == {"changed": True}
+    assert reinstall.hostname == "my-dedicated-server"
+    assert reinstall.operating_system_id == 51
+    assert reinstall.ssh_keys == ["aa:bb:cc:dd"]
+    mock_api.get_dedicated_servers.assert_called_once_with("test-server")
+    mock_api.post_dedicated_server_reinstall.assert_not_called()
+
+
+def test_old_operating_system_is_kept(mock_api):
+    reinstall = create_reinstall(hostname="new-name")
+    reinstall.run()
+    assert reinstall.hostname == "new-name"
+    assert reinstall.operating_system_id == 49
+    assert reinstall.ssh_keys == []
+
+
+def test_invalid_template_fails_before_requests(mock_api):
+    with pytest.raises(ModuleError):
+        create_reinstall(drives_layout_template="nope")
+    assert not mock_api.method_calls
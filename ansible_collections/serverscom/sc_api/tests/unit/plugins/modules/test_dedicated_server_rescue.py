@@ -3,6 +3,8 @@
 # (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 
 from __future__ import absolute_import, division, print_function
+from itertools import chain, repeat
+
 import pytest
 import mock
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
@@ -50,7 +52,7 @@ def create_rescue_instance(
         auth_methods = ["password"]
     with mock.patch(
         "ansible_collections.serverscom.sc_api.plugins.module_utils"
-        ".dedicated_server.ScApi"
+        ".dedicated_server.ScDedicatedServerApi"
     ) as mock_api:
         instance = ScDedicatedServerRescue(
             endpoint="https://api.servers.com/v1",
@@ -99,13 +101,7 @@ def test_deactivate_already_deactivated():
 # --- Idempotency: transitional states (wait for completion) ---
 
 
-@mock.patch(
-    "ansible_collections.serverscom.sc_api.plugins.module_utils"
-    ".dedicated_server.time"
-)
-def test_activate_while_activating(mock_time):
-    mock_time.time.side_effect = [0, 0]
-    mock_time.sleep = mock.MagicMock()
+def test_activate_while_activating(poll_clock):
 
     instance, _mock_api = create_rescue_instance(state="rescue")
     instance.api.get_dedicated_server_features.side_effect = [
@@ -120,13 +116,7 @@ def test_activate_while_activating(mock_time):
     instance.api.post_dedicated_server_rescue_activate.assert_not_called()
 
 
-@mock.patch(
-    "ansible_collections.serverscom.sc_api.plugins.module_utils"
-    ".dedicated_server.time"
-)
-def test_deactivate_while_deactivating(mock_time):
-    mock_time.time.side_effect = [0, 0]
-    mock_time.sleep = mock.MagicMock()
+def test_deactivate_while_deactivating(poll_clock):
 
     instance, _mock_api = create_rescue_instance(state="normal", auth_methods=None)
     instance.api.get_dedicated_server_features.side_effect = [
@@ -175,13 +165,7 @@ def test_deactivate_checkmode():
 # --- Success flows ---
 
 
-@mock.patch(
-    "ansible_collections.serverscom.sc_api.plugins.module_utils"
-    ".dedicated_server.time"
-)
-def test_activate_success(mock_time):
-    mock_time.time.side_effect = [0, 0, 0, 0]
-    mock_time.sleep = mock.MagicMock()
+def test_activate_success(poll_clock):
 
     instance, _mock_api = create_rescue_instance(state="rescue")
     instance.api.get_dedicated_server_features.side_effect = [
@@ -205,13 +189,7 @@ def test_activate_success(mock_time):
     )
 
 
-@mock.patch(
-    "ansible_collections.serverscom.sc_api.plugins.module_utils"
-    ".dedicated_server.time"
-)
-def test_deactivate_success(mock_time):
-    mock_time.time.side_effect = [0, 0, 0, 0]
-    mock_time.sleep = mock.MagicMock()
+def test_deactivate_success(poll_clock):
 
     instance, _mock_api = create_rescue_instance(state="normal", auth_methods=None)
     instance.api.get_dedicated_server_features.side_effect = [
@@ -373,13 +351,7 @@ PRECONDITION_FAILED_MSG = (
 )
 
 
-@mock.patch(
-    "ansible_collections.serverscom.sc_api.plugins.module_utils"
-    ".dedicated_server.time"
-)
-def test_409_retry_success(mock_time):
-    mock_time.time.side_effect = [0, 0, 0, 0, 0, 0]
-    mock_time.sleep = mock.MagicMock()
+def test_409_retry_success(poll_clock):
 
     instance, _mock_api = create_rescue_instance(state="rescue")
     instance.api.get_dedicated_server_features.side_effect = [
@@ -400,13 +372,7 @@ def test_409_retry_success(mock_time):
     assert instance.api.post_dedicated_server_rescue_activate.call_count == 2
 
 
-@mock.patch(
-    "ansible_collections.serverscom.sc_api.plugins.module_utils"
-    ".dedicated_server.time"
-)
-def test_412_retry_success(mock_time):
-    mock_time.time.side_effect = [0, 0, 0, 0, 0, 0]
-    mock_time.sleep = mock.MagicMock()
+def test_412_retry_success(poll_clock):
 
     instance, _mock_api = create_rescue_instance(state="rescue")
     instance.api.get_dedicated_server_features.side_effect = [
@@ -427,13 +393,7 @@ def test_412_retry_success(mock_time):
     assert instance.api.post_dedicated_server_rescue_activate.call_count == 2
 
 
-@mock.patch(
-    "ansible_collections.serverscom.sc_api.plugins.module_utils"
-    ".dedicated_server.time"
-)
-def test_409_412_timeout(mock_time):
-    mock_time.time.side_effect = [0, 100000]
-    mock_time.sleep = mock.MagicMock()
+def test_409_412_timeout(poll_clock):
 
     instance, _mock_api = create_rescue_instance(state="rescue")
     instance.api.get_dedicated_server_features.return_value = [
@@ -467,21 +427,14 @@ def test_409_non_feature_state_not_retried():
 # --- Wait timeout ---
 
 
-@mock.patch(
-    "ansible_collections.serverscom.sc_api.plugins.module_utils"
-    ".dedicated_server.time"
-)
-def test_wait_timeout(mock_time):
-    # time calls: _retry_on_api_error(start), _wait(start), _wait loop(elapsed)
-    mock_time.time.side_effect = [0, 0, 100000]
-    mock_time.sleep = mock.MagicMock()
+def test_wait_timeout(poll_clock):
 
     instance, _mock_api = create_rescue_instance(state="rescue")
-    # features calls: activate_rescue(initial check), _wait loop iter 1
-    instance.api.get_dedicated_server_features.side_effect = [
-        [{"name": "host_rescue_mode", "status": "deactivated"}],
-        [{"name": "host_rescue_mode", "status": "activation"}],
-    ]
+    # features calls: activate_rescue(initial check), then _wait loop polls
+    instance.api.get_dedicated_server_features.side_effect = chain(
+        [[{"name": "host_rescue_mode", "status": "deactivated"}]],
+        repeat([{"name": "host_rescue_mode", "status": "activation"}]),
+    )
     instance.api.post_dedicated_server_rescue_activate.return_value = {
         "name": "host_rescue_mode",
         "status": "activation",
@@ -491,6 +444,7 @@ def test_wait_timeout(mock_time):
         instance.run()
 
     assert "Timeout" in str(exc_info.value.msg)
+    assert poll_clock.now == instance.wait
 
 
 # --- SSH key resolution ---
@@ -501,8 +455,15 @@ def test_ssh_key_name_resolution():
         state="rescue",
         auth_methods=["ssh_key"],
         ssh_key_name="my-key",
+        checkmode=True,
     )
+    assert not instance.api.method_calls  # nothing is looked up in __init__
+    instance.api.get_dedicated_server_features.return_value = [
+        {"name": "host_rescue_mode", "status": "deactivated"},
+    ]
+    instance.api.get_dedicated_servers.return_value = dict(READY_SERVER)
 
+    assert instance.run()["changed"] is True
     instance.api.toolbox.get_ssh_fingerprints_by_key_name.assert_called_once_with(
         "my-key", must=True
     )
@@ -511,13 +472,22 @@ def test_ssh_key_name_resolution():
     ]
 
 
-@mock.patch(
-    "ansible_collections.serverscom.sc_api.plugins.module_utils"
-    ".dedicated_server.time"
-)
-def test_activate_with_ssh_key_fingerprints(mock_time):
-    mock_time.time.side_effect = [0, 0, 0, 0]
-    mock_time.sleep = mock.MagicMock()
+def test_ssh_key_name_not_resolved_when_activated():
+    instance, _mock_api = create_rescue_instance(
+        state="rescue",
+        auth_methods=["ssh_key"],
+        ssh_key_name="my-key",
+    )
+    instance.api.get_dedicated_server_features.return_value = [
+        {"name": "host_rescue_mode", "status": "activated"},
+    ]
+    instance.api.get_dedicated_servers.return_value = dict(RESCUE_SERVER)
+
+    assert instance.run()["changed"] is False
+    instance.api.toolbox.get_ssh_fingerprints_by_key_name.assert_not_called()
+
+
+def test_activate_with_ssh_key_fingerprints(poll_clock):
 
     instance, _mock_api = create_rescue_instance(
         state="rescue",
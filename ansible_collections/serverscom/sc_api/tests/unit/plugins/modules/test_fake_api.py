@@ -0,0 +1,150 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+import pytest
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    CLIENT_DEFAULTS,
+    APIError404,
+    APIError409,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_client import (
+    ScApi,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.sbm import (
+    ScSbmServersCreate,
+)
+from ansible_collections.serverscom.sc_api.tests.fake_api.server import (
+    FakeApi,
+    match_labels,
+    start_in_thread,
+)
+
+
+__metaclass__ = type
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def fake():
+    clock = Clock()
+    api = FakeApi({"transition_delay": 10}, clock=clock)
+    server, endpoint = start_in_thread(api=api)
+    yield api, clock, endpoint
+    server.shutdown()
+    server.server_close()
+
+
+def test_pagination_links(fake):
+    _api, _clock, endpoint = fake
+    api = ScApi("token", endpoint, page_size=1)
+    response = api.api_helper.send_get_request(
+        endpoint + "/locations", {"per_page": 1}, None
+    )
+    assert response.headers["X-Total-Count"] == "3"
+    assert set(response.links) == {"first", "last", "next"}
+    assert [loc["code"] for loc in api.list_locations()] == ["AMS1", "AMS7", "DFW1"]
+    assert [loc["code"] for loc in api.list_locations(search_pattern="us")] == ["DFW1"]
+
+
+def test_unknown_object(fake):
+    _api, _clock, endpoint = fake
+    with pytest.raises(APIError404):
+        ScApi("token", endpoint).get_dedicated_servers("gd0EL519")
+
+
+def test_sbm_servers_become_ready(fake, poll_clock):
+    fake_api, _clock, endpoint = fake
+    fake_api.clock = poll_clock.time
+    worker = ScSbmServersCreate(
+        endpoint=endpoint,
+        token="token",
+        orders=[
+            {
+                "location_id": 46,
+                "sbm_flavor_model_id": 3091,
+                "operating_system_id": 80,
+                "hostnames": ["web-01", "web-02"],
+            }
+        ],
+        ssh_key_fingerprints=None,
+        user_data=None,
+        wait=600,
+        update_interval=5,
+        checkmode=False,
+    )
+    result = worker.run()
+    assert [s["status"] for s in result["sbm_servers"]] == ["active", "active"]
+    assert poll_clock.now >= 20
+    assert len(fake_api.state["hosts"]) == 5
+
+
+def test_busy_object_conflicts(fake):
+    _api, clock, endpoint = fake
+    api = ScApi("token", endpoint)
+    instance = api.post_instance(
+        2, "vm", "33227-1", "img-debian-13", False, False, True, None, None, None, None
+    )
+    assert instance["status"] == "BUILD"
+    with pytest.raises(APIError409):
+        api.post_instance_switch_off(instance["id"])
+    clock.now += 10
+    assert api.get_instances(instance["id"])["status"] == "ACTIVE"
+    assert api.post_instance_switch_off(instance["id"])["status"] == "SWITCHING_OFF"
+    clock.now += 10
+    api.delete_instance(instance["id"])
+    clock.now += 10
+    with pytest.raises(APIError404):
+        api.get_instances(instance["id"])
+
+
+def test_injected_conflict(fake):
+    fake_api, _clock, endpoint = fake
+    fake_api.config["conflict_every"] = 2
+    api = ScApi("token", endpoint)
+    key = "ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAAIBBBB test"
+    api.post_ssh_keys(name="a", public_key=key, labels=None)
+    with pytest.raises(APIError409):
+        api.delete_ssh_keys(list(api.list_ssh_keys(label_selector=None))[0]["fingerprint"])
+
+
+def test_throttling_is_retried(fake, tmp_path, monkeypatch):
+    fake_api, _clock, endpoint = fake
+    fake_api.config.update(throttle_every=2, retry_after=0)
+    monkeypatch.setitem(CLIENT_DEFAULTS, "rate_limit", 100)
+    monkeypatch.setitem(CLIENT_DEFAULTS, "cache_dir", str(tmp_path))
+    api = ScApi("token", endpoint, page_size=1)
+    assert len(list(api.list_locations())) == 3
+    assert fake_api.request_count == 5
+
+
+def test_bad_token(fake):
+    fake_api, _clock, endpoint = fake
+    fake_api.config["token"] = "right"
+    with pytest.raises(Exception) as exc_info:
+        ScApi("wrong", endpoint).get_dedicated_servers("Vmrzwomx")
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.parametrize(
+    "selector, expected",
+    [
+        ("env=prod", True),
+        ("env==prod,role=web", True),
+        ("env!=prod", False),
+        ("team", False),
+        ("!team", True),
+        ("env=dev", False),
+    ],
+)
+def test_match_labels(selector, expected):
+    assert match_labels({"env": "prod", "role": "web"}, selector) is expected
@@ -0,0 +1,189 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+import gzip
+import io
+import json
+import tracemalloc
+
+import pytest
+import requests
+from urllib3.response import HTTPResponse
+
+from ansible_collections.serverscom.sc_api.plugins.module_utils import jsonstream
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    ApiHelper,
+    DecodeError,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_client import (
+    ScApi,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.jsonstream import (
+    iter_json_array,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.tracing import (
+    TRACE,
+)
+from ansible_collections.serverscom.sc_api.tests.fake_api import seed
+from ansible_collections.serverscom.sc_api.tests.fake_api.server import (
+    FakeApi,
+    start_in_thread,
+)
+
+
+__metaclass__ = type
+
+
+DOCUMENT = [
+    {"id": "s1", "title": "Ünïcødé ✓ 😀", "tags": ["a", "b"], "ram": 64, "ok": True},
+    12345,
+    -1.5e3,
+    None,
+    "x",
+    [[], {}],
+]
+
+
+def split(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 64, 100000])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_items_across_chunk_boundaries(size, indent):
+    data = json.dumps(DOCUMENT, indent=indent, ensure_ascii=False).encode("utf-8")
+    assert list(iter_json_array(split(data, size))) == DOCUMENT
+
+
+def test_items_are_yielded_before_the_end():
+    chunks = iter([b'[{"id": 1}, ', b'{"id": 2}, ', b'{"id": 3}]'])
+    items = iter_json_array(chunks)
+    assert next(items) == {"id": 1}
+    # Only the first chunk has been read.
+    assert next(chunks) == b'{"id": 2}, '
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"", b"{}", b"[1,]", b"[,1]", b"[1 2]", b"[1", b"[1] 2", b"[tru]", b'["a]'],
+)
+def test_invalid_documents(data):
+    with pytest.raises(ValueError):
+        list(iter_json_array(split(data, 1)))
+
+
+def make_response(body, helper):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers = requests.structures.CaseInsensitiveDict({"Content-Encoding": "gzip"})
+    response.url = helper.make_url("/hosts/sbm_servers")
+    response.raw = HTTPResponse(
+        body=io.BytesIO(gzip.compress(body)),
+        headers=dict(response.headers),
+        status=200,
+        preload_content=False,
+        decode_content=True,
+    )
+    return response
+
+
+def peak_memory(consume):
+    tracemalloc.start()
+    try:
+        consume()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_memory_per_page_is_per_item():
+    helper = ApiHelper("token", "http://fake/v1")
+    items = [
+        dict(
+            seed.sbm_server(
+                f"sbm{number}",
+                f"node{number}",
+                seed.LOCATIONS[0],
+                seed.ORDER_OPTIONS["sbm_flavor_models"][0],
+            ),
+            labels={"blob": "x" * 4096},
+        )
+        for number in range(300)
+    ]
+    body = json.dumps(items).encode("utf-8")
+
+    def consume(decode):
+        response = make_response(body, helper)
+        return lambda: all(item["id"] for item in decode(response))
+
+    whole = peak_memory(consume(helper.decode))
+    by_item = peak_memory(consume(helper.decode_items))
+    assert whole > len(body)
+    assert by_item < whole / 4
+
+
+@pytest.mark.parametrize("body", [b'{"message": "x"}', b'{"message": "%s"}' % (b"x" * 100000)])
+def test_not_an_array(body):
+    helper = ApiHelper("token", "http://fake/v1")
+    with pytest.raises(DecodeError):
+        list(helper.decode_items(make_response(body, helper)))
+
+
+def test_page_in_one_chunk_is_decoded_whole(monkeypatch):
+    monkeypatch.setattr(jsonstream, "iter_json_array", None)
+    helper = ApiHelper("token", "http://fake/v1")
+    response = make_response(json.dumps(DOCUMENT).encode("utf-8"), helper)
+    assert list(helper.decode_items(response)) == DOCUMENT
+    assert response.raw.closed
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    monkeypatch.setattr(TRACE, "enabled", True)
+    api = FakeApi({"transition_delay": 0})
+    for number in range(150):
+        api.state["hosts"][f"sbm{number:03d}"] = seed.sbm_server(
+            f"sbm{number:03d}",
+            f"node{number}",
+            seed.LOCATIONS[0],
+            seed.ORDER_OPTIONS["sbm_flavor_models"][0],
+        )
+    server, endpoint = start_in_thread(api=api)
+    yield api, endpoint
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("prefetch_workers", [1, 4])
+def test_listing_is_compressed(fake, prefetch_workers):
+    _fake_api, endpoint = fake
+    api = ScApi("token", endpoint, page_size=50)
+    api.api_helper.prefetch_workers = prefetch_workers
+    servers = list(api.list_sbm_servers())
+    assert [server["id"] for server in servers] == [
+        f"sbm{number:03d}" for number in range(150)
+    ]
+    received = TRACE.stats()["bytes"]
+    assert 0 < received < len(json.dumps(servers)) / 5
+
+
+def test_listing_stopped_early_closes_page(fake):
+    _fake_api, endpoint = fake
+    helper = ScApi("token", endpoint, page_size=100).api_helper
+    closed = []
+    decode_items = helper.decode_items
+
+    def tracking(response):
+        try:
+            yield from decode_items(response)
+        finally:
+            closed.append(response.raw.closed)
+
+    helper.decode_items = tracking
+    listing = helper.make_multipage_request("/hosts/sbm_servers")
+    assert next(listing)["id"] == "sbm000"
+    listing.close()
+    assert closed == [True]
@@ -3,9 +3,27 @@
 # (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 
 from __future__ import absolute_import, division, print_function
+
+import mock
+import pytest
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    CLIENT_DEFAULTS,
+)
 from ansible_collections.serverscom.sc_api.plugins.module_utils.l2_segment import (
     ScL2Segment,
+    ScL2SegmentAliases,
+    ScL2SegmentInfo,
 )  # noqa
+from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
+    ModuleError,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.tracing import (
+    TRACE,
+)
+from ansible_collections.serverscom.sc_api.tests.fake_api.server import (
+    FakeApi,
+    start_in_thread,
+)
 
 
 __metaclass__ = type
@@ -56,3 +74,130 @@ def test_simplify_members():
         }
     ]
     assert list(ScL2Segment._simplify_members(data)) == data
+
+
+@pytest.fixture
+def fake(tmp_path, monkeypatch):
+    monkeypatch.setitem(CLIENT_DEFAULTS, "cache", "use")
+    monkeypatch.setitem(CLIENT_DEFAULTS, "cache_dir", str(tmp_path))
+    monkeypatch.setattr(TRACE, "enabled", True)
+    api = FakeApi({"transition_delay": 0})
+    for number in range(150):
+        segment_id = f"l2{number}"
+        api.state["l2_segments"][segment_id] = {
+            "id": segment_id,
+            "name": f"net{number}",
+            "type": "private",
+            "status": "active",
+            "location_group_id": 1,
+            "labels": {},
+            "members": [],
+            "networks": [],
+        }
+    server, endpoint = start_in_thread(api=api)
+    yield api, endpoint
+    server.shutdown()
+    server.server_close()
+
+
+def lookup_requests():
+    requests = {
+        (stats["method"], stats["path"]): stats["requests"]
+        for stats in TRACE.stats()["endpoints"]
+    }
+    TRACE.reset()
+    return requests
+
+
+def aliases(endpoint, name):
+    return ScL2SegmentAliases(endpoint, "token", name, None, 1, None, 60, 5, False)
+
+
+def test_segment_name_is_indexed(fake):
+    fake_api, endpoint = fake
+    assert aliases(endpoint, "net7").get_segment_id() == "l27"
+    assert lookup_requests() == {("GET", "/l2_segments"): 1}
+
+    assert aliases(endpoint, "net7").get_segment_id() == "l27"
+    assert lookup_requests() == {("GET", "/l2_segments/{id}"): 1}
+
+    # renamed elsewhere: the index is checked and the name searched again
+    fake_api.state["l2_segments"]["l27"]["name"] = "renamed"
+    with pytest.raises(ModuleError):
+        aliases(endpoint, "net7").get_segment_id()
+    assert lookup_requests() == {
+        ("GET", "/l2_segments/{id}"): 1,
+        ("GET", "/l2_segments"): 1,
+    }
+
+
+def test_segment_info(fake):
+    fake_api, endpoint = fake
+    fake_api.state["l2_segments"]["l27"]["members"] = [
+        {"id": "Vmrzwomx", "mode": "native"}
+    ]
+    result = ScL2SegmentInfo(endpoint, "token", id=None, name="net7").run()
+    assert result["l2_segment"]["id"] == "l27"
+    assert [m["id"] for m in result["l2_segment"]["members"]] == ["Vmrzwomx"]
+    assert result["l2_segment"]["networks"] == []
+    assert lookup_requests() == {
+        ("GET", "/l2_segments"): 1,
+        ("GET", "/l2_segments/{id}"): 1,
+        ("GET", "/l2_segments/{id}/members"): 1,
+        ("GET", "/l2_segments/{id}/networks"): 1,
+    }
+    with pytest.raises(ModuleError, match="Unable to find segment"):
+        ScL2SegmentInfo(endpoint, "token", id=None, name="other").run()
+
+
+def test_deleted_segment_is_dropped_from_index(fake):
+    fake_api, endpoint = fake
+    assert aliases(endpoint, "net7").get_segment_id() == "l27"
+    result = ScL2Segment(
+        endpoint, "token", "net7", None, "absent", None, None, None, None, None,
+        None, 60, 5, False,
+    ).run()
+    assert result == {"changed": True, "id": "l27"}
+    assert "l27" not in fake_api.state["l2_segments"]
+    TRACE.reset()
+
+    with pytest.raises(ModuleError):
+        aliases(endpoint, "net7").get_segment_id()
+    assert lookup_requests() == {("GET", "/l2_segments"): 1}
+
+
+def segment(wait=600, update_interval=30):
+    return ScL2Segment(
+        endpoint="http://api",
+        token="token",
+        name="net1",
+        segment_id=None,
+        state="present",
+        type="private",
+        members=None,
+        members_present=None,
+        members_absent=None,
+        location_group_id=None,
+        labels=None,
+        wait=wait,
+        update_interval=update_interval,
+        checkmode=False,
+    )
+
+
+def test_wait_for_active_segment_ignores_old_status(poll_clock):
+    l2 = segment()
+    # The update is applied a few seconds after the PUT.
+    l2.api.get_l2_segment = mock.Mock(
+        side_effect=[{"status": "active"}, {"status": "pending"}, {"status": "active"}]
+    )
+    l2.wait_for_active_segment("l2seg1")
+    assert l2.api.get_l2_segment.call_count == 3
+
+
+def test_wait_for_active_segment_accepts_active_after_update_interval(poll_clock):
+    l2 = segment()
+    l2.api.get_l2_segment = mock.Mock(return_value={"status": "active"})
+    l2.wait_for_active_segment("l2seg1")
+    assert poll_clock.now >= 30
+    assert poll_clock.now < 60
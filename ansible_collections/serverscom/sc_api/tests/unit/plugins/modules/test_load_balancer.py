@@ -0,0 +1,96 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+import pytest
+from ansible_collections.serverscom.sc_api.plugins.module_utils.load_balancer import (
+    ScLbInstanceDelete,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
+    WaitError,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.tracing import (
+    TRACE,
+)
+from ansible_collections.serverscom.sc_api.tests.fake_api.server import (
+    FakeApi,
+    start_in_thread,
+)
+
+
+__metaclass__ = type
+
+
+@pytest.fixture
+def fake(poll_clock, monkeypatch):
+    monkeypatch.setattr(TRACE, "enabled", True)
+    api = FakeApi({"transition_delay": 3}, clock=poll_clock.time)
+    for number in range(150):
+        lb_id = f"lb{number}"
+        api.state["load_balancers"][lb_id] = {
+            "id": lb_id,
+            "name": f"balancer{number}",
+            "type": "l4",
+            "status": "active",
+            "location_id": 1,
+        }
+    server, endpoint = start_in_thread(api=api)
+    yield api, endpoint
+    server.shutdown()
+    server.server_close()
+
+
+def requests_by_path():
+    return {
+        (stats["method"], stats["path"]): stats["requests"]
+        for stats in TRACE.stats()["endpoints"]
+    }
+
+
+def test_delete_by_id_never_lists(fake, poll_clock):
+    fake_api, endpoint = fake
+    result = ScLbInstanceDelete(
+        endpoint, "token", "l4", lb_id="lb7", wait=60, update_interval=5
+    ).run()
+    assert result["changed"] is True
+    assert result["status"] == "absent"
+    assert "lb7" not in fake_api.state["load_balancers"]
+    assert poll_clock.sleeps == [1, 1.5, 2.25]
+    assert requests_by_path() == {
+        ("GET", "/load_balancers/l4/{id}"): 5,
+        ("DELETE", "/load_balancers/l4/{id}"): 1,
+    }
+
+
+def test_delete_by_name_lists_once(fake, poll_clock):
+    fake_api, endpoint = fake
+    ScLbInstanceDelete(
+        endpoint, "token", "l4", lb_name="balancer7", wait=60, update_interval=5
+    ).run()
+    assert "lb7" not in fake_api.state["load_balancers"]
+    assert requests_by_path() == {
+        ("GET", "/load_balancers"): 2,
+        ("GET", "/load_balancers/l4/{id}"): 4,
+        ("DELETE", "/load_balancers/l4/{id}"): 1,
+    }
+
+
+def test_delete_absent(fake):
+    fake_api, endpoint = fake
+    result = ScLbInstanceDelete(endpoint, "token", "l7", lb_id="lb7").run()
+    assert result == {"changed": False, "status": "absent", "identifier": "lb7"}
+    assert fake_api.request_count == 1
+
+
+def test_delete_timeout(fake, poll_clock):
+    fake_api, endpoint = fake
+    fake_api.config["transition_delay"] = 100
+    with pytest.raises(WaitError) as exc:
+        ScLbInstanceDelete(
+            endpoint, "token", "l4", lb_id="lb7", wait=10, update_interval=5
+        ).run()
+    assert exc.value.msg == (
+        "Timeout waiting for lb instance lb7 to disappear after 10.00 seconds."
+    )
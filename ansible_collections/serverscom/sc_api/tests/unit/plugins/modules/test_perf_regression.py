@@ -0,0 +1,71 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Replay recorded module runs and check their requests and round-trips.
+
+See tests/cassettes/scenarios.py. Every replayed request takes LATENCY
+seconds, so requests which a module sends together overlap, and the
+cassette counts round-trips instead of measuring wall time: a request
+is one round-trip deeper than the deepest one answered before it was
+sent. One more round-trip than expected (e.g. a request made serial)
+fails the test, however slow the machine running it.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import threading
+
+import pytest
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    ApiHelper,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.tracing import (
+    TRACE,
+)
+from ansible_collections.serverscom.sc_api.tests.cassettes.cassette import (
+    Cassette,
+)
+from ansible_collections.serverscom.sc_api.tests.cassettes.scenarios import (
+    SCENARIOS,
+    TOKEN,
+)
+
+
+__metaclass__ = type
+
+LATENCY = 0.2
+
+
+class RoundTripCassette(Cassette):
+    """Replays with LATENCY and counts round-trips."""
+
+    def __init__(self, path):
+        super(RoundTripCassette, self).__init__(path, latency=LATENCY)
+        self.depth_lock = threading.Lock()
+        self.round_trips = 0  # of the deepest request answered so far
+
+    def play(self, token, endpoint, request):
+        with self.depth_lock:
+            depth = self.round_trips + 1
+        answer = super(RoundTripCassette, self).play(token, endpoint, request)
+        with self.depth_lock:
+            self.round_trips = max(self.round_trips, depth)
+        return answer
+
+
+def requests_by_path():
+    return {
+        (stats["method"], stats["path"]): stats["requests"]
+        for stats in TRACE.stats()["endpoints"]
+    }
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS, ids=lambda scenario: scenario.name)
+def test_replayed_run(monkeypatch, scenario):
+    monkeypatch.setattr(TRACE, "enabled", True)
+    cassette = RoundTripCassette(scenario.cassette)
+    monkeypatch.setattr(ApiHelper, "_send", cassette.sender())
+    scenario.run("http://replay.invalid/v1", TOKEN)
+    assert requests_by_path() == scenario.requests
+    assert cassette.round_trips == scenario.round_trips
@@ -0,0 +1,115 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+import pytest
+
+from ansible_collections.serverscom.sc_api.plugins.module_utils import modules
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    APIError404,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
+    Poller,
+    WaitError,
+    wait_until_gone,
+)
+
+
+__metaclass__ = type
+
+
+def test_intervals_grow_up_to_max(poll_clock):
+    poller = Poller(wait=300, max_interval=5)
+    for _attempt in range(7):
+        assert poller.sleep()
+    assert poll_clock.sleeps == [1, 1.5, 2.25, 3.375, 5, 5, 5]
+
+
+def test_last_sleep_ends_at_deadline(poll_clock):
+    poller = Poller(wait=10, max_interval=4)
+    while poller.sleep():
+        pass
+    assert poll_clock.sleeps == [1, 1.5, 2.25, 3.375, pytest.approx(1.875)]
+    assert poll_clock.now == pytest.approx(10)
+    assert poller.remaining() == 0
+    assert not poller.sleep()
+
+
+def test_no_sleep_without_wait(poll_clock):
+    assert not Poller(wait=0, max_interval=5).sleep()
+    assert not Poller(wait=None, max_interval=5).sleep()
+    assert poll_clock.sleeps == []
+
+
+def test_long_wait_grows_past_max_interval(poll_clock):
+    assert Poller(wait=86400, max_interval=60).max_interval == 300
+    assert Poller(wait=3000, max_interval=60).max_interval == 60
+    assert Poller(wait=12000, max_interval=60).max_interval == 120
+
+
+def test_first_interval_not_above_max(poll_clock):
+    poller = Poller(wait=10, max_interval=0.5)
+    poller.sleep()
+    assert poll_clock.sleeps == [0.5]
+
+
+def test_jitter(poll_clock, monkeypatch):
+    monkeypatch.setattr(modules.random, "uniform", lambda a, b: b)
+    poller = Poller(wait=100, max_interval=5)
+    poller.sleep()
+    assert poll_clock.sleeps == [pytest.approx(1 + modules.POLL_JITTER)]
+
+
+def test_retry_rules_bounded_by_remaining(poll_clock):
+    poller = Poller(wait=30, max_interval=10)
+    poll_clock.now = 20
+    rules = poller.retry_rules()
+    assert rules["codes"] == {429, 500}
+    assert rules["delay"] == 1
+    assert rules["max_wait"] == 9
+
+
+def test_quick_operation_is_noticed_quickly(poll_clock):
+    """An operation done in 8 seconds is seen well before 2 x update_interval."""
+    poller = Poller(wait=600, max_interval=60)
+    while poll_clock.now < 8:
+        poller.sleep()
+    assert poll_clock.now < 10
+    assert len(poll_clock.sleeps) == 4
+
+
+def probe_gone_after(polls):
+    calls = []
+
+    def probe(retry_rules):
+        calls.append(retry_rules)
+        if len(calls) >= polls:
+            raise APIError404(msg="gone", api_url="/x", status_code=404)
+        return {"id": "x"}
+
+    return probe, calls
+
+
+def test_wait_until_gone_stops_on_404(poll_clock):
+    probe, calls = probe_gone_after(3)
+    wait_until_gone(probe, 60, 5, "thing x")
+    assert len(calls) == 3
+    assert poll_clock.sleeps == [1, 1.5]
+    assert all(rules["max_wait"] <= 60 for rules in calls)
+
+
+def test_wait_until_gone_timeout(poll_clock):
+    probe, calls = probe_gone_after(1000)
+    with pytest.raises(WaitError) as exc:
+        wait_until_gone(probe, 10, 4, "thing x")
+    assert exc.value.msg == "Timeout waiting for thing x to disappear after 10.00 seconds."
+    assert exc.value.timeout == pytest.approx(10)
+
+
+def test_wait_until_gone_stops_on_none(poll_clock):
+    answers = [{"id": "x"}, {"id": "x"}, None]
+    wait_until_gone(lambda retry_rules: answers.pop(0), 60, 5, "thing x")
+    assert answers == []
+    assert len(poll_clock.sleeps) == 2
@@ -0,0 +1,183 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+import gzip
+import hashlib
+import json
+import os
+
+import pytest
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    APIError404,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
+    ModuleError,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.projection import (
+    Projection,
+    write_json_lines,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.sbm import (
+    ScSbmServerInfo,
+    ScSbmServersInfo,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.tracing import (
+    TRACE,
+)
+from ansible_collections.serverscom.sc_api.tests.fake_api import seed
+from ansible_collections.serverscom.sc_api.tests.fake_api.server import (
+    FakeApi,
+    start_in_thread,
+)
+
+
+__metaclass__ = type
+
+
+SERVER = {
+    "id": "s1",
+    "title": "node1",
+    "configuration_details": {"ram_size": 64, "server_model_id": 7},
+    "networks": [
+        {"id": "n1", "cidr": "198.51.100.0/29", "family": "ipv4"},
+        {"id": "n2", "cidr": "2001:db8::/64", "family": "ipv6"},
+    ],
+    "labels": None,
+}
+
+
+def test_dotted_paths():
+    projection = Projection(
+        ["id", "configuration_details.ram_size", "networks.cidr", "labels.env", "missing"]
+    )
+    assert projection.one(SERVER) == {
+        "id": "s1",
+        "configuration_details": {"ram_size": 64},
+        "networks": [{"cidr": "198.51.100.0/29"}, {"cidr": "2001:db8::/64"}],
+        "labels": None,
+    }
+
+
+def test_whole_key_wins_over_subpath():
+    projection = Projection(["networks.cidr", "networks"])
+    assert projection.one(SERVER)["networks"] == SERVER["networks"]
+    projection = Projection(["networks", "networks.cidr"])
+    assert projection.one(SERVER)["networks"] == SERVER["networks"]
+
+
+def test_no_fields_returns_objects_as_is():
+    assert Projection().one(SERVER) is SERVER
+    assert Projection()([SERVER, SERVER]) == [SERVER, SERVER]
+
+
+def test_limit_closes_iterator():
+    consumed = []
+
+    def items():
+        try:
+            for number in range(100):
+                consumed.append(number)
+                yield {"id": number}
+        finally:
+            consumed.append("closed")
+
+    assert Projection(["id"], limit=3)(items()) == [{"id": 0}, {"id": 1}, {"id": 2}]
+    assert consumed == [0, 1, 2, "closed"]
+
+
+@pytest.mark.parametrize("fields, limit", [(["."], None), (None, -1)])
+def test_invalid_arguments(fields, limit):
+    with pytest.raises(ModuleError):
+        Projection(fields, limit)
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    monkeypatch.setattr(TRACE, "enabled", True)
+    api = FakeApi({"transition_delay": 0})
+    for number in range(250):
+        server_id = f"sbm{number:03d}"
+        api.state["hosts"][server_id] = seed.sbm_server(
+            server_id,
+            f"node{number}",
+            seed.LOCATIONS[0],
+            seed.ORDER_OPTIONS["sbm_flavor_models"][0],
+        )
+    server, endpoint = start_in_thread(api=api)
+    yield endpoint
+    server.shutdown()
+    server.server_close()
+
+
+def test_listing_stops_at_limit(fake):
+    result = ScSbmServersInfo(
+        fake, "token", projection=Projection(["id", "title"], limit=5)
+    ).run()
+    assert result["sbm_servers"] == [
+        {"id": f"sbm{number:03d}", "title": f"node{number}"} for number in range(5)
+    ]
+    requests = {s["path"]: s["requests"] for s in TRACE.stats()["endpoints"]}
+    assert requests == {"/hosts/sbm_servers": 1}
+
+
+def test_single_object_keeps_status_flags(fake):
+    result = ScSbmServerInfo(
+        fake, "token", "sbm007", True, projection=Projection(["title"])
+    ).run()
+    assert result == {"title": "node7", "found": True, "ready": True, "changed": False}
+
+
+def read_lines(path):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.parametrize("name", ["servers.jsonl", "servers.jsonl.gz"])
+def test_dest_streams_listing_to_file(fake, tmp_path, name):
+    dest = str(tmp_path / name)
+    projection = Projection(["id"], dest=dest)
+    result = ScSbmServersInfo(fake, "token", projection=projection).run()
+    assert "sbm_servers" not in result
+    assert result["changed"] is True
+    assert result["count"] == 250
+    assert result["dest"] == dest
+    with open(dest, "rb") as f:
+        assert result["checksum"] == hashlib.sha1(f.read()).hexdigest()
+    assert read_lines(dest)[:2] == [{"id": "sbm000"}, {"id": "sbm001"}]
+    assert os.listdir(str(tmp_path)) == [name]
+
+    again = ScSbmServersInfo(fake, "token", projection=projection).run()
+    assert again["changed"] is False
+    assert again["checksum"] == result["checksum"]
+
+
+def test_dest_is_untouched_when_listing_fails(tmp_path):
+    dest = tmp_path / "servers.jsonl"
+    dest.write_text("old\n")
+
+    def items():
+        yield {"id": 1}
+        raise APIError404(msg="gone", api_url="/x", status_code=404)
+
+    with pytest.raises(APIError404):
+        write_json_lines(str(dest), items())
+    assert dest.read_text() == "old\n"
+    assert os.listdir(str(tmp_path)) == ["servers.jsonl"]
+
+
+def test_dest_check_mode(tmp_path):
+    dest = str(tmp_path / "servers.jsonl")
+    result = write_json_lines(dest, iter([{"id": 1}, {"id": 2}]), checkmode=True)
+    assert result["changed"] is True
+    assert result["count"] == 2
+    assert result["checksum"] == hashlib.sha1(b'{"id": 1}\n{"id": 2}\n').hexdigest()
+    assert os.listdir(str(tmp_path)) == []
+
+
+def test_dest_directory_must_exist(tmp_path):
+    with pytest.raises(ModuleError):
+        write_json_lines(str(tmp_path / "missing" / "x.jsonl"), iter([]))
@@ -0,0 +1,175 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+import pytest
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    APIError404,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
+    ModuleError,
+    PartialFailureError,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.ptr_records import (
+    ScPtrRecords,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.tracing import (
+    TRACE,
+)
+from ansible_collections.serverscom.sc_api.tests.fake_api import seed
+from ansible_collections.serverscom.sc_api.tests.fake_api.server import (
+    FakeApi,
+    start_in_thread,
+)
+
+
+__metaclass__ = type
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    monkeypatch.setattr(TRACE, "enabled", True)
+    api = FakeApi({"transition_delay": 0})
+    for number in range(20):
+        api.state["hosts"][f"sbm{number}"] = seed.sbm_server(
+            f"sbm{number}",
+            f"node{number}",
+            seed.LOCATIONS[0],
+            seed.ORDER_OPTIONS["sbm_flavor_models"][0],
+        )
+    api.state["instances"]["i1"] = seed.instance(
+        "i1", "web1", seed.CLOUD_REGIONS[0], seed.CLOUD_FLAVORS[0], seed.CLOUD_IMAGES[0]
+    )
+    server, endpoint = start_in_thread(api=api)
+    yield api, endpoint
+    server.shutdown()
+    server.server_close()
+
+
+def requests_by_path():
+    return {
+        (stats["method"], stats["path"]): stats["requests"]
+        for stats in TRACE.stats()["endpoints"]
+    }
+
+
+def add_record(fake_api, server_id, ip, domain, ttl=60):
+    fake_api.state["hosts"][server_id]["ptr_records"].append(
+        {"id": f"{server_id}-{ip}", "ip": ip, "domain": domain, "ttl": ttl, "priority": 0}
+    )
+
+
+def desired_records():
+    records = [
+        {"owner_id": f"sbm{number}", "ip": f"198.51.100.{number}", "domain": f"node{number}.example.com"}
+        for number in range(20)
+    ]
+    records.append(
+        {"owner_type": "cloud_instance", "owner_id": "i1", "ip": "203.0.113.20", "domain": "web.example.com"}
+    )
+    return records
+
+
+def test_creates_missing_and_second_run_only_lists(fake):
+    fake_api, endpoint = fake
+    result = ScPtrRecords(endpoint, "token", desired_records(), concurrency=5).run()
+    assert result["changed"] is True
+    assert result["summary"] == {
+        "owners": 21,
+        "created": 21,
+        "deleted": 0,
+        "unchanged": 0,
+        "failed": 0,
+    }
+    assert fake_api.state["hosts"]["sbm7"]["ptr_records"][0]["domain"] == "node7.example.com"
+    assert fake_api.state["instances"]["i1"]["ptr_records"][0]["ip"] == "203.0.113.20"
+    assert requests_by_path() == {
+        ("GET", "/hosts/sbm_servers/{id}/ptr_records"): 20,
+        ("POST", "/hosts/sbm_servers/{id}/ptr_records"): 20,
+        ("GET", "/cloud_computing/instances/{id}/ptr_records"): 1,
+        ("POST", "/cloud_computing/instances/{id}/ptr_records"): 1,
+    }
+
+    TRACE.reset()
+    result = ScPtrRecords(endpoint, "token", desired_records()).run()
+    assert result["changed"] is False
+    assert result["summary"]["unchanged"] == 21
+    assert set(requests_by_path()) == {
+        ("GET", "/hosts/sbm_servers/{id}/ptr_records"),
+        ("GET", "/cloud_computing/instances/{id}/ptr_records"),
+    }
+
+
+@pytest.mark.parametrize("exclusive, kept", [(True, []), (False, ["198.51.100.99"])])
+def test_replaces_changed_records(fake, exclusive, kept):
+    fake_api, endpoint = fake
+    add_record(fake_api, "sbm0", "198.51.100.0", "old.example.com")
+    add_record(fake_api, "sbm0", "198.51.100.99", "other.example.com")
+    result = ScPtrRecords(
+        endpoint,
+        "token",
+        [{"owner_id": "sbm0", "ip": "198.51.100.0", "domain": "new.example.com"}],
+        exclusive=exclusive,
+    ).run()
+    assert result["summary"]["created"] == 1
+    assert result["summary"]["deleted"] == 2 - len(kept)
+    records = fake_api.state["hosts"]["sbm0"]["ptr_records"]
+    assert sorted(record["ip"] for record in records) == sorted(["198.51.100.0"] + kept)
+    assert [r["domain"] for r in records if r["ip"] == "198.51.100.0"] == ["new.example.com"]
+
+
+def test_ttl_is_compared_only_when_given(fake):
+    fake_api, endpoint = fake
+    add_record(fake_api, "sbm0", "198.51.100.0", "node0.example.com", ttl=60)
+    records = [{"owner_id": "sbm0", "ip": "198.51.100.0", "domain": "node0.example.com"}]
+    assert ScPtrRecords(endpoint, "token", records).run()["changed"] is False
+
+    result = ScPtrRecords(endpoint, "token", records, ttl=300).run()
+    assert result["summary"]["created"] == 1
+    assert result["summary"]["deleted"] == 1
+    assert fake_api.state["hosts"]["sbm0"]["ptr_records"][0]["ttl"] == 300
+
+
+def test_failed_requests_do_not_stop_others(fake):
+    fake_api, endpoint = fake
+    fake_api.config["conflict_every"] = 4
+    with pytest.raises(PartialFailureError) as exc:
+        ScPtrRecords(endpoint, "token", desired_records()).run()
+    failed = exc.value.fail()
+    assert failed["failed"] is True
+    assert failed["msg"] == "5 of 21 PTR changes failed."
+    assert failed["summary"]["failed"] == 5
+    assert all("409" in error["msg"] for error in failed["errors"])
+    created = sum(
+        len(host.get("ptr_records") or [])
+        for host in fake_api.state["hosts"].values()
+    ) + len(fake_api.state["instances"]["i1"]["ptr_records"])
+    assert created == 16
+
+
+def test_check_mode(fake):
+    fake_api, endpoint = fake
+    result = ScPtrRecords(endpoint, "token", desired_records(), checkmode=True).run()
+    assert result["changed"] is True
+    assert result["summary"]["created"] == 21
+    assert fake_api.state["hosts"]["sbm0"]["ptr_records"] == []
+    assert all(method == "GET" for method, _path in requests_by_path())
+
+
+def test_unknown_owner_fails_before_changes(fake):
+    fake_api, endpoint = fake
+    records = desired_records() + [{"owner_id": "nope", "ip": "192.0.2.1", "domain": "x.example.com"}]
+    with pytest.raises(APIError404):
+        ScPtrRecords(endpoint, "token", records).run()
+    assert fake_api.state["hosts"]["sbm0"]["ptr_records"] == []
+
+
+def test_unknown_owner_type():
+    with pytest.raises(ModuleError):
+        ScPtrRecords(
+            "http://127.0.0.1:1/v1",
+            "token",
+            [{"owner_type": "vm", "owner_id": "x", "ip": "192.0.2.1", "domain": "x"}],
+        )
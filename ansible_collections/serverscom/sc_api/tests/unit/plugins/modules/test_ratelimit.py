@@ -0,0 +1,174 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+import mock
+import pytest
+
+from ansible_collections.serverscom.sc_api.plugins.module_utils import api as sc_api
+from ansible_collections.serverscom.sc_api.plugins.module_utils import (
+    ratelimit as sc_ratelimit,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
+    client_info,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.ratelimit import (
+    THROTTLE_STATS,
+    RateLimiter,
+    parse_retry_after,
+)
+
+
+__metaclass__ = type
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(sc_ratelimit.time, "time", clock.time)
+    monkeypatch.setattr(sc_ratelimit.time, "sleep", clock.sleep)
+    return clock
+
+
+def response(status_code, headers=None):
+    return mock.Mock(status_code=status_code, headers=headers or {}, links={})
+
+
+def test_burst_then_rate(tmp_path, clock):
+    limiter = RateLimiter("token", "http://api", rate=2, state_dir=str(tmp_path))
+    waits = [limiter.acquire() for _attempt in range(4)]
+    assert waits == [0, 0, 0.5, 0.5]
+    assert THROTTLE_STATS["seconds"] == 1.0
+
+
+def test_bucket_refills(tmp_path, clock):
+    limiter = RateLimiter("token", "http://api", rate=2, state_dir=str(tmp_path))
+    limiter.acquire()
+    limiter.acquire()
+    clock.now += 10
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == 0
+
+
+def test_state_is_shared_between_processes(tmp_path, clock):
+    first = RateLimiter("token", "http://api", rate=1, state_dir=str(tmp_path))
+    second = RateLimiter("token", "http://api", rate=1, state_dir=str(tmp_path))
+    other_account = RateLimiter("other", "http://api", rate=1, state_dir=str(tmp_path))
+
+    assert first.acquire() == 0
+    assert second.acquire() == 1
+    assert other_account.acquire() == 0
+
+
+def test_429_blocks_everyone(tmp_path, clock):
+    first = RateLimiter("token", "http://api", rate=0, state_dir=str(tmp_path))
+    second = RateLimiter("token", "http://api", rate=0, state_dir=str(tmp_path))
+
+    assert first.observe(response(429, {"Retry-After": "7"})) == 7
+    assert second.acquire() == 7
+    assert first.acquire() == 0
+    assert THROTTLE_STATS["rate_limited"] == 1
+
+
+def test_429_without_headers(tmp_path, clock):
+    limiter = RateLimiter("token", "http://api", rate=0, state_dir=str(tmp_path))
+    assert limiter.observe(response(429)) == sc_ratelimit.RATE_LIMIT_FALLBACK_DELAY
+
+
+def test_remaining_zero_waits_for_reset(tmp_path, clock):
+    limiter = RateLimiter("token", "http://api", rate=10, state_dir=str(tmp_path))
+    headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(clock.now + 30)}
+
+    assert limiter.observe(response(200, headers)) is None
+    assert limiter.acquire() == 30
+
+
+def test_remaining_caps_tokens(tmp_path, clock):
+    limiter = RateLimiter("token", "http://api", rate=10, state_dir=str(tmp_path))
+    limiter.observe(response(200, {"X-RateLimit-Remaining": "1"}))
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == pytest.approx(0.1)
+
+
+def test_parse_retry_after(clock):
+    assert parse_retry_after("3", clock.now) == 3
+    assert parse_retry_after("Tue, 14 Nov 2023 22:13:40 GMT", clock.now) == 20
+    assert parse_retry_after("garbage", clock.now) is None
+    assert parse_retry_after(None, clock.now) is None
+
+
+def test_unusable_state_dir(tmp_path, clock):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    limiter = RateLimiter("token", "http://api", rate=1, state_dir=str(blocker / "sub"))
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == 1
+
+
+def make_helper(tmp_path, monkeypatch, rate):
+    monkeypatch.setitem(sc_api.CLIENT_DEFAULTS, "rate_limit", rate)
+    monkeypatch.setitem(sc_api.CLIENT_DEFAULTS, "cache_dir", str(tmp_path))
+    return sc_api.ApiHelper(token="token", endpoint="http://api")
+
+
+def test_api_helper_retries_429(tmp_path, monkeypatch, clock):
+    helper = make_helper(tmp_path, monkeypatch, rate=0)
+    ok = response(200)
+    ok.json.return_value = {"ok": True}
+    helper.session.send = mock.Mock(
+        side_effect=[response(429, {"Retry-After": "2"}), ok]
+    )
+
+    assert helper.make_post_request("/path", {}, None, [200]) == {"ok": True}
+    assert helper.session.send.call_count == 2
+    assert clock.sleeps == [2]
+
+
+def test_api_helper_gives_up_on_long_429(tmp_path, monkeypatch, clock):
+    helper = make_helper(tmp_path, monkeypatch, rate=0)
+    helper.session.send = mock.Mock(return_value=response(429, {"Retry-After": "100"}))
+
+    with pytest.raises(sc_api.APIError) as exc_info:
+        helper.make_get_request("/path")
+    assert exc_info.value.status_code == 429
+    assert helper.session.send.call_count == 2
+
+
+def test_api_helper_without_limiter(monkeypatch):
+    monkeypatch.setitem(sc_api.CLIENT_DEFAULTS, "rate_limit", None)
+    helper = sc_api.ApiHelper(
+        token="token",
+        endpoint="http://api",
+        retry_policy=sc_api.RetryPolicy(max_attempts=1),
+    )
+    helper.session.send = mock.Mock(return_value=response(429, {"Retry-After": "1"}))
+
+    assert helper.limiter is None
+    with pytest.raises(sc_api.APIError):
+        helper.make_get_request("/path")
+    assert helper.session.send.call_count == 1
+
+
+def test_client_info(monkeypatch):
+    monkeypatch.setitem(THROTTLE_STATS, "seconds", 0.0)
+    monkeypatch.setitem(THROTTLE_STATS, "rate_limited", 0)
+    assert client_info() == {}
+
+    monkeypatch.setitem(THROTTLE_STATS, "seconds", 1.23456)
+    monkeypatch.setitem(THROTTLE_STATS, "rate_limited", 2)
+    assert client_info() == {"api_throttle": {"seconds": 1.235, "rate_limited": 2}}
@@ -0,0 +1,83 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+import mock
+import pytest
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    APIError404,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.rbs import (
+    ScRBSVolumeList,
+)
+
+
+__metaclass__ = type
+
+VOLUMES = [
+    {"id": "v1", "name": "data"},
+    {"id": "v2", "name": "logs"},
+    {"id": "v3", "name": "backup"},
+]
+
+
+def create_instance(**kwargs):
+    with mock.patch(
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.rbs.ScRbsApi"
+    ):
+        instance = ScRBSVolumeList(
+            endpoint="https://api.servers.com/v1",
+            token="test-token",
+            location_id=1,
+            **kwargs,
+        )
+    instance.api.list_rbs_volumes.return_value = iter(
+        [dict(volume) for volume in VOLUMES]
+    )
+    instance.api.get_rbs_volume_credentials.side_effect = lambda volume_id: {
+        "username": f"user-{volume_id}",
+        "password": "secret",
+    }
+    return instance
+
+
+def test_credentials_for_all_volumes():
+    result = create_instance().run()
+
+    assert [volume["username"] for volume in result["rbs_volumes"]] == [
+        "user-v1",
+        "user-v2",
+        "user-v3",
+    ]
+    assert result["changed"] is False
+
+
+def test_without_credentials():
+    instance = create_instance(include_credentials=False)
+
+    result = instance.run()
+
+    assert result["rbs_volumes"] == VOLUMES
+    instance.api.get_rbs_volume_credentials.assert_not_called()
+
+
+def test_credentials_for_subset():
+    instance = create_instance(credentials_for=["v3", "data"])
+
+    volumes = {volume["id"]: volume for volume in instance.run()["rbs_volumes"]}
+
+    assert volumes["v1"]["username"] == "user-v1"
+    assert "username" not in volumes["v2"]
+    assert volumes["v3"]["password"] == "secret"
+    assert instance.api.get_rbs_volume_credentials.call_count == 2
+
+
+def test_credentials_error_is_raised():
+    instance = create_instance(credentials_workers=2)
+    instance.api.get_rbs_volume_credentials.side_effect = APIError404(
+        msg="404 Not Found.", api_url="url", status_code=404
+    )
+
+    with pytest.raises(APIError404):
+        instance.run()
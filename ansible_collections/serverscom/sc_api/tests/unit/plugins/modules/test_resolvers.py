@@ -5,6 +5,13 @@
 from __future__ import absolute_import, division, print_function
 import pytest
 import mock
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    ScApiToolbox,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.cache import (
+    CACHE_BYPASS,
+    ReferenceCache,
+)
 from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
     ModuleError,
 )
@@ -19,18 +26,24 @@ from ansible_collections.serverscom.sc_api.plugins.module_utils.sbm import (
 __metaclass__ = type
 
 
+def mock_api():
+    api = mock.MagicMock()
+    api.toolbox = ScApiToolbox(api)
+    api.api_helper.cache = ReferenceCache("token", "endpoint", mode=CACHE_BYPASS)
+    return api
+
 # ─── resolve_sbm_server_id tests ───
 
 
 def test_resolve_server_id_passthrough():
-    api = mock.MagicMock()
+    api = mock_api()
     result = resolve_sbm_server_id(api, server_id="srv123")
     assert result == "srv123"
     api.list_sbm_servers.assert_not_called()
 
 
 def test_resolve_server_id_by_hostname():
-    api = mock.MagicMock()
+    api = mock_api()
     api.list_sbm_servers.return_value = iter([{"id": "srv123", "title": "web-01"}])
     result = resolve_sbm_server_id(api, hostname="web-01")
     assert result == "srv123"
@@ -38,7 +51,7 @@ def test_resolve_server_id_by_hostname():
 
 
 def test_resolve_server_id_hostname_not_found():
-    api = mock.MagicMock()
+    api = mock_api()
     api.list_sbm_servers.return_value = iter([])
     with pytest.raises(ModuleError) as exc_info:
         resolve_sbm_server_id(api, hostname="nonexistent")
@@ -46,7 +59,7 @@ def test_resolve_server_id_hostname_not_found():
 
 
 def test_resolve_server_id_hostname_multiple():
-    api = mock.MagicMock()
+    api = mock_api()
     api.list_sbm_servers.return_value = iter(
         [
             {"id": "srv1", "title": "web-01"},
@@ -59,7 +72,7 @@ def test_resolve_server_id_hostname_multiple():
 
 
 def test_resolve_server_id_hostname_filters_exact():
-    api = mock.MagicMock()
+    api = mock_api()
     api.list_sbm_servers.return_value = iter(
         [
             {"id": "srv1", "title": "web-01-staging"},
@@ -71,14 +84,14 @@ def test_resolve_server_id_hostname_filters_exact():
 
 
 def test_resolve_server_id_both_provided():
-    api = mock.MagicMock()
+    api = mock_api()
     with pytest.raises(ModuleError) as exc_info:
         resolve_sbm_server_id(api, server_id="srv123", hostname="web-01")
     assert "mutually exclusive" in str(exc_info.value.msg)
 
 
 def test_resolve_server_id_neither_provided():
-    api = mock.MagicMock()
+    api = mock_api()
     with pytest.raises(ModuleError) as exc_info:
         resolve_sbm_server_id(api)
     assert "must be provided" in str(exc_info.value.msg)
@@ -88,14 +101,14 @@ def test_resolve_server_id_neither_provided():
 
 
 def test_resolve_location_id_passthrough():
-    api = mock.MagicMock()
+    api = mock_api()
     result = resolve_location_id(api, location_id=42)
     assert result == 42
     api.list_locations.assert_not_called()
 
 
 def test_resolve_location_id_by_code():
-    api = mock.MagicMock()
+    api = mock_api()
     api.list_locations.return_value = iter([{"id": 42, "code": "AMS7"}])
     result = resolve_location_id(api, location_code="ams7")
     assert result == 42
@@ -103,7 +116,7 @@ def test_resolve_location_id_by_code():
 
 
 def test_resolve_location_id_code_not_found():
-    api = mock.MagicMock()
+    api = mock_api()
     api.list_locations.return_value = iter([])
     with pytest.raises(ModuleError) as exc_info:
         resolve_location_id(api, location_code="ZZZZ")
@@ -111,21 +124,21 @@ def test_resolve_location_id_code_not_found():
 
 
 def test_resolve_location_id_both_provided():
-    api = mock.MagicMock()
+    api = mock_api()
     with pytest.raises(ModuleError) as exc_info:
         resolve_location_id(api, location_id=42, location_code="AMS7")
     assert "mutually exclusive" in str(exc_info.value.msg)
 
 
 def test_resolve_location_id_neither_provided():
-    api = mock.MagicMock()
+    api = mock_api()
     with pytest.raises(ModuleError) as exc_info:
         resolve_location_id(api)
     assert "must be provided" in str(exc_info.value.msg)
 
 
 def test_resolve_location_id_code_filters_exact():
-    api = mock.MagicMock()
+    api = mock_api()
     api.list_locations.return_value = iter(
         [
             {"id": 10, "code": "AMS77"},
@@ -140,14 +153,14 @@ def test_resolve_location_id_code_filters_exact():
 
 
 def test_resolve_flavor_id_passthrough():
-    api = mock.MagicMock()
+    api = mock_api()
     result = resolve_sbm_flavor_model_id(api, 42, sbm_flavor_model_id=100)
     assert result == 100
     api.list_sbm_flavor_models.assert_not_called()
 
 
 def test_resolve_flavor_id_by_name():
-    api = mock.MagicMock()
+    api = mock_api()
     api.list_sbm_flavor_models.return_value = iter([{"id": 100, "name": "DL-01"}])
     result = resolve_sbm_flavor_model_id(api, 42, sbm_flavor_model_name="DL-01")
     assert result == 100
@@ -155,7 +168,7 @@ def test_resolve_flavor_id_by_name():
 
 
 def test_resolve_flavor_id_name_not_found():
-    api = mock.MagicMock()
+    api = mock_api()
     api.list_sbm_flavor_models.return_value = iter([])
     with pytest.raises(ModuleError) as exc_info:
         resolve_sbm_flavor_model_id(api, 42, sbm_flavor_model_name="NONEXISTENT")
@@ -163,7 +176,7 @@ def test_resolve_flavor_id_name_not_found():
 
 
 def test_resolve_flavor_id_both_provided():
-    api = mock.MagicMock()
+    api = mock_api()
     with pytest.raises(ModuleError) as exc_info:
         resolve_sbm_flavor_model_id(
             api, 42, sbm_flavor_model_id=100, sbm_flavor_model_name="DL-01"
@@ -172,14 +185,14 @@ def test_resolve_flavor_id_both_provided():
 
 
 def test_resolve_flavor_id_neither_provided():
-    api = mock.MagicMock()
+    api = mock_api()
     with pytest.raises(ModuleError) as exc_info:
         resolve_sbm_flavor_model_id(api, 42)
     assert "must be provided" in str(exc_info.value.msg)
 
 
 def test_resolve_flavor_id_name_filters_exact():
-    api = mock.MagicMock()
+    api = mock_api()
     api.list_sbm_flavor_models.return_value = iter(
         [
             {"id": 100, "name": "DL-01-Extended"},
@@ -202,14 +215,14 @@ OS_LIST = [
 
 
 def test_resolve_os_id_passthrough():
-    api = mock.MagicMock()
+    api = mock_api()
     result = resolve_operating_system_id(api, 42, 100, operating_system_id=49)
     assert result == 49
     api.list_os_images_by_sbm_flavor_id.assert_not_called()
 
 
 def test_resolve_os_id_by_name():
-    api = mock.MagicMock()
+    api = mock_api()
     api.list_os_images_by_sbm_flavor_id.return_value = iter(OS_LIST)
     result = resolve_operating_system_id(
         api, 42, 100, operating_system_name="Debian 11"
@@ -218,7 +231,7 @@ def test_resolve_os_id_by_name():
 
 
 def test_resolve_os_id_by_name_not_found():
-    api = mock.MagicMock()
+    api = mock_api()
     api.list_os_images_by_sbm_flavor_id.return_value = iter(OS_LIST)
     with pytest.raises(ModuleError) as exc_info:
         resolve_operating_system_id(api, 42, 100, operating_system_name="Windows 10")
@@ -226,14 +239,14 @@ def test_resolve_os_id_by_name_not_found():
 
 
 def test_resolve_os_id_by_regex_single_match():
-    api = mock.MagicMock()
+    api = mock_api()
     api.list_os_images_by_sbm_flavor_id.return_value = iter(OS_LIST)
     result = resolve_operating_system_id(api, 42, 100, operating_system_regex="Debian")
     assert result == 51
 
 
 def test_resolve_os_id_by_regex_multiple_matches():
-    api = mock.MagicMock()
+    api = mock_api()
     api.list_os_images_by_sbm_flavor_id.return_value = iter(OS_LIST)
     with pytest.raises(ModuleError) as exc_info:
         resolve_operating_system_id(api, 42, 100, operating_system_regex="Ubuntu")
@@ -241,7 +254,7 @@ def test_resolve_os_id_by_regex_multiple_matches():
 
 
 def test_resolve_os_id_by_regex_no_match():
-    api = mock.MagicMock()
+    api = mock_api()
     api.list_os_images_by_sbm_flavor_id.return_value = iter(OS_LIST)
     with pytest.raises(ModuleError) as exc_info:
         resolve_operating_system_id(api, 42, 100, operating_system_regex="Windows")
@@ -249,7 +262,7 @@ def test_resolve_os_id_by_regex_no_match():
 
 
 def test_resolve_os_id_by_regex_invalid():
-    api = mock.MagicMock()
+    api = mock_api()
     api.list_os_images_by_sbm_flavor_id.return_value = iter(OS_LIST)
     with pytest.raises(ModuleError) as exc_info:
         resolve_operating_system_id(api, 42, 100, operating_system_regex="[invalid")
@@ -257,7 +270,7 @@ def test_resolve_os_id_by_regex_invalid():
 
 
 def test_resolve_os_id_empty_os_list():
-    api = mock.MagicMock()
+    api = mock_api()
     api.list_os_images_by_sbm_flavor_id.return_value = iter([])
     with pytest.raises(ModuleError) as exc_info:
         resolve_operating_system_id(
@@ -267,7 +280,7 @@ def test_resolve_os_id_empty_os_list():
 
 
 def test_resolve_os_id_multiple_provided():
-    api = mock.MagicMock()
+    api = mock_api()
     with pytest.raises(ModuleError) as exc_info:
         resolve_operating_system_id(
             api,
@@ -280,7 +293,7 @@ def test_resolve_os_id_multiple_provided():
 
 
 def test_resolve_os_id_none_provided():
-    api = mock.MagicMock()
+    api = mock_api()
     with pytest.raises(ModuleError) as exc_info:
         resolve_operating_system_id(api, 42, 100)
     assert "must be provided" in str(exc_info.value.msg)
@@ -0,0 +1,158 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+import os
+
+import pytest
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    CLIENT_DEFAULTS,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_client import (
+    ScApi,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils import revalidate
+from ansible_collections.serverscom.sc_api.plugins.module_utils.tracing import (
+    TRACE,
+)
+from ansible_collections.serverscom.sc_api.tests.fake_api import seed
+from ansible_collections.serverscom.sc_api.tests.fake_api.server import (
+    FakeApi,
+    start_in_thread,
+)
+
+
+__metaclass__ = type
+
+
+@pytest.fixture
+def fake(monkeypatch, tmp_path):
+    monkeypatch.setattr(TRACE, "enabled", True)
+    monkeypatch.setattr(revalidate, "MEMORY", revalidate._Memory())
+    monkeypatch.setitem(CLIENT_DEFAULTS, "revalidate", "memory")
+    monkeypatch.setitem(CLIENT_DEFAULTS, "cache_dir", str(tmp_path))
+    api = FakeApi({"transition_delay": 0})
+    for number in range(25):
+        server_id = f"sbm{number:02d}"
+        api.state["hosts"][server_id] = seed.sbm_server(
+            server_id,
+            f"node{number}",
+            seed.LOCATIONS[0],
+            seed.ORDER_OPTIONS["sbm_flavor_models"][0],
+        )
+    server, endpoint = start_in_thread(api=api)
+    yield api, endpoint
+    server.shutdown()
+    server.server_close()
+
+
+def statuses(path):
+    for stats in TRACE.stats()["endpoints"]:
+        if stats["path"] == path:
+            return stats["statuses"]
+    return {}
+
+
+def test_polling_unchanged_object(fake):
+    fake_api, endpoint = fake
+    api = ScApi("token", endpoint)
+    first = api.get_sbm_servers("sbm01")
+    received = TRACE.stats()["bytes"]
+    first["title"] = "changed by caller"
+    polls = [api.get_sbm_servers("sbm01") for _ in range(5)]
+    assert all(poll["title"] == "node1" for poll in polls)
+    assert statuses("/hosts/sbm_servers/{id}") == {"200": 1, "304": 5}
+    assert TRACE.stats()["bytes"] == received
+
+    fake_api.state["hosts"]["sbm01"]["title"] = "renamed"
+    TRACE.reset()
+    assert api.get_sbm_servers("sbm01")["title"] == "renamed"
+    assert statuses("/hosts/sbm_servers/{id}") == {"200": 1}
+
+
+def test_listing_pages_are_revalidated(fake):
+    _fake_api, endpoint = fake
+    api = ScApi("token", endpoint, page_size=10)
+    first = list(api.list_sbm_servers())
+    TRACE.reset()
+    # A new client (the way modules create them) shares the validators.
+    again = list(ScApi("token", endpoint, page_size=10).list_sbm_servers())
+    assert again == first
+    assert len(again) == 25
+    # The first page is streamed, so it isn't stored; prefetched ones are.
+    assert statuses("/hosts/sbm_servers") == {"200": 1, "304": 2}
+
+
+def test_streamed_pages_are_not_stored(fake, monkeypatch):
+    _fake_api, endpoint = fake
+    monkeypatch.setitem(CLIENT_DEFAULTS, "prefetch_workers", 1)
+    for _attempt in range(2):
+        assert len(list(ScApi("token", endpoint, page_size=10).list_sbm_servers())) == 25
+    assert statuses("/hosts/sbm_servers") == {"200": 6}
+
+
+def test_tokens_do_not_share_entries(fake):
+    _fake_api, endpoint = fake
+    ScApi("token", endpoint).get_sbm_servers("sbm01")
+    ScApi("other", endpoint).get_sbm_servers("sbm01")
+    assert statuses("/hosts/sbm_servers/{id}") == {"200": 2}
+
+
+def test_disk_entries_survive_the_process(fake, tmp_path, monkeypatch):
+    _fake_api, endpoint = fake
+    monkeypatch.setitem(CLIENT_DEFAULTS, "revalidate", "disk")
+    ScApi("token", endpoint).get_sbm_servers("sbm01")
+    assert len(os.listdir(str(tmp_path / "validators"))) == 1
+    monkeypatch.setattr(revalidate, "MEMORY", revalidate._Memory())
+    assert ScApi("token", endpoint).get_sbm_servers("sbm01")["title"] == "node1"
+    assert statuses("/hosts/sbm_servers/{id}") == {"200": 1, "304": 1}
+
+
+def test_credentials_are_not_written_to_disk(fake, tmp_path, monkeypatch):
+    fake_api, endpoint = fake
+    fake_api.state["volumes"]["vol1"] = seed.volume(
+        "vol1", "data", 10, seed.LOCATIONS[0], seed.ORDER_OPTIONS["rbs_flavors"][0]
+    )
+    monkeypatch.setitem(CLIENT_DEFAULTS, "revalidate", "disk")
+    api = ScApi("token", endpoint)
+    for _attempt in range(2):
+        assert api.get_rbs_volume_credentials("vol1")["password"] == "fake-password"
+        assert api.get_credentials(seed.CLOUD_REGIONS[0]["id"])["password"] == "fake-password"
+    # Kept in memory for this run only.
+    assert statuses("/remote_block_storage/volumes/{id}/credentials") == {"200": 1, "304": 1}
+    assert not os.path.exists(str(tmp_path / "validators"))
+
+
+def test_off(fake, tmp_path, monkeypatch):
+    _fake_api, endpoint = fake
+    monkeypatch.setitem(CLIENT_DEFAULTS, "revalidate", "off")
+    api = ScApi("token", endpoint)
+    api.get_sbm_servers("sbm01")
+    api.get_sbm_servers("sbm01")
+    assert statuses("/hosts/sbm_servers/{id}") == {"200": 2}
+    assert not revalidate.MEMORY.entries
+    assert not os.path.exists(str(tmp_path / "validators"))
+
+
+def test_responses_without_validators_are_not_kept(fake):
+    fake_api, endpoint = fake
+    fake_api.config["etags"] = False
+    api = ScApi("token", endpoint)
+    api.get_sbm_servers("sbm01")
+    api.get_sbm_servers("sbm01")
+    assert statuses("/hosts/sbm_servers/{id}") == {"200": 2}
+    assert not revalidate.MEMORY.entries
+
+
+def test_memory_drops_least_recently_used():
+    memory = revalidate._Memory(limit=10)
+    memory.put("a", {"content": b"1234"})
+    memory.put("b", {"content": b"1234"})
+    memory.get("a")
+    memory.put("c", {"content": b"1234"})
+    assert list(memory.entries) == ["a", "c"]
+    assert memory.size == 8
+    memory.put("d", {"content": b"12345678901"})
+    assert "d" not in memory.entries
@@ -39,7 +39,7 @@ FLAVOR_MODELS = [
 
 def test_run_returns_flavor_models():
     with mock.patch(
-        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScApi"
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
     ) as mock_api_class:
         mock_instance = mock_api_class.return_value
         mock_instance.list_sbm_flavor_models.return_value = iter(FLAVOR_MODELS)
@@ -59,7 +59,7 @@ def test_run_returns_flavor_models():
 
 def test_run_with_search_pattern():
     with mock.patch(
-        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScApi"
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
     ) as mock_api_class:
         mock_instance = mock_api_class.return_value
         mock_instance.list_sbm_flavor_models.return_value = iter([FLAVOR_MODELS[1]])
@@ -80,7 +80,7 @@ def test_run_with_search_pattern():
 
 def test_run_empty_result():
     with mock.patch(
-        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScApi"
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
     ) as mock_api_class:
         mock_instance = mock_api_class.return_value
         mock_instance.list_sbm_flavor_models.return_value = iter([])
@@ -35,7 +35,7 @@ def create_os_list_instance(
     os_name_regex=None,
 ):
     with mock.patch(
-        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScApi"
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
     ):
         return ScSbmOSList(
             endpoint="https://api.servers.com/v1",
@@ -53,7 +53,7 @@ def create_create_instance(
 ):
     """Create a ScSbmServerCreate instance with mocked API."""
     with mock.patch(
-        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScApi"
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
     ):
         instance = ScSbmServerCreate(
             endpoint="https://api.servers.com/v1",
@@ -80,7 +80,7 @@ def create_delete_instance(
 ):
     """Create a ScSbmServerDelete instance with mocked API."""
     with mock.patch(
-        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScApi"
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
     ):
         instance = ScSbmServerDelete(
             endpoint="https://api.servers.com/v1",
@@ -131,10 +131,7 @@ def test_create_immediate_ready():
     instance.api.get_sbm_servers.assert_not_called()
 
 
-@mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.time")
-def test_create_polls_until_ready(mock_time):
-    mock_time.time.side_effect = [0, 0, 0, 0, 0]
-    mock_time.sleep = mock.MagicMock()
+def test_create_polls_until_ready(poll_clock):
 
     instance = create_create_instance(wait=86400, update_interval=60)
     instance.api.post_sbm_servers.return_value = [PENDING_SERVER.copy()]
@@ -150,10 +147,7 @@ def test_create_polls_until_ready(mock_time):
     assert instance.api.get_sbm_servers.call_count == 2
 
 
-@mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.time")
-def test_create_timeout(mock_time):
-    mock_time.time.side_effect = [0, 0, 100000]
-    mock_time.sleep = mock.MagicMock()
+def test_create_timeout(poll_clock):
 
     instance = create_create_instance(wait=100, update_interval=10)
     instance.api.post_sbm_servers.return_value = [PENDING_SERVER.copy()]
@@ -247,10 +241,7 @@ def test_delete_checkmode():
     instance.api.delete_sbm_server.assert_not_called()
 
 
-@mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.time")
-def test_delete_409_retry_success(mock_time):
-    mock_time.time.side_effect = [0, 0, 0, 0, 0]
-    mock_time.sleep = mock.MagicMock()
+def test_delete_409_retry_success(poll_clock):
 
     instance = create_delete_instance(retry_on_conflicts=True)
     instance.api.get_sbm_servers.side_effect = [
@@ -294,10 +285,7 @@ def test_delete_404_during_delete():
     assert result["changed"] is True
 
 
-@mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.time")
-def test_delete_wait_timeout(mock_time):
-    mock_time.time.side_effect = [0, 0, 0, 100000]
-    mock_time.sleep = mock.MagicMock()
+def test_delete_wait_timeout(poll_clock):
 
     instance = create_delete_instance(
         wait=100, update_interval=10, wait_for_deletion=True
@@ -318,10 +306,7 @@ def test_delete_interval_greater_than_wait():
     assert "Update interval" in exc_info.value.msg
 
 
-@mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.time")
-def test_create_passes_retry_rules(mock_time):
-    mock_time.time.side_effect = [0, 0]
-    mock_time.sleep = mock.MagicMock()
+def test_create_passes_retry_rules(poll_clock):
 
     instance = create_create_instance(wait=86400, update_interval=60)
     instance.api.post_sbm_servers.return_value = [PENDING_SERVER.copy()]
@@ -334,12 +319,7 @@ def test_create_passes_retry_rules(mock_time):
     assert call.kwargs["retry_rules"]["codes"] == {429, 500}
 
 
-@mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.time")
-def test_delete_wait_passes_retry_rules(mock_time):
-    # retry_to_delete: time(start), delete ok
-    # wait_for_disappearance: time(start), time(elapsed), GET -> 404
-    mock_time.time.side_effect = [0, 0, 0]
-    mock_time.sleep = mock.MagicMock()
+def test_delete_wait_passes_retry_rules(poll_clock):
 
     instance = create_delete_instance(wait=600, wait_for_deletion=True)
     instance.api.get_sbm_servers.side_effect = [
@@ -31,7 +31,7 @@ def create_labels_instance(labels=None, checkmode=False):
     if labels is None:
         labels = {"env": "prod"}
     with mock.patch(
-        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScApi"
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
     ):
         return ScSbmServerLabels(
             endpoint="https://api.servers.com/v1",
@@ -64,7 +64,7 @@ def create_network_instance(
     checkmode=False,
 ):
     with mock.patch(
-        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScApi"
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
     ):
         return ScSbmServerNetwork(
             endpoint="https://api.servers.com/v1",
@@ -97,8 +97,7 @@ def test_create_no_wait():
     instance.api.get_sbm_server_network.assert_not_called()
 
 
-@mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.time")
-def test_create_immediate_active(mock_time):
+def test_create_immediate_active(poll_clock):
     instance = create_network_instance(state="present", mask=29)
     instance.api.post_sbm_server_private_ipv4_network.return_value = dict(
         ACTIVE_NETWORK
@@ -112,10 +111,7 @@ def test_create_immediate_active(mock_time):
     instance.api.get_sbm_server_network.assert_not_called()
 
 
-@mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.time")
-def test_create_polls_until_active(mock_time):
-    mock_time.time.side_effect = [0, 0, 0, 0, 0]
-    mock_time.sleep = mock.MagicMock()
+def test_create_polls_until_active(poll_clock):
 
     instance = create_network_instance(state="present", mask=29)
     instance.api.post_sbm_server_private_ipv4_network.return_value = dict(NETWORK)
@@ -132,10 +128,7 @@ def test_create_polls_until_active(mock_time):
     assert instance.api.get_sbm_server_network.call_count == 2
 
 
-@mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.time")
-def test_create_timeout(mock_time):
-    mock_time.time.side_effect = [0, 0, 100000]
-    mock_time.sleep = mock.MagicMock()
+def test_create_timeout(poll_clock):
 
     instance = create_network_instance(
         state="present", mask=29, wait=100, update_interval=10
@@ -165,12 +158,7 @@ def test_create_network_checkmode():
     instance.api.post_sbm_server_private_ipv4_network.assert_not_called()
 
 
-@mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.time")
-def test_delete_waits_for_removal(mock_time):
-    # retry loop: time(start) -> delete ok
-    # _wait_for_network_gone: time(start), GET(active), sleep, time(elapsed), GET(404)
-    mock_time.time.side_effect = [0, 0, 0, 0, 0, 0]
-    mock_time.sleep = mock.MagicMock()
+def test_delete_waits_for_removal(poll_clock):
 
     instance = create_network_instance(state="absent", network_id="net-1", mask=None)
     instance.api.get_sbm_server_network.side_effect = [
@@ -215,10 +203,7 @@ def test_delete_network_not_found():
     instance.api.delete_sbm_server_network.assert_not_called()
 
 
-@mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.time")
-def test_delete_already_removed_waits_for_404(mock_time):
-    mock_time.time.side_effect = [0, 0, 0]
-    mock_time.sleep = mock.MagicMock()
+def test_delete_already_removed_waits_for_404(poll_clock):
 
     instance = create_network_instance(state="absent", network_id="net-1", mask=None)
     instance.api.get_sbm_server_network.side_effect = [
@@ -232,12 +217,7 @@ def test_delete_already_removed_waits_for_404(mock_time):
     instance.api.delete_sbm_server_network.assert_called_once()
 
 
-@mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.time")
-def test_delete_409_still_succeeds(mock_time):
-    # retry loop: time(start), delete->409, time(elapsed), sleep, delete->ok
-    # _wait_for_network_gone: time(start), GET->404
-    mock_time.time.side_effect = [0, 0, 0, 0, 0]
-    mock_time.sleep = mock.MagicMock()
+def test_delete_409_still_succeeds(poll_clock):
 
     instance = create_network_instance(state="absent", network_id="net-1", mask=None)
     instance.api.get_sbm_server_network.side_effect = [
@@ -266,28 +246,20 @@ def test_delete_network_checkmode():
     instance.api.delete_sbm_server_network.assert_not_called()
 
 
-@mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.time")
-def test_delete_wait_timeout(mock_time):
-    # retry loop: time(start), delete->ok
-    # _wait_for_network_gone: time(start), time(elapsed=0), GET(active), ok, sleep,
-    #   time(elapsed=100000), GET(active), timeout
-    mock_time.time.side_effect = [0, 0, 0, 100000]
-    mock_time.sleep = mock.MagicMock()
+def test_delete_wait_timeout(poll_clock):
 
     instance = create_network_instance(
         state="absent", network_id="net-1", mask=None, wait=100, update_interval=10
     )
-    instance.api.get_sbm_server_network.side_effect = [
-        dict(ACTIVE_NETWORK),  # initial check in delete()
-        dict(ACTIVE_NETWORK),  # first poll in _wait_for_network_gone (elapsed=0)
-        dict(ACTIVE_NETWORK),  # second poll (elapsed=100000, triggers timeout)
-    ]
+    # initial check in delete(), then every poll in _wait_for_network_gone
+    instance.api.get_sbm_server_network.return_value = dict(ACTIVE_NETWORK)
     instance.api.delete_sbm_server_network.return_value = None
 
     with pytest.raises(WaitError) as exc_info:
         instance.run()
 
     assert "Timeout" in exc_info.value.msg
+    assert exc_info.value.timeout == 100
 
 
 def test_unknown_state():
@@ -300,10 +272,7 @@ def test_unknown_state():
     assert "Unknown state" in str(exc_info.value.msg)
 
 
-@mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.time")
-def test_create_passes_retry_rules(mock_time):
-    mock_time.time.side_effect = [0, 0]
-    mock_time.sleep = mock.MagicMock()
+def test_create_passes_retry_rules(poll_clock):
 
     instance = create_network_instance(state="present", mask=29, wait=600)
     instance.api.post_sbm_server_private_ipv4_network.return_value = dict(NETWORK)
@@ -316,12 +285,7 @@ def test_create_passes_retry_rules(mock_time):
     assert call.kwargs["retry_rules"]["codes"] == {429, 500}
 
 
-@mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.time")
-def test_wait_for_network_gone_passes_retry_rules(mock_time):
-    # delete retry: time(start), delete ok
-    # _wait_for_network_gone: time(start), time(elapsed), GET -> 404
-    mock_time.time.side_effect = [0, 0, 0]
-    mock_time.sleep = mock.MagicMock()
+def test_wait_for_network_gone_passes_retry_rules(poll_clock):
 
     instance = create_network_instance(
         state="absent", network_id="net-1", mask=None, wait=600
@@ -39,7 +39,7 @@ NETWORKS = [NETWORK_1, NETWORK_2]
 
 def test_list_networks():
     with mock.patch(
-        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScApi"
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
     ) as mock_api_class:
         mock_instance = mock_api_class.return_value
         mock_instance.list_sbm_server_networks.return_value = iter(NETWORKS)
@@ -57,7 +57,7 @@ def test_list_networks():
 
 def test_list_networks_with_filter():
     with mock.patch(
-        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScApi"
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
     ) as mock_api_class:
         mock_instance = mock_api_class.return_value
         mock_instance.list_sbm_server_networks.return_value = iter([NETWORK_2])
@@ -85,7 +85,7 @@ def test_list_networks_with_filter():
 
 def test_get_single_network():
     with mock.patch(
-        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScApi"
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
     ) as mock_api_class:
         mock_instance = mock_api_class.return_value
         mock_instance.get_sbm_server_network.return_value = dict(NETWORK_1)
@@ -107,7 +107,7 @@ def test_get_single_network():
 
 def test_list_networks_empty():
     with mock.patch(
-        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScApi"
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
     ) as mock_api_class:
         mock_instance = mock_api_class.return_value
         mock_instance.list_sbm_server_networks.return_value = iter([])
@@ -23,7 +23,7 @@ __metaclass__ = type
 def create_power_instance(state="on", wait=60, checkmode=False):
     """Create a ScSbmServerPower instance with mocked API."""
     with mock.patch(
-        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScApi"
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
     ) as mock_api:
         instance = ScSbmServerPower(
             endpoint="https://api.servers.com/v1",
@@ -197,10 +197,7 @@ CONFLICT_MSG = (
 )
 
 
-@mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.time")
-def test_power_off_409_conflict_retry_success(mock_time):
-    mock_time.time.side_effect = [0, 0, 0, 0, 0]
-    mock_time.sleep = mock.MagicMock()
+def test_power_off_409_conflict_retry_success(poll_clock):
 
     instance, _mock_api = create_power_instance(state="off", wait=60)
     instance.api.get_sbm_servers.side_effect = [
@@ -219,10 +216,7 @@ def test_power_off_409_conflict_retry_success(mock_time):
     assert instance.api.post_sbm_server_power_off.call_count == 2
 
 
-@mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.time")
-def test_power_on_409_conflict_retry_success(mock_time):
-    mock_time.time.side_effect = [0, 0, 0, 0, 0]
-    mock_time.sleep = mock.MagicMock()
+def test_power_on_409_conflict_retry_success(poll_clock):
 
     instance, _mock_api = create_power_instance(state="on", wait=60)
     instance.api.get_sbm_servers.side_effect = [
@@ -240,10 +234,7 @@ def test_power_on_409_conflict_retry_success(mock_time):
     assert instance.api.post_sbm_server_power_on.call_count == 2
 
 
-@mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.time")
-def test_power_409_conflict_timeout(mock_time):
-    mock_time.time.side_effect = [0, 100000]
-    mock_time.sleep = mock.MagicMock()
+def test_power_409_conflict_timeout(poll_clock):
 
     instance, _mock_api = create_power_instance(state="off", wait=60)
     instance.api.get_sbm_servers.return_value = {
@@ -281,10 +272,7 @@ def test_power_409_non_conflict_not_retried():
     instance.api.post_sbm_server_power_off.assert_called_once()
 
 
-@mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.time")
-def test_wait_for_status_passes_retry_rules(mock_time):
-    mock_time.time.side_effect = [0, 0]
-    mock_time.sleep = mock.MagicMock()
+def test_wait_for_status_passes_retry_rules(poll_clock):
 
     instance, _mock_api = create_power_instance(state="on", wait=60)
     instance.api.get_sbm_servers.return_value = {
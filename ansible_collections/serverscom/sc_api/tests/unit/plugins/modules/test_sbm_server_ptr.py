@@ -49,7 +49,7 @@ def create_ptr_instance(
 ):
     """Create a ScSbmServerPtr instance with mocked API."""
     with mock.patch(
-        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScApi"
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
     ):
         return ScSbmServerPtr(
             endpoint="https://api.servers.com/v1",
@@ -148,7 +148,7 @@ def test_run_unknown_state():
 def create_ptr_info_instance():
     """Create a ScSbmServerPtrInfo instance with mocked API."""
     with mock.patch(
-        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScApi"
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
     ):
         return ScSbmServerPtrInfo(
             endpoint="https://api.servers.com/v1",
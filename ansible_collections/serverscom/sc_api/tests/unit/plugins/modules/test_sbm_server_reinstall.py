@@ -11,6 +11,11 @@ from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
 from ansible_collections.serverscom.sc_api.plugins.module_utils.sbm import (
     ScSbmServerReinstall,
 )  # noqa
+from ansible_collections.serverscom.sc_api.tests.fake_api import seed
+from ansible_collections.serverscom.sc_api.tests.fake_api.server import (
+    FakeApi,
+    start_in_thread,
+)
 
 
 __metaclass__ = type
@@ -43,7 +48,7 @@ OS_LIST = [
 @pytest.fixture
 def mock_api():
     with mock.patch(
-        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScApi"
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
     ) as mock_api_class:
         mock_instance = mock_api_class.return_value
         mock_instance.get_sbm_servers.return_value = SERVER_DATA.copy()
@@ -69,6 +74,7 @@ def test_get_hostname_provided(mock_api):
         update_interval=60,
         checkmode=True,
     )
+    reinstall.run()
     assert reinstall.hostname == "custom-hostname"
 
 
@@ -87,6 +93,8 @@ def test_get_hostname_from_server(mock_api):
         update_interval=60,
         checkmode=True,
     )
+    assert not mock_api.method_calls  # nothing is looked up in __init__
+    reinstall.run()
     assert reinstall.hostname == "my-sbm-server"
 
 
@@ -105,6 +113,7 @@ def test_get_operating_system_id_provided(mock_api):
         update_interval=60,
         checkmode=True,
     )
+    reinstall.run()
     assert reinstall.operating_system_id == 51
 
 
@@ -123,6 +132,7 @@ def test_get_operating_system_id_from_server(mock_api):
         update_interval=60,
         checkmode=True,
     )
+    reinstall.run()
     assert reinstall.operating_system_id == 49
 
 
@@ -142,6 +152,7 @@ def test_get_operating_system_id_by_name(mock_api):
         update_interval=60,
         checkmode=True,
     )
+    reinstall.run()
     assert reinstall.operating_system_id == 51
 
 
@@ -161,7 +172,7 @@ def test_get_operating_system_id_by_name_not_found(mock_api):
             wait=0,
             update_interval=60,
             checkmode=True,
-        )
+        ).run()
     assert "not found" in str(exc_info.value.msg)
 
 
@@ -180,6 +191,7 @@ def test_get_operating_system_id_by_regex(mock_api):
         update_interval=60,
         checkmode=True,
     )
+    reinstall.run()
     assert reinstall.operating_system_id == 51
 
 
@@ -198,7 +210,7 @@ def test_get_operating_system_id_by_regex_multiple_matches(mock_api):
             wait=0,
             update_interval=60,
             checkmode=True,
-        )
+        ).run()
     assert "Multiple OS options match" in str(exc_info.value.msg)
 
 
@@ -217,7 +229,7 @@ def test_get_operating_system_id_by_regex_no_match(mock_api):
             wait=0,
             update_interval=60,
             checkmode=True,
-        )
+        ).run()
     assert "No OS options match" in str(exc_info.value.msg)
 
 
@@ -236,6 +248,7 @@ def test_get_ssh_keys_provided(mock_api):
         update_interval=60,
         checkmode=True,
     )
+    reinstall.run()
     assert reinstall.ssh_keys == ["aa:bb:cc:dd", "ee:ff:00:11"]
 
 
@@ -254,6 +267,7 @@ def test_get_ssh_keys_by_name(mock_api):
         update_interval=60,
         checkmode=True,
     )
+    reinstall.run()
     assert reinstall.ssh_keys == ["aa:bb:cc:dd"]
 
 
@@ -272,6 +286,7 @@ def test_get_ssh_keys_empty(mock_api):
         update_interval=60,
         checkmode=True,
     )
+    reinstall.run()
     assert reinstall.ssh_keys == []
 
 
@@ -314,17 +329,15 @@ def test_wait_interval_validation(mock_api):
     assert "Update interval" in str(exc_info.value.msg)
 
 
-@mock.patch("ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.time")
-def test_wait_for_server_passes_retry_rules(mock_time):
-    mock_time.time.side_effect = [0, 0]
-    mock_time.sleep = mock.MagicMock()
+def test_wait_for_server_passes_retry_rules(poll_clock):
 
     with mock.patch(
-        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScApi"
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
     ) as mock_api_class:
         mock_instance = mock_api_class.return_value
         mock_instance.get_sbm_servers.side_effect = [
             SERVER_DATA.copy(),  # get_server_data
+            dict(SERVER_DATA, operational_status="installation"),
             {  # wait_for_server poll
                 "id": "test-server",
                 "status": "active",
@@ -357,3 +370,47 @@ def test_wait_for_server_passes_retry_rules(mock_time):
         call = mock_instance.get_sbm_servers.call_args
         assert "retry_rules" in call.kwargs
         assert call.kwargs["retry_rules"]["codes"] == {429, 500}
+
+
+def reinstall_with_fake_api(poll_clock, config):
+    api = FakeApi(config, clock=poll_clock.time)
+    api.state["hosts"]["sbm1"] = seed.sbm_server(
+        "sbm1", "node1", seed.LOCATIONS[0], seed.ORDER_OPTIONS["sbm_flavor_models"][0]
+    )
+    server, endpoint = start_in_thread(api=api)
+    try:
+        return ScSbmServerReinstall(
+            endpoint=endpoint,
+            token="token",
+            server_id="sbm1",
+            hostname=None,
+            operating_system_id=seed.SBM_OPERATING_SYSTEMS[0]["id"],
+            operating_system_regex=None,
+            ssh_keys=None,
+            ssh_key_name=None,
+            user_data=None,
+            wait=600,
+            update_interval=30,
+            checkmode=False,
+        ).run()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_wait_for_server_ignores_old_status(poll_clock):
+    # The server reports its old, ready status for 5 seconds, then
+    # installs for 10.
+    result = reinstall_with_fake_api(
+        poll_clock, {"transition_delay": 10, "reinstall_lag": 5}
+    )
+    assert result["ready"] is True
+    assert result["operational_status"] == "normal"
+    assert result["elapsed"] >= 15
+
+
+def test_wait_for_server_without_visible_install(poll_clock):
+    # Installed between two polls: ready is accepted after update_interval.
+    result = reinstall_with_fake_api(poll_clock, {"transition_delay": 0})
+    assert result["ready"] is True
+    assert 30 <= result["elapsed"] < 45
@@ -0,0 +1,315 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+import pytest
+import mock
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    APIError,
+    APIError404,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
+    ModuleError,
+    PartialFailureError,
+    WaitError,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.sbm import (
+    ORDER_LABEL,
+    ScSbmServersCreate,
+)
+from ansible_collections.serverscom.sc_api.plugins.modules.sbm_servers import (
+    resolve_orders,
+    server_specs,
+)
+
+
+__metaclass__ = type
+
+
+def server(server_id, title, location_id=1, ready=False):
+    return {
+        "id": server_id,
+        "title": title,
+        "type": "sbm_server",
+        "location_id": location_id,
+        "status": "active" if ready else "init",
+        "operational_status": "normal" if ready else "provisioning",
+        "power_status": "powered_on" if ready else "unknown",
+    }
+
+
+ORDER_AMS = {
+    "location_id": 1,
+    "sbm_flavor_model_id": 42,
+    "operating_system_id": 100,
+    "hostnames": ["web-01", "web-02"],
+}
+ORDER_DFW = {
+    "location_id": 2,
+    "sbm_flavor_model_id": 42,
+    "operating_system_id": 100,
+    "hostnames": ["web-03"],
+}
+
+
+def create_instance(orders, wait=86400, update_interval=60, checkmode=False):
+    with mock.patch(
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
+    ):
+        return ScSbmServersCreate(
+            endpoint="https://api.servers.com/v1",
+            token="test-token",
+            orders=orders,
+            ssh_key_fingerprints=["aa:bb"],
+            user_data=None,
+            wait=wait,
+            update_interval=update_interval,
+            checkmode=checkmode,
+        )
+
+
+def test_one_order_per_group():
+    instance = create_instance([ORDER_AMS, ORDER_DFW], wait=0)
+    instance.api.post_sbm_servers.side_effect = [
+        [server("s1", "web-01"), server("s2", "web-02")],
+        [server("s3", "web-03", location_id=2)],
+    ]
+
+    result = instance.run()
+
+    assert result["changed"] is True
+    assert [s["id"] for s in result["sbm_servers"]] == ["s1", "s2", "s3"]
+    assert instance.api.post_sbm_servers.call_count == 2
+    first = instance.api.post_sbm_servers.call_args_list[0][1]
+    labels = {ORDER_LABEL: instance.order_id}
+    assert first["hosts"] == [
+        {"hostname": "web-01", "labels": labels},
+        {"hostname": "web-02", "labels": labels},
+    ]
+    assert first["location_id"] == 1
+    assert first["ssh_key_fingerprints"] == ["aa:bb"]
+    instance.api.list_sbm_servers.assert_not_called()
+
+
+def test_checkmode():
+    instance = create_instance([ORDER_AMS], checkmode=True)
+    result = instance.run()
+    assert result["changed"] is True
+    instance.api.post_sbm_servers.assert_not_called()
+
+
+def test_single_polling_loop(poll_clock):
+    instance = create_instance([ORDER_AMS, ORDER_DFW])
+    instance.api.post_sbm_servers.side_effect = [
+        [server("s1", "web-01"), server("s2", "web-02")],
+        [server("s3", "web-03", location_id=2)],
+    ]
+    listings = [
+        [
+            server("s1", "web-01", ready=True),
+            server("s2", "web-02"),
+            server("s3", "web-03", location_id=2, ready=True),
+        ],
+        [
+            server("s1", "web-01", ready=True),
+            server("s2", "web-02", ready=True),
+            server("s3", "web-03", location_id=2, ready=True),
+        ],
+    ]
+    instance.api.list_sbm_servers.side_effect = (
+        lambda label_selector, retry_rules: iter(listings.pop(0))
+    )
+
+    result = instance.run()
+
+    assert [s["status"] for s in result["sbm_servers"]] == ["active"] * 3
+    # One listing per poll, of this order's servers only.
+    assert [
+        c[1]["label_selector"] for c in instance.api.list_sbm_servers.call_args_list
+    ] == [f"{ORDER_LABEL}={instance.order_id}"] * 2
+    instance.api.get_sbm_servers.assert_not_called()
+
+
+def test_failed_order_keeps_ordered_servers():
+    instance = create_instance([ORDER_AMS, ORDER_DFW])
+    instance.api.post_sbm_servers.side_effect = [
+        [server("s1", "web-01"), server("s2", "web-02")],
+        APIError(msg="API Error: no stock", api_url="u", status_code=422),
+    ]
+
+    with pytest.raises(PartialFailureError) as exc_info:
+        instance.run()
+
+    result = exc_info.value.fail()
+    assert result["failed"] is True
+    assert result["changed"] is True
+    assert [s["id"] for s in result["sbm_servers"]] == ["s1", "s2"]
+    assert result["status_code"] == 422
+    assert "web-03 failed after 2 servers were ordered" in result["msg"]
+    instance.api.list_sbm_servers.assert_not_called()
+
+
+def test_first_order_failure_is_raised():
+    instance = create_instance([ORDER_AMS])
+    error = APIError(msg="API Error", api_url="u", status_code=422)
+    instance.api.post_sbm_servers.side_effect = error
+
+    with pytest.raises(APIError):
+        instance.run()
+
+
+def test_missing_server_is_not_waited_for(poll_clock):
+    instance = create_instance([ORDER_AMS], wait=3600)
+    instance.api.post_sbm_servers.return_value = [
+        server("s1", "web-01"),
+        server("s2", "web-02"),
+    ]
+    listings = [
+        [server("s1", "web-01")],
+        [server("s1", "web-01", ready=True)],
+    ]
+    instance.api.list_sbm_servers.side_effect = lambda **kwargs: iter(listings.pop(0))
+    instance.api.get_sbm_servers.side_effect = APIError404(
+        msg="404 Not Found.", api_url="u", status_code=404
+    )
+
+    with pytest.raises(PartialFailureError) as exc_info:
+        instance.run()
+
+    result = exc_info.value.fail()
+    instance.api.get_sbm_servers.assert_called_once_with("s2", retry_rules=mock.ANY)
+    assert "1 of 2 SBM servers disappeared" in result["msg"]
+    assert [s["id"] for s in result["sbm_servers"]] == ["s1"]
+    assert result["sbm_servers"][0]["status"] == "active"
+    assert [s["id"] for s in result["missing_sbm_servers"]] == ["s2"]
+    assert poll_clock.now < 60
+
+
+def test_server_not_listed_yet_is_waited_for(poll_clock):
+    # s2's label is applied late, so the first listing misses it.
+    instance = create_instance([ORDER_AMS], wait=3600)
+    instance.api.post_sbm_servers.return_value = [
+        server("s1", "web-01"),
+        server("s2", "web-02"),
+    ]
+    listings = [
+        [server("s1", "web-01")],
+        [server("s1", "web-01", ready=True), server("s2", "web-02", ready=True)],
+    ]
+    instance.api.list_sbm_servers.side_effect = lambda **kwargs: iter(listings.pop(0))
+    instance.api.get_sbm_servers.return_value = server("s2", "web-02")
+
+    result = instance.run()
+
+    assert [s["status"] for s in result["sbm_servers"]] == ["active"] * 2
+    assert instance.api.get_sbm_servers.call_count == 1
+
+
+def test_timeout_lists_not_ready_servers(poll_clock):
+    instance = create_instance([ORDER_AMS], wait=100, update_interval=10)
+    instance.api.post_sbm_servers.return_value = [
+        server("s1", "web-01", ready=True),
+        server("s2", "web-02"),
+    ]
+    instance.api.list_sbm_servers.side_effect = lambda **kwargs: iter(
+        [server("s2", "web-02")]
+    )
+
+    with pytest.raises(WaitError) as exc_info:
+        instance.run()
+
+    assert "1 of 2" in exc_info.value.msg
+    assert "s2 (web-02" in exc_info.value.msg
+
+
+def test_interval_greater_than_wait():
+    with pytest.raises(ModuleError):
+        create_instance([ORDER_AMS], wait=30, update_interval=60)
+
+
+PARAMS = {
+    "hostnames": None,
+    "count": None,
+    "hostname_template": "sbm-{index}",
+    "start_index": 1,
+    "servers": None,
+    "location_id": None,
+    "location_code": "AMS7",
+    "flavor_id": 42,
+    "flavor_name": None,
+    "operating_system_id": 100,
+    "operating_system_name": None,
+    "operating_system_regex": None,
+}
+
+
+def test_specs_from_count():
+    params = dict(PARAMS, count=3, hostname_template="node-{index:03d}", start_index=9)
+    specs = server_specs(params)
+    assert [spec["hostname"] for spec in specs] == ["node-009", "node-010", "node-011"]
+    assert specs[0]["location_code"] == "AMS7"
+
+
+@pytest.mark.parametrize(
+    "params, error",
+    [
+        (dict(PARAMS, count=0), "count must be positive"),
+        (dict(PARAMS, count=2, hostname_template="n-{name}"), "hostname_template"),
+        (dict(PARAMS, hostnames=["a", "b", "a"]), "Duplicate hostnames: a"),
+    ],
+)
+def test_specs_errors(params, error):
+    with pytest.raises(ModuleError) as exc_info:
+        server_specs(params)
+    assert error in exc_info.value.msg
+
+
+def test_specs_overrides():
+    params = dict(
+        PARAMS,
+        servers=[
+            {"hostname": "a", "location_id": None, "location_code": None},
+            {"hostname": "b", "location_id": 2, "location_code": None},
+        ],
+    )
+    specs = server_specs(params)
+    assert specs[0]["location_code"] == "AMS7"
+    assert specs[1]["location_id"] == 2
+    assert specs[1]["location_code"] is None
+    assert specs[1]["flavor_id"] == 42
+
+
+def test_resolve_orders_groups_servers():
+    api = mock.Mock()
+    api.list_locations.side_effect = lambda search_pattern: iter(
+        [{"id": 1, "code": "AMS7"}]
+    )
+    specs = server_specs(
+        dict(
+            PARAMS,
+            servers=[
+                {"hostname": "a"},
+                {"hostname": "b", "location_id": 2},
+                {"hostname": "c"},
+            ],
+        )
+    )
+
+    orders = resolve_orders(api, specs)
+
+    assert orders == [
+        {
+            "location_id": 1,
+            "sbm_flavor_model_id": 42,
+            "operating_system_id": 100,
+            "hostnames": ["a", "c"],
+        },
+        {
+            "location_id": 2,
+            "sbm_flavor_model_id": 42,
+            "operating_system_id": 100,
+            "hostnames": ["b"],
+        },
+    ]
+    assert api.list_locations.call_count == 1
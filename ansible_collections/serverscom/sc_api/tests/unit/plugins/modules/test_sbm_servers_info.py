@@ -33,7 +33,7 @@ SERVERS = [SERVER_1, SERVER_2]
 
 def test_run_returns_servers():
     with mock.patch(
-        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScApi"
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
     ) as mock_api_class:
         mock_instance = mock_api_class.return_value
         mock_instance.list_sbm_servers.return_value = iter(SERVERS)
@@ -50,7 +50,7 @@ def test_run_returns_servers():
 
 def test_run_with_search_pattern():
     with mock.patch(
-        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScApi"
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
     ) as mock_api_class:
         mock_instance = mock_api_class.return_value
         mock_instance.list_sbm_servers.return_value = iter([SERVER_1])
@@ -74,7 +74,7 @@ def test_run_with_search_pattern():
 
 def test_run_with_location_filter():
     with mock.patch(
-        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScApi"
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
     ) as mock_api_class:
         mock_instance = mock_api_class.return_value
         mock_instance.list_sbm_servers.return_value = iter([SERVER_1])
@@ -97,7 +97,7 @@ def test_run_with_location_filter():
 
 def test_run_with_label_selector():
     with mock.patch(
-        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScApi"
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
     ) as mock_api_class:
         mock_instance = mock_api_class.return_value
         mock_instance.list_sbm_servers.return_value = iter([SERVER_1])
@@ -120,7 +120,7 @@ def test_run_with_label_selector():
 
 def test_run_empty_result():
     with mock.patch(
-        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScApi"
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.sbm.ScSbmApi"
     ) as mock_api_class:
         mock_instance = mock_api_class.return_value
         mock_instance.list_sbm_servers.return_value = iter([])
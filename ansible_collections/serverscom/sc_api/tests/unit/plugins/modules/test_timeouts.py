@@ -0,0 +1,163 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+import random
+import socket
+import threading
+
+import mock
+import pytest
+
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    CLIENT_DEFAULTS,
+    APIError,
+    ApiHelper,
+    RetryPolicy,
+    SCTimeoutError,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
+    Poller,
+    configure_api_client,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.tracing import (
+    TRACE,
+)
+
+
+__metaclass__ = type
+
+
+@pytest.fixture
+def stalled_endpoint():
+    """An endpoint which accepts connections and never answers."""
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(8)
+    accepted = []
+    stop = threading.Event()
+
+    def accept():
+        listener.settimeout(0.05)
+        while not stop.is_set():
+            try:
+                accepted.append(listener.accept()[0])
+            except socket.timeout:
+                pass
+
+    thread = threading.Thread(target=accept, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{listener.getsockname()[1]}/v1"
+    stop.set()
+    thread.join()
+    for connection in accepted:
+        connection.close()
+    listener.close()
+
+
+def test_stalled_request_times_out(stalled_endpoint, monkeypatch):
+    monkeypatch.setattr(TRACE, "enabled", True)
+    monkeypatch.setitem(CLIENT_DEFAULTS, "read_timeout", 0.2)
+    helper = ApiHelper("token", stalled_endpoint, retry_policy=RetryPolicy(max_attempts=1))
+    with pytest.raises(SCTimeoutError) as exc:
+        helper.make_get_request("/hosts/sbm_servers/s1")
+    failed = exc.value.fail()
+    assert failed["request_timeout"] == {"connect": 10, "read": 0.2}
+    assert "attempts" not in failed
+    assert TRACE.stats()["endpoints"][0]["statuses"] == {"timeout": 1}
+
+
+def test_timeouts_are_retried_by_default(stalled_endpoint, monkeypatch):
+    monkeypatch.setattr(TRACE, "enabled", True)
+    monkeypatch.setattr(random, "uniform", lambda _a, _b: 0.0)
+    monkeypatch.setitem(CLIENT_DEFAULTS, "read_timeout", 0.1)
+    helper = ApiHelper("token", stalled_endpoint)
+    with pytest.raises(SCTimeoutError) as exc:
+        helper.make_get_request("/hosts/sbm_servers/s1")
+    assert exc.value.fail()["attempts"] == 4
+    assert TRACE.stats()["endpoints"][0]["statuses"] == {"timeout": 4}
+
+
+def test_timeouts_are_retried(stalled_endpoint, monkeypatch):
+    monkeypatch.setattr(TRACE, "enabled", True)
+    monkeypatch.setitem(CLIENT_DEFAULTS, "read_timeout", 0.1)
+    helper = ApiHelper("token", stalled_endpoint)
+    with pytest.raises(SCTimeoutError) as exc:
+        helper.make_get_request(
+            "/hosts/sbm_servers/s1",
+            retry_rules={"codes": [500], "delay": 0.01, "max_wait": 0.25},
+        )
+    attempts = exc.value.fail()["attempts"]
+    assert attempts >= 2
+    stats = TRACE.stats()
+    assert stats["retries"] == attempts - 1
+    assert stats["endpoints"][0]["statuses"] == {"timeout": attempts}
+
+
+@pytest.mark.parametrize(
+    "connect, read, left, expected",
+    [
+        (10, 60, None, (10, 60)),
+        (0, 0, None, (None, None)),
+        (10, 60, 100, (10, 60)),
+        (10, 60, 30, (10, 30)),
+        (10, 60, 1, (5, 5)),
+        (0, 0, 30, (30, 30)),
+    ],
+)
+def test_timeouts_are_cut_to_deadline(poll_clock, monkeypatch, connect, read, left, expected):
+    monkeypatch.setitem(CLIENT_DEFAULTS, "connect_timeout", connect)
+    monkeypatch.setitem(CLIENT_DEFAULTS, "read_timeout", read)
+    if left is not None:
+        monkeypatch.setitem(CLIENT_DEFAULTS, "deadline", poll_clock.now + left)
+    assert ApiHelper("token", "http://api/v1").timeout() == expected
+
+
+class Answer500:
+    status_code = 500
+    headers = {}
+    content = b"oops"
+    url = "http://api/v1/x"
+
+
+def test_retries_stop_at_deadline(poll_clock, monkeypatch):
+    # The longest delay full jitter can pick.
+    monkeypatch.setattr(random, "uniform", lambda _a, b: b)
+    monkeypatch.setitem(CLIENT_DEFAULTS, "deadline", poll_clock.now + 10)
+    helper = ApiHelper("token", "http://api/v1")
+    send = mock.Mock(return_value=Answer500())
+    helper.session.send = send
+    with pytest.raises(APIError):
+        helper.make_get_request(
+            "/x", retry_rules={"codes": [500], "delay": 3, "max_wait": 1000}
+        )
+    assert poll_clock.sleeps == [3, 6, 1]
+    assert send.call_count == 4
+
+
+def test_wait_loops_share_deadline(poll_clock, monkeypatch):
+    monkeypatch.setitem(CLIENT_DEFAULTS, "deadline", poll_clock.now + 20)
+    first = Poller(wait=15, max_interval=5)
+    while first.sleep():
+        pass
+    assert poll_clock.now == 15
+    second = Poller(wait=15, max_interval=5)
+    assert second.remaining() == 5
+    while second.sleep():
+        pass
+    assert poll_clock.now == 20
+    assert second.retry_rules()["max_wait"] == 0
+
+
+@pytest.mark.parametrize("wait, deadline", [(600, 1600), (0, None), (None, None)])
+def test_deadline_from_wait(poll_clock, wait, deadline):
+    poll_clock.now = 1000
+    params = {"connect_timeout": 3, "read_timeout": 30}
+    if wait is not None:
+        params["wait"] = wait
+    configure_api_client(mock.Mock(params=params, _socket_path=None))
+    assert CLIENT_DEFAULTS["deadline"] == deadline
+    assert CLIENT_DEFAULTS["connect_timeout"] == 3
+    assert CLIENT_DEFAULTS["read_timeout"] == 30
@@ -0,0 +1,189 @@
+# Copyright (c) 2026 Servers.com
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+import json
+
+import mock
+import pytest
+from ansible.module_utils import basic
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api import (
+    CLIENT_DEFAULTS,
+    APIError404,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.api_client import (
+    ScApi,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.modules import (
+    Poller,
+    configure_api_client,
+    with_client_info,
+)
+from ansible_collections.serverscom.sc_api.plugins.module_utils.tracing import (
+    TRACE,
+    path_template,
+    percentile,
+)
+from ansible_collections.serverscom.sc_api.plugins.modules import ssh_keys_info
+from ansible_collections.serverscom.sc_api.tests.fake_api.server import (
+    FakeApi,
+    start_in_thread,
+)
+
+
+__metaclass__ = type
+
+
+@pytest.fixture
+def fake():
+    api = FakeApi({"transition_delay": 0})
+    server, endpoint = start_in_thread(api=api)
+    yield api, endpoint
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize(
+    "url, template",
+    [
+        ("https://api/v1/hosts/sbm_servers/Vmrzwomx", "/hosts/sbm_servers/{id}"),
+        ("https://api/v1/hosts?page=2&per_page=100", "/hosts"),
+        (
+            "https://api/v1/locations/46/order_options/sbm_flavor_models/3091/operating_systems",
+            "/locations/{id}/order_options/sbm_flavor_models/{id}/operating_systems",
+        ),
+        ("https://api/v1/ssh_keys/f7:90:27:e6", "/ssh_keys/{id}"),
+        ("https://api/v1/load_balancers/l4/lb1", "/load_balancers/l4/{id}"),
+        ("https://api/v1/l2_segments/x1/networks", "/l2_segments/{id}/networks"),
+        (
+            "https://api/v1/hosts/sbm_servers/s1/networks/private_ipv4",
+            "/hosts/sbm_servers/{id}/networks/private_ipv4",
+        ),
+    ],
+)
+def test_path_template(url, template):
+    assert path_template("https://api/v1", url) == template
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 0.5) == 50
+    assert percentile(values, 0.95) == 95
+    assert percentile(values, 0.99) == 99
+    assert percentile([7], 0.99) == 7
+    assert percentile([], 0.5) is None
+
+
+def test_disabled_by_default(fake):
+    _fake, endpoint = fake
+    list(ScApi("token", endpoint).list_hosts())
+    assert TRACE.stats()["requests"] == 0
+
+
+def test_requests_are_recorded(fake, tmp_path, monkeypatch):
+    fake_api, endpoint = fake
+    fake_api.config.update(throttle_every=3, retry_after=0)
+    monkeypatch.setitem(CLIENT_DEFAULTS, "rate_limit", 100)
+    monkeypatch.setitem(CLIENT_DEFAULTS, "cache_dir", str(tmp_path))
+    monkeypatch.setattr(TRACE, "enabled", True)
+    api = ScApi("token", endpoint, page_size=1)
+
+    assert len(list(api.list_hosts())) == 3
+    with pytest.raises(APIError404):
+        api.get_dedicated_servers("nope")
+    stats = TRACE.stats()
+
+    assert stats["requests"] == 5
+    assert stats["retries"] == 1
+    assert stats["bytes"] > 0
+    assert stats["latency"]["p50"] <= stats["latency"]["p99"] <= stats["latency"]["max"]
+    assert stats["network_seconds"] > 0
+    assert stats["endpoints"] == [
+        {
+            "method": "GET",
+            "path": "/hosts",
+            "requests": 4,
+            "retries": 1,
+            "statuses": {"200": 3, "429": 1},
+            "bytes": mock.ANY,
+            "seconds": mock.ANY,
+        },
+        {
+            "method": "GET",
+            "path": "/hosts/dedicated_servers/{id}",
+            "requests": 1,
+            "retries": 0,
+            "statuses": {"404": 1},
+            "bytes": mock.ANY,
+            "seconds": mock.ANY,
+        },
+    ]
+
+
+def test_retry_rules_sleep_is_recorded(monkeypatch):
+    monkeypatch.setattr(TRACE, "enabled", True)
+    api = ScApi("token", "http://127.0.0.1:9/v1")
+    with mock.patch(
+        "ansible_collections.serverscom.sc_api.plugins.module_utils.api.time.sleep"
+    ) as sleep:
+        with pytest.raises(Exception):
+            api.get_dedicated_servers(
+                "s1", retry_rules={"codes": [500], "delay": 0.01, "max_wait": 0.05}
+            )
+    stats = TRACE.stats()
+    assert stats["endpoints"][0]["statuses"] == {"error": stats["requests"]}
+    assert stats["retries"] == sleep.call_count
+    assert stats["sleep_seconds"]["retry"] == pytest.approx(
+        sum(call[0][0] for call in sleep.call_args_list), abs=0.001
+    )
+
+
+def test_poller_sleep_is_recorded(poll_clock, monkeypatch):
+    monkeypatch.setattr(TRACE, "enabled", True)
+    poller = Poller(wait=10, max_interval=5)
+    while poller.sleep():
+        pass
+    assert TRACE.stats()["sleep_seconds"]["wait"] == pytest.approx(10)
+
+
+def test_module_result(fake):
+    _fake, endpoint = fake
+    module = mock.Mock(params={"api_stats": True}, _socket_path=None)
+    configure_api_client(module)
+    list(ScApi("token", endpoint).list_locations())
+
+    result = with_client_info({"changed": False})
+
+    assert result["changed"] is False
+    assert result["api_stats"]["requests"] == 1
+    assert result["api_stats"]["endpoints"][0]["path"] == "/locations"
+    assert set(result["api_stats"]["sleep_seconds"]) == {"wait", "retry", "throttle"}
+
+
+def test_module_result_without_option():
+    module = mock.Mock(params={}, _socket_path=None)
+    configure_api_client(module)
+    assert with_client_info({"changed": False}) == {"changed": False}
+
+
+@pytest.mark.parametrize("token, failed", [("token", False), ("wrong-token", True)])
+def test_module_main_reports_stats(fake, capsys, token, failed):
+    fake_api, endpoint = fake
+    fake_api.config["token"] = "token"
+    basic._ANSIBLE_ARGS = json.dumps(
+        {
+            "ANSIBLE_MODULE_ARGS": {
+                "token": token,
+                "endpoint": endpoint,
+                "api_stats": True,
+            }
+        }
+    ).encode("utf-8")
+    basic._ANSIBLE_PROFILE = "legacy"
+    with pytest.raises(SystemExit):
+        ssh_keys_info.main()
+    result = json.loads(capsys.readouterr().out)
+    assert bool(result.get("failed")) is failed
+    assert result["api_stats"]["endpoints"][0]["path"] == "/ssh_keys"